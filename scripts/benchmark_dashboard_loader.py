@@ -0,0 +1,163 @@
+"""
+Compara o carregamento do dashboard em três passadas (uma por visão: nacional,
+regional e mapa) com a agregação única de dashboard_data.agregar_dashboard:
+tempo e número de leituras da base por invocação (scans Parquet por partição),
+sobre uma Silver sintética.
+
+Uso: uv run python scripts/benchmark_dashboard_loader.py [--linhas 2000000] [--anos 3]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.dashboard_data import (
+    COLUNAS_METRICAS,
+    UF_EXTERIOR,
+    agregar_dashboard,
+    scan_base_uf,
+)
+from participacao_eleitoral.silver.reader import agregar_participacao, caminho_particao_silver
+from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+
+UFS = list(RegionMapper.REGIAO_MAP)
+REPETICOES = 5
+
+
+def gerar_silver(settings: Settings, anos: list[int], linhas: int, seed: int = 42) -> None:
+    """Escreve partições Silver sintéticas (só as colunas que o dashboard lê)."""
+
+    def sortear(valores: pl.Series, semente: int) -> pl.Series:
+        return valores.sample(linhas, with_replacement=True, seed=semente)
+
+    for indice, ano in enumerate(anos):
+        semente = seed + 3 * indice
+        df = (
+            pl.DataFrame(
+                {
+                    "SG_UF": sortear(pl.Series(UFS), semente),
+                    "QT_APTOS": sortear(pl.int_range(1, 400, eager=True), semente + 1),
+                    # Taxa de comparecimento entre 60% e 95%
+                    "taxa": sortear(pl.int_range(600, 950, eager=True), semente + 2) / 1000,
+                }
+            )
+            .with_columns(
+                pl.lit(ano).alias("ANO_ELEICAO"),
+                pl.col("SG_UF").replace_strict(RegionMapper.REGIAO_MAP).alias("NOME_REGIAO"),
+                (pl.col("QT_APTOS") * pl.col("taxa")).cast(pl.Int64).alias("QT_COMPARECIMENTO"),
+            )
+            .with_columns((pl.col("QT_APTOS") - pl.col("QT_COMPARECIMENTO")).alias("QT_ABSTENCAO"))
+            .select(
+                "ANO_ELEICAO",
+                "SG_UF",
+                "NOME_REGIAO",
+                "QT_APTOS",
+                "QT_COMPARECIMENTO",
+                "QT_ABSTENCAO",
+            )
+        )
+        caminho = caminho_particao_silver(settings, ano)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        df.cast({c: SCHEMA_SILVER[c] for c in df.columns}).sort("SG_UF").write_parquet(caminho)
+
+
+def agregar_tres_passadas(base: pl.LazyFrame) -> tuple[pl.DataFrame, ...]:
+    """Carregamento anterior: cada visão é um plano próprio, com o próprio scan."""
+    nacional = (
+        agregar_participacao(base, ["Ano"])
+        .select(["Ano", *COLUNAS_METRICAS])
+        .rename(COLUNAS_METRICAS)
+        .collect()
+    )
+    regional = (
+        agregar_participacao(base, ["Ano", "NOME_REGIAO"])
+        .select(["Ano", "NOME_REGIAO", *COLUNAS_METRICAS])
+        .rename(COLUNAS_METRICAS)
+        .collect()
+    )
+    mapa = (
+        agregar_participacao(base.filter(pl.col("SG_UF") != UF_EXTERIOR), ["Ano", "SG_UF"])
+        .select("Ano", "SG_UF", pl.col("TAXA_COMPARECIMENTO_PCT").alias("taxa_comparecimento"))
+        .collect()
+    )
+    return nacional, regional, mapa
+
+
+@contextmanager
+def contar_scans() -> Iterator[list[int]]:
+    """Conta os scans Parquet de todos os planos executados no bloco."""
+    contagem = [0]
+    collect = pl.LazyFrame.collect
+    collect_all = pl.collect_all
+
+    def _collect(self: pl.LazyFrame, *args: Any, **kwargs: Any) -> Any:
+        contagem[0] += self.explain().count("Parquet SCAN")
+        return collect(self, *args, **kwargs)
+
+    def _collect_all(lfs: list[pl.LazyFrame], *args: Any, **kwargs: Any) -> Any:
+        contagem[0] += sum(lf.explain().count("Parquet SCAN") for lf in lfs)
+        return collect_all(lfs, *args, **kwargs)
+
+    pl.LazyFrame.collect = _collect  # type: ignore[method-assign]
+    pl.collect_all = _collect_all  # type: ignore[assignment]
+    try:
+        yield contagem
+    finally:
+        pl.LazyFrame.collect = collect  # type: ignore[method-assign]
+        pl.collect_all = collect_all
+
+
+def medir(funcao: Callable[[], object]) -> float:
+    """Mediana do tempo de várias execuções, em ms."""
+    tempos = []
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--linhas", type=int, default=2_000_000, help="Linhas por ano")
+    parser.add_argument("--anos", type=int, default=3, help="Número de anos")
+    args = parser.parse_args()
+
+    anos = [2014 + 2 * i for i in range(args.anos)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = Settings(project_root=Path(tmp))
+        gerar_silver(settings, anos, args.linhas)
+        print(f"Silver sintética: {args.anos} ano(s) × {args.linhas:,} linhas\n")
+
+        variantes: dict[str, Callable[[], object]] = {
+            "três passadas": lambda: agregar_tres_passadas(scan_base_uf(anos, settings)),
+            "agregação única": lambda: agregar_dashboard(scan_base_uf(anos, settings)),
+        }
+
+        resultados = {}
+        for nome, funcao in variantes.items():
+            with contar_scans() as scans:
+                funcao()
+            # Um scan por partição a cada leitura da base
+            resultados[nome] = (scans[0] // len(anos), medir(funcao))
+
+        print(f"{'variante':<18}{'leituras':>10}{'mediana (ms)':>16}")
+        for nome, (leituras, ms) in resultados.items():
+            print(f"{nome:<18}{leituras:>10}{ms:>16.1f}")
+
+        antigo, novo = resultados["três passadas"][1], resultados["agregação única"][1]
+        print(f"\nGanho: {antigo / novo:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Relatório de inicialização do dashboard: tempo de import das dependências e
+tempo da primeira renderização, num processo Python novo (como o contêiner
+após um deploy), mais um rerun já aquecido e a primeira abertura do mapa.
+
+Usa as amostras de data/samples (modo demo, RENDER=1), então roda sem a
+Silver/Gold locais. Com --orcamento-ms, sai com código 1 se a primeira
+renderização passar do orçamento (para checagem em CI).
+
+Uso: uv run python scripts/benchmark_dashboard_startup.py [--orcamento-ms 4000] [--top 12]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+DASHBOARD = (
+    Path(__file__).resolve().parent.parent / "src" / "participacao_eleitoral" / "dashboard.py"
+)
+
+# Executado no processo filho: mede primeira renderização, rerun e aba do mapa
+MEDICAO = f"""
+import json, time
+inicio = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({str(DASHBOARD)!r}, default_timeout=120)
+at.run()
+primeira = time.perf_counter() - inicio
+inicio = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - inicio
+inicio = time.perf_counter()
+at.radio(key="aba").set_value("Mapa Interativo").run()
+mapa = time.perf_counter() - inicio
+print(json.dumps({{
+    "primeira": primeira * 1000,
+    "rerun": rerun * 1000,
+    "mapa": mapa * 1000,
+    "excecoes": [str(e.value) for e in at.exception],
+}}))
+"""
+
+
+def medir(top: int) -> tuple[dict[str, float], list[tuple[str, float]]]:
+    """Roda a medição num processo novo; retorna tempos e os imports mais caros."""
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", MEDICAO],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "RENDER": "1"},
+        check=True,
+    )
+    tempos = json.loads(resultado.stdout.strip().splitlines()[-1])
+    if tempos.pop("excecoes"):
+        raise RuntimeError("O dashboard levantou exceção durante a medição")
+
+    # Linhas "import time: self [us] | cumulative | pacote"; só os imports de
+    # primeiro nível (sem indentação), que somam os submódulos
+    imports: list[tuple[str, float]] = []
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        _, cumulativo, nome = linha.removeprefix("import time:").split("|")
+        if not nome.startswith("  "):
+            imports.append((nome.strip(), int(cumulativo) / 1000))
+
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return tempos, imports[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--orcamento-ms", type=float, default=None, help="Máximo da primeira renderização"
+    )
+    parser.add_argument("--top", type=int, default=12, help="Imports listados")
+    args = parser.parse_args()
+
+    tempos, imports = medir(args.top)
+
+    print(f"{'import (cumulativo)':<48}{'ms':>10}")
+    for nome, ms in imports:
+        print(f"{nome:<48}{ms:>10.1f}")
+
+    print(f"\n{'etapa':<48}{'ms':>10}")
+    print(f"{'primeira renderização (processo novo)':<48}{tempos['primeira']:>10.1f}")
+    print(f"{'rerun aquecido':<48}{tempos['rerun']:>10.1f}")
+    print(f"{'primeira abertura do mapa':<48}{tempos['mapa']:>10.1f}")
+
+    if args.orcamento_ms is not None:
+        dentro = tempos["primeira"] <= args.orcamento_ms
+        print(f"\nOrçamento de {args.orcamento_ms:.0f} ms: {'OK' if dentro else 'EXCEDIDO'}")
+        if not dentro:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
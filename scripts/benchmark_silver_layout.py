@@ -0,0 +1,192 @@
+"""
+Compara o layout Silver antigo (todas as colunas bronze, taxas Float64, textos Utf8)
+com o layout compacto do SCHEMA_SILVER: tamanho em disco, memória e tempo dos
+scans que o dashboard executa.
+
+Uso: uv run python scripts/benchmark_silver_layout.py [--linhas 2000000]
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+from participacao_eleitoral.silver.transformer import BronzeToSilverTransformer
+from participacao_eleitoral.utils.logger import ModernLogger
+
+UFS = list(RegionMapper.REGIAO_MAP)
+GENEROS = ["MASCULINO", "FEMININO", "NÃO INFORMADO"]
+FAIXAS = [f"{i} a {i + 4} anos" for i in range(20, 95, 5)]
+ESCOLARIDADES = [
+    "ANALFABETO",
+    "LÊ E ESCREVE",
+    "ENSINO FUNDAMENTAL INCOMPLETO",
+    "ENSINO MÉDIO COMPLETO",
+    "SUPERIOR COMPLETO",
+]
+REPETICOES = 5
+
+
+def gerar_bronze(linhas: int, seed: int = 42) -> pl.DataFrame:
+    """Gera um bronze sintético com a largura e a cardinalidade do arquivo de perfil do TSE."""
+
+    def sortear(valores: list[str] | pl.Series, semente: int) -> pl.Series:
+        return pl.Series(valores).sample(linhas, with_replacement=True, seed=semente)
+
+    df = (
+        pl.DataFrame(
+            {
+                "NR_TURNO": sortear(pl.int_range(1, 3, eager=True), seed),
+                "SG_UF": sortear(UFS, seed + 1),
+                "CD_MUNICIPIO": sortear(pl.int_range(1, 5570, eager=True), seed + 2),
+                "NR_ZONA": sortear(pl.int_range(1, 400, eager=True), seed + 3),
+                "DS_GENERO": sortear(GENEROS, seed + 4),
+                "DS_FAIXA_ETARIA": sortear(FAIXAS, seed + 5),
+                "DS_GRAU_ESCOLARIDADE": sortear(ESCOLARIDADES, seed + 6),
+                "QT_APTOS": sortear(pl.int_range(1, 400, eager=True), seed + 7),
+                # Taxa de comparecimento entre 60% e 95%
+                "taxa": sortear(pl.int_range(600, 950, eager=True), seed + 8) / 1000,
+            }
+        )
+        .with_columns(
+            pl.lit("29/04/2025").alias("DT_GERACAO"),
+            pl.lit("22:31:40").alias("HH_GERACAO"),
+            pl.lit(2022, dtype=pl.Int32).alias("ANO_ELEICAO"),
+            pl.col("NR_TURNO").cast(pl.Int8),
+            pl.col("CD_MUNICIPIO").cast(pl.Int32),
+            ("MUNICIPIO " + pl.col("CD_MUNICIPIO").cast(pl.String)).alias("NM_MUNICIPIO"),
+            pl.col("NR_ZONA").cast(pl.Int32),
+            (pl.col("QT_APTOS") * pl.col("taxa")).cast(pl.Int64).alias("QT_COMPARECIMENTO"),
+        )
+        .with_columns((pl.col("QT_APTOS") - pl.col("QT_COMPARECIMENTO")).alias("QT_ABSTENCAO"))
+        .select(
+            "DT_GERACAO",
+            "HH_GERACAO",
+            "ANO_ELEICAO",
+            "NR_TURNO",
+            "SG_UF",
+            "CD_MUNICIPIO",
+            "NM_MUNICIPIO",
+            "NR_ZONA",
+            "DS_GENERO",
+            "DS_FAIXA_ETARIA",
+            "DS_GRAU_ESCOLARIDADE",
+            "QT_APTOS",
+            "QT_COMPARECIMENTO",
+            "QT_ABSTENCAO",
+        )
+    )
+
+    # Contagens acessórias que o layout antigo carregava até a Silver
+    extras = [
+        "QT_COMPARECIMENTO_DEFICIENCIA",
+        "QT_ABSTENCAO_DEFICIENCIA",
+        "QT_COMPARECIMENTO_TTE",
+        "QT_ABSTENCAO_TTE",
+        "QT_COMPAREC_FACULTATIVO",
+        "QT_ABST_FACULTATIVO",
+        "QT_COMPAREC_OBRIGATORIO",
+        "QT_ABST_OBRIGATORIO",
+    ]
+    return df.with_columns([pl.lit(0, dtype=pl.Int64).alias(c) for c in extras]).with_columns(
+        pl.lit("2026-01-16T16:54:52").alias("_metadata_ingestion_timestamp"),
+        pl.lit("tse:comparecimento_abstencao:2022").alias("_metadata_source"),
+    )
+
+
+def escrever_layout_antigo(bronze: pl.DataFrame, destino: Path) -> None:
+    """Reproduz a escrita Silver anterior ao SCHEMA_SILVER (todas as colunas, Float64, Utf8)."""
+    bronze.with_columns(
+        ((pl.col("QT_COMPARECIMENTO") / pl.col("QT_APTOS")) * 100).alias("TAXA_COMPARECIMENTO_PCT"),
+        ((pl.col("QT_ABSTENCAO") / pl.col("QT_APTOS")) * 100).alias("TAXA_ABSTENCAO_PCT"),
+        pl.col("SG_UF")
+        .replace_strict(RegionMapper.REGIAO_MAP, default="Desconhecido")
+        .alias("NOME_REGIAO"),
+    ).write_parquet(
+        destino,
+        compression="zstd",
+        compression_level=3,
+        statistics=True,
+        row_group_size=100_000,
+    )
+
+
+def consultas_dashboard(path: Path) -> list[pl.LazyFrame]:
+    """As três agregações que o dashboard faz sobre a Silver."""
+    lf = pl.scan_parquet(path)
+    metricas = [
+        pl.col("QT_COMPARECIMENTO").sum(),
+        pl.col("QT_ABSTENCAO").sum(),
+        pl.col("TAXA_COMPARECIMENTO_PCT").mean(),
+    ]
+    return [
+        lf.group_by("ANO_ELEICAO").agg(metricas),
+        lf.group_by("ANO_ELEICAO", "NOME_REGIAO").agg(metricas),
+        lf.filter(pl.col("SG_UF") != "ZZ")
+        .group_by("ANO_ELEICAO", "SG_UF")
+        .agg(pl.col("TAXA_COMPARECIMENTO_PCT").mean()),
+    ]
+
+
+def cronometrar(funcao: Callable[[], object]) -> float:
+    """Menor tempo (segundos) entre algumas repetições."""
+    tempos = []
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def medir(path: Path) -> dict[str, float]:
+    def scan() -> None:
+        for consulta in consultas_dashboard(path):
+            consulta.collect()
+
+    return {
+        "disco_mb": path.stat().st_size / 1024**2,
+        "memoria_mb": pl.read_parquet(path).estimated_size("mb"),
+        "scan_dashboard_ms": cronometrar(scan) * 1000,
+        "leitura_completa_ms": cronometrar(lambda: pl.read_parquet(path)) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--linhas", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        bronze_path = tmp_dir / "bronze.parquet"
+        antigo_path = tmp_dir / "silver_antigo.parquet"
+        novo_path = tmp_dir / "silver_compacto.parquet"
+
+        bronze = gerar_bronze(args.linhas)
+        bronze.write_parquet(bronze_path)
+
+        escrever_layout_antigo(bronze, antigo_path)
+        BronzeToSilverTransformer(logger=ModernLogger(level="WARNING")).transform(
+            bronze_parquet_path=bronze_path,
+            silver_parquet_path=novo_path,
+            region_mapper=RegionMapper(),
+            schema=SCHEMA_SILVER,
+        )
+
+        antigo = medir(antigo_path)
+        novo = medir(novo_path)
+
+    print(f"Silver com {args.linhas:,} linhas de perfil\n")
+    print(f"{'métrica':<22}{'antigo':>12}{'compacto':>12}{'razão':>9}")
+    for chave in antigo:
+        razao = antigo[chave] / novo[chave] if novo[chave] else float("inf")
+        print(f"{chave:<22}{antigo[chave]:>12.1f}{novo[chave]:>12.1f}{razao:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
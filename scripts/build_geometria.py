@@ -0,0 +1,110 @@
+"""
+Gera a geometria simplificada dos estados empacotada com o dashboard
+(src/participacao_eleitoral/assets/brasil_uf.topo.json) e mede o ganho:
+tamanho do arquivo, payload do mapa enviado ao navegador e tempo de montagem
+da figura, antes (GeoJSON completo) e depois (TopoJSON simplificado).
+
+Fronteiras compartilhadas são simplificadas uma única vez (utils.topologia),
+então estados vizinhos continuam encaixados.
+
+Uso: uv run python scripts/build_geometria.py [--fonte URL|arquivo] [--tolerancia 0.01]
+"""
+
+import argparse
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import plotly.express as px  # type: ignore
+
+from participacao_eleitoral.dashboard_data import (
+    ARQUIVO_GEOMETRIA_UF,
+    OBJETO_GEOMETRIA_UF,
+)
+from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.utils.topologia import simplificar_topologia, topojson_para_geojson
+
+FONTE_PADRAO = "https://raw.githubusercontent.com/codeforamerica/click_that_hood/master/public/data/brazil-states.geojson"
+PACOTE = Path(__file__).resolve().parent.parent / "src" / "participacao_eleitoral"
+
+# Propriedades mantidas: a sigla é a chave do mapa (featureidkey)
+PROPRIEDADES = ["sigla", "name"]
+
+
+def carregar_fonte(fonte: str) -> dict[str, Any]:
+    if fonte.startswith(("http://", "https://")):
+        resposta = httpx.get(fonte, timeout=60, follow_redirects=True)
+        resposta.raise_for_status()
+        return resposta.json()  # type: ignore[no-any-return]
+    return json.loads(Path(fonte).read_text(encoding="utf-8"))  # type: ignore[no-any-return]
+
+
+def medir_mapa(geojson: dict[str, Any]) -> tuple[int, float]:
+    """Payload (bytes do JSON da figura) e tempo de montagem/serialização do mapa."""
+    ufs = [uf for uf in RegionMapper.REGIAO_MAP if uf != "ZZ"]
+    dados = {"Estado (UF)": ufs, "Taxa": [70 + i % 10 for i in range(len(ufs))]}
+
+    inicio = time.perf_counter()
+    fig = px.choropleth(
+        dados,
+        geojson=geojson,
+        locations="Estado (UF)",
+        featureidkey="properties.sigla",
+        color="Taxa",
+    )
+    fig.update_geos(fitbounds="locations", visible=False)
+    payload = fig.to_json()
+    return len(payload.encode()), (time.perf_counter() - inicio) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fonte", default=FONTE_PADRAO, help="URL ou caminho do GeoJSON")
+    parser.add_argument(
+        "--tolerancia", type=float, default=0.01, help="Tolerância da simplificação, em graus"
+    )
+    parser.add_argument("--quantizacao", type=int, default=100_000, help="Grade de quantização")
+    parser.add_argument("--saida", type=Path, default=PACOTE / ARQUIVO_GEOMETRIA_UF)
+    args = parser.parse_args()
+
+    original = carregar_fonte(args.fonte)
+
+    for feicao in original["features"]:
+        feicao["properties"] = {
+            chave: feicao["properties"][chave]
+            for chave in PROPRIEDADES
+            if chave in feicao["properties"]
+        }
+
+    topologia = simplificar_topologia(
+        original,
+        tolerancia=args.tolerancia,
+        quantizacao=args.quantizacao,
+        objeto=OBJETO_GEOMETRIA_UF,
+    )
+    conteudo = json.dumps(topologia, separators=(",", ":"))
+    args.saida.parent.mkdir(parents=True, exist_ok=True)
+    args.saida.write_text(conteudo, encoding="utf-8")
+
+    bruto = json.dumps(original).encode()
+    simplificado = topojson_para_geojson(topologia, OBJETO_GEOMETRIA_UF)
+
+    print(f"Geometria gravada em {args.saida}\n")
+    print(f"{'':<28}{'antes':>14}{'depois':>14}")
+    print(f"{'arquivo (bytes)':<28}{len(bruto):>14,}{len(conteudo):>14,}")
+    print(
+        f"{'arquivo gzip (bytes)':<28}"
+        f"{len(gzip.compress(bruto)):>14,}{len(gzip.compress(conteudo.encode())):>14,}"
+    )
+
+    payload_antes, ms_antes = medir_mapa(original)
+    payload_depois, ms_depois = medir_mapa(simplificado)
+    print(f"{'payload do mapa (bytes)':<28}{payload_antes:>14,}{payload_depois:>14,}")
+    print(f"{'montagem do mapa (ms)':<28}{ms_antes:>14.1f}{ms_depois:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
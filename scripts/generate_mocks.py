@@ -1,32 +1,133 @@
+"""
+Gera as amostras do modo demo (Render) a partir da Silver local.
+
+As amostras formam uma Lakehouse mínima com raiz em data/samples (mesmo
+layout da Silver: data/silver/<dataset>/year=YYYY/data.parquet), lida pelos
+mesmos leitores da produção: o dashboard só troca o project_root. São
+Parquet tipados pelo SCHEMA_SILVER, só com as colunas que o dashboard lê
+(as demais entram como nulos tipados na leitura, ver scan_silver).
+
+A amostra de cada ano é estratificada por UF × turno: alocação
+proporcional ao número de linhas do estrato, com um mínimo por estrato,
+então toda UF aparece no mapa e na tabela de municípios. As
+contagens são expandidas pelo peso amostral (linhas do estrato / linhas
+amostradas): totais e taxas nacionais, regionais e por UF estimam os da
+Silver completa, mesmo com UFs pequenas sobre-representadas.
+
+Uso: uv run python scripts/generate_mocks.py [--linhas 6000] [--minimo 40] [--seed 42]
+"""
+
+import argparse
 from pathlib import Path
+
 import polars as pl
 
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.silver.reader import (
+    CONTAGENS,
+    caminho_particao_silver,
+    listar_particoes_silver,
+    scan_silver,
+)
+from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+
 ANOS = [2014, 2016, 2018, 2020, 2022, 2024]
-NUM_LINHAS = 100
-SILVER_DIR = Path("data/silver/comparecimento_abstencao")
-OUTPUT_DIR = Path("data/samples")
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+DESTINO = Path(__file__).resolve().parent.parent / "data" / "samples"
 
+ESTRATOS = ["SG_UF", "NR_TURNO"]
 
-def extrair_mock_silver(ano: int) -> pl.DataFrame:
-    parquet_path = SILVER_DIR / f"year={ano}" / "data.parquet"
-    if not parquet_path.exists():
-        raise FileNotFoundError(f"Arquivo silver não encontrado: {parquet_path}")
+# Toda amostra cobre as 27 UFs (votos no exterior, ZZ, só em eleições gerais)
+UFS = set(RegionMapper.REGIAO_MAP) - {"ZZ"}
 
-    df = pl.read_parquet(parquet_path)
-    # Amostrar 100 linhas aleatórias
-    if len(df) < NUM_LINHAS:
-        return df  # Se menos que 100, usar tudo
-    return df.sample(n=NUM_LINHAS, seed=42)  # Seed para consistência
+# Colunas lidas pelo dashboard: visões por UF e tabela de municípios
+COLUNAS = ["NR_TURNO", "SG_UF", "NOME_REGIAO", "CD_MUNICIPIO", "NM_MUNICIPIO", *CONTAGENS]
 
 
-if __name__ == "__main__":
+def amostra_estratificada(df: pl.DataFrame, linhas: int, minimo: int, seed: int) -> pl.DataFrame:
+    """Amostra estratificada por UF × turno, com contagens expandidas pelo peso."""
+    estratos = df.group_by(ESTRATOS).agg(pl.len().alias("_populacao"))
+    total = estratos["_populacao"].sum()
+
+    alocacao = estratos.with_columns(
+        pl.max_horizontal((pl.col("_populacao") * linhas / total).round(), pl.lit(minimo))
+        .clip(upper_bound=pl.col("_populacao"))
+        .cast(pl.Int64)
+        .alias("_amostra")
+    )
+    peso = pl.col("_populacao") / pl.col("_amostra")
+
+    aptos = (pl.col("QT_APTOS") * peso).round()
+    comparecimento = (pl.col("QT_COMPARECIMENTO") * peso).round()
+
+    return (
+        df.with_columns(pl.int_range(pl.len()).shuffle(seed=seed).over(ESTRATOS).alias("_ordem"))
+        .join(alocacao, on=ESTRATOS)
+        .filter(pl.col("_ordem") < pl.col("_amostra"))
+        .with_columns(
+            aptos.alias("QT_APTOS"),
+            comparecimento.alias("QT_COMPARECIMENTO"),
+            (aptos - comparecimento).alias("QT_ABSTENCAO"),
+        )
+        .select(COLUNAS)
+    )
+
+
+def validar_amostra(ano: int, amostra: pl.DataFrame) -> None:
+    """
+    Recusa amostras que o modo demo não pode publicar: sem alguma das 27 UFs
+    (Silver incompleta) ou com nomes corrompidos (U+FFFD, Silver ingerida
+    antes da leitura em Latin-1: refaça `data ingest` e `data transform`).
+    """
+    faltando = UFS - set(amostra["SG_UF"].cast(pl.String).unique())
+    if faltando:
+        raise SystemExit(f"{ano}: UFs ausentes da Silver: {', '.join(sorted(faltando))}")
+
+    corrompidos = amostra.filter(pl.col("NM_MUNICIPIO").str.contains("\ufffd", literal=True))
+    if not corrompidos.is_empty():
+        exemplos = ", ".join(corrompidos["NM_MUNICIPIO"].unique().sort().head(3))
+        raise SystemExit(f"{ano}: nomes com encoding corrompido na Silver ({exemplos}...)")
+
+
+def gerar_amostra(ano: int, origem: Settings, destino: Settings, args: argparse.Namespace) -> Path:
+    df = scan_silver(anos=[ano], columns=COLUNAS, settings=origem).collect()
+    amostra = (
+        amostra_estratificada(df, args.linhas, args.minimo, args.seed)
+        .cast({c: SCHEMA_SILVER[c] for c in COLUNAS})
+        # Mesma ordenação da Silver: filtros por UF pulam row groups
+        .sort(["SG_UF", "CD_MUNICIPIO"])
+    )
+    validar_amostra(ano, amostra)
+
+    caminho = caminho_particao_silver(destino, ano)
+    with escrita_atomica(caminho) as tmp_path:
+        amostra.write_parquet(tmp_path, compression="zstd", statistics=True)
+
+    print(
+        f"{ano}: {len(amostra):,} de {len(df):,} linhas, "
+        f"{amostra['SG_UF'].n_unique()} UFs -> {caminho.relative_to(DESTINO)}"
+    )
+    return caminho
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--linhas", type=int, default=6000, help="Tamanho alvo por ano")
+    parser.add_argument("--minimo", type=int, default=40, help="Mínimo de linhas por estrato")
+    parser.add_argument("--seed", type=int, default=42, help="Semente (amostras reprodutíveis)")
+    args = parser.parse_args()
+
+    DESTINO.mkdir(parents=True, exist_ok=True)
+    origem = Settings()
+    destino = Settings(project_root=DESTINO)
+
     for ano in ANOS:
-        try:
-            df = extrair_mock_silver(ano)
-            output_path = OUTPUT_DIR / f"{ano}_mock.csv"
-            df.write_csv(output_path)
-            print(f"Extraído: {output_path} ({len(df)} linhas)")
-        except Exception as e:
-            print(f"Erro em {ano}: {e}")
-    print("Mocks extraídos com sucesso!")
+        if ano not in listar_particoes_silver(origem, [ano]):
+            print(f"{ano}: partição Silver não encontrada")
+            continue
+        gerar_amostra(ano, origem, destino, args)
+
+
+if __name__ == "__main__":
+    main()
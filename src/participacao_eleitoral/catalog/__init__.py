@@ -0,0 +1,14 @@
+"""Catálogo DuckDB sobre as camadas do Lakehouse"""
+
+from .catalog import LakehouseCatalog, planejar_visoes
+from .query_cache import QueryResultCache, normalizar_sql
+from .results import CatalogRefreshResult, QueryResult
+
+__all__ = [
+    "LakehouseCatalog",
+    "CatalogRefreshResult",
+    "QueryResultCache",
+    "QueryResult",
+    "normalizar_sql",
+    "planejar_visoes",
+]
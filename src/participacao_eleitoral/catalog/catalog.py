@@ -0,0 +1,339 @@
+"""Catálogo DuckDB com visões sobre as camadas Bronze, Silver e Gold"""
+
+import hashlib
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import duckdb
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento import ComparecimentoContrato
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.core.contracts.comparecimento_silver import (
+    ComparecimentoSilverContrato,
+)
+from participacao_eleitoral.gold.reader import caminho_historico_gold, listar_particoes_gold
+from participacao_eleitoral.silver.reader import COLUNA_PARTICAO, listar_particoes_silver
+from participacao_eleitoral.utils.logger import ModernLogger
+
+from .results import CatalogRefreshResult
+
+
+@dataclass(frozen=True)
+class VisaoCatalogo:
+    """Definição de uma visão: arquivos Parquet de origem e sua assinatura."""
+
+    nome: str
+    camada: str
+    arquivos: tuple[Path, ...]
+    particionada: bool = True
+
+    @property
+    def assinatura(self) -> str:
+        """Muda quando um arquivo entra, sai ou é reescrito (tamanho + mtime)."""
+        digest = hashlib.sha256()
+        for arquivo in self.arquivos:
+            stat = arquivo.stat()
+            digest.update(f"{arquivo}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()[:16]
+
+    def fonte_sql(self) -> str:
+        """read_parquet sobre a lista explícita de arquivos (sem glob na consulta)."""
+        arquivos = ", ".join(_literal_sql(str(a)) for a in self.arquivos)
+        opcoes = "union_by_name = true"
+        if self.particionada:
+            opcoes += (
+                f", hive_partitioning = true, hive_types = {{'{COLUNA_PARTICAO}': 'SMALLINT'}}"
+            )
+        return f"read_parquet([{arquivos}], {opcoes})"
+
+
+def planejar_visoes(settings: Settings) -> dict[str, VisaoCatalogo]:
+    """
+    Lista as visões que o catálogo deve ter, a partir das partições existentes.
+
+    Só nomes de diretório e stat de arquivos: nenhum Parquet é aberto aqui.
+    Visões sem nenhum arquivo ficam de fora (read_parquet de lista vazia falha).
+    """
+    visoes: list[VisaoCatalogo] = []
+
+    bronze_dir = settings.bronze_dir / ComparecimentoContrato.DATASET_NAME
+    bronze = sorted(bronze_dir.glob(f"{COLUNA_PARTICAO}=*/data.parquet"))
+    visoes.append(VisaoCatalogo("bronze_comparecimento", "bronze", tuple(bronze)))
+
+    silver = listar_particoes_silver(settings)
+    visoes.append(VisaoCatalogo("silver_comparecimento", "silver", tuple(silver.values())))
+
+    tabelas_anuais = [
+        *ComparecimentoGoldContrato.GRAOS,
+        ComparecimentoGoldContrato.TABELA_CUBO,
+        ComparecimentoGoldContrato.TABELA_SKETCH,
+        ComparecimentoGoldContrato.TABELA_OUTLIERS,
+        *(
+            f"delta_{tipo}_{tabela}"
+            for tipo in ComparecimentoGoldContrato.TIPOS_DELTA
+            for tabela in ComparecimentoGoldContrato.TABELAS_DELTA
+        ),
+    ]
+    for tabela in tabelas_anuais:
+        arquivos = listar_particoes_gold(settings, tabela)
+        visoes.append(VisaoCatalogo(f"gold_{tabela}", "gold", tuple(arquivos.values())))
+
+    for grao in ComparecimentoGoldContrato.GRAOS_HISTORICO:
+        historico = caminho_historico_gold(settings, grao)
+        visoes.append(
+            VisaoCatalogo(
+                f"gold_historico_{grao}",
+                "gold",
+                (historico,) if historico.exists() else (),
+                particionada=False,
+            )
+        )
+
+    return {visao.nome: visao for visao in visoes if visao.arquivos}
+
+
+class LakehouseCatalog:
+    """
+    Banco DuckDB único com visões sobre as camadas do Lakehouse.
+
+    Cada visão é um read_parquet sobre a lista explícita de partições, com
+    particionamento Hive (coluna year), então consultas com filtro em year
+    leem só as partições pedidas. Consumidores (CLI, dashboard, notebooks)
+    usam SQL sem montar caminhos nem refazer globs.
+
+    - Atualização automática: conexao() compara a assinatura das partições
+      (tamanho + mtime) com a registrada e recria só as visões que mudaram
+    - Conexões de leitura: um banco read-only por processo; cada conexao()
+      entrega um cursor de um pool, compartilhando o cache de metadados
+      Parquet (rodapés lidos uma vez) e o paralelismo do DuckDB
+
+    DuckDB não abre o mesmo arquivo em modo escrita e leitura ao mesmo tempo:
+    a atualização fecha o pool (só quando nenhum cursor está em uso) e, se
+    outro processo estiver lendo o catálogo, é adiada para a próxima conexão.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        logger: ModernLogger,
+        db_path: Path | None = None,
+    ):
+        self.settings = settings
+        self.logger = logger
+
+        self.db_path = db_path or self.settings.data_dir / "_catalog.duckdb"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._leitura: duckdb.DuckDBPyConnection | None = None
+        self._pool: list[duckdb.DuckDBPyConnection] = []
+        self._em_uso = 0
+        self._trava = threading.Lock()
+
+    @contextmanager
+    def conexao(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Cursor read-only sobre o catálogo atualizado, devolvido ao pool no fim.
+
+        Uso:
+            with catalogo.conexao() as conn:
+                conn.sql("SELECT * FROM gold_uf WHERE year = 2022").pl()
+        """
+        with self._trava:
+            self._garantir_atualizado()
+            assert self._leitura is not None
+            cursor = self._pool.pop() if self._pool else self._leitura.cursor()
+            self._em_uso += 1
+
+        try:
+            yield cursor
+        finally:
+            with self._trava:
+                self._em_uso -= 1
+                self._pool.append(cursor)
+
+    def atualizar(self) -> CatalogRefreshResult:
+        """Recria as visões cujas partições mudaram (fecha o pool de leitura)."""
+        with self._trava:
+            if self._em_uso:
+                raise RuntimeError("Catálogo com conexões em uso; atualize depois de liberá-las")
+
+            self._fechar_leitura()
+            return self._atualizar(planejar_visoes(self.settings))
+
+    def visoes(self) -> dict[str, str]:
+        """Visões registradas e a camada de cada uma."""
+        with self.conexao() as conn:
+            rows = conn.execute(
+                "SELECT visao, camada FROM catalogo_visoes ORDER BY visao"
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        """Fecha o pool e a conexão de leitura."""
+        with self._trava:
+            self._fechar_leitura()
+
+    def __enter__(self) -> "LakehouseCatalog":
+        """Suporta uso com contexto 'with'."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Fecha conexões ao sair do contexto."""
+        self.close()
+
+    def _garantir_atualizado(self) -> None:
+        """Abre o banco de leitura, atualizando antes as visões desatualizadas."""
+        planejadas = planejar_visoes(self.settings)
+        esperado = {nome: visao.assinatura for nome, visao in planejadas.items()}
+
+        if self._leitura is None and self.db_path.exists():
+            self._abrir_leitura()
+
+        if self._leitura is not None and self._registradas(self._leitura) == esperado:
+            return
+
+        if self._em_uso:
+            # Cursores abertos seguem nas visões antigas; a próxima conexão atualiza
+            self.logger.warning("catalogo_desatualizado_em_uso", em_uso=self._em_uso)
+            return
+
+        self._fechar_leitura()
+        try:
+            self._atualizar(planejadas)
+        except duckdb.IOException as exc:
+            # Outro processo com o catálogo aberto: segue com as visões atuais
+            if not self.db_path.exists():
+                raise
+            self.logger.warning("catalogo_atualizacao_adiada", erro=str(exc))
+
+        self._abrir_leitura()
+
+    def _atualizar(self, planejadas: dict[str, VisaoCatalogo]) -> CatalogRefreshResult:
+        conn = duckdb.connect(str(self.db_path))
+        try:
+            self._create_tables(conn)
+            registradas = self._registradas(conn)
+
+            recriadas: list[str] = []
+            mantidas: list[str] = []
+
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                for nome, visao in planejadas.items():
+                    assinatura = visao.assinatura
+                    if registradas.get(nome) == assinatura:
+                        mantidas.append(nome)
+                        continue
+
+                    conn.execute(f"CREATE OR REPLACE VIEW {nome} AS {self._sql_visao(conn, visao)}")
+                    conn.execute(
+                        """
+                        INSERT INTO catalogo_visoes
+                            (visao, camada, arquivos, assinatura, atualizado_em)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT (visao) DO UPDATE SET
+                            camada = EXCLUDED.camada,
+                            arquivos = EXCLUDED.arquivos,
+                            assinatura = EXCLUDED.assinatura,
+                            atualizado_em = EXCLUDED.atualizado_em
+                        """,
+                        (nome, visao.camada, len(visao.arquivos), assinatura, datetime.now(UTC)),
+                    )
+                    recriadas.append(nome)
+
+                removidas = sorted(registradas.keys() - planejadas.keys())
+                for nome in removidas:
+                    conn.execute(f"DROP VIEW IF EXISTS {nome}")
+                    conn.execute("DELETE FROM catalogo_visoes WHERE visao = ?", (nome,))
+
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+        self.logger.info(
+            "catalogo_atualizado",
+            recriadas=len(recriadas),
+            removidas=len(removidas),
+            mantidas=len(mantidas),
+        )
+        return CatalogRefreshResult(recriadas=recriadas, removidas=removidas, mantidas=mantidas)
+
+    def _sql_visao(self, conn: duckdb.DuckDBPyConnection, visao: VisaoCatalogo) -> str:
+        """
+        SELECT da visão.
+
+        Na Silver, as taxas são sempre derivadas das contagens (colunas
+        virtuais, como em silver.reader), estejam ou não materializadas.
+        """
+        fonte = visao.fonte_sql()
+        if visao.camada != "silver":
+            return f"SELECT * FROM {fonte}"
+
+        colunas = {row[0] for row in conn.execute(f"DESCRIBE SELECT * FROM {fonte}").fetchall()}
+        taxas = ComparecimentoSilverContrato.CAMPOS_DERIVADOS
+        denominador = ComparecimentoSilverContrato.DENOMINADOR_TAXAS
+
+        materializadas = [taxa for taxa in taxas if taxa in colunas]
+        exclude = f" EXCLUDE ({', '.join(materializadas)})" if materializadas else ""
+        derivadas = ", ".join(
+            f"{numerador}::DOUBLE / NULLIF({denominador}, 0) * 100 AS {taxa}"
+            for taxa, numerador in taxas.items()
+        )
+        return f"SELECT *{exclude}, {derivadas} FROM {fonte}"
+
+    @staticmethod
+    def _create_tables(conn: duckdb.DuckDBPyConnection) -> None:
+        """Inicializa o registro de visões se não existir."""
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS catalogo_visoes (
+                visao TEXT PRIMARY KEY,
+                camada TEXT NOT NULL,
+                arquivos INTEGER NOT NULL,
+                assinatura TEXT NOT NULL,
+                atualizado_em TIMESTAMP NOT NULL
+            )
+            """
+        )
+
+    @staticmethod
+    def _registradas(conn: duckdb.DuckDBPyConnection) -> dict[str, str]:
+        existe = conn.execute(
+            "SELECT count(*) FROM duckdb_tables() WHERE table_name = 'catalogo_visoes'"
+        ).fetchone()
+        if not existe or not existe[0]:
+            return {}
+        return dict(conn.execute("SELECT visao, assinatura FROM catalogo_visoes").fetchall())
+
+    def _abrir_leitura(self) -> None:
+        self._leitura = duckdb.connect(str(self.db_path), read_only=True)
+        # Cache de rodapés Parquet compartilhado por todos os cursores do pool
+        self._leitura.execute("SET GLOBAL parquet_metadata_cache = true")
+
+    def _fechar_leitura(self) -> None:
+        for cursor in self._pool:
+            cursor.close()
+        self._pool.clear()
+
+        if self._leitura is not None:
+            self._leitura.close()
+            self._leitura = None
+
+
+def _literal_sql(texto: str) -> str:
+    return "'" + texto.replace("'", "''") + "'"
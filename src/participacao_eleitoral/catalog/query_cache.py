@@ -0,0 +1,152 @@
+"""Execução de SQL sobre o catálogo com cache de resultados em disco"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.logger import ModernLogger
+
+from .catalog import LakehouseCatalog, planejar_visoes
+from .results import QueryResult
+
+# Literais ('...', "...") são preservados; comentários (-- e /* */) viram
+# espaço; o resto tem espaços colapsados
+_PADRAO_TOKENS = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|\s+|[^'\"\s/-]+|[-/]",
+    re.DOTALL,
+)
+
+# Funções cujo resultado muda sem a Lakehouse mudar: nunca entram no cache
+_PADRAO_VOLATIL = re.compile(
+    r"\b(random|uuid|gen_random_uuid|now|current_date|current_time|current_timestamp|"
+    r"today|get_current_time|read_parquet|read_csv|read_json|glob)\b",
+    re.IGNORECASE,
+)
+
+
+def normalizar_sql(sql: str) -> str:
+    """
+    Forma canônica de uma consulta para a chave do cache.
+
+    Remove comentários (de linha e de bloco) e ';' finais e colapsa espaços
+    fora de literais. Não muda maiúsculas: literais e identificadores entre
+    aspas diferenciam caixa. Só serve de chave: a consulta executada é a
+    original.
+    """
+    partes: list[str] = []
+    for token in _PADRAO_TOKENS.findall(sql):
+        if token.startswith(("--", "/*")) or token.isspace():
+            if partes and partes[-1] != " ":
+                partes.append(" ")
+        else:
+            partes.append(token)
+
+    return "".join(partes).strip().rstrip(";").strip()
+
+
+def visoes_referenciadas(sql: str, visoes: set[str]) -> list[str]:
+    """Visões do catálogo citadas na consulta (por nome, fora de literais)."""
+    sem_literais = re.sub(r"'(?:[^']|'')*'", "''", sql)
+    palavras = {p.lower() for p in re.findall(r"[A-Za-z_][A-Za-z0-9_]*", sem_literais)}
+    return sorted(visao for visao in visoes if visao.lower() in palavras)
+
+
+class QueryResultCache:
+    """
+    Executa SQL no catálogo e guarda o resultado em Parquet.
+
+    A chave é o SQL normalizado + a assinatura de cada visão que ele lê
+    (tamanho e mtime das partições, ver LakehouseCatalog). Quando uma
+    partição é reescrita, a assinatura muda, a chave muda e a consulta roda
+    de novo; entradas antigas saem pelo limite de tamanho (LRU por uso).
+
+    Não entram no cache consultas que não leem nenhuma visão ou que usam
+    funções voláteis (now(), random(), read_parquet direto...), nem as que
+    leem uma visão cuja atualização foi adiada (catálogo desatualizado).
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        logger: ModernLogger,
+        catalog: LakehouseCatalog | None = None,
+        cache_dir: Path | None = None,
+    ):
+        self.settings = settings
+        self.logger = logger
+        self.catalog = catalog or LakehouseCatalog(settings=settings, logger=logger)
+        self.cache_dir = cache_dir or self.settings.data_dir / "_query_cache"
+        self.max_bytes = self.settings.query_cache_max_mb * 1024**2
+
+    def executar(self, sql: str, usar_cache: bool = True) -> QueryResult:
+        """Executa a consulta (ou lê do cache) e retorna o resultado em Polars."""
+        normalizado = normalizar_sql(sql)
+
+        with self.catalog.conexao() as conn:
+            registradas: dict[str, str] = dict(
+                conn.execute("SELECT visao, assinatura FROM catalogo_visoes").fetchall()
+            )
+            lidas = visoes_referenciadas(normalizado, set(registradas))
+
+            # Chave pelas assinaturas recalculadas das partições: se conexao()
+            # adiou a atualização (catálogo aberto por outro processo), a
+            # registrada é a de arquivos que já foram reescritos
+            planejadas = planejar_visoes(self.settings)
+            assinaturas = {v: planejadas[v].assinatura for v in lidas if v in planejadas}
+            desatualizadas = [v for v in lidas if registradas[v] != assinaturas.get(v)]
+            if desatualizadas:
+                self.logger.debug("query_cache_ignorado", visoes_desatualizadas=desatualizadas)
+
+            chave = self._chave(normalizado, assinaturas)
+            cacheavel = usar_cache and self.max_bytes > 0 and chave is not None
+            cacheavel = cacheavel and not desatualizadas
+
+            if cacheavel and chave is not None:
+                arquivo = self.cache_dir / f"{chave}.parquet"
+                if arquivo.exists():
+                    # mtime marca o último uso (ordem de despejo)
+                    os.utime(arquivo)
+                    self.logger.debug("query_cache_hit", chave=chave, visoes=lidas)
+                    return QueryResult(df=pl.read_parquet(arquivo), do_cache=True, visoes=lidas)
+
+            df = conn.sql(sql).pl()
+
+        if cacheavel and chave is not None:
+            with escrita_atomica(self.cache_dir / f"{chave}.parquet") as tmp_path:
+                df.write_parquet(tmp_path, compression="zstd")
+            self._despejar()
+
+        return QueryResult(df=df, do_cache=False, visoes=lidas)
+
+    def limpar(self) -> int:
+        """Remove todas as entradas do cache. Retorna quantas foram removidas."""
+        entradas = list(self.cache_dir.glob("*.parquet")) if self.cache_dir.exists() else []
+        for arquivo in entradas:
+            arquivo.unlink(missing_ok=True)
+        return len(entradas)
+
+    def _chave(self, normalizado: str, assinaturas: dict[str, str]) -> str | None:
+        if not assinaturas or _PADRAO_VOLATIL.search(normalizado):
+            return None
+
+        digest = hashlib.sha256(normalizado.encode())
+        for visao, assinatura in sorted(assinaturas.items()):
+            digest.update(f"\n{visao}:{assinatura}".encode())
+        return digest.hexdigest()[:32]
+
+    def _despejar(self) -> None:
+        """Remove as entradas usadas há mais tempo até caber no limite."""
+        entradas = sorted(self.cache_dir.glob("*.parquet"), key=lambda a: a.stat().st_mtime_ns)
+        total = sum(a.stat().st_size for a in entradas)
+
+        for arquivo in entradas:
+            if total <= self.max_bytes:
+                break
+            total -= arquivo.stat().st_size
+            arquivo.unlink(missing_ok=True)
+            self.logger.debug("query_cache_despejo", arquivo=arquivo.name)
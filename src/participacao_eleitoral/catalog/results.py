@@ -0,0 +1,36 @@
+"""Objetos de resultado do catálogo do Lakehouse"""
+
+from dataclasses import dataclass
+
+import polars as pl
+
+
+@dataclass(frozen=True)
+class CatalogRefreshResult:
+    """
+    Resultado de uma atualização das visões do catálogo.
+
+    Este objeto:
+    - é imutável (frozen=True)
+    - lista as visões recriadas (partições mudaram), removidas (sem arquivos)
+      e mantidas (assinatura igual à registrada)
+    """
+
+    recriadas: list[str]
+    removidas: list[str]
+    mantidas: list[str]
+
+
+@dataclass(frozen=True)
+class QueryResult:
+    """
+    Resultado de uma consulta SQL sobre o catálogo.
+
+    Este objeto:
+    - é imutável (frozen=True)
+    - indica se veio do cache e quais visões a consulta lê
+    """
+
+    df: pl.DataFrame
+    do_cache: bool
+    visoes: list[str]
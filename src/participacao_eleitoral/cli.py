@@ -1,19 +1,49 @@
+import re
+from pathlib import Path
+
+import polars as pl
 import typer
 
+# Catálogo DuckDB e cache de consultas
+from participacao_eleitoral.catalog.query_cache import QueryResultCache
+
 # Configurações globais (paths, timeouts, etc.)
 from participacao_eleitoral.config import Settings
 
+# Agregados Gold
+from participacao_eleitoral.gold.outliers import consultar_outliers
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+from participacao_eleitoral.gold.reader import diretorio_gold, diretorio_particao_gold
+
 # Pipeline orquestrador
 from participacao_eleitoral.ingestion.pipeline import IngestionPipeline
+from participacao_eleitoral.silver.reader import (
+    COLUNA_PARTICAO,
+    caminho_particao_silver,
+    diretorio_silver,
+)
 from participacao_eleitoral.silver.region_mapper import RegionMapper
 from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
 
 # Transformação Silver (importados no topo para evitar erros de importação)
 from participacao_eleitoral.silver.transformer import BronzeToSilverTransformer
 
+# Escrita concorrente segura (trava por partição)
+from participacao_eleitoral.utils.escrita_atomica import trava_particao
+
 # Logger estruturado
 from participacao_eleitoral.utils.logger import ModernLogger
 
+# Manifesto de partições (estatísticas para poda sem abrir Parquet)
+from participacao_eleitoral.utils.manifesto import (
+    carregar_manifesto,
+    registrar_no_manifesto,
+    verificar_manifesto,
+)
+
+# Snapshots de partição (rollback e vacuum)
+from participacao_eleitoral.utils.snapshots import PartitionSnapshots
+
 app = typer.Typer(help="CLI para ingestão de dados eleitorais do TSE")
 
 data_app = typer.Typer(help="Comandos para manipulação de dados")
@@ -25,6 +55,17 @@ app.add_typer(validate_app, name="validate")
 utils_app = typer.Typer(help="Comandos utilitários")
 app.add_typer(utils_app, name="utils")
 
+analytics_app = typer.Typer(help="Consultas analíticas sobre a camada Gold")
+app.add_typer(analytics_app, name="analytics")
+
+snapshots_app = typer.Typer(help="Versões das partições Silver e Gold (rollback, vacuum)")
+app.add_typer(snapshots_app, name="snapshots")
+
+CAMADAS_SNAPSHOT = ("silver", "gold")
+
+# Diretórios de partição (year=YYYY); outros nomes na raiz da camada são ignorados
+_PADRAO_PARTICAO = re.compile(rf"^{COLUNA_PARTICAO}=(\d{{4}})$")
+
 
 @data_app.command()
 def ingest(
@@ -113,7 +154,7 @@ def transform(
 
     # Criar caminhos
     bronze_path = settings.bronze_dir / "comparecimento_abstencao" / f"year={ano}" / "data.parquet"
-    silver_path = settings.silver_dir / "comparecimento_abstencao" / f"year={ano}" / "data.parquet"
+    silver_path = caminho_particao_silver(settings, ano)
 
     try:
         logger.info(
@@ -136,16 +177,25 @@ def transform(
             raise typer.Exit(code=1)
 
         # Criar transformador e executar
-        transformer = BronzeToSilverTransformer(logger=logger)
+        transformer = BronzeToSilverTransformer(
+            logger=logger,
+            materializar_taxas=settings.silver_materializar_taxas,
+        )
 
         # Criar mapper de região e schema
         region_mapper = RegionMapper()
-        result = transformer.transform(
-            bronze_path,
-            silver_path,
-            region_mapper=region_mapper,
-            schema=SCHEMA_SILVER,
-        )
+
+        # Trava a partição: outro worker pode estar escrevendo o mesmo ano
+        with trava_particao(silver_path.parent):
+            result = transformer.transform(
+                bronze_path,
+                silver_path,
+                region_mapper=region_mapper,
+                schema=SCHEMA_SILVER,
+            )
+            PartitionSnapshots(silver_path.parent).commit([silver_path.name], "transform")
+
+        registrar_no_manifesto(diretorio_silver(settings), [silver_path])
 
         logger.success(
             "cli_transform_concluida",
@@ -171,6 +221,74 @@ def transform(
         raise typer.Exit(code=1) from exc
 
 
+@data_app.command()
+def aggregate(
+    ano: int | None = typer.Argument(None, help="Ano da eleição (padrão: todos)"),
+    log_level: str = typer.Option("INFO", help="Nível de log"),
+) -> None:
+    """
+    Atualiza os agregados Gold (grãos, cubo demográfico e séries multi-ano).
+
+    Incremental: só os anos cuja Silver mudou desde a última agregação são
+    recalculados; as séries multi-ano são refeitas a partir da própria Gold.
+
+    Args:
+        ano: Ano da eleição para agregar. Sem ano, verifica todos os anos da Silver.
+        log_level: Nível de log (DEBUG, INFO, WARNING, ERROR).
+
+    Raises:
+        typer.Exit: Se ocorrer erro durante a agregação.
+
+    Examples:
+        >>> uv run participacao-eleitoral data aggregate
+        >>> uv run participacao-eleitoral data aggregate 2022
+    """
+
+    settings = Settings()
+    settings.setup_dirs()
+
+    sufixo = ano if ano is not None else "todos"
+    log_file_path = settings.logs_dir / f"aggregate_gold_{sufixo}.log"
+    logger = ModernLogger(level=log_level, log_file=str(log_file_path))
+
+    pipeline = GoldAggregationPipeline(
+        settings=settings,
+        logger=logger,
+    )
+
+    try:
+        logger.info(
+            "cli_aggregate_iniciada",
+            ano=sufixo,
+        )
+
+        plano = pipeline.refresh([ano] if ano is not None else None)
+
+        logger.success(
+            "cli_aggregate_concluida",
+            ano=sufixo,
+            reconstruidos=plano.reconstruir,
+        )
+
+        typer.echo(f"Agregação Gold concluída. Anos recalculados: {plano.reconstruir or 'nenhum'}")
+        if plano.em_dia:
+            typer.echo(f"Anos já em dia: {plano.em_dia}")
+
+    except Exception as exc:
+        logger.error(
+            "cli_aggregate_falhou",
+            ano=sufixo,
+            erro=str(exc),
+            tipo_erro=type(exc).__name__,
+        )
+
+        typer.echo(
+            f"Erro ao agregar ({sufixo}): {exc}",
+            err=True,
+        )
+        raise typer.Exit(code=1) from exc
+
+
 @data_app.command()
 def list_years(
     log_level: str = typer.Option(
@@ -194,6 +312,243 @@ def list_years(
         raise typer.Exit(code=1) from exc
 
 
+FORMATOS_QUERY = ("table", "csv", "parquet")
+
+
+@app.command()
+def query(
+    sql: str = typer.Argument(..., help="Consulta SQL sobre as visões do catálogo"),
+    formato: str = typer.Option("table", "--format", "-f", help="Saída: table, csv ou parquet"),
+    saida: str | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Arquivo de saída (obrigatório para parquet; csv vai para stdout sem ele)",
+    ),
+    max_linhas: int = typer.Option(50, help="Linhas exibidas no formato table"),
+    sem_cache: bool = typer.Option(False, "--no-cache", help="Ignora o cache de resultados"),
+    log_level: str = typer.Option("WARNING", help="Nível de log"),
+) -> None:
+    """
+    Executa SQL (DuckDB) sobre as camadas Bronze, Silver e Gold.
+
+    Visões: bronze_comparecimento, silver_comparecimento, gold_<tabela>
+    (ex.: gold_uf, gold_cubo_demografico), gold_delta_<tipo>_<tabela> e
+    gold_historico_<grao>. Filtros em `year` leem só as partições pedidas.
+
+    Resultados ficam em cache até alguma partição lida mudar.
+
+    Examples:
+        >>> uv run participacao-eleitoral query "SELECT * FROM gold_uf WHERE year = 2022"
+        >>> uv run participacao-eleitoral query "SELECT ..." --format csv -o resultado.csv
+    """
+    if formato not in FORMATOS_QUERY:
+        typer.echo(f"Formato inválido: {formato}. Use {', '.join(FORMATOS_QUERY)}", err=True)
+        raise typer.Exit(code=2)
+    if formato == "parquet" and saida is None:
+        typer.echo("O formato parquet exige --output", err=True)
+        raise typer.Exit(code=2)
+
+    settings = Settings()
+    logger = ModernLogger(level=log_level)
+
+    try:
+        result = QueryResultCache(settings=settings, logger=logger).executar(
+            sql, usar_cache=not sem_cache
+        )
+    except Exception as exc:
+        logger.error("cli_query_falhou", erro=str(exc), tipo_erro=type(exc).__name__)
+        typer.echo(f"Erro na consulta: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    df = result.df
+    if formato == "parquet" and saida is not None:
+        df.write_parquet(Path(saida))
+    elif formato == "csv":
+        if saida is not None:
+            df.write_csv(Path(saida))
+        else:
+            typer.echo(df.write_csv(), nl=False)
+    else:
+        with pl.Config(tbl_rows=max_linhas, tbl_cols=-1, tbl_hide_dataframe_shape=True):
+            typer.echo(df)
+
+    origem = "cache" if result.do_cache else "executada"
+    destino = f" → {saida}" if saida is not None else ""
+    typer.echo(f"{len(df)} linha(s) ({origem}){destino}", err=True)
+
+
+@analytics_app.command()
+def outliers(
+    ano: int = typer.Option(..., "--ano", help="Ano da eleição (ex: 2022)"),
+    uf: str | None = typer.Option(None, "--uf", help="Sigla da UF (padrão: todas)"),
+    nivel: str = typer.Option("municipio", help="Unidade ranqueada (municipio, zona)"),
+    taxa: str = typer.Option(
+        "TAXA_COMPARECIMENTO_PCT",
+        help="Taxa (TAXA_COMPARECIMENTO_PCT, TAXA_ABSTENCAO_PCT)",
+    ),
+    turno: int | None = typer.Option(None, help="Turno (padrão: todos)"),
+    todos: bool = typer.Option(
+        False,
+        "--todos",
+        help="Inclui os extremos (maiores/menores) que não são outliers",
+    ),
+    log_level: str = typer.Option("INFO", help="Nível de log"),
+) -> None:
+    """
+    Lista municípios ou zonas com taxas atípicas dentro da UF.
+
+    Lê apenas o índice de outliers pré-calculado na Gold (z-score robusto por
+    mediana/MAD da UF); rode `data aggregate` antes.
+
+    Examples:
+        >>> uv run participacao-eleitoral analytics outliers --ano 2022 --uf BA
+        >>> uv run participacao-eleitoral analytics outliers --ano 2022 --nivel zona --todos
+    """
+    logger = ModernLogger(level=log_level)
+
+    try:
+        df = consultar_outliers(
+            ano,
+            [uf.upper()] if uf else None,
+            nivel=nivel,
+            taxa=taxa,
+            turno=turno,
+            apenas_outliers=not todos,
+        )
+    except Exception as exc:
+        logger.error("cli_outliers_falhou", ano=ano, erro=str(exc), tipo_erro=type(exc).__name__)
+        typer.echo(f"Erro ao consultar outliers ({ano}): {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    if df.is_empty():
+        typer.echo(f"Nenhum resultado no índice de outliers de {ano}.")
+        return
+
+    colunas = ["NR_TURNO", "SG_UF", "NM_MUNICIPIO" if nivel == "municipio" else "NR_ZONA"]
+    with pl.Config(tbl_rows=-1, tbl_hide_dataframe_shape=True):
+        typer.echo(
+            df.select([*colunas, "QT_APTOS", "VALOR", "MEDIANA_UF", "Z_ROBUSTO", "OUTLIER"]).rename(
+                {"VALOR": taxa}
+            )
+        )
+
+
+def _validar_camada_snapshot(camada: str) -> None:
+    """Sai com código 2 se a camada não tem snapshots."""
+    if camada not in CAMADAS_SNAPSHOT:
+        typer.echo(f"Camada {camada} não versionada. Use {', '.join(CAMADAS_SNAPSHOT)}", err=True)
+        raise typer.Exit(code=2)
+
+
+def _particao_snapshot(settings: Settings, camada: str, ano: int) -> PartitionSnapshots:
+    """Snapshots da partição de um ano na camada pedida."""
+    _validar_camada_snapshot(camada)
+
+    if camada == "silver":
+        return PartitionSnapshots(caminho_particao_silver(settings, ano).parent)
+    return PartitionSnapshots(diretorio_particao_gold(settings, ano))
+
+
+@snapshots_app.command("list")
+def snapshots_list(
+    camada: str = typer.Argument(..., help="Camada: silver ou gold"),
+    ano: int = typer.Argument(..., help="Ano da partição"),
+) -> None:
+    """Lista os snapshots de uma partição (* = atual, 📌 = fixado)."""
+    log = _particao_snapshot(Settings(), camada, ano).carregar()
+    if not log["snapshots"]:
+        typer.echo(f"Partição {camada} {ano} sem snapshots.")
+        return
+
+    for snapshot in log["snapshots"]:
+        marca = "*" if snapshot["versao"] == log["atual"] else " "
+        fixo = " 📌" if snapshot["versao"] in log["fixados"] else ""
+        typer.echo(
+            f"{marca} v{snapshot['versao']:<4} {snapshot['criado_em'][:19]}  "
+            f"{snapshot['operacao']:<10} {len(snapshot['arquivos'])} arquivo(s){fixo}"
+        )
+
+
+@snapshots_app.command()
+def rollback(
+    camada: str = typer.Argument(..., help="Camada: silver ou gold"),
+    ano: int = typer.Argument(..., help="Ano da partição"),
+    versao: int = typer.Argument(..., help="Versão de destino (ver `snapshots list`)"),
+) -> None:
+    """
+    Volta a partição a um snapshot anterior, sem reprocessar nada.
+
+    Depois de um rollback da Silver, `data aggregate` reagrega o ano na Gold
+    (a impressão digital da partição muda).
+    """
+    settings = Settings()
+    snapshots = _particao_snapshot(settings, camada, ano)
+
+    try:
+        with trava_particao(snapshots.diretorio):
+            alvo = snapshots.rollback(versao)
+    except ValueError as exc:
+        typer.echo(f"Erro: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    raiz = diretorio_silver(settings) if camada == "silver" else diretorio_gold(settings)
+    registrar_no_manifesto(raiz, [snapshots.diretorio / nome for nome in alvo["arquivos"]])
+
+    typer.echo(f"Partição {camada} {ano} em v{versao} ({len(alvo['arquivos'])} arquivo(s)).")
+
+
+@snapshots_app.command()
+def pin(
+    camada: str = typer.Argument(..., help="Camada: silver ou gold"),
+    ano: int = typer.Argument(..., help="Ano da partição"),
+    versao: int = typer.Argument(..., help="Versão a proteger do vacuum"),
+    remover: bool = typer.Option(False, "--remover", help="Libera a versão"),
+) -> None:
+    """Fixa (ou libera) um snapshot: versões fixadas nunca são removidas pelo vacuum."""
+    snapshots = _particao_snapshot(Settings(), camada, ano)
+
+    try:
+        with trava_particao(snapshots.diretorio):
+            snapshots.fixar(versao, fixo=not remover)
+    except ValueError as exc:
+        typer.echo(f"Erro: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"v{versao} de {camada} {ano} {'liberada' if remover else 'fixada'}.")
+
+
+@snapshots_app.command()
+def vacuum(
+    camada: str = typer.Argument(..., help="Camada: silver ou gold"),
+    reter: int | None = typer.Option(
+        None, min=1, help="Versões recentes mantidas por partição (padrão: snapshots_reter)"
+    ),
+) -> None:
+    """Remove versões antigas sem referência de todas as partições da camada."""
+    _validar_camada_snapshot(camada)
+    settings = Settings()
+    if reter is None:
+        reter = settings.snapshots_reter
+
+    raiz = diretorio_silver(settings) if camada == "silver" else diretorio_gold(settings)
+    anos = sorted(
+        int(match.group(1))
+        for diretorio in (raiz.iterdir() if raiz.exists() else [])
+        if diretorio.is_dir() and (match := _PADRAO_PARTICAO.match(diretorio.name))
+    )
+
+    removidos = 0
+    for ano in anos:
+        snapshots = _particao_snapshot(settings, camada, ano)
+        with trava_particao(snapshots.diretorio):
+            removidos += len(snapshots.vacuum(reter))
+
+    typer.echo(
+        f"Vacuum {camada}: {removidos} arquivo(s) de versão removido(s) em {len(anos)} partição(ões)."
+    )
+
+
 @validate_app.command()
 def schema(
     dataset: str = typer.Argument(..., help="Dataset para validar (comparecimento)"),
@@ -218,6 +573,33 @@ def schema(
         raise typer.Exit(code=1) from exc
 
 
+@validate_app.command()
+def manifest(
+    camada: str = typer.Argument(..., help="Camada: bronze, silver ou gold"),
+) -> None:
+    """Confere os checksums do manifesto (_manifest.json) de uma camada."""
+    settings = Settings()
+    raizes = {
+        "bronze": settings.bronze_dir / "comparecimento_abstencao",
+        "silver": diretorio_silver(settings),
+        "gold": diretorio_gold(settings),
+    }
+    if camada not in raizes:
+        typer.echo(f"Camada {camada} não reconhecida. Use {', '.join(raizes)}", err=True)
+        raise typer.Exit(code=2)
+
+    raiz = raizes[camada]
+    arquivos = carregar_manifesto(raiz)["arquivos"]
+    divergentes = verificar_manifesto(raiz)
+
+    for caminho, motivo in divergentes.items():
+        typer.echo(f"  {caminho}: {motivo}", err=True)
+
+    typer.echo(f"Manifesto {camada}: {len(arquivos)} arquivo(s), {len(divergentes)} divergente(s)")
+    if divergentes:
+        raise typer.Exit(code=1)
+
+
 @utils_app.command()
 def version() -> None:
     """Mostra versão da CLI."""
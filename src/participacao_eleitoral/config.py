@@ -64,6 +64,29 @@ class Settings(BaseSettings):
     log_format: Literal["json", "console"] = "console"
     show_timestamps: bool = False
 
+    # ===== SILVER =====
+    # Taxas são deriváveis das contagens na leitura (silver.reader);
+    # desligar reduz o tamanho dos arquivos Silver
+    silver_materializar_taxas: bool = True
+
+    # ===== SNAPSHOTS =====
+    # Versões mais recentes de cada partição preservadas pelo vacuum
+    snapshots_reter: int = Field(default=3, ge=1)
+
+    # ===== CONSULTAS =====
+    # Limite do cache de resultados do comando `query` (0 desliga o cache)
+    query_cache_max_mb: int = Field(default=256, ge=0)
+
+    # ===== DASHBOARD =====
+    # Onde ficam os agregados em cache: "memoria" (por processo) ou "disco"
+    # (Arrow IPC mapeado em memória, compartilhado pelos processos do host)
+    dashboard_cache_backend: Literal["memoria", "disco"] = "memoria"
+    # Limite do cache de agregados, em memória ou em disco (0 desliga o cache)
+    dashboard_cache_max_mb: int = Field(default=64, ge=0)
+    # Diretório do backend "disco" (padrão: data/_dashboard_cache); apontar
+    # réplicas em contêineres para o mesmo volume faz uma aquecer a outra
+    dashboard_cache_dir: Path | None = None
+
     # ===== PERFORMANCE =====
     chunk_size: int = Field(default=8192, ge=1024)
     polars_threads: int = Field(
@@ -1,9 +1,11 @@
 from .comparecimento import ComparecimentoContrato
+from .comparecimento_gold import ComparecimentoGoldContrato
 from .comparecimento_silver import ComparecimentoSilverContrato
 from .ingestao_metadata import IngestaoMetadataDict
 
 __all__ = [
     "ComparecimentoContrato",
+    "ComparecimentoGoldContrato",
     "ComparecimentoSilverContrato",
     "IngestaoMetadataDict",
 ]
@@ -0,0 +1,131 @@
+"""Contratos da camada Gold"""
+
+from typing import ClassVar
+
+
+class ComparecimentoGoldContrato:
+    """
+    CONTRATO LÓGICO dos agregados de comparecimento na camada Gold.
+
+    Diferenças da camada Silver:
+    - Uma tabela por grão (município, zona, UF, região, nacional)
+    - Contagens somadas no grão, por ano e turno
+    - Taxas ponderadas pelos aptos (soma/soma), nunca média de taxas
+    - Tabelas pequenas: leitura em kilobytes, não gigabytes
+    """
+
+    DATASET_NAME: ClassVar[str] = "comparecimento_abstencao_gold"
+
+    # Dimensões presentes em todos os grãos
+    DIMENSOES_BASE: ClassVar[list[str]] = ["ANO_ELEICAO", "NR_TURNO"]
+
+    # Grão → dimensões geográficas (além das DIMENSOES_BASE).
+    #
+    # Zonas eleitorais são numeradas dentro da UF e podem atravessar
+    # municípios, por isso o grão de zona é (UF, zona) e não (município, zona).
+    GRAOS: ClassVar[dict[str, list[str]]] = {
+        "municipio": ["NOME_REGIAO", "SG_UF", "CD_MUNICIPIO", "NM_MUNICIPIO"],
+        "zona": ["NOME_REGIAO", "SG_UF", "NR_ZONA"],
+        "uf": ["NOME_REGIAO", "SG_UF"],
+        "regiao": ["NOME_REGIAO"],
+        "nacional": [],
+    }
+
+    # Séries multi-ano reconstruídas a partir das tabelas anuais da Gold
+    # (nunca da Silver): gold/<dataset>/historico_<grao>.parquet
+    GRAOS_HISTORICO: ClassVar[list[str]] = ["nacional", "regiao", "uf"]
+
+    # Medidas de todos os grãos
+    MEDIDAS: ClassVar[list[str]] = [
+        "QT_APTOS",
+        "QT_COMPARECIMENTO",
+        "QT_ABSTENCAO",
+        "TAXA_COMPARECIMENTO_PCT",
+        "TAXA_ABSTENCAO_PCT",
+    ]
+
+    # ===== CUBO DEMOGRÁFICO =====
+
+    # Tabela do cubo, ao lado dos grãos em cada partição year=YYYY
+    TABELA_CUBO: ClassVar[str] = "cubo_demografico"
+
+    # Dimensões de perfil do eleitor agregadas no cubo
+    DIMENSOES_DEMOGRAFICAS: ClassVar[list[str]] = [
+        "DS_GENERO",
+        "DS_ESTADO_CIVIL",
+        "DS_FAIXA_ETARIA",
+        "DS_GRAU_ESCOLARIDADE",
+        "DS_COR_RACA",
+        "DS_QUILOMBOLA",
+        "DS_INTERPRETE_LIBRAS",
+        "DS_IDENTIDADE_GENERO",
+    ]
+
+    # Níveis geográficos do cubo → dimensões agrupadas
+    NIVEIS_GEOGRAFICOS: ClassVar[dict[str, list[str]]] = {
+        "uf": ["NOME_REGIAO", "SG_UF"],
+        "regiao": ["NOME_REGIAO"],
+        "nacional": [],
+    }
+
+    # Combinações materializadas: até 2 dimensões demográficas por nível.
+    #
+    # O CUBE completo das 8 dimensões (~1M combinações por UF) é maior que a
+    # própria Silver; cruzamentos de 3+ dimensões ficam para consultas na Silver.
+    MAX_DIMENSOES_CUBO: ClassVar[int] = 2
+
+    # ===== TABELAS DE VARIAÇÃO =====
+
+    # Eleições gerais (2014, 2018, 2022) e municipais (2016, 2020, 2024)
+    # se alternam a cada 2 anos: a comparação ano a ano é com a eleição
+    # anterior do MESMO tipo, 4 anos antes
+    INTERVALO_ELEICOES: ClassVar[int] = 4
+
+    # Tabelas da Gold com variação pré-calculada
+    TABELAS_DELTA: ClassVar[list[str]] = [
+        "municipio",
+        "zona",
+        "uf",
+        "regiao",
+        "nacional",
+        "cubo_demografico",
+    ]
+
+    # Tipos de variação → coluna que identifica a base da comparação
+    # - ano: mesma chave, eleição de INTERVALO_ELEICOES anos antes
+    # - turno: mesma chave e ano, 2º turno contra o 1º
+    TIPOS_DELTA: ClassVar[dict[str, str]] = {
+        "ano": "ANO_BASE",
+        "turno": "NR_TURNO_BASE",
+    }
+
+    # Colunas descritivas: acompanham a chave, mas não fazem parte do join
+    # (o nome de um município pode mudar de grafia entre eleições)
+    COLUNAS_DESCRITIVAS: ClassVar[list[str]] = ["NM_MUNICIPIO"]
+
+    # ===== SKETCHES DE DISTRIBUIÇÃO =====
+
+    # Histogramas esparsos de taxas por ano × turno × UF, somáveis entre
+    # partições: mediana/percentis e distribuições sem reler a Silver
+    TABELA_SKETCH: ClassVar[str] = "sketch_taxas"
+
+    # Unidades cujas taxas entram nos sketches
+    NIVEIS_SKETCH: ClassVar[list[str]] = ["municipio", "zona"]
+
+    # Largura do bin em pontos percentuais: taxas vivem em [0, 100], então
+    # 1000 bins dão erro absoluto máximo de meio bin (0,05 p.p.) em qualquer percentil
+    RESOLUCAO_SKETCH_PP: ClassVar[float] = 0.1
+
+    # ===== ÍNDICE DE OUTLIERS =====
+
+    # Triagem de anomalias por ano: extremos e z-scores robustos por UF
+    TABELA_OUTLIERS: ClassVar[str] = "indice_outliers"
+
+    # Unidades ranqueadas dentro de cada UF × turno
+    NIVEIS_OUTLIERS: ClassVar[list[str]] = ["municipio", "zona"]
+
+    # Maiores e menores taxas guardadas por UF × turno × nível × taxa
+    TOP_N_OUTLIERS: ClassVar[int] = 10
+
+    # |z robusto| a partir do qual a unidade é outlier (Iglewicz & Hoaglin)
+    LIMIAR_Z_ROBUSTO: ClassVar[float] = 3.5
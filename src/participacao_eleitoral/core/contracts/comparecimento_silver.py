@@ -37,6 +37,36 @@ class ComparecimentoSilverContrato:
     # Todos os campos obrigatórios
     CAMPOS_OBRIGATORIOS: ClassVar[list[str]] = CAMPOS_BRONZE + CAMPOS_SILVER
 
+    # Taxas são função exata das contagens: taxa = numerador / QT_APTOS * 100.
+    #
+    # Por isso podem ser derivadas na leitura (colunas virtuais) em qualquer
+    # grão, somando as contagens antes de dividir. Média de taxas por linha
+    # de perfil NÃO é a taxa do agregado.
+    DENOMINADOR_TAXAS: ClassVar[str] = "QT_APTOS"
+    CAMPOS_DERIVADOS: ClassVar[dict[str, str]] = {
+        "TAXA_COMPARECIMENTO_PCT": "QT_COMPARECIMENTO",
+        "TAXA_ABSTENCAO_PCT": "QT_ABSTENCAO",
+    }
+
+    # Dimensões mantidas quando existem no bronze do ano.
+    #
+    # O arquivo de perfil do TSE mudou ao longo dos anos (quilombola,
+    # intérprete de LIBRAS, identidade de gênero e idioma indígena só
+    # aparecem em eleições recentes), então a ausência NÃO invalida o ano.
+    CAMPOS_OPCIONAIS: ClassVar[list[str]] = [
+        "NR_TURNO",
+        "NR_ZONA",
+        "DS_GENERO",
+        "DS_ESTADO_CIVIL",
+        "DS_FAIXA_ETARIA",
+        "DS_GRAU_ESCOLARIDADE",
+        "DS_COR_RACA",
+        "DS_QUILOMBOLA",
+        "DS_INTERPRETE_LIBRAS",
+        "DS_IDENTIDADE_GENERO",
+        "DS_IDIOMA_INDIGENA",
+    ]
+
     # Validações específicas Silver
     CAMPOS_VALIDACOES: ClassVar[dict[str, dict[str, Any]]] = {
         "TAXA_COMPARECIMENTO_PCT": {
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import ClassVar
 
 from .contracts.comparecimento import ComparecimentoContrato
+from .contracts.comparecimento_gold import ComparecimentoGoldContrato
 from .contracts.comparecimento_silver import ComparecimentoSilverContrato
 
 
@@ -28,6 +29,7 @@ class Dataset:
     TIPOS_CONHECIDOS: ClassVar[set[str]] = {
         ComparecimentoContrato.DATASET_NAME,
         ComparecimentoSilverContrato.DATASET_NAME,
+        ComparecimentoGoldContrato.DATASET_NAME,
     }
 
     def __post_init__(self) -> None:
@@ -53,7 +55,7 @@ class Dataset:
             raise ValueError("URL não pode ser vazia")
 
         # Para Bronze: HTTP/HTTPS (datasets externos)
-        # Para Silver: path local (transformação de dados já baixados)
+        # Para Silver/Gold: path local (transformação de dados já baixados)
         is_http = self.url_origem.startswith(("http://", "https://"))
         # Path Windows: C:\ ou Unix: /
         is_windows_path = len(self.url_origem) > 1 and self.url_origem[1] == ":"
@@ -10,20 +10,30 @@ Execução: streamlit run src/participacao_eleitoral/dashboard.py
 from __future__ import annotations
 
 import logging
-from pathlib import Path
-from typing import Any, cast
+import os
+import time
+from typing import Any
 
-import numpy as np
-import pandas as pd
-import plotly.express as px  # type: ignore
 import polars as pl
-import requests
 import streamlit as st
 
-from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.dashboard_data import (
+    CacheAgregados,
+    Visoes,
+    carregar_geometria_uf,
+    carregar_municipios,
+    carregar_visoes,
+    criar_cache,
+    filtrar_visoes,
+    visoes_vazias,
+)
 
 logger = logging.getLogger(__name__)
 
+# Início da execução do script (cada rerun do Streamlit), para o log de tempo
+inicio_execucao = time.perf_counter()
+
 
 # Configuração da página
 st.set_page_config(
@@ -37,9 +47,13 @@ st.set_page_config(
 # Scroll suave para melhorar UX com filtros
 st.markdown("<style>html {scroll-behavior: smooth;}</style>", unsafe_allow_html=True)
 
-# Define project root para resolver caminho correto dos dados
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-DATA_PATH = PROJECT_ROOT / "data" / "silver" / "comparecimento_abstencao"
+# Define project root para resolver caminho correto dos dados (a raiz do
+# repositório, ou PARTICIPACAO_PROJECT_ROOT, ex.: harness de desempenho)
+PROJECT_ROOT = Settings().project_root
+
+# Modo demo (Render): Lakehouse de amostras estratificadas, lida pelos
+# mesmos leitores da Silver/Gold (gerada por scripts/generate_mocks.py)
+DEMO_ROOT = PROJECT_ROOT / "data" / "samples"
 
 # Pasta temp para dados extraídos
 TEMP_DATA_PATH = PROJECT_ROOT / "temp_data"
@@ -75,199 +89,78 @@ UF_NOME_MAP = {
     "TO": "Tocantins",
 }
 
+# Nomes das métricas exibidos em gráficos e tabelas
+ROTULOS_METRICAS = {
+    "taxa_comparecimento": "Taxa de Comparecimento (%)",
+    "comparecimento_total": "Total de Comparecimentos",
+    "abstencao_total": "Total de Abstenções",
+}
 
-# Função para carregar dados reais da Silver layer
-@st.cache_data
-def carregar_dados_reais(
-    anos_selecionados: list[int],
-) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Carrega e agrega dados reais da Silver layer.
-
-    Args:
-        anos_selecionados: Lista de anos eleitorais para carregar dados.
-
-    Returns:
-        Tupla com três DataFrames:
-        - df_nacional: Dados nacionais agregados por ano
-        - df_regional: Dados regionais agregados por ano e região
-        - df_mapa: Dados para mapa agregados por ano e UF
 
-    Raises:
-        Nenhum erro é propagado - problemas são logados e DataFrames vazios retornados.
-    """
-    if not anos_selecionados:
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+# Agregados compartilhados por todas as sessões do processo (e, com o
+# backend "disco", por todos os processos do host)
+@st.cache_resource
+def cache_anual() -> CacheAgregados:
+    """Cache dos agregados (backend e limite: dashboard_cache_backend e _max_mb)."""
+    return criar_cache(Settings(project_root=PROJECT_ROOT))
 
-    # Carregar dados: mocks no Render, dados reais locais
-    import os
 
+def settings_dados() -> Settings:
+    """Lakehouse lida pelo dashboard: amostras no Render, dados reais locais."""
     is_render = (
         os.getenv("RENDER")
         or os.getenv("RENDER_SERVICE_ID")
         or os.getenv("STREAMLIT_SERVER_HEADLESS")
     )
+    return Settings(project_root=DEMO_ROOT if is_render else PROJECT_ROOT)
 
-    if is_render:
-        # Render: carregar mocks leves
-        paths = []
-        for ano in anos_selecionados:
-            caminho = PROJECT_ROOT / "data" / "samples" / f"{ano}_mock.csv"
-            if not caminho.exists():
-                logger.warning(f"Arquivo mock não encontrado para {ano}: {caminho}")
-                continue
-            paths.append((ano, str(caminho)))
-
-        if not paths:
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-
-        try:
-            # Scan mocks
-            scans = [
-                pl.scan_csv(caminho).with_columns(pl.lit(ano).alias("Ano"))
-                for ano, caminho in paths
-            ]
-            df = pl.concat(scans, how="vertical")
-
-            # Agregação nacional por ano
-            nacional = (
-                df.group_by("Ano")
-                .agg(
-                    [
-                        pl.col("QT_COMPARECIMENTO").sum().alias("comparecimento_total"),
-                        pl.col("QT_ABSTENCAO").sum().alias("abstencao_total"),
-                        pl.col("TAXA_COMPARECIMENTO_PCT").mean().alias("taxa_comparecimento"),
-                    ]
-                )
-                .collect()
-            )
 
-            # Agregação regional por ano e região
-            # Agrupa por Ano e NOME_REGIAO para mostrar evolução regional
-            regional = (
-                df.group_by(["Ano", "NOME_REGIAO"])
-                .agg(
-                    [
-                        pl.col("QT_COMPARECIMENTO").sum().alias("comparecimento_total"),
-                        pl.col("QT_ABSTENCAO").sum().alias("abstencao_total"),
-                        pl.col("TAXA_COMPARECIMENTO_PCT").mean().alias("taxa_comparecimento"),
-                    ]
-                )
-                .collect()
-            )
+# Função para carregar dados reais (Gold pré-agregada ou Silver)
+def carregar_dados_reais(anos_selecionados: list[int]) -> Visoes:
+    """Carrega e agrega dados reais (série UF da Gold; Silver se ainda não construída).
 
-            # Dados para mapa por ano e UF (excluindo ZZ)
-            mapa_df = df.filter(pl.col("SG_UF") != "ZZ")
-            mapa = (
-                mapa_df.group_by(["Ano", "SG_UF"])
-                .agg(
-                    [
-                        pl.col("TAXA_COMPARECIMENTO_PCT").mean().alias("taxa_comparecimento"),
-                    ]
-                )
-                .collect()
-            )
+    Args:
+        anos_selecionados: Lista de anos eleitorais para carregar dados.
 
-            # Converter para Pandas
-            df_nacional = nacional.to_pandas()
-            df_regional = regional.to_pandas()
-            df_mapa = mapa.to_pandas()
-        except Exception as e:
-            logger.error(f"Erro ao processar mocks: {e}")
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-    else:
-        # Local: carregar dados reais da silver
-        paths = []
-        for ano in anos_selecionados:
-            caminho = (
-                PROJECT_ROOT
-                / "data"
-                / "silver"
-                / "comparecimento_abstencao"
-                / f"year={ano}"
-                / "data.parquet"
-            )
-            if not caminho.exists():
-                logger.warning(f"Arquivo silver não encontrado para {ano}: {caminho}")
-                continue
-            paths.append((ano, str(caminho)))
-
-        if not paths:
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-
-        try:
-            # Scan parquet silver
-            scans = [
-                pl.scan_parquet(caminho).with_columns(pl.lit(ano).alias("Ano"))
-                for ano, caminho in paths
-            ]
-            df = pl.concat(scans, how="vertical")
-
-            # Agregação nacional por ano
-            nacional = (
-                df.group_by("Ano")
-                .agg(
-                    [
-                        pl.col("QT_COMPARECIMENTO").sum().alias("comparecimento_total"),
-                        pl.col("QT_ABSTENCAO").sum().alias("abstencao_total"),
-                        pl.col("TAXA_COMPARECIMENTO_PCT").mean().alias("taxa_comparecimento"),
-                    ]
-                )
-                .collect()
-            )
+    Returns:
+        Tupla com três DataFrames Polars (vazios e tipados se não houver dados):
+        - df_nacional: Dados nacionais agregados por ano
+        - df_regional: Dados regionais agregados por ano e região
+        - df_mapa: Dados para mapa agregados por ano e UF
 
-            # Agregação regional por ano e região
-            # Agrupa por Ano e NOME_REGIAO para mostrar evolução regional
-            regional = (
-                df.group_by(["Ano", "NOME_REGIAO"])
-                .agg(
-                    [
-                        pl.col("QT_COMPARECIMENTO").sum().alias("comparecimento_total"),
-                        pl.col("QT_ABSTENCAO").sum().alias("abstencao_total"),
-                        pl.col("TAXA_COMPARECIMENTO_PCT").mean().alias("taxa_comparecimento"),
-                    ]
-                )
-                .collect()
-            )
+    Cada ano é agregado uma vez e fica em cache_anual(); a seleção é
+    composta dos anos em cache, então trocar um ano na barra lateral custa
+    no máximo a agregação desse ano.
 
-            # Dados para mapa por ano e UF (excluindo ZZ)
-            mapa_df = df.filter(pl.col("SG_UF") != "ZZ")
-            mapa = (
-                mapa_df.group_by(["Ano", "SG_UF"])
-                .agg(
-                    [
-                        pl.col("TAXA_COMPARECIMENTO_PCT").mean().alias("taxa_comparecimento"),
-                    ]
-                )
-                .collect()
-            )
+    Raises:
+        Nenhum erro é propagado - problemas são logados e DataFrames vazios retornados.
+    """
+    if not anos_selecionados:
+        return visoes_vazias()
 
-            # Converter para Pandas
-            df_nacional = nacional.to_pandas()
-            df_regional = regional.to_pandas()
-            df_mapa = mapa.to_pandas()
-        except Exception as e:
-            logger.error(f"Erro ao processar dados silver: {e}")
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+    try:
+        # Render: amostras; local: agregados da Gold (ou Silver).
+        # Mesmos leitores e plano de agregação nos dois casos
+        visoes = carregar_visoes(anos_selecionados, cache_anual(), settings=settings_dados())
+    except Exception as e:
+        logger.error(f"Erro ao processar dados: {e}")
+        return visoes_vazias()
 
-    # Adicionar coluna região ao df_mapa para filtragem
-    if not df_mapa.empty:
-        df_mapa["regiao"] = df_mapa["SG_UF"].map(RegionMapper.get_regiao)
+    if visoes is None:
+        logger.warning(f"Nenhum dado encontrado para {anos_selecionados}")
+        return visoes_vazias()
 
-    return df_nacional, df_regional, df_mapa
+    return visoes
 
 
-# Função para carregar geojson do Brasil
-@st.cache_data
+# Geometria dos estados empacotada com a aplicação (uma vez por processo)
+@st.cache_resource
 def carregar_geojson() -> dict[str, Any] | None:
-    """Carrega geojson dos estados brasileiros."""
-    url = "https://raw.githubusercontent.com/codeforamerica/click_that_hood/master/public/data/brazil-states.geojson"
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return cast(dict[str, Any], response.json())
-    except requests.RequestException as e:
-        logger.error(f"Erro carregando geojson: {e}")
-        return None
+    """
+    GeoJSON dos estados, decodificado do TopoJSON simplificado empacotado
+    (gerado por scripts/build_geometria.py). Sem rede na renderização.
+    """
+    return carregar_geometria_uf()
 
 
 # Título principal
@@ -299,69 +192,15 @@ regiao_selecionada = st.sidebar.multiselect(
 
 # Carregar dados
 try:
-    data = carregar_dados_reais(Anos_selecionados)
-    df_nacional = data[0]
-    df_regional = data[1]
-    df_mapa = data[2]
+    visoes = carregar_dados_reais(Anos_selecionados)
 except Exception as e:
     st.error(f"Erro ao carregar dados: {e}. Usando dados vazios para demo.")
-    df_nacional = pd.DataFrame()
-    df_regional = pd.DataFrame()
-    df_mapa = pd.DataFrame()
-geojson = carregar_geojson()
-
-# Renomear colunas para nomes consistentes
-if not df_regional.empty:
-    df_regional.rename(columns={"NOME_REGIAO": "Região"}, inplace=True)
-if not df_mapa.empty:
-    df_mapa.rename(columns={"SG_UF": "Estado (UF)"}, inplace=True)
-
-# Renomear colunas para nomes amigáveis
-if not df_nacional.empty:
-    df_nacional.rename(
-        columns={
-            "taxa_comparecimento": "Taxa de Comparecimento (%)",
-            "comparecimento_total": "Total de Comparecimentos",
-            "abstencao_total": "Total de Abstenções",
-        },
-        inplace=True,
-    )
-if not df_regional.empty:
-    df_regional.rename(
-        columns={
-            "taxa_comparecimento": "Taxa de Comparecimento (%)",
-            "comparecimento_total": "Total de Comparecimentos",
-            "abstencao_total": "Total de Abstenções",
-        },
-        inplace=True,
-    )
-if not df_mapa.empty:
-    df_mapa.rename(
-        columns={
-            "taxa_comparecimento": "Taxa de Comparecimento (%)",
-        },
-        inplace=True,
-    )
-
-    # Garantir que a coluna 'Ano' seja tipo int64
-    if "Ano" in df_nacional.columns:
-        df_nacional["Ano"] = df_nacional["Ano"].astype("int64")
-    if "Ano" in df_regional.columns:
-        df_regional["Ano"] = df_regional["Ano"].astype("int64")
-    if "Ano" in df_mapa.columns:
-        df_mapa["Ano"] = df_mapa["Ano"].astype("int64")
+    visoes = visoes_vazias()
 
 # Validação de dados
-required_cols = {"Ano": df_nacional, "Região": df_regional, "Estado (UF)": df_mapa}
-for col, df in required_cols.items():
-    if df.empty:
+for col, df in zip(("Ano", "Região", "Estado (UF)"), visoes, strict=True):
+    if df.is_empty():
         st.warning(f"DataFrame vazio para {col}. Verifique dados Silver.")
-        continue
-    if col not in df.columns:
-        st.warning(
-            f"Coluna '{col}' ausente em DataFrame. Colunas disponíveis: {df.columns.tolist()}"
-        )
-        continue
 
 # Filtro adicional para mapa
 map_year = (
@@ -370,50 +209,28 @@ map_year = (
     else None
 )
 
-# Filtrar dados por seleção
-if df_nacional.empty:
-    df_nacional_filtrado = pd.DataFrame()
-else:
-    mask_nacional = df_nacional["Ano"].isin(Anos_selecionados)
-    df_nacional_filtrado = df_nacional[mask_nacional].copy()
-
-if df_regional.empty:
-    df_regional_filtrado = pd.DataFrame()
-else:
-    mask_regional = df_regional["Ano"].isin(Anos_selecionados)
-    df_regional_filtrado = df_regional[mask_regional].copy()
-
-# Filtrar por regiões selecionadas
-if not df_regional_filtrado.empty:
-    df_regional_filtrado = df_regional_filtrado[
-        df_regional_filtrado["Região"].isin(regiao_selecionada)
-    ]
-
-if df_mapa.empty:
-    df_mapa_filtrado = pd.DataFrame()
-else:
-    df_mapa_filtrado = df_mapa[df_mapa["Ano"] == map_year].copy() if map_year else pd.DataFrame()
-
-# Filtrar mapa por regiões selecionadas
-if not df_mapa_filtrado.empty:
-    df_mapa_filtrado = df_mapa_filtrado[df_mapa_filtrado["regiao"].isin(regiao_selecionada)]
-
-# Resetar índice após filtro
-if not df_nacional_filtrado.empty:
-    df_nacional_filtrado.reset_index(drop=True, inplace=True)
-if not df_regional_filtrado.empty:
-    df_regional_filtrado.reset_index(drop=True, inplace=True)
-if not df_mapa_filtrado.empty:
-    df_mapa_filtrado.reset_index(drop=True, inplace=True)
-
-# Agregar dados regionais por média
-# Tabs
-tab_nacional, tab_mapa, tab_regional, tab_detalhes = st.tabs(
-    ["Visão Nacional", "Mapa Interativo", "Comparação Regional", "Dados Detalhados"]
+# Filtrar dados por seleção (anos, regiões e ano do mapa)
+df_nacional_filtrado, df_regional_filtrado, df_mapa_filtrado = filtrar_visoes(
+    visoes, Anos_selecionados, regiao_selecionada, map_year
 )
 
-with tab_nacional:
-    if df_nacional_filtrado.empty:
+# Renomear colunas para nomes amigáveis (sem copiar os dados)
+df_nacional_filtrado = df_nacional_filtrado.rename(ROTULOS_METRICAS)
+df_regional_filtrado = df_regional_filtrado.rename({"NOME_REGIAO": "Região", **ROTULOS_METRICAS})
+df_mapa_filtrado = df_mapa_filtrado.rename(
+    {"SG_UF": "Estado (UF)", "taxa_comparecimento": "Taxa de Comparecimento (%)"}
+)
+
+# Abas: só a aba ativa é calculada e enviada (st.tabs renderiza todas a cada
+# rerun), então geometria e figuras do mapa só são montadas quando ele é aberto
+ABAS = ["Visão Nacional", "Mapa Interativo", "Comparação Regional", "Dados Detalhados"]
+aba = st.radio("Aba", ABAS, horizontal=True, key="aba", label_visibility="collapsed")
+
+# Plotly é importado só pelas abas que desenham gráficos
+if aba == "Visão Nacional":
+    import plotly.express as px  # type: ignore
+
+    if df_nacional_filtrado.is_empty():
         st.warning("Nenhum dado nacional disponível para os anos selecionados.")
     else:
         st.header("Métricas Nacionais")
@@ -425,24 +242,17 @@ with tab_nacional:
 
         # Para métricas, usar o último ano selecionado
         ano_para_metricas = max(Anos_selecionados) if Anos_selecionados else None
-        df_metricas = pd.DataFrame()
+        df_metricas = pl.DataFrame()
         fig = None
         if ano_para_metricas:
-            df_metricas = df_nacional_filtrado[
-                df_nacional_filtrado["Ano"] == ano_para_metricas
-            ].copy()
+            df_metricas = df_nacional_filtrado.filter(pl.col("Ano") == ano_para_metricas)
 
-            if not df_metricas.empty:
+            if not df_metricas.is_empty():
                 # KPIs
-                try:
-                    if isinstance(df_metricas, pd.DataFrame) and len(df_metricas) > 0:
-                        taxa_atual = df_metricas["Taxa de Comparecimento (%)"].iloc[0]
-                        comparecimento = df_metricas["Total de Comparecimentos"].iloc[0]
-                        abstencao = df_metricas["Total de Abstenções"].iloc[0]
-                    else:
-                        taxa_atual = comparecimento = abstencao = 0
-                except Exception:
-                    taxa_atual = comparecimento = abstencao = 0
+                metricas = df_metricas.row(0, named=True)
+                taxa_atual = metricas["Taxa de Comparecimento (%)"]
+                comparecimento = metricas["Total de Comparecimentos"]
+                abstencao = metricas["Total de Abstenções"]
 
                 col1, col2, col3 = st.columns(3)
                 with col1:
@@ -460,8 +270,9 @@ with tab_nacional:
                 )
 
                 # Ordenar por ano
-                df_plotar = df_nacional_filtrado.sort_values("Ano")
-                df_plotar["Ano"] = df_plotar["Ano"].astype(str)
+                df_plotar = df_nacional_filtrado.sort("Ano").with_columns(
+                    pl.col("Ano").cast(pl.String)
+                )
                 fig = px.line(
                     df_plotar,
                     x="Ano",
@@ -480,8 +291,10 @@ with tab_nacional:
         else:
             st.warning("Dados não disponíveis para os anos selecionados.")
 
-with tab_mapa:
-    if df_mapa_filtrado.empty:
+elif aba == "Mapa Interativo":
+    import plotly.express as px
+
+    if df_mapa_filtrado.is_empty():
         st.warning("Nenhum dado de mapa disponível para os filtros selecionados.")
     else:
         st.header("Mapa Interativo da Taxa de Comparecimento")
@@ -495,20 +308,18 @@ with tab_mapa:
 
         st.info("💡 Mudanças em filtros podem ajustar a visualização da página.")
 
+        geojson = carregar_geojson()
         if geojson:
             try:
-                # Verificar se coluna existe
-                if "Estado (UF)" not in df_mapa_filtrado.columns:
-                    st.error(
-                        f"Coluna 'Estado (UF)' não encontrada. Colunas: {df_mapa_filtrado.columns.tolist()}"
-                    )
-                    st.stop()
-
                 # Adicionar nome completo do estado
-                df_mapa_filtrado["Nome Estado"] = df_mapa_filtrado["Estado (UF)"].map(UF_NOME_MAP)
+                df_mapa_plotar = df_mapa_filtrado.with_columns(
+                    pl.col("Estado (UF)")
+                    .replace_strict(UF_NOME_MAP, default=None)
+                    .alias("Nome Estado")
+                )
 
                 fig = px.choropleth(
-                    df_mapa_filtrado,
+                    df_mapa_plotar,
                     geojson=geojson,
                     locations="Estado (UF)",
                     featureidkey="properties.sigla",
@@ -541,17 +352,73 @@ with tab_mapa:
                     title_x=0.5,
                     title_font={"size": 18},
                 )
-                st.plotly_chart(fig, width="stretch")
+                evento = st.plotly_chart(
+                    fig,
+                    width="stretch",
+                    on_select="rerun",
+                    selection_mode="points",
+                    key="mapa_uf",
+                )
+                # Clique em um estado abre a tabela de municípios abaixo; a
+                # seleção persiste entre reruns, então só um clique novo conta
+                pontos = evento["selection"]["points"] if evento else []
+                clique = pontos[0].get("location") if pontos else None
+                if clique and clique != st.session_state.get("uf_clicada"):
+                    st.session_state["uf_detalhe"] = clique
+                st.session_state["uf_clicada"] = clique
                 st.info(
                     "ℹ️ Votos do exterior não são exibidos no mapa pois representam votações internacionais sem localização geográfica específica."
                 )
             except Exception as e:
                 st.error(f"Erro ao renderizar mapa: {e}")
         else:
-            st.warning("Dados ou geojson não disponíveis para o ano selecionado.")
+            st.warning(
+                "Geometria dos estados não empacotada: gere-a com scripts/build_geometria.py."
+            )
+
+        # Tabela municipal: só a UF escolhida é lida, agregada e enviada
+        st.subheader("Tabela de Municípios")
+        ufs_mapa = df_mapa_filtrado["Estado (UF)"].unique().sort().to_list()
+        if st.session_state.get("uf_detalhe") not in ufs_mapa:
+            st.session_state.pop("uf_detalhe", None)
+        uf_detalhe = st.selectbox(
+            "Estado (clique no mapa ou escolha aqui)",
+            ufs_mapa,
+            index=None,
+            format_func=lambda uf: f"{uf} - {UF_NOME_MAP.get(uf, uf)}",
+            key="uf_detalhe",
+        )
 
-with tab_regional:
-    if df_regional_filtrado.empty:
+        if uf_detalhe and map_year:
+            try:
+                df_municipios = carregar_municipios(
+                    uf_detalhe,
+                    map_year,
+                    cache_anual(),
+                    settings=settings_dados(),
+                )
+            except Exception as e:
+                logger.error(f"Erro ao carregar municípios de {uf_detalhe}: {e}")
+                df_municipios = None
+
+            if df_municipios is None:
+                st.warning(f"Dados municipais de {uf_detalhe} não disponíveis para {map_year}.")
+            else:
+                st.dataframe(
+                    df_municipios.select(
+                        pl.col("NM_MUNICIPIO").alias("Município"),
+                        pl.col("QT_APTOS").alias("Aptos"),
+                        pl.col("QT_COMPARECIMENTO").alias("Comparecimento"),
+                        pl.col("taxa_comparecimento").alias("Taxa de Comparecimento (%)"),
+                    ).sort("Taxa de Comparecimento (%)"),
+                    width="stretch",
+                    hide_index=True,
+                )
+
+elif aba == "Comparação Regional":
+    import plotly.express as px
+
+    if df_regional_filtrado.is_empty():
         st.warning("Nenhum dado regional disponível para os filtros selecionados.")
     else:
         st.header("Comparação por Região")
@@ -564,7 +431,7 @@ with tab_regional:
         )
 
         fig = px.line(
-            df_regional_filtrado.sort_values(["Região", "Ano"]),
+            df_regional_filtrado.sort("Região", "Ano"),
             x="Ano",
             y="Taxa de Comparecimento (%)",
             color="Região",
@@ -578,8 +445,8 @@ with tab_regional:
         )
         st.plotly_chart(fig, width="stretch")
 
-with tab_detalhes:
-    if df_nacional_filtrado.empty and df_regional_filtrado.empty:
+elif aba == "Dados Detalhados":
+    if df_nacional_filtrado.is_empty() and df_regional_filtrado.is_empty():
         st.warning("Nenhum dado detalhado disponível para os filtros selecionados.")
     else:
         st.header("Dados Detalhados")
@@ -588,20 +455,23 @@ with tab_detalhes:
         col1, col2 = st.columns(2)
         with col1:
             st.subheader("Dados Nacionais")
-            if not df_nacional_filtrado.empty:
+            if not df_nacional_filtrado.is_empty():
                 # Adicionar coluna Tipo para destacar Exterior
-                df_nacional_display = df_nacional_filtrado.copy()
-                df_nacional_display["Tipo"] = "Nacional"
+                df_nacional_display = df_nacional_filtrado.with_columns(
+                    pl.lit("Nacional").alias("Tipo")
+                )
                 # Como df_nacional não tem NOME_REGIAO, assumimos que Exterior aparece em regional
                 st.dataframe(df_nacional_display, width="stretch")
 
         with col2:
             st.subheader("Dados por Região")
-            if not df_regional_filtrado.empty:
+            if not df_regional_filtrado.is_empty():
                 # Adicionar coluna Tipo
-                df_regional_display = df_regional_filtrado.copy()
-                df_regional_display["Tipo"] = np.where(
-                    df_regional_display["Região"] == "Exterior", "Internacional", "Nacional"
+                df_regional_display = df_regional_filtrado.with_columns(
+                    pl.when(pl.col("Região") == "Exterior")
+                    .then(pl.lit("Internacional"))
+                    .otherwise(pl.lit("Nacional"))
+                    .alias("Tipo")
                 )
                 st.dataframe(df_regional_display, width="stretch")
 
@@ -611,3 +481,7 @@ st.caption(
     "Dashboard desenvolvido com Streamlit. Dados da camada Silver - TSE (Tribunal Superior Eleitoral)."
 )
 st.caption(f"Anos selecionados: {', '.join(map(str, Anos_selecionados))}")
+
+logger.info(
+    f"Dashboard renderizado em {(time.perf_counter() - inicio_execucao) * 1000:.0f} ms (aba: {aba})"
+)
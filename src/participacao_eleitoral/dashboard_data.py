@@ -0,0 +1,537 @@
+"""Dados do dashboard: uma única agregação por consulta, sem dependência do Streamlit"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from functools import lru_cache, partial
+from importlib import resources
+from pathlib import Path
+from typing import Any, Protocol
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.gold.reader import (
+    caminho_historico_gold,
+    caminho_tabela_gold,
+    scan_gold,
+    scan_historico_gold,
+)
+from participacao_eleitoral.silver.reader import (
+    CONTAGENS,
+    agregar_participacao,
+    caminho_particao_silver,
+    scan_silver,
+)
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.topologia import topojson_para_geojson
+
+# Colunas lidas das camadas: UF é o grão mais fino que o dashboard exibe
+COLUNAS_UF = ["SG_UF", "NOME_REGIAO", *CONTAGENS]
+
+# Grão da agregação única; nacional, regional e mapa derivam dele
+GRAO_BASE = ["Ano", "NOME_REGIAO", "SG_UF"]
+
+# Métricas agregadas (saída de agregar_participacao) → nomes usados no dashboard
+COLUNAS_METRICAS = {
+    "QT_COMPARECIMENTO": "comparecimento_total",
+    "QT_ABSTENCAO": "abstencao_total",
+    "TAXA_COMPARECIMENTO_PCT": "taxa_comparecimento",
+}
+
+# Votos no exterior não têm geometria no mapa
+UF_EXTERIOR = "ZZ"
+
+# (nacional, regional, mapa)
+Visoes = tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]
+
+# Geometria simplificada dos estados, empacotada com a aplicação
+# (gerada por scripts/build_geometria.py); feições identificadas por "sigla"
+ARQUIVO_GEOMETRIA_UF = "assets/brasil_uf.topo.json"
+OBJETO_GEOMETRIA_UF = "ufs"
+
+
+def anos_historico_uf(settings: Settings) -> frozenset[int]:
+    """Anos cobertos pela série Gold historico_uf (vazio sem a série)."""
+    caminho = caminho_historico_gold(settings, "uf")
+    try:
+        stat = caminho.stat()
+    except FileNotFoundError:
+        return frozenset()
+    return _anos_do_historico(str(caminho), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _anos_do_historico(caminho: str, tamanho: int, mtime_ns: int) -> frozenset[int]:
+    # Tamanho e mtime na chave: uma série reconstruída é relida
+    anos = pl.read_parquet(caminho, columns=["ANO_ELEICAO"])["ANO_ELEICAO"].unique()
+    return frozenset(anos.to_list())
+
+
+def scan_base_uf(anos: Sequence[int], settings: Settings) -> pl.LazyFrame:
+    """
+    Base do dashboard: contagens por Ano × UF (com região).
+
+    Lê a série pré-agregada da Gold (historico_uf, construída por
+    `data aggregate`): um arquivo de kilobytes com todos os anos. Somar as
+    contagens dos turnos e UFs dá exatamente os mesmos totais da Silver.
+    Anos que a série não cobre (Silver mais nova que a Gold, ou sem a
+    série) caem no scan da Silver.
+    """
+    na_serie = anos_historico_uf(settings)
+    anos_serie = [ano for ano in anos if ano in na_serie]
+    anos_silver = [ano for ano in anos if ano not in na_serie]
+
+    partes = []
+    if anos_serie:
+        partes.append(
+            scan_historico_gold("uf", anos_serie, settings=settings).select(
+                pl.col("ANO_ELEICAO").alias("Ano"), *COLUNAS_UF
+            )
+        )
+    if anos_silver or not partes:
+        # Poda por ano + projeção no scan
+        partes.append(
+            scan_silver(
+                anos=anos_silver,
+                columns=["year", *COLUNAS_UF],
+                settings=settings,
+            ).rename({"year": "Ano"})
+        )
+
+    if len(partes) == 1:
+        return partes[0]
+
+    # Série e Silver diferem nos tipos de Ano, UF, região e contagens
+    return pl.concat(
+        [
+            parte.with_columns(
+                pl.col("Ano").cast(pl.Int32),
+                pl.col("SG_UF", "NOME_REGIAO").cast(pl.String),
+                pl.col(CONTAGENS).cast(pl.Int64),
+            )
+            for parte in partes
+        ],
+        how="vertical",
+    )
+
+
+class CacheAgregados(Protocol):
+    """
+    Backend de cache das funções de dados do dashboard.
+
+    As chaves trazem o caminho, o tamanho e o mtime do arquivo de origem
+    (partição Silver, tabela Gold ou amostra): reescrever a partição muda a
+    chave, e a entrada antiga sai pelo limite de tamanho.
+    """
+
+    def obter(self, chave: Hashable, calcular: Callable[[], pl.DataFrame]) -> pl.DataFrame: ...
+
+    def limpar(self) -> int: ...
+
+
+class CacheAnual:
+    """
+    Cache LRU de agregados anuais, limitado pela memória ocupada.
+
+    Cada entrada é o agregado Ano × região × UF de UM ano (kilobytes); uma
+    seleção de anos é composta concatenando as entradas. Trocar um ano na
+    seleção custa no máximo a agregação desse ano, e o cache cresce com o
+    número de anos, não com o de combinações.
+
+    O tamanho de cada entrada vem de `DataFrame.estimated_size()`; ao passar
+    de `max_bytes`, as entradas menos usadas recentemente saem primeiro.
+    Entradas maiores que o limite (ou max_bytes=0) não são guardadas.
+
+    Seguro entre threads (sessões do Streamlit compartilham a instância).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.acertos = 0
+        self.faltas = 0
+        self._entradas: OrderedDict[Hashable, pl.DataFrame] = OrderedDict()
+        self._tamanho = 0
+        self._trava = threading.Lock()
+
+    @property
+    def tamanho_bytes(self) -> int:
+        return self._tamanho
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def obter(self, chave: Hashable, calcular: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+        """Entrada de `chave`; calculada (fora da trava) e guardada se ausente."""
+        if self.max_bytes <= 0:
+            # Cache desligado: nem frames vazios (estimated_size 0) são guardados
+            with self._trava:
+                self.faltas += 1
+            return calcular()
+
+        with self._trava:
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+                return self._entradas[chave]
+            self.faltas += 1
+
+        df = calcular()
+        tamanho = int(df.estimated_size())
+        if tamanho > self.max_bytes:
+            return df
+
+        with self._trava:
+            if chave not in self._entradas:
+                self._entradas[chave] = df
+                self._tamanho += tamanho
+            while self._tamanho > self.max_bytes:
+                _, removida = self._entradas.popitem(last=False)
+                self._tamanho -= int(removida.estimated_size())
+
+        return df
+
+    def limpar(self) -> int:
+        """Remove todas as entradas do cache. Retorna quantas foram removidas."""
+        with self._trava:
+            removidas = len(self._entradas)
+            self._entradas.clear()
+            self._tamanho = 0
+        return removidas
+
+
+class CacheArrowDisco:
+    """
+    Cache de agregados em disco, compartilhado pelos processos do host.
+
+    Cada entrada é um arquivo Arrow IPC sem compressão, lido com memory
+    map: os workers do dashboard (e réplicas apontadas para o mesmo
+    diretório) usam as mesmas páginas do page cache do SO em vez de uma
+    cópia por processo, e um processo aproveita o que outro já agregou.
+
+    Como QueryResultCache: o nome do arquivo é o hash da chave, o mtime
+    marca o último uso e, ao passar de `max_bytes`, as entradas usadas há
+    mais tempo são removidas (max_bytes=0 desliga o cache). A escrita é
+    atômica, então leitores concorrentes nunca veem um arquivo parcial.
+    """
+
+    def __init__(self, diretorio: Path, max_bytes: int):
+        self.diretorio = diretorio
+        self.max_bytes = max_bytes
+        self.acertos = 0
+        self.faltas = 0
+
+    @property
+    def tamanho_bytes(self) -> int:
+        return sum(tamanho for _, tamanho in self._entradas())
+
+    def __len__(self) -> int:
+        return len(self._entradas())
+
+    def obter(self, chave: Hashable, calcular: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+        """Entrada de `chave` (mapeada do disco); calculada e gravada se ausente."""
+        if self.max_bytes <= 0:
+            self.faltas += 1
+            return calcular()
+
+        arquivo = self.diretorio / f"{self._nome(chave)}.arrow"
+        try:
+            df = pl.read_ipc(arquivo, memory_map=True)
+            # mtime marca o último uso (ordem de despejo)
+            os.utime(arquivo)
+            self.acertos += 1
+            return df
+        except FileNotFoundError:
+            # Ausente ou despejada por outro processo entre a leitura e o utime
+            pass
+        except (pl.exceptions.ComputeError, OSError):
+            # Entrada corrompida (escrita interrompida, disco cheio): recalcula
+            arquivo.unlink(missing_ok=True)
+
+        self.faltas += 1
+        df = calcular()
+        if df.estimated_size() > self.max_bytes:
+            return df
+
+        with escrita_atomica(arquivo) as tmp_path:
+            df.write_ipc(tmp_path, compression="uncompressed")
+        self._despejar()
+        return df
+
+    def limpar(self) -> int:
+        """Remove todas as entradas do cache. Retorna quantas foram removidas."""
+        entradas = list(self.diretorio.glob("*.arrow")) if self.diretorio.exists() else []
+        for arquivo in entradas:
+            arquivo.unlink(missing_ok=True)
+        return len(entradas)
+
+    @staticmethod
+    def _nome(chave: Hashable) -> str:
+        # repr de tuplas de str/int é estável entre processos (hash() não é)
+        return hashlib.sha256(repr(chave).encode()).hexdigest()[:32]
+
+    def _entradas(self) -> list[tuple[Path, int]]:
+        """(arquivo, tamanho) das entradas, da usada há mais tempo à mais recente."""
+        if not self.diretorio.exists():
+            return []
+
+        entradas = []
+        for arquivo in self.diretorio.glob("*.arrow"):
+            try:
+                stat = arquivo.stat()
+            except FileNotFoundError:
+                continue  # despejada por outro processo
+            entradas.append((stat.st_mtime_ns, arquivo, stat.st_size))
+
+        entradas.sort()
+        return [(arquivo, tamanho) for _, arquivo, tamanho in entradas]
+
+    def _despejar(self) -> None:
+        """Remove as entradas usadas há mais tempo até caber no limite."""
+        entradas = self._entradas()
+        total = sum(tamanho for _, tamanho in entradas)
+
+        for arquivo, tamanho in entradas:
+            if total <= self.max_bytes:
+                break
+            total -= tamanho
+            arquivo.unlink(missing_ok=True)
+
+
+def criar_cache(settings: Settings | None = None) -> CacheAgregados:
+    """Backend de cache configurado (dashboard_cache_backend e limite em MB)."""
+    settings = settings or Settings()
+    max_bytes = settings.dashboard_cache_max_mb * 1024 * 1024
+
+    if settings.dashboard_cache_backend == "disco":
+        diretorio = settings.dashboard_cache_dir or settings.data_dir / "_dashboard_cache"
+        return CacheArrowDisco(diretorio, max_bytes)
+    return CacheAnual(max_bytes)
+
+
+def carregar_visoes(
+    anos: Sequence[int],
+    cache: CacheAgregados,
+    *,
+    settings: Settings | None = None,
+) -> Visoes | None:
+    """
+    Visões do dashboard para `anos`, compostas dos agregados anuais em cache.
+
+    A chave de cada ano inclui tamanho e mtime do arquivo de origem (série
+    Gold ou partição Silver): reconstruir a camada invalida as entradas sem
+    reiniciar o dashboard.
+
+    O modo demo usa o mesmo caminho, com `settings` apontando para a
+    Lakehouse de amostras (ver scripts/generate_mocks.py).
+    Retorna None se nenhum ano tem dados.
+    """
+    settings = settings or Settings()
+    historico = caminho_historico_gold(settings, "uf")
+    na_serie = anos_historico_uf(settings)
+
+    agregados = []
+    for ano in sorted(set(anos)):
+        # Fonte do próprio ano: a série Gold, ou a Silver se a série não o cobre
+        arquivo = historico if ano in na_serie else caminho_particao_silver(settings, ano)
+
+        try:
+            stat = arquivo.stat()
+        except FileNotFoundError:
+            continue
+
+        chave = (str(arquivo), ano, stat.st_size, stat.st_mtime_ns)
+        agregado = cache.obter(chave, partial(_agregar_ano, ano, settings))
+        if not agregado.is_empty():
+            agregados.append(agregado)
+
+    if not agregados:
+        return None
+    return derivar_visoes(pl.concat(agregados, how="vertical"))
+
+
+def agregar_base(base: pl.LazyFrame) -> pl.DataFrame:
+    """
+    Lê a base uma vez e agrupa no grão Ano × região × UF (no máximo algumas
+    centenas de linhas por ano). Regiões e UFs saem como String.
+    """
+    return (
+        base.group_by(GRAO_BASE)
+        .agg(pl.col(c).cast(pl.Int64).sum() for c in CONTAGENS)
+        # Depois do group_by: Categorical/Enum da Gold/Silver viram String
+        .with_columns(pl.col("Ano").cast(pl.Int32), pl.col("SG_UF", "NOME_REGIAO").cast(pl.String))
+        .select(*GRAO_BASE, *CONTAGENS)
+        .collect()
+    )
+
+
+def _agregar_ano(ano: int, settings: Settings) -> pl.DataFrame:
+    return agregar_base(scan_base_uf([ano], settings))
+
+
+def agregar_dashboard(base: pl.LazyFrame) -> Visoes:
+    """
+    Agrega a base em uma única passada e deriva as três visões do dashboard.
+
+    A base é lida e agrupada uma vez, no grão Ano × região × UF (no máximo
+    algumas centenas de linhas). Nacional, regional e mapa são reagregados
+    dessas contagens em memória: taxas continuam soma/soma, iguais às
+    calculadas direto da base.
+
+    Returns:
+        Tupla (nacional, regional, mapa):
+        - nacional: Ano + métricas
+        - regional: Ano, NOME_REGIAO + métricas
+        - mapa: Ano, SG_UF, taxa_comparecimento, regiao (sem o exterior)
+    """
+    return derivar_visoes(agregar_base(base))
+
+
+def derivar_visoes(agregado_df: pl.DataFrame) -> Visoes:
+    """Nacional, regional e mapa a partir de contagens no grão Ano × região × UF."""
+    agregado = agregado_df.lazy()
+
+    nacional, regional, mapa = pl.collect_all(
+        [
+            agregar_participacao(agregado, ["Ano"])
+            .select(["Ano", *COLUNAS_METRICAS])
+            .rename(COLUNAS_METRICAS)
+            .sort("Ano"),
+            agregar_participacao(agregado, ["Ano", "NOME_REGIAO"])
+            .select(["Ano", "NOME_REGIAO", *COLUNAS_METRICAS])
+            .rename(COLUNAS_METRICAS)
+            .sort("Ano", "NOME_REGIAO"),
+            agregar_participacao(
+                agregado.filter(pl.col("SG_UF") != UF_EXTERIOR), ["Ano", "NOME_REGIAO", "SG_UF"]
+            )
+            .select(
+                "Ano",
+                "SG_UF",
+                pl.col("TAXA_COMPARECIMENTO_PCT").alias("taxa_comparecimento"),
+                pl.col("NOME_REGIAO").alias("regiao"),
+            )
+            .sort("Ano", "SG_UF"),
+        ]
+    )
+
+    return nacional, regional, mapa
+
+
+def visoes_vazias() -> Visoes:
+    """Visões sem linhas, já no schema de derivar_visoes."""
+    return derivar_visoes(
+        pl.DataFrame(
+            schema={
+                "Ano": pl.Int32,
+                "NOME_REGIAO": pl.String,
+                "SG_UF": pl.String,
+                **dict.fromkeys(CONTAGENS, pl.Int64),
+            }
+        )
+    )
+
+
+def filtrar_visoes(
+    visoes: Visoes,
+    anos: Sequence[int],
+    regioes: Sequence[str],
+    ano_mapa: int | None,
+) -> Visoes:
+    """
+    Recorte das visões pela seleção da barra lateral.
+
+    Os filtros são predicados lazy executados juntos (collect_all) sobre as
+    visões em cache, que não são copiadas nem alteradas.
+    """
+    nacional, regional, mapa = visoes
+    filtro_mapa = pl.col("Ano") == ano_mapa if ano_mapa is not None else pl.lit(False)
+
+    nacional, regional, mapa = pl.collect_all(
+        [
+            nacional.lazy().filter(pl.col("Ano").is_in(anos)),
+            regional.lazy().filter(pl.col("Ano").is_in(anos), pl.col("NOME_REGIAO").is_in(regioes)),
+            mapa.lazy().filter(filtro_mapa, pl.col("regiao").is_in(regioes)),
+        ]
+    )
+
+    return nacional, regional, mapa
+
+
+def carregar_geometria_uf() -> dict[str, Any] | None:
+    """
+    GeoJSON dos estados a partir do TopoJSON empacotado (sem rede).
+
+    Retorna None se o pacote foi instalado sem a geometria.
+    """
+    arquivo = resources.files("participacao_eleitoral").joinpath(ARQUIVO_GEOMETRIA_UF)
+    if not arquivo.is_file():
+        return None
+
+    topologia = json.loads(arquivo.read_text(encoding="utf-8"))
+    return topojson_para_geojson(topologia, OBJETO_GEOMETRIA_UF)
+
+
+def scan_municipios(uf: str, ano: int, settings: Settings) -> pl.LazyFrame:
+    """
+    Contagens por município de UMA UF em um ano.
+
+    Lê a tabela municipal da Gold com o filtro de UF empurrado para o scan
+    (tabelas ordenadas por UF); sem a Gold do ano, a Silver com poda de
+    partição e de UF (scan_silver).
+    """
+    colunas = ["CD_MUNICIPIO", "NM_MUNICIPIO", *CONTAGENS]
+
+    if caminho_tabela_gold(settings, ano, "municipio").exists():
+        # SG_UF Categorical comparado direto ao literal: o filtro desce ao scan
+        lf = scan_gold("municipio", [ano], settings=settings).filter(pl.col("SG_UF") == uf)
+        return lf.select(colunas)
+
+    return scan_silver(anos=[ano], ufs=[uf], columns=colunas, settings=settings)
+
+
+def carregar_municipios(
+    uf: str,
+    ano: int,
+    cache: CacheAgregados,
+    *,
+    settings: Settings | None = None,
+) -> pl.DataFrame | None:
+    """
+    Taxa de comparecimento por município de uma UF (turnos somados).
+
+    Cada par UF × ano entra no cache uma vez: escolher um estado carrega
+    e envia só os municípios dele.
+
+    Returns:
+        CD_MUNICIPIO, NM_MUNICIPIO, contagens e taxa_comparecimento; None
+        sem dados
+    """
+    settings = settings or Settings()
+    gold = caminho_tabela_gold(settings, ano, "municipio")
+    arquivo = gold if gold.exists() else caminho_particao_silver(settings, ano)
+
+    try:
+        stat = arquivo.stat()
+    except FileNotFoundError:
+        return None
+
+    chave = (str(arquivo), "municipios", uf, ano, stat.st_size, stat.st_mtime_ns)
+    df = cache.obter(chave, partial(_agregar_municipios, uf, ano, settings))
+    return None if df.is_empty() else df
+
+
+def _agregar_municipios(uf: str, ano: int, settings: Settings) -> pl.DataFrame:
+    return (
+        agregar_participacao(scan_municipios(uf, ano, settings), ["CD_MUNICIPIO", "NM_MUNICIPIO"])
+        .select(
+            "CD_MUNICIPIO",
+            pl.col("NM_MUNICIPIO").cast(pl.String),
+            *CONTAGENS,
+            pl.col("TAXA_COMPARECIMENTO_PCT").alias("taxa_comparecimento"),
+        )
+        .sort("NM_MUNICIPIO")
+        .collect()
+    )
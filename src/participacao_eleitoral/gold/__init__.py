@@ -0,0 +1,35 @@
+"""Camada Gold do Lakehouse"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .builder import GoldAggregateBuilder
+    from .metadata_store import GoldMetadataStore
+    from .pipeline import GoldAggregationPipeline
+    from .reader import scan_gold
+    from .results import GoldBuildResult
+
+# Exportações importadas sob demanda: quem só lê a Gold (dashboard) não
+# carrega builder, pipeline nem o DuckDB do metadata store
+_EXPORTACOES = {
+    "GoldAggregationPipeline": ".pipeline",
+    "GoldAggregateBuilder": ".builder",
+    "GoldMetadataStore": ".metadata_store",
+    "GoldBuildResult": ".results",
+    "scan_gold": ".reader",
+}
+
+__all__ = [
+    "GoldAggregationPipeline",
+    "GoldAggregateBuilder",
+    "GoldMetadataStore",
+    "GoldBuildResult",
+    "scan_gold",
+]
+
+
+def __getattr__(nome: str) -> Any:
+    if nome not in _EXPORTACOES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    return getattr(import_module(_EXPORTACOES[nome], __name__), nome)
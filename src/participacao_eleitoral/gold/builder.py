@@ -0,0 +1,106 @@
+"""Construtor dos agregados da camada Gold"""
+
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.schemas.comparecimento_gold import schema_gold
+from participacao_eleitoral.silver.reader import CONTAGENS, agregar_participacao
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.logger import ModernLogger
+
+from .results import GoldBuildResult
+
+
+class GoldAggregateBuilder:
+    """
+    Materializa os agregados de comparecimento por grão.
+
+    Esta classe:
+    - lê a Silver de um ano UMA vez, já agregando no grão mais fino
+      (turno × município × zona)
+    - deriva os grãos mais grossos dessa tabela pequena, sem reler a Silver
+    - calcula taxas ponderadas pelos aptos em cada grão
+    - escreve uma tabela Parquet por grão (escrita atômica)
+
+    Ela NÃO:
+    - decide quais anos reconstruir (ver GoldAggregationPipeline)
+    - conhece Airflow ou dashboard
+    """
+
+    def __init__(self, logger: ModernLogger):
+        self.logger = logger
+
+    def build(self, silver: pl.LazyFrame, destino_dir: Path) -> GoldBuildResult:
+        """
+        Agrega a Silver de um ano em todas as tabelas Gold.
+
+        Args:
+            silver: LazyFrame da Silver do ano (ver silver.reader.scan_silver)
+            destino_dir: Diretório da partição Gold do ano (year=YYYY)
+
+        Returns:
+            GoldBuildResult com os caminhos e linhas de cada grão
+        """
+        contrato = ComparecimentoGoldContrato
+
+        # Grão mais fino: união das dimensões de todos os grãos
+        dimensoes_finas = list(
+            dict.fromkeys(
+                contrato.DIMENSOES_BASE
+                + [d for dimensoes in contrato.GRAOS.values() for d in dimensoes]
+            )
+        )
+
+        # Única passada sobre a Silver: contagens somadas no grão mais fino
+        base = (
+            silver.group_by(dimensoes_finas)
+            .agg(
+                [pl.col(c).cast(pl.Int64).sum() for c in CONTAGENS]
+                + [pl.len().alias("_linhas_silver")]
+            )
+            .collect()
+        )
+
+        linhas_silver = int(base["_linhas_silver"].sum())
+        self.logger.info(
+            "gold_base_agregada",
+            linhas_silver=linhas_silver,
+            linhas_base=len(base),
+        )
+
+        tabelas: dict[str, Path] = {}
+        linhas_por_grao: dict[str, int] = {}
+
+        for grao in contrato.GRAOS:
+            schema = schema_gold(grao)
+            dimensoes = [c for c in schema if c not in contrato.MEDIDAS]
+
+            df = (
+                agregar_participacao(base.lazy(), dimensoes)
+                .select([pl.col(c).cast(t) for c, t in schema.items()])
+                .sort(dimensoes, nulls_last=True)
+                .collect()
+            )
+
+            destino = destino_dir / f"{grao}.parquet"
+            with escrita_atomica(destino) as tmp_path:
+                df.write_parquet(tmp_path, compression="zstd", statistics=True)
+
+            tabelas[grao] = destino
+            linhas_por_grao[grao] = len(df)
+
+        self.logger.success(
+            "gold_agregados_escritos",
+            destino=str(destino_dir),
+            **{f"linhas_{grao}": linhas for grao, linhas in linhas_por_grao.items()},
+        )
+
+        return GoldBuildResult(
+            tabelas=tabelas,
+            linhas_silver=linhas_silver,
+            linhas_por_grao=linhas_por_grao,
+        )
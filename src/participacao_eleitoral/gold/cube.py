@@ -0,0 +1,212 @@
+"""Cubo demográfico da camada Gold (GROUPING SETS no DuckDB)"""
+
+from collections.abc import Sequence
+from itertools import combinations
+from pathlib import Path
+
+import duckdb
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.core.contracts.comparecimento_silver import (
+    ComparecimentoSilverContrato,
+)
+from participacao_eleitoral.gold.reader import listar_particoes_gold
+from participacao_eleitoral.gold.schemas.comparecimento_gold import (
+    colunas_grupo_cubo,
+    schema_cubo,
+)
+from participacao_eleitoral.silver.reader import CONTAGENS, TAXAS_VIRTUAIS
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.logger import ModernLogger
+
+from .results import DemographicCubeResult
+
+# Tipo DuckDB do nulo que substitui colunas ausentes no Parquet do ano
+_TIPO_NULO = {"NR_TURNO": "TINYINT"}
+
+
+def conjuntos_cubo() -> list[tuple[str, ...]]:
+    """
+    Conjuntos de agrupamento materializados no cubo.
+
+    Para cada nível geográfico: o total e toda combinação de até
+    MAX_DIMENSOES_CUBO dimensões demográficas.
+    """
+    contrato = ComparecimentoGoldContrato
+    conjuntos: list[tuple[str, ...]] = []
+
+    for geografia in contrato.NIVEIS_GEOGRAFICOS.values():
+        for tamanho in range(contrato.MAX_DIMENSOES_CUBO + 1):
+            for dimensoes in combinations(contrato.DIMENSOES_DEMOGRAFICAS, tamanho):
+                conjuntos.append((*contrato.DIMENSOES_BASE, *geografia, *dimensoes))
+
+    return conjuntos
+
+
+def grupo_id(nivel: str, dimensoes: Sequence[str]) -> int:
+    """
+    GRUPO_ID do conjunto (nível geográfico + dimensões demográficas).
+
+    Raises:
+        ValueError: se o conjunto não é materializado no cubo
+    """
+    contrato = ComparecimentoGoldContrato
+
+    if nivel not in contrato.NIVEIS_GEOGRAFICOS:
+        raise ValueError(
+            f"Nível geográfico desconhecido: {nivel}. "
+            f"Níveis válidos: {list(contrato.NIVEIS_GEOGRAFICOS)}"
+        )
+
+    desconhecidas = [d for d in dimensoes if d not in contrato.DIMENSOES_DEMOGRAFICAS]
+    if desconhecidas:
+        raise ValueError(f"Dimensões fora do cubo: {desconhecidas}")
+
+    if len(set(dimensoes)) > contrato.MAX_DIMENSOES_CUBO:
+        raise ValueError(
+            f"O cubo materializa até {contrato.MAX_DIMENSOES_CUBO} dimensões "
+            f"demográficas por consulta; pedido: {list(dimensoes)}"
+        )
+
+    agrupadas = set(contrato.NIVEIS_GEOGRAFICOS[nivel]) | set(dimensoes)
+    colunas = colunas_grupo_cubo()
+
+    return sum(
+        1 << (len(colunas) - 1 - posicao)
+        for posicao, coluna in enumerate(colunas)
+        if coluna not in agrupadas
+    )
+
+
+class DemographicCubeBuilder:
+    """
+    Constrói o cubo demográfico de um ano com UMA consulta DuckDB.
+
+    Esta classe:
+    - lê a Silver do ano direto do Parquet (uma única passada)
+    - agrega todos os conjuntos de conjuntos_cubo() com GROUPING SETS
+    - identifica cada conjunto por GRUPO_ID (bitmask do GROUPING())
+    - escreve o cubo ordenado por GRUPO_ID (escrita atômica), para que
+      consultas de um conjunto pulem row groups pelas estatísticas
+
+    Ela NÃO:
+    - decide quais anos reconstruir (ver GoldAggregationPipeline)
+    """
+
+    def __init__(self, logger: ModernLogger):
+        self.logger = logger
+
+    def build(self, silver_parquet_path: Path, destino: Path) -> DemographicCubeResult:
+        """
+        Constrói o cubo demográfico a partir da partição Silver de um ano.
+
+        Dimensões ausentes no arquivo do ano (o perfil do TSE ganhou colunas
+        ao longo dos anos) entram como nulas.
+        """
+        colunas_arquivo = set(pl.read_parquet_schema(silver_parquet_path))
+        contrato = ComparecimentoGoldContrato
+
+        projecao = [
+            f'"{coluna}"'
+            if coluna in colunas_arquivo
+            else f'CAST(NULL AS {_TIPO_NULO.get(coluna, "VARCHAR")}) AS "{coluna}"'
+            for coluna in [*contrato.DIMENSOES_BASE, *colunas_grupo_cubo(), *CONTAGENS]
+        ]
+
+        conjuntos = conjuntos_cubo()
+        grouping_sets = ", ".join(
+            "(" + ", ".join(f'"{c}"' for c in conjunto) + ")" for conjunto in conjuntos
+        )
+        denominador = ComparecimentoSilverContrato.DENOMINADOR_TAXAS
+
+        medidas = [f'CAST(SUM("{c}") AS BIGINT) AS "{c}"' for c in CONTAGENS] + [
+            f'SUM("{numerador}") * 100.0 / SUM("{denominador}") AS "{taxa}"'
+            for taxa, numerador in TAXAS_VIRTUAIS.items()
+        ]
+
+        colunas_grupo = ", ".join(f'"{c}"' for c in colunas_grupo_cubo())
+        sql = f"""
+            SELECT
+                {", ".join(f'"{c}"' for c in contrato.DIMENSOES_BASE)},
+                GROUPING({colunas_grupo}) AS "GRUPO_ID",
+                {colunas_grupo},
+                {", ".join(medidas)}
+            FROM (
+                SELECT {", ".join(projecao)}
+                FROM read_parquet(?)
+            )
+            GROUP BY GROUPING SETS ({grouping_sets})
+            ORDER BY "GRUPO_ID"
+        """
+
+        with duckdb.connect() as conn:
+            df = conn.execute(sql, [str(silver_parquet_path)]).pl()
+
+        df = df.select([pl.col(c).cast(t) for c, t in schema_cubo().items()])
+
+        with escrita_atomica(destino) as tmp_path:
+            df.write_parquet(
+                tmp_path,
+                compression="zstd",
+                statistics=True,
+                row_group_size=10_000,
+            )
+
+        self.logger.success(
+            "cubo_demografico_escrito",
+            arquivo=str(destino),
+            linhas=len(df),
+            conjuntos=len(conjuntos),
+        )
+
+        return DemographicCubeResult(cubo_path=destino, linhas=len(df), conjuntos=len(conjuntos))
+
+
+def consultar_cubo(
+    dimensoes: Sequence[str],
+    anos: Sequence[int] | None = None,
+    *,
+    regioes: Sequence[str] | None = None,
+    ufs: Sequence[str] | None = None,
+    settings: Settings | None = None,
+) -> pl.DataFrame:
+    """
+    Responde cortes demográficos a partir do cubo, sem tocar a Silver.
+
+    O nível geográfico é deduzido dos filtros: `ufs` → por UF, `regioes` →
+    por região, nenhum → nacional.
+
+    Exemplo: comparecimento por faixa etária e escolaridade no Nordeste, 2022
+        consultar_cubo(["DS_FAIXA_ETARIA", "DS_GRAU_ESCOLARIDADE"],
+                       anos=[2022], regioes=["Nordeste"])
+    """
+    settings = settings or Settings()
+    contrato = ComparecimentoGoldContrato
+
+    nivel = "uf" if ufs is not None else "regiao" if regioes is not None else "nacional"
+    alvo = grupo_id(nivel, dimensoes)
+
+    colunas = [
+        *contrato.DIMENSOES_BASE,
+        *contrato.NIVEIS_GEOGRAFICOS[nivel],
+        *dict.fromkeys(dimensoes),
+        *contrato.MEDIDAS,
+    ]
+    schema = schema_cubo()
+
+    particoes = listar_particoes_gold(settings, contrato.TABELA_CUBO, anos)
+    if not particoes:
+        return pl.DataFrame(schema={c: schema[c] for c in colunas})
+
+    lf = pl.scan_parquet(list(particoes.values()), schema=schema).filter(pl.col("GRUPO_ID") == alvo)
+
+    if ufs is not None:
+        lf = lf.filter(pl.col("SG_UF").is_in(list(ufs)))
+    if regioes is not None:
+        lf = lf.filter(pl.col("NOME_REGIAO").is_in(list(regioes)))
+
+    return lf.select(colunas).sort(colunas[: -len(contrato.MEDIDAS)], nulls_last=True).collect()
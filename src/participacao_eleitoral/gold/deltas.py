@@ -0,0 +1,198 @@
+"""Tabelas de variação (ano a ano e turno a turno) da camada Gold"""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.reader import (
+    caminho_delta_gold,
+    diretorio_particao_gold,
+    listar_particoes_gold,
+)
+from participacao_eleitoral.gold.schemas.comparecimento_gold import (
+    MEDIDAS_GOLD,
+    schema_tabela_gold,
+)
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.logger import ModernLogger
+
+from .results import DeltaBuildResult
+
+# Variações calculadas: absolutas nas contagens, pontos percentuais nas taxas
+DELTAS: dict[str, tuple[str, str]] = {
+    "DELTA_QT_COMPARECIMENTO": ("QT_COMPARECIMENTO", "abs"),
+    "DELTA_QT_ABSTENCAO": ("QT_ABSTENCAO", "abs"),
+    "DELTA_TAXA_COMPARECIMENTO_PP": ("TAXA_COMPARECIMENTO_PCT", "pp"),
+    "DELTA_TAXA_ABSTENCAO_PP": ("TAXA_ABSTENCAO_PCT", "pp"),
+}
+
+
+def chaves_delta(tipo: str, tabela: str) -> list[str]:
+    """Colunas do join entre atual e base de uma tabela Gold."""
+    if tipo not in ComparecimentoGoldContrato.TIPOS_DELTA:
+        raise ValueError(
+            f"Tipo de variação desconhecido: {tipo}. "
+            f"Tipos válidos: {list(ComparecimentoGoldContrato.TIPOS_DELTA)}"
+        )
+
+    # A dimensão comparada sai da chave: o ano no "ano", o turno no "turno"
+    comparada = "ANO_ELEICAO" if tipo == "ano" else "NR_TURNO"
+    excluidas = {comparada, *ComparecimentoGoldContrato.COLUNAS_DESCRITIVAS}
+
+    return [c for c in schema_tabela_gold(tabela) if c not in MEDIDAS_GOLD and c not in excluidas]
+
+
+def calcular_delta(
+    atual: pl.LazyFrame,
+    base: pl.LazyFrame,
+    tipo: str,
+    tabela: str,
+) -> pl.LazyFrame:
+    """
+    Variação entre duas versões de uma tabela Gold (mesmo schema).
+
+    Só chaves presentes nas duas entram (join interno). Nulos na chave casam
+    entre si: no cubo, nulo marca a dimensão agregada daquele GRUPO_ID.
+    Ambos os lados já vêm ordenados pela chave (ordem de escrita da Gold).
+    """
+    chaves = chaves_delta(tipo, tabela)
+    coluna_base = ComparecimentoGoldContrato.TIPOS_DELTA[tipo]
+    comparada = "ANO_ELEICAO" if tipo == "ano" else "NR_TURNO"
+
+    lado_base = base.select(
+        [*chaves, pl.col(comparada).alias(coluna_base)]
+        + [pl.col(m).alias(f"{m}_BASE") for m in MEDIDAS_GOLD]
+    )
+
+    deltas = [
+        (pl.col(medida) - pl.col(f"{medida}_BASE")).alias(nome)
+        for nome, (medida, _) in DELTAS.items()
+    ]
+
+    colunas = [c for c in schema_tabela_gold(tabela) if c not in MEDIDAS_GOLD]
+    colunas.insert(colunas.index(comparada) + 1, coluna_base)
+
+    return (
+        atual.join(lado_base, on=chaves, how="inner", nulls_equal=True)
+        .with_columns(deltas)
+        .select(
+            [
+                *colunas,
+                *[c for m in MEDIDAS_GOLD for c in (m, f"{m}_BASE")],
+                *DELTAS,
+            ]
+        )
+    )
+
+
+class DeltaTableBuilder:
+    """
+    Pré-calcula as tabelas de variação de um ano a partir da própria Gold.
+
+    Esta classe:
+    - lê só as tabelas anuais da Gold (kilobytes), nunca a Silver
+    - "turno": 2º turno contra o 1º no mesmo ano
+    - "ano": contra a eleição anterior do mesmo tipo (INTERVALO_ELEICOES)
+    - escreve delta_<tipo>_<tabela>.parquet na partição do ano (escrita atômica)
+    """
+
+    def __init__(self, settings: Settings, logger: ModernLogger):
+        self.settings = settings
+        self.logger = logger
+
+    def build(self, ano: int) -> DeltaBuildResult:
+        """Constrói todas as variações disponíveis para o ano."""
+        contrato = ComparecimentoGoldContrato
+        ano_base = ano - contrato.INTERVALO_ELEICOES
+        tabelas: dict[str, Path] = {}
+        linhas = 0
+
+        for tabela in contrato.TABELAS_DELTA:
+            # Snapshot atual de cada ano: o ano base não está travado por esta escrita
+            particoes = listar_particoes_gold(self.settings, tabela, [ano, ano_base])
+            atual_path = particoes.get(ano)
+            if atual_path is None:
+                continue
+
+            atual = pl.scan_parquet(atual_path)
+            comparacoes = {
+                "turno": (
+                    atual.filter(pl.col("NR_TURNO") == 2),
+                    atual.filter(pl.col("NR_TURNO") == 1),
+                )
+            }
+
+            base_path = particoes.get(ano_base)
+            if base_path is not None:
+                comparacoes["ano"] = (atual, pl.scan_parquet(base_path))
+
+            for tipo, (lado_atual, lado_base) in comparacoes.items():
+                df = calcular_delta(lado_atual, lado_base, tipo, tabela).collect()
+
+                destino = caminho_delta_gold(self.settings, ano, tipo, tabela)
+                with escrita_atomica(destino) as tmp_path:
+                    df.write_parquet(tmp_path, compression="zstd", statistics=True)
+
+                tabelas[f"{tipo}_{tabela}"] = destino
+                linhas += len(df)
+
+        self.logger.success(
+            "gold_deltas_escritos",
+            ano=ano,
+            ano_base=ano_base,
+            tabelas=len(tabelas),
+            linhas=linhas,
+        )
+
+        return DeltaBuildResult(
+            destino_dir=diretorio_particao_gold(self.settings, ano), tabelas=tabelas, linhas=linhas
+        )
+
+
+def scan_delta(
+    tipo: str,
+    tabela: str,
+    anos: Sequence[int] | None = None,
+    *,
+    settings: Settings | None = None,
+) -> pl.LazyFrame:
+    """LazyFrame sobre as variações pré-calculadas de uma tabela Gold."""
+    settings = settings or Settings()
+    particoes = listar_particoes_gold(settings, f"delta_{tipo}_{tabela}", anos)
+
+    if not particoes:
+        schema = schema_tabela_gold(tabela)
+        vazio = pl.LazyFrame(schema=schema)
+        return calcular_delta(vazio, vazio, tipo, tabela).clear()
+
+    return pl.scan_parquet(list(particoes.values()))
+
+
+def maiores_variacoes(
+    tipo: str,
+    tabela: str,
+    ano: int,
+    *,
+    n: int = 10,
+    coluna: str = "DELTA_TAXA_COMPARECIMENTO_PP",
+    quedas: bool = True,
+    ufs: Sequence[str] | None = None,
+    settings: Settings | None = None,
+) -> pl.DataFrame:
+    """
+    Ranking das maiores quedas (ou altas) de uma variação pré-calculada.
+
+    Exemplo: 10 municípios da BA com maior queda de comparecimento desde 2018
+        maiores_variacoes("ano", "municipio", 2022, ufs=["BA"])
+    """
+    lf = scan_delta(tipo, tabela, [ano], settings=settings)
+
+    if ufs is not None:
+        lf = lf.filter(pl.col("SG_UF").is_in(list(ufs)))
+
+    return lf.sort(coluna, descending=not quedas, nulls_last=True).head(n).collect()
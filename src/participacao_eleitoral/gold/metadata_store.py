@@ -0,0 +1,184 @@
+"""Gerencia persistência de metadados de agregação Gold"""
+
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.utils.conexao_duckdb import conexao_duckdb
+from participacao_eleitoral.utils.logger import ModernLogger
+
+
+class GoldMetadataStore:
+    """
+    Gerência persistência de metadados de agregação Gold usando DuckDB.
+
+    Responsabilidades:
+    - Garantir idempotência (dataset + ano)
+    - Auditar execuções de agregação
+    - Servir como fonte de observabilidade do pipeline Gold
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        logger: ModernLogger,
+        db_path: Path | None = None,
+    ):
+        self.settings = settings
+        self.logger = logger
+
+        # Caminho do banco de metadados (gold)
+        self.db_path = db_path or self.settings.gold_dir / "_metadata.duckdb"
+
+        # Garante que o diretório existe
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Sem conexão permanente: o banco é compartilhado por workers paralelos
+        # e o DuckDB trava o arquivo para um único processo (ver conexao())
+
+        # Inicializa schema
+        self._create_tables()
+
+        self.logger.info("gold_metadata_store_inicializado", db_path=str(self.db_path))
+
+    def _create_tables(self) -> None:
+        """Inicializa o esquema se não existir."""
+
+        with self.conexao() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS gold_metadata (
+                    dataset TEXT NOT NULL,
+                    ano INTEGER NOT NULL,
+
+                    timestamp_inicio TIMESTAMP NOT NULL,
+                    timestamp_fim TIMESTAMP NOT NULL,
+
+                    linhas_silver BIGINT,
+                    linhas_gold BIGINT,
+                    duracao_segundos DOUBLE,
+                    status TEXT,
+                    erro TEXT,
+                    silver_fingerprint TEXT,
+
+                    PRIMARY KEY (dataset, ano)
+                )
+                """
+            )
+
+            # Add missing columns if table already exists (migration)
+            conn.execute(
+                "ALTER TABLE gold_metadata ADD COLUMN IF NOT EXISTS silver_fingerprint TEXT"
+            )
+
+    def salvar(self, metadata: dict[str, Any]) -> None:
+        """
+        Persiste metadados da agregação no DuckDB.
+
+        Usa UPSERT por ano para garantir idempotência.
+        """
+        with self.conexao() as conn:
+            conn.execute(
+                """
+                INSERT INTO gold_metadata (
+                    dataset,
+                    ano,
+                    timestamp_inicio,
+                    timestamp_fim,
+                    linhas_silver,
+                    linhas_gold,
+                    duracao_segundos,
+                    status,
+                    erro,
+                    silver_fingerprint
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (dataset, ano) DO UPDATE SET
+                    timestamp_inicio = excluded.timestamp_inicio,
+                    timestamp_fim = excluded.timestamp_fim,
+                    linhas_silver = excluded.linhas_silver,
+                    linhas_gold = excluded.linhas_gold,
+                    duracao_segundos = excluded.duracao_segundos,
+                    status = excluded.status,
+                    erro = excluded.erro,
+                    silver_fingerprint = excluded.silver_fingerprint
+                """,
+                (
+                    metadata["dataset"],
+                    metadata["ano"],
+                    metadata["inicio"],
+                    metadata["fim"],
+                    metadata["linhas_silver"],
+                    metadata["linhas_gold"],
+                    metadata["duracao_segundos"],
+                    metadata["status"],
+                    metadata["erro"],
+                    metadata.get("silver_fingerprint"),
+                ),
+            )
+
+        self.logger.success(
+            "gold_metadata_salvo",
+            ano=metadata["ano"],
+            status=metadata["status"],
+        )
+
+    def buscar(self, dataset: str, ano: int) -> dict[str, Any] | None:
+        """Busca metadados de uma agregação específica."""
+
+        with self.conexao() as conn:
+            row = conn.execute(
+                """
+                SELECT *
+                FROM gold_metadata
+                WHERE dataset = ? AND ano = ?
+                """,
+                (dataset, ano),
+            ).fetchone()
+            columns = [c[0] for c in conn.description]
+
+        if not row:
+            return None
+
+        return dict(zip(columns, row, strict=False))
+
+    def listar_todos(self) -> list[dict[str, Any]]:
+        """Lista todas as entradas de metadados de agregação."""
+
+        with self.conexao() as conn:
+            rows = conn.execute(
+                """
+                SELECT *
+                FROM gold_metadata
+                ORDER BY ano DESC
+                """
+            ).fetchall()
+            columns = [c[0] for c in conn.description]
+
+        if not rows:
+            return []
+
+        return [dict(zip(columns, row, strict=False)) for row in rows]
+
+    def conexao(self) -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+        """Conexão curta com o banco, aberta só durante uma leitura ou escrita."""
+        return conexao_duckdb(self.db_path)
+
+    def close(self) -> None:
+        """Nada a fechar: cada operação abre e fecha a própria conexão."""
+
+    def __enter__(self) -> "GoldMetadataStore":
+        """Suporta uso com contexto 'with'."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Mantido por compatibilidade com o uso em 'with'."""
+        self.close()
@@ -0,0 +1,206 @@
+"""Índice de extremos e outliers (z-score robusto) da camada Gold"""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.reader import listar_particoes_gold
+from participacao_eleitoral.gold.results import OutlierIndexResult
+from participacao_eleitoral.silver.reader import TAXAS_VIRTUAIS
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.logger import ModernLogger
+
+# Constante do z-score modificado: torna o MAD comparável ao desvio-padrão na normal
+FATOR_MAD = 0.6745
+
+NIVEL_ENUM = pl.Enum(ComparecimentoGoldContrato.NIVEIS_OUTLIERS)
+TAXA_ENUM = pl.Enum(list(TAXAS_VIRTUAIS))
+
+SCHEMA_OUTLIERS: dict[str, pl.DataType | type[pl.DataType]] = {
+    "ANO_ELEICAO": SCHEMA_SILVER["ANO_ELEICAO"],
+    "NR_TURNO": SCHEMA_SILVER["NR_TURNO"],
+    "NOME_REGIAO": SCHEMA_SILVER["NOME_REGIAO"],
+    "SG_UF": SCHEMA_SILVER["SG_UF"],
+    "NIVEL": NIVEL_ENUM,
+    "TAXA": TAXA_ENUM,
+    "CD_MUNICIPIO": SCHEMA_SILVER["CD_MUNICIPIO"],
+    "NM_MUNICIPIO": SCHEMA_SILVER["NM_MUNICIPIO"],
+    "NR_ZONA": SCHEMA_SILVER["NR_ZONA"],
+    "QT_APTOS": pl.Int64,
+    "VALOR": pl.Float64,
+    "MEDIANA_UF": pl.Float64,
+    "MAD_UF": pl.Float64,
+    "Z_ROBUSTO": pl.Float64,
+    "POSICAO_MAIOR": pl.UInt32,
+    "POSICAO_MENOR": pl.UInt32,
+    "OUTLIER": pl.Boolean,
+}
+
+_GRUPO = ["ANO_ELEICAO", "NR_TURNO", "SG_UF", "NIVEL", "TAXA"]
+
+
+def z_robusto(valor: pl.Expr, por: Sequence[str]) -> tuple[pl.Expr, pl.Expr, pl.Expr]:
+    """
+    Mediana, MAD e z-score robusto de `valor` dentro de cada grupo `por`.
+
+    Tudo em expressões de janela (over): uma passada, sem join de volta.
+    Grupos com MAD zero (taxas idênticas) não têm z definido (nulo).
+    """
+    grupo = list(por)
+    mediana = valor.median().over(grupo)
+    mad = (valor - mediana).abs().median().over(grupo)
+    z = pl.when(mad > 0).then(FATOR_MAD * (valor - mediana) / mad)
+    return mediana, mad, z
+
+
+class OutlierIndexBuilder:
+    """
+    Constrói o índice de triagem de anomalias de um ano a partir da Gold.
+
+    Para cada UF × turno × nível (município, zona) × taxa, guarda:
+    - as TOP_N_OUTLIERS maiores e menores taxas (POSICAO_MAIOR / POSICAO_MENOR)
+    - toda unidade com |Z_ROBUSTO| >= LIMIAR_Z_ROBUSTO (OUTLIER)
+
+    O z-score robusto usa mediana e MAD da própria UF, então um município
+    atípico não desloca a referência como faria com média e desvio-padrão.
+    """
+
+    def __init__(
+        self,
+        logger: ModernLogger,
+        top_n: int = ComparecimentoGoldContrato.TOP_N_OUTLIERS,
+        limiar: float = ComparecimentoGoldContrato.LIMIAR_Z_ROBUSTO,
+    ):
+        self.logger = logger
+        self.top_n = top_n
+        self.limiar = limiar
+
+    def build(self, tabelas: dict[str, Path], destino: Path) -> OutlierIndexResult:
+        """
+        Escreve o índice do ano (escrita atômica).
+
+        Args:
+            tabelas: Tabelas Gold do ano por grão (precisa de NIVEIS_OUTLIERS)
+            destino: Caminho do indice_outliers.parquet do ano
+
+        Returns:
+            OutlierIndexResult com o caminho, as linhas e o total de outliers
+        """
+        partes = [
+            pl.scan_parquet(tabelas[nivel])
+            .unpivot(
+                index=[c for c in SCHEMA_OUTLIERS if c in _colunas_do_grao(nivel)],
+                on=list(TAXAS_VIRTUAIS),
+                variable_name="TAXA",
+                value_name="VALOR",
+            )
+            .drop_nulls("VALOR")
+            .with_columns(pl.lit(nivel).alias("NIVEL"))
+            for nivel in ComparecimentoGoldContrato.NIVEIS_OUTLIERS
+        ]
+
+        mediana, mad, z = z_robusto(pl.col("VALOR"), _GRUPO)
+
+        df = (
+            pl.concat(partes, how="diagonal")
+            .with_columns(
+                mediana.alias("MEDIANA_UF"),
+                mad.alias("MAD_UF"),
+                z.alias("Z_ROBUSTO"),
+                pl.col("VALOR")
+                .rank("ordinal", descending=True)
+                .over(_GRUPO)
+                .alias("POSICAO_MAIOR"),
+                pl.col("VALOR").rank("ordinal").over(_GRUPO).alias("POSICAO_MENOR"),
+            )
+            .with_columns(
+                (pl.col("Z_ROBUSTO").abs() >= self.limiar).fill_null(False).alias("OUTLIER")
+            )
+            .filter(
+                (pl.col("POSICAO_MAIOR") <= self.top_n)
+                | (pl.col("POSICAO_MENOR") <= self.top_n)
+                | pl.col("OUTLIER")
+            )
+            .select([pl.col(c).cast(t) for c, t in SCHEMA_OUTLIERS.items()])
+            .sort([*_GRUPO, "POSICAO_MAIOR"])
+            .collect()
+        )
+
+        outliers = int(df["OUTLIER"].sum())
+        with escrita_atomica(destino) as tmp_path:
+            df.write_parquet(tmp_path, compression="zstd", statistics=True)
+
+        self.logger.success(
+            "indice_outliers_escrito",
+            arquivo=str(destino),
+            linhas=len(df),
+            outliers=outliers,
+        )
+        return OutlierIndexResult(indice_path=destino, linhas=len(df), outliers=outliers)
+
+
+def _colunas_do_grao(nivel: str) -> list[str]:
+    return [
+        *ComparecimentoGoldContrato.DIMENSOES_BASE,
+        *ComparecimentoGoldContrato.GRAOS[nivel],
+        "QT_APTOS",
+    ]
+
+
+def consultar_outliers(
+    ano: int,
+    ufs: Sequence[str] | None = None,
+    *,
+    nivel: str = "municipio",
+    taxa: str = "TAXA_COMPARECIMENTO_PCT",
+    turno: int | None = None,
+    apenas_outliers: bool = False,
+    settings: Settings | None = None,
+) -> pl.DataFrame:
+    """
+    Lê extremos e outliers de um ano direto do índice (sem tocar a Gold nem a Silver).
+
+    Ordenado por |Z_ROBUSTO| decrescente dentro de cada UF e turno.
+
+    Exemplo: zonas com abstenção atípica na BA em 2022
+        consultar_outliers(2022, ["BA"], nivel="zona", taxa="TAXA_ABSTENCAO_PCT",
+                           apenas_outliers=True)
+    """
+    if taxa not in TAXAS_VIRTUAIS:
+        raise ValueError(f"Taxa desconhecida: {taxa}. Taxas válidas: {list(TAXAS_VIRTUAIS)}")
+    if nivel not in ComparecimentoGoldContrato.NIVEIS_OUTLIERS:
+        raise ValueError(
+            f"Nível desconhecido: {nivel}. "
+            f"Níveis válidos: {ComparecimentoGoldContrato.NIVEIS_OUTLIERS}"
+        )
+
+    settings = settings or Settings()
+    particoes = listar_particoes_gold(settings, ComparecimentoGoldContrato.TABELA_OUTLIERS, [ano])
+    if not particoes:
+        return pl.DataFrame(schema=SCHEMA_OUTLIERS)
+
+    lf = pl.scan_parquet(particoes[ano]).filter(
+        (pl.col("NIVEL") == nivel) & (pl.col("TAXA") == taxa)
+    )
+    if ufs is not None:
+        lf = lf.filter(pl.col("SG_UF").is_in(list(ufs)))
+    if turno is not None:
+        lf = lf.filter(pl.col("NR_TURNO") == turno)
+    if apenas_outliers:
+        lf = lf.filter(pl.col("OUTLIER"))
+
+    return (
+        lf.sort(
+            ["SG_UF", "NR_TURNO", pl.col("Z_ROBUSTO").abs()],
+            descending=[False, False, True],
+            nulls_last=True,
+        )
+        .select(list(SCHEMA_OUTLIERS))
+        .collect()
+    )
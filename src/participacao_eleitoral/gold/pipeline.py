@@ -0,0 +1,335 @@
+"""Orquestrador da agregação Silver → Gold"""
+
+from datetime import UTC, datetime
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.core.entities import Dataset
+from participacao_eleitoral.core.enums import StatusIngestao
+from participacao_eleitoral.gold.reader import (
+    caminho_delta_gold,
+    caminho_historico_gold,
+    diretorio_gold,
+    diretorio_particao_gold,
+    listar_particoes_gold,
+    scan_gold,
+)
+from participacao_eleitoral.silver.metadata_store import SilverMetadataStore
+from participacao_eleitoral.silver.reader import caminho_particao_silver, scan_silver
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica, trava_particao
+from participacao_eleitoral.utils.logger import ModernLogger
+from participacao_eleitoral.utils.manifesto import registrar_no_manifesto
+from participacao_eleitoral.utils.snapshots import PartitionSnapshots
+
+from .builder import GoldAggregateBuilder
+from .cube import DemographicCubeBuilder
+from .deltas import DeltaTableBuilder
+from .metadata_store import GoldMetadataStore
+from .outliers import OutlierIndexBuilder
+from .refresh import GoldRefreshPlan, GoldRefreshPlanner
+from .results import (
+    DemographicCubeResult,
+    GoldBuildResult,
+    OutlierIndexResult,
+    RateSketchResult,
+)
+from .sketches import RateSketchBuilder
+
+
+class GoldAggregationPipeline:
+    """
+    Orquestrador do fluxo de agregação Silver → Gold.
+
+    Esta classe:
+    - coordena as etapas
+    - aplica idempotência (DuckDB + impressão digital da Silver + arquivos)
+    - atualiza incrementalmente só os anos cuja Silver mudou
+    - conecta core e infra
+
+    Ela NÃO conhece:
+    - Airflow
+    - CLI
+    - detalhes internos de Polars
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        logger: ModernLogger,
+        metadata_store: GoldMetadataStore | None = None,
+        silver_metadata_store: SilverMetadataStore | None = None,
+    ):
+        self.settings = settings
+        self.logger = logger
+
+        # MetadataStore pode ser injetado (útil para testes)
+        self.metadata_store = metadata_store or GoldMetadataStore(
+            settings=settings,
+            logger=logger,
+        )
+
+        # Metadados da Silver: origem das impressões digitais do refresh
+        self.silver_metadata_store = silver_metadata_store or SilverMetadataStore(
+            settings=settings,
+            logger=logger,
+        )
+
+        self.planner = GoldRefreshPlanner(
+            settings=settings,
+            logger=logger,
+            silver_metadata_store=self.silver_metadata_store,
+            gold_metadata_store=self.metadata_store,
+        )
+
+        # Builders (grãos geográficos, cubo demográfico, sketches e outliers)
+        self.builder = GoldAggregateBuilder(logger=logger)
+        self.cube_builder = DemographicCubeBuilder(logger=logger)
+        self.sketch_builder = RateSketchBuilder(logger=logger)
+        self.outlier_builder = OutlierIndexBuilder(logger=logger)
+        self.delta_builder = DeltaTableBuilder(settings=settings, logger=logger)
+
+    def run(self, ano: int) -> None:
+        """
+        Executa o pipeline completo para um ano específico.
+
+        Fluxo:
+        1. Cria entidade do domínio
+        2. Verifica idempotência (DuckDB + impressão digital da Silver + arquivos)
+        3. Trava a partição e verifica idempotência de novo
+        4. Verifica se a Silver existe
+        5. Agrega todos os grãos
+        6. Constrói o cubo demográfico
+        7. Constrói os sketches de distribuição das taxas
+        8. Constrói o índice de extremos e outliers
+        9. Publica as tabelas 5-8 juntas, como um único snapshot
+        10. Persiste metadados
+        """
+
+        dataset = Dataset(
+            nome=ComparecimentoGoldContrato.DATASET_NAME,
+            ano=ano,
+            url_origem=str(caminho_particao_silver(self.settings, ano)),
+        )
+
+        if self._ja_agregado(dataset, ano):
+            return
+
+        # Workers paralelos no mesmo diretório serializam por partição
+        with trava_particao(diretorio_particao_gold(self.settings, ano)):
+            # Outro worker pode ter concluído enquanto esperávamos a trava
+            if self._ja_agregado(dataset, ano):
+                return
+
+            self._agregar(dataset, ano)
+
+    def refresh(self, anos: list[int] | None = None) -> GoldRefreshPlan:
+        """
+        Atualização incremental: reagrega só os anos cuja Silver mudou.
+
+        Depois, a partir das tabelas anuais da Gold (sem reler a Silver):
+        - recalcula as variações dos anos afetados (o próprio ano e a eleição
+          seguinte do mesmo tipo, que o usa como base)
+        - reconstrói as séries multi-ano (GRAOS_HISTORICO)
+        """
+        plano = self.planner.planejar(anos)
+
+        for ano in plano.reconstruir:
+            self.run(ano)
+
+        self.atualizar_deltas(plano.reconstruir)
+
+        historico_ausente = any(
+            not caminho_historico_gold(self.settings, grao).exists()
+            for grao in ComparecimentoGoldContrato.GRAOS_HISTORICO
+        )
+        if plano.reconstruir or historico_ausente:
+            self.atualizar_historico()
+
+        return plano
+
+    def atualizar_deltas(self, reconstruidos: list[int]) -> list[int]:
+        """
+        Recalcula as tabelas de variação afetadas por anos reagregados.
+
+        Também cobre anos da Gold que ainda não têm variações (ex.: Gold
+        construída antes das tabelas de variação existirem).
+        """
+        intervalo = ComparecimentoGoldContrato.INTERVALO_ELEICOES
+        anos_gold = set(listar_particoes_gold(self.settings, "nacional"))
+
+        afetados = {a for ano in reconstruidos for a in (ano, ano + intervalo)}
+        afetados |= {
+            ano
+            for ano in anos_gold
+            if not caminho_delta_gold(self.settings, ano, "turno", "nacional").exists()
+        }
+
+        for ano in sorted(afetados & anos_gold):
+            diretorio = diretorio_particao_gold(self.settings, ano)
+            with trava_particao(diretorio):
+                deltas = self.delta_builder.build(ano)
+                PartitionSnapshots(diretorio).commit(
+                    [arquivo.name for arquivo in deltas.tabelas.values()], "deltas"
+                )
+            registrar_no_manifesto(diretorio_gold(self.settings), deltas.tabelas.values())
+
+        return sorted(afetados & anos_gold)
+
+    def atualizar_historico(self) -> None:
+        """Reconstrói as séries multi-ano a partir das partições anuais da Gold."""
+
+        historicos = [
+            caminho_historico_gold(self.settings, grao)
+            for grao in ComparecimentoGoldContrato.GRAOS_HISTORICO
+        ]
+
+        # Trava o dataset inteiro: as séries cobrem todos os anos
+        with trava_particao(diretorio_gold(self.settings)):
+            for grao, destino in zip(
+                ComparecimentoGoldContrato.GRAOS_HISTORICO, historicos, strict=True
+            ):
+                df = scan_gold(grao, settings=self.settings).collect()
+
+                with escrita_atomica(destino) as tmp_path:
+                    df.write_parquet(tmp_path, compression="zstd", statistics=True)
+
+                self.logger.info("gold_historico_atualizado", grao=grao, linhas=len(df))
+
+            registrar_no_manifesto(diretorio_gold(self.settings), historicos)
+
+    def _ja_agregado(self, dataset: Dataset, ano: int) -> bool:
+        """Idempotência: Gold do ano em dia com a Silver atual (ver GoldRefreshPlanner)."""
+
+        if not self.planner.esta_em_dia(ano):
+            return False
+
+        self.logger.info(
+            "agregacao_ja_realizada",
+            dataset=dataset.nome,
+            ano=ano,
+        )
+        return True
+
+    def _agregar(self, dataset: Dataset, ano: int) -> None:
+        """Executa a agregação de um ano (com a partição travada)."""
+
+        inicio = datetime.now(UTC)
+
+        try:
+            self.logger.info(
+                "pipeline_gold_iniciado",
+                dataset=dataset.nome,
+                ano=ano,
+            )
+
+            # Verifica se silver existe
+            silver_path = caminho_particao_silver(self.settings, ano)
+
+            if not silver_path.exists():
+                self.logger.warning(
+                    "silver_nao_existe_skip",
+                    ano=ano,
+                    silver_path=str(silver_path),
+                )
+                return
+
+            # Impressão digital ANTES de ler: uma Silver reescrita durante a
+            # agregação fica com impressão diferente e é reprocessada depois
+            fingerprint = self.planner.fingerprint(ano)
+
+            contrato = ComparecimentoGoldContrato
+            diretorio = diretorio_particao_gold(self.settings, ano)
+
+            # Todas as tabelas do ano são montadas numa versão nova e publicadas
+            # juntas: leitores nunca veem grãos novos com cubo/sketch/outliers antigos
+            with PartitionSnapshots(diretorio).nova_versao("aggregate") as versao_dir:
+                result: GoldBuildResult = self.builder.build(
+                    silver=scan_silver(anos=[ano], settings=self.settings),
+                    destino_dir=versao_dir,
+                )
+
+                cubo: DemographicCubeResult = self.cube_builder.build(
+                    silver_parquet_path=silver_path,
+                    destino=versao_dir / f"{contrato.TABELA_CUBO}.parquet",
+                )
+
+                sketch: RateSketchResult = self.sketch_builder.build(
+                    tabelas=result.tabelas,
+                    destino=versao_dir / f"{contrato.TABELA_SKETCH}.parquet",
+                )
+
+                indice: OutlierIndexResult = self.outlier_builder.build(
+                    tabelas=result.tabelas,
+                    destino=versao_dir / f"{contrato.TABELA_OUTLIERS}.parquet",
+                )
+
+            publicados = [
+                diretorio / arquivo.name
+                for arquivo in (
+                    *result.tabelas.values(),
+                    cubo.cubo_path,
+                    sketch.sketch_path,
+                    indice.indice_path,
+                )
+            ]
+
+            # Estatísticas das tabelas do ano para leitores podarem sem abrir o Parquet
+            registrar_no_manifesto(diretorio_gold(self.settings), publicados)
+
+            fim = datetime.now(UTC)
+
+            metadata = {
+                "dataset": dataset.nome,
+                "ano": dataset.ano,
+                "status": StatusIngestao.SUCESSO.value,
+                "inicio": inicio.astimezone(UTC).isoformat(),
+                "fim": fim.astimezone(UTC).isoformat(),
+                "duracao_segundos": (fim - inicio).total_seconds(),
+                "linhas_silver": result.linhas_silver,
+                "linhas_gold": (
+                    sum(result.linhas_por_grao.values())
+                    + cubo.linhas
+                    + sketch.linhas
+                    + indice.linhas
+                ),
+                "erro": None,
+                "silver_fingerprint": fingerprint,
+            }
+
+            self.metadata_store.salvar(metadata)
+
+            self.logger.success(
+                "pipeline_gold_concluido",
+                dataset=dataset.nome,
+                ano=ano,
+                linhas_silver=result.linhas_silver,
+            )
+
+        except Exception as exc:
+            fim = datetime.now(UTC)
+
+            self.logger.error(
+                "pipeline_gold_falhou",
+                dataset=dataset.nome,
+                ano=ano,
+                erro=str(exc),
+                tipo_erro=type(exc).__name__,
+            )
+
+            metadata = {
+                "dataset": dataset.nome,
+                "ano": dataset.ano,
+                "status": StatusIngestao.FALHA.value,
+                "inicio": inicio.astimezone(UTC).isoformat(),
+                "fim": fim.astimezone(UTC).isoformat(),
+                "duracao_segundos": (fim - inicio).total_seconds(),
+                "linhas_silver": 0,
+                "linhas_gold": 0,
+                "erro": str(exc),
+            }
+
+            self.metadata_store.salvar(metadata)
+
+            raise
@@ -0,0 +1,143 @@
+"""Ponto único de leitura da camada Gold"""
+
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.schemas.comparecimento_gold import schema_gold
+from participacao_eleitoral.utils.snapshots import PartitionSnapshots
+
+# Partições por ano (year=YYYY), uma tabela Parquet por grão dentro de cada ano
+COLUNA_PARTICAO = "year"
+
+_PADRAO_PARTICAO = re.compile(rf"^{COLUNA_PARTICAO}=(\d{{4}})$")
+
+
+def diretorio_gold(settings: Settings) -> Path:
+    """Diretório do dataset Gold (raiz das partições year=YYYY)."""
+    return settings.gold_dir / ComparecimentoGoldContrato.DATASET_NAME
+
+
+def diretorio_particao_gold(settings: Settings, ano: int) -> Path:
+    """Diretório com as tabelas Gold (uma por grão) de um ano."""
+    return diretorio_gold(settings) / f"{COLUNA_PARTICAO}={ano}"
+
+
+def caminho_tabela_gold(settings: Settings, ano: int, grao: str) -> Path:
+    """Caminho do Parquet Gold de um grão em um ano."""
+    return diretorio_particao_gold(settings, ano) / f"{grao}.parquet"
+
+
+def caminho_delta_gold(settings: Settings, ano: int, tipo: str, tabela: str) -> Path:
+    """Caminho da tabela de variação (tipo "ano" ou "turno") de uma tabela Gold."""
+    return diretorio_particao_gold(settings, ano) / f"delta_{tipo}_{tabela}.parquet"
+
+
+def caminho_historico_gold(settings: Settings, grao: str) -> Path:
+    """Caminho da série multi-ano de um grão (ver GRAOS_HISTORICO)."""
+    return diretorio_gold(settings) / f"historico_{grao}.parquet"
+
+
+def scan_historico_gold(
+    grao: str,
+    anos: Sequence[int] | None = None,
+    *,
+    settings: Settings | None = None,
+) -> pl.LazyFrame:
+    """
+    Retorna um LazyFrame sobre a série multi-ano de um grão (um único arquivo).
+
+    É o caminho de leitura barato para consumidores interativos (dashboard):
+    todos os anos em kilobytes, sem listar partições. Sem a série construída
+    (`data aggregate`), retorna um LazyFrame vazio tipado.
+    """
+    if grao not in ComparecimentoGoldContrato.GRAOS_HISTORICO:
+        raise ValueError(
+            f"Grão sem série histórica: {grao}. "
+            f"Grãos válidos: {ComparecimentoGoldContrato.GRAOS_HISTORICO}"
+        )
+
+    settings = settings or Settings()
+    schema = schema_gold(grao)
+    caminho = caminho_historico_gold(settings, grao)
+
+    if not caminho.exists():
+        return pl.LazyFrame(schema=schema)
+
+    lf = pl.scan_parquet(caminho, schema=schema)
+    if anos is not None:
+        lf = lf.filter(pl.col("ANO_ELEICAO").is_in(list(anos)))
+    return lf
+
+
+def listar_particoes_gold(
+    settings: Settings,
+    grao: str,
+    anos: Iterable[int] | None = None,
+) -> dict[int, Path]:
+    """
+    Lista as tabelas Gold existentes de um grão, podando pelo nome do diretório.
+
+    Cada arquivo é o do snapshot atual da partição: as tabelas de um ano são
+    publicadas juntas (PartitionSnapshots.nova_versao), então leitores nunca
+    misturam tabelas de versões diferentes do mesmo ano.
+    """
+    raiz = diretorio_gold(settings)
+    if not raiz.exists():
+        return {}
+
+    filtro = set(anos) if anos is not None else None
+    particoes: dict[int, Path] = {}
+
+    for diretorio in sorted(raiz.iterdir()):
+        match = _PADRAO_PARTICAO.match(diretorio.name)
+        if not match:
+            continue
+
+        ano = int(match.group(1))
+        if filtro is not None and ano not in filtro:
+            continue
+
+        arquivo = PartitionSnapshots(diretorio).atual(f"{grao}.parquet")
+        if arquivo.exists():
+            particoes[ano] = arquivo
+
+    return particoes
+
+
+def scan_gold(
+    grao: str,
+    anos: Sequence[int] | None = None,
+    *,
+    settings: Settings | None = None,
+    versoes: Mapping[int, int] | None = None,
+) -> pl.LazyFrame:
+    """
+    Retorna um LazyFrame sobre a tabela Gold de um grão.
+
+    Todas as partições são escritas pelo mesmo builder, então o concat
+    é sempre vertical. Sem partições, retorna um LazyFrame vazio tipado.
+
+    `versoes` fixa o snapshot lido por ano (ex.: {2022: 3}); os demais
+    anos leem o snapshot atual.
+    """
+    settings = settings or Settings()
+    schema = schema_gold(grao)
+    particoes = listar_particoes_gold(settings, grao, anos)
+
+    for ano, versao in (versoes or {}).items():
+        if ano in particoes:
+            particoes[ano] = PartitionSnapshots(diretorio_particao_gold(settings, ano)).caminho(
+                versao, particoes[ano].name
+            )
+
+    if not particoes:
+        return pl.LazyFrame(schema=schema)
+
+    return pl.scan_parquet(list(particoes.values()), schema=schema)
@@ -0,0 +1,129 @@
+"""Planejamento da atualização incremental da Gold"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.core.contracts.comparecimento_silver import (
+    ComparecimentoSilverContrato,
+)
+from participacao_eleitoral.core.enums import StatusIngestao
+from participacao_eleitoral.gold.reader import caminho_tabela_gold, listar_particoes_gold
+from participacao_eleitoral.silver.metadata_store import SilverMetadataStore
+from participacao_eleitoral.silver.reader import caminho_particao_silver, listar_particoes_silver
+from participacao_eleitoral.utils.logger import ModernLogger
+
+from .metadata_store import GoldMetadataStore
+
+
+def fingerprint_silver(arquivo: Path, registro: dict[str, Any] | None) -> str:
+    """
+    Impressão digital de uma partição Silver.
+
+    Combina o rodapé do sistema de arquivos (tamanho + mtime em ns, que
+    mudam a cada os.replace da escrita atômica) com o fim da última
+    transformação registrada no SilverMetadataStore. Partições escritas
+    fora do pipeline (CLI transform) não têm registro e usam só o arquivo.
+    """
+    stat = arquivo.stat()
+
+    fim = "-"
+    if registro and registro["status"] == StatusIngestao.SUCESSO.value:
+        fim = str(registro["timestamp_fim"])
+
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{fim}"
+
+
+@dataclass(frozen=True)
+class GoldRefreshPlan:
+    """
+    Plano de atualização da Gold.
+
+    - reconstruir: anos com Silver nova ou alterada desde a última agregação
+    - em_dia: anos cuja Gold corresponde à Silver atual
+    - sem_silver: anos com Gold mas sem partição Silver (não são apagados)
+    """
+
+    reconstruir: list[int]
+    em_dia: list[int]
+    sem_silver: list[int]
+
+
+class GoldRefreshPlanner:
+    """
+    Decide quais partições anuais da Gold precisam ser recalculadas.
+
+    Compara a impressão digital atual de cada partição Silver com a
+    registrada no GoldMetadataStore na última agregação bem-sucedida.
+    Nenhum Parquet é lido: só metadados DuckDB e stat() dos arquivos.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        logger: ModernLogger,
+        silver_metadata_store: SilverMetadataStore,
+        gold_metadata_store: GoldMetadataStore,
+    ):
+        self.settings = settings
+        self.logger = logger
+        self.silver_metadata_store = silver_metadata_store
+        self.gold_metadata_store = gold_metadata_store
+
+    def fingerprint(self, ano: int) -> str | None:
+        """Impressão digital atual da Silver de um ano (None se não existe)."""
+        arquivo = caminho_particao_silver(self.settings, ano)
+        if not arquivo.exists():
+            return None
+
+        registro = self.silver_metadata_store.buscar(ComparecimentoSilverContrato.DATASET_NAME, ano)
+        return fingerprint_silver(arquivo, registro)
+
+    def esta_em_dia(self, ano: int) -> bool:
+        """Gold do ano agregada com sucesso, a partir da Silver atual, com todas as tabelas."""
+        registro = self.gold_metadata_store.buscar(ComparecimentoGoldContrato.DATASET_NAME, ano)
+
+        if not registro or registro["status"] != StatusIngestao.SUCESSO.value:
+            return False
+
+        atual = self.fingerprint(ano)
+        if atual is None or registro.get("silver_fingerprint") != atual:
+            return False
+
+        tabelas = [
+            *ComparecimentoGoldContrato.GRAOS,
+            ComparecimentoGoldContrato.TABELA_CUBO,
+            ComparecimentoGoldContrato.TABELA_SKETCH,
+            ComparecimentoGoldContrato.TABELA_OUTLIERS,
+        ]
+        return all(caminho_tabela_gold(self.settings, ano, t).exists() for t in tabelas)
+
+    def planejar(self, anos: Iterable[int] | None = None) -> GoldRefreshPlan:
+        """Monta o plano para os anos pedidos (padrão: todos com Silver ou Gold)."""
+        filtro = set(anos) if anos is not None else None
+
+        anos_silver = set(listar_particoes_silver(self.settings, filtro))
+        anos_gold = set(listar_particoes_gold(self.settings, "nacional", filtro))
+
+        reconstruir = sorted(ano for ano in anos_silver if not self.esta_em_dia(ano))
+        em_dia = sorted(anos_silver - set(reconstruir))
+        sem_silver = sorted(anos_gold - anos_silver)
+
+        plano = GoldRefreshPlan(reconstruir=reconstruir, em_dia=em_dia, sem_silver=sem_silver)
+
+        self.logger.info(
+            "gold_refresh_planejado",
+            reconstruir=plano.reconstruir,
+            em_dia=plano.em_dia,
+            sem_silver=plano.sem_silver,
+        )
+
+        if plano.sem_silver:
+            self.logger.warning("gold_sem_silver", anos=plano.sem_silver)
+
+        return plano
@@ -0,0 +1,79 @@
+"""Objetos de resultado da agregação Gold"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class GoldBuildResult:
+    """
+    Resultado da agregação Silver → Gold de um ano.
+
+    Este objeto:
+    - é imutável (frozen=True)
+    - representa agregação bem-sucedida
+    - contém o caminho e o tamanho de cada tabela por grão
+    """
+
+    tabelas: dict[str, Path]
+    linhas_silver: int
+    linhas_por_grao: dict[str, int]
+
+
+@dataclass(frozen=True)
+class DemographicCubeResult:
+    """
+    Resultado da construção do cubo demográfico de um ano.
+
+    Este objeto:
+    - é imutável (frozen=True)
+    - representa construção bem-sucedida
+    """
+
+    cubo_path: Path
+    linhas: int
+    conjuntos: int
+
+
+@dataclass(frozen=True)
+class DeltaBuildResult:
+    """
+    Resultado da construção das tabelas de variação de um ano.
+
+    Este objeto:
+    - é imutável (frozen=True)
+    - lista as tabelas escritas ("<tipo>_<tabela>" → caminho)
+    """
+
+    destino_dir: Path
+    tabelas: dict[str, Path]
+    linhas: int
+
+
+@dataclass(frozen=True)
+class RateSketchResult:
+    """
+    Resultado da construção dos sketches de distribuição de um ano.
+
+    Este objeto:
+    - é imutável (frozen=True)
+    - representa construção bem-sucedida
+    """
+
+    sketch_path: Path
+    linhas: int
+
+
+@dataclass(frozen=True)
+class OutlierIndexResult:
+    """
+    Resultado da construção do índice de outliers de um ano.
+
+    Este objeto:
+    - é imutável (frozen=True)
+    - representa construção bem-sucedida
+    """
+
+    indice_path: Path
+    linhas: int
+    outliers: int
@@ -0,0 +1,15 @@
+from .comparecimento_gold import (
+    MEDIDAS_GOLD,
+    colunas_grupo_cubo,
+    schema_cubo,
+    schema_gold,
+    schema_tabela_gold,
+)
+
+__all__ = [
+    "MEDIDAS_GOLD",
+    "colunas_grupo_cubo",
+    "schema_cubo",
+    "schema_gold",
+    "schema_tabela_gold",
+]
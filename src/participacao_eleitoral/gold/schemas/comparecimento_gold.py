@@ -0,0 +1,70 @@
+"""Schema físico da camada Gold"""
+
+import polars as pl
+
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+
+# Medidas agregadas: somas de muitas linhas de perfil pedem Int64,
+# e as taxas (soma/soma) ficam em Float64 por serem poucas linhas
+MEDIDAS_GOLD: dict[str, pl.DataType | type[pl.DataType]] = {
+    "QT_APTOS": pl.Int64,
+    "QT_COMPARECIMENTO": pl.Int64,
+    "QT_ABSTENCAO": pl.Int64,
+    "TAXA_COMPARECIMENTO_PCT": pl.Float64,
+    "TAXA_ABSTENCAO_PCT": pl.Float64,
+}
+
+
+def schema_gold(grao: str) -> dict[str, pl.DataType | type[pl.DataType]]:
+    """
+    SCHEMA FÍSICO da tabela Gold de um grão.
+
+    Dimensões mantêm o tipo da Silver (Categorical/Enum continuam compactos);
+    medidas seguem MEDIDAS_GOLD.
+    """
+    if grao not in ComparecimentoGoldContrato.GRAOS:
+        raise ValueError(
+            f"Grão desconhecido: {grao}. Grãos válidos: {list(ComparecimentoGoldContrato.GRAOS)}"
+        )
+
+    dimensoes = ComparecimentoGoldContrato.DIMENSOES_BASE + ComparecimentoGoldContrato.GRAOS[grao]
+
+    return {
+        **{dimensao: SCHEMA_SILVER[dimensao] for dimensao in dimensoes},
+        **MEDIDAS_GOLD,
+    }
+
+
+def colunas_grupo_cubo() -> list[str]:
+    """
+    Colunas cobertas pelo GRUPO_ID do cubo, na ordem dos bits.
+
+    A primeira coluna é o bit mais significativo (mesma convenção do
+    GROUPING() do DuckDB): bit 1 = coluna agregada (fora do conjunto).
+    """
+    contrato = ComparecimentoGoldContrato
+    return contrato.NIVEIS_GEOGRAFICOS["uf"] + contrato.DIMENSOES_DEMOGRAFICAS
+
+
+def schema_cubo() -> dict[str, pl.DataType | type[pl.DataType]]:
+    """SCHEMA FÍSICO do cubo demográfico."""
+    return {
+        **{
+            dimensao: SCHEMA_SILVER[dimensao]
+            for dimensao in ComparecimentoGoldContrato.DIMENSOES_BASE
+        },
+        # Cabe folgadamente: 10 colunas de agrupamento → 10 bits
+        "GRUPO_ID": pl.UInt16,
+        **{coluna: SCHEMA_SILVER[coluna] for coluna in colunas_grupo_cubo()},
+        **MEDIDAS_GOLD,
+    }
+
+
+def schema_tabela_gold(tabela: str) -> dict[str, pl.DataType | type[pl.DataType]]:
+    """Schema de qualquer tabela anual da Gold (grão ou cubo demográfico)."""
+    if tabela == ComparecimentoGoldContrato.TABELA_CUBO:
+        return schema_cubo()
+    return schema_gold(tabela)
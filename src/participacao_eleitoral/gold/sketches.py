@@ -0,0 +1,218 @@
+"""Sketches de distribuição das taxas (histogramas somáveis) da camada Gold"""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.reader import listar_particoes_gold
+from participacao_eleitoral.gold.results import RateSketchResult
+from participacao_eleitoral.silver.reader import TAXAS_VIRTUAIS
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.logger import ModernLogger
+
+RESOLUCAO_PP = ComparecimentoGoldContrato.RESOLUCAO_SKETCH_PP
+N_BINS = round(100 / RESOLUCAO_PP)
+
+# Erro absoluto máximo de um percentil: o valor devolvido é o centro do bin
+ERRO_MAXIMO_PP = RESOLUCAO_PP / 2
+
+NIVEL_ENUM = pl.Enum(ComparecimentoGoldContrato.NIVEIS_SKETCH)
+TAXA_ENUM = pl.Enum(list(TAXAS_VIRTUAIS))
+
+SCHEMA_SKETCH: dict[str, pl.DataType | type[pl.DataType]] = {
+    "ANO_ELEICAO": SCHEMA_SILVER["ANO_ELEICAO"],
+    "NR_TURNO": SCHEMA_SILVER["NR_TURNO"],
+    "NOME_REGIAO": SCHEMA_SILVER["NOME_REGIAO"],
+    "SG_UF": SCHEMA_SILVER["SG_UF"],
+    "NIVEL": NIVEL_ENUM,
+    "TAXA": TAXA_ENUM,
+    "BIN": pl.UInt16,
+    "CONTAGEM": pl.UInt32,
+}
+
+_PARTICAO = ["ANO_ELEICAO", "NR_TURNO", "NOME_REGIAO", "SG_UF"]
+
+
+def bin_da_taxa(taxa: pl.Expr) -> pl.Expr:
+    """Índice do bin de uma taxa em [0, 100] (100% cai no último bin)."""
+    return (taxa / RESOLUCAO_PP).floor().clip(0, N_BINS - 1).cast(pl.UInt16)
+
+
+class RateSketchBuilder:
+    """
+    Constrói os sketches de distribuição de um ano a partir da Gold.
+
+    Um sketch é um histograma esparso (só bins não vazios) das taxas de
+    municípios e zonas, por ano × turno × UF. Histogramas de resolução fixa
+    são somáveis: juntar UFs, regiões ou anos é somar CONTAGEM por BIN,
+    sem perda além da resolução.
+    """
+
+    def __init__(self, logger: ModernLogger):
+        self.logger = logger
+
+    def build(self, tabelas: dict[str, Path], destino: Path) -> RateSketchResult:
+        """
+        Escreve o sketch do ano (escrita atômica).
+
+        Args:
+            tabelas: Tabelas Gold do ano por grão (precisa de NIVEIS_SKETCH)
+            destino: Caminho do sketch_taxas.parquet do ano
+
+        Returns:
+            RateSketchResult com o caminho e o número de bins não vazios
+        """
+        partes = [
+            pl.scan_parquet(tabelas[nivel])
+            .unpivot(index=_PARTICAO, on=list(TAXAS_VIRTUAIS), variable_name="TAXA")
+            .drop_nulls("value")
+            .with_columns(
+                pl.lit(nivel).alias("NIVEL"),
+                bin_da_taxa(pl.col("value")).alias("BIN"),
+            )
+            for nivel in ComparecimentoGoldContrato.NIVEIS_SKETCH
+        ]
+
+        df = (
+            pl.concat(partes)
+            .group_by([*_PARTICAO, "NIVEL", "TAXA", "BIN"])
+            .agg(pl.len().alias("CONTAGEM"))
+            .select([pl.col(c).cast(t) for c, t in SCHEMA_SKETCH.items()])
+            .sort(["NIVEL", "TAXA", *_PARTICAO, "BIN"])
+            .collect()
+        )
+
+        with escrita_atomica(destino) as tmp_path:
+            df.write_parquet(tmp_path, compression="zstd", statistics=True)
+
+        self.logger.success("sketch_taxas_escrito", arquivo=str(destino), linhas=len(df))
+        return RateSketchResult(sketch_path=destino, linhas=len(df))
+
+
+def _sketch_mesclado(
+    taxa: str,
+    nivel: str,
+    por: Sequence[str],
+    anos: Sequence[int] | None,
+    ufs: Sequence[str] | None,
+    regioes: Sequence[str] | None,
+    settings: Settings | None,
+) -> pl.LazyFrame:
+    """Soma os sketches das partições selecionadas por grupo e bin."""
+    if taxa not in TAXAS_VIRTUAIS:
+        raise ValueError(f"Taxa desconhecida: {taxa}. Taxas válidas: {list(TAXAS_VIRTUAIS)}")
+    if nivel not in ComparecimentoGoldContrato.NIVEIS_SKETCH:
+        raise ValueError(
+            f"Nível desconhecido: {nivel}. "
+            f"Níveis válidos: {ComparecimentoGoldContrato.NIVEIS_SKETCH}"
+        )
+
+    settings = settings or Settings()
+    particoes = listar_particoes_gold(settings, ComparecimentoGoldContrato.TABELA_SKETCH, anos)
+
+    if particoes:
+        lf = pl.scan_parquet(list(particoes.values()), schema=SCHEMA_SKETCH)
+    else:
+        lf = pl.LazyFrame(schema=SCHEMA_SKETCH)
+
+    lf = lf.filter((pl.col("TAXA") == taxa) & (pl.col("NIVEL") == nivel))
+    if ufs is not None:
+        lf = lf.filter(pl.col("SG_UF").is_in(list(ufs)))
+    if regioes is not None:
+        lf = lf.filter(pl.col("NOME_REGIAO").is_in(list(regioes)))
+
+    return lf.group_by([*por, "BIN"]).agg(pl.col("CONTAGEM").cast(pl.UInt64).sum())
+
+
+def percentis(
+    taxa: str = "TAXA_COMPARECIMENTO_PCT",
+    quantis: Sequence[float] = (0.5,),
+    *,
+    nivel: str = "municipio",
+    por: Sequence[str] = ("ANO_ELEICAO", "NR_TURNO"),
+    anos: Sequence[int] | None = None,
+    ufs: Sequence[str] | None = None,
+    regioes: Sequence[str] | None = None,
+    settings: Settings | None = None,
+) -> pl.DataFrame:
+    """
+    Percentis da distribuição de uma taxa, mesclando os sketches selecionados.
+
+    Cada coluna P<q> (ex.: P50) tem erro absoluto máximo de ERRO_MAXIMO_PP.
+
+    Exemplo: mediana do comparecimento municipal por UF em 2022
+        percentis(anos=[2022], por=["ANO_ELEICAO", "NR_TURNO", "SG_UF"])
+    """
+    grupo = list(por) or ["_TODOS"]
+    base = _sketch_mesclado(taxa, nivel, list(por), anos, ufs, regioes, settings)
+    if not por:
+        base = base.with_columns(pl.lit(0).alias("_TODOS"))
+
+    acumulado = base.sort([*grupo, "BIN"]).with_columns(
+        pl.col("CONTAGEM").cum_sum().over(grupo).alias("_ACUMULADO"),
+        pl.col("CONTAGEM").sum().over(grupo).alias("_TOTAL"),
+    )
+
+    colunas = [
+        (
+            (
+                pl.col("BIN")
+                .filter(pl.col("_ACUMULADO") >= q * pl.col("_TOTAL"))
+                .first()
+                .cast(pl.Float64)
+                + 0.5
+            )
+            * RESOLUCAO_PP
+        ).alias(f"P{q * 100:g}")
+        for q in quantis
+    ]
+
+    return (
+        acumulado.group_by(grupo)
+        .agg([pl.col("CONTAGEM").sum().alias("UNIDADES"), *colunas])
+        .with_columns(pl.lit(ERRO_MAXIMO_PP).alias("ERRO_MAXIMO_PP"))
+        .drop([c for c in ["_TODOS"] if not por])
+        .sort(list(por) or "UNIDADES")
+        .collect()
+    )
+
+
+def histograma(
+    taxa: str = "TAXA_ABSTENCAO_PCT",
+    *,
+    largura_pp: float = 5.0,
+    nivel: str = "municipio",
+    por: Sequence[str] = ("ANO_ELEICAO", "NR_TURNO"),
+    anos: Sequence[int] | None = None,
+    ufs: Sequence[str] | None = None,
+    regioes: Sequence[str] | None = None,
+    settings: Settings | None = None,
+) -> pl.DataFrame:
+    """
+    Histograma de uma taxa em faixas de `largura_pp` (múltiplo da resolução).
+
+    Exemplo: distribuição da abstenção municipal por região em 2022
+        histograma(anos=[2022], por=["ANO_ELEICAO", "NR_TURNO", "NOME_REGIAO"])
+    """
+    bins_por_faixa = round(largura_pp / RESOLUCAO_PP)
+    if bins_por_faixa < 1 or abs(bins_por_faixa * RESOLUCAO_PP - largura_pp) > 1e-9:
+        raise ValueError(f"largura_pp deve ser múltiplo de {RESOLUCAO_PP}")
+
+    return (
+        _sketch_mesclado(taxa, nivel, list(por), anos, ufs, regioes, settings)
+        .with_columns(
+            ((pl.col("BIN").cast(pl.Int64) // bins_por_faixa) * largura_pp).alias("FAIXA_INICIO_PP")
+        )
+        .group_by([*por, "FAIXA_INICIO_PP"])
+        .agg(pl.col("CONTAGEM").sum().alias("UNIDADES"))
+        .with_columns((pl.col("FAIXA_INICIO_PP") + largura_pp).alias("FAIXA_FIM_PP"))
+        .select([*por, "FAIXA_INICIO_PP", "FAIXA_FIM_PP", "UNIDADES"])
+        .sort([*por, "FAIXA_INICIO_PP"])
+        .collect()
+    )
@@ -1,12 +1,17 @@
+import shutil
 from datetime import UTC, datetime
 from pathlib import Path
 
 import polars as pl
 
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
 from participacao_eleitoral.utils.logger import ModernLogger
 
 from .results import ConvertResult
 
+# Os CSVs do TSE são publicados em Latin-1 (ISO-8859-1)
+ENCODING_TSE = "latin-1"
+
 
 class CSVToParquetConverter:
     """
@@ -15,8 +20,9 @@ class CSVToParquetConverter:
     NÃO conhece: Airflow, DuckDB ou regras de negócio.
     """
 
-    def __init__(self, logger: ModernLogger):
+    def __init__(self, logger: ModernLogger, encoding: str = ENCODING_TSE):
         self.logger = logger
+        self.encoding = encoding
 
     def convert(
         self,
@@ -33,13 +39,34 @@ class CSVToParquetConverter:
             destino=parquet_path.name,
         )
 
-        # Garante que o diretório de saída existe
-        parquet_path.parent.mkdir(parents=True, exist_ok=True)
-
+        # O scan do Polars só lê UTF-8: lido como utf8-lossy, o Latin-1 do TSE
+        # perde os acentos ("S\ufffdO PAULO"). Transcodifica antes, em streaming
+        utf8_path = parquet_path.with_name(f".{parquet_path.stem}.utf8.csv")
+        try:
+            self._transcodificar(csv_path, utf8_path)
+            return self._converter(utf8_path, parquet_path, schema, source)
+        finally:
+            utf8_path.unlink(missing_ok=True)
+
+    def _transcodificar(self, csv_path: Path, destino: Path) -> None:
+        """Cópia UTF-8 do CSV, decodificado com o encoding da fonte."""
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        with (
+            csv_path.open(encoding=self.encoding, newline="") as origem,
+            destino.open("w", encoding="utf-8", newline="") as saida,
+        ):
+            shutil.copyfileobj(origem, saida, length=1024 * 1024)
+
+    def _converter(
+        self,
+        csv_path: Path,
+        parquet_path: Path,
+        schema: dict[str, type[pl.DataType]] | None,
+        source: str,
+    ) -> ConvertResult:
         lf = pl.scan_csv(
             csv_path,
             separator=";",  # padrão TSE
-            encoding="utf8-lossy",  # tolera encoding ruim
             null_values=["#NULO#", "#NE#"],  # padrões do TSE
             schema_overrides=schema,  # contrato explícito
         )
@@ -53,16 +80,18 @@ class CSVToParquetConverter:
             ]
         )
 
-        lf.sink_parquet(
-            parquet_path,
-            compression="zstd",  # ótimo custo-benefício
-            compression_level=3,  # balanceado
-            statistics=True,  # melhora query pushdown
-            row_group_size=100_000,  # bom para leitura analítica
-        )
-
-        # Conta linhas lendo apenas metadados do Parquet
-        linhas = pl.scan_parquet(parquet_path).select(pl.len()).collect().item()
+        # Escrita atômica: o Parquet final nunca fica truncado
+        with escrita_atomica(parquet_path) as tmp_path:
+            lf.sink_parquet(
+                tmp_path,
+                compression="zstd",  # ótimo custo-benefício
+                compression_level=3,  # balanceado
+                statistics=True,  # melhora query pushdown
+                row_group_size=100_000,  # bom para leitura analítica
+            )
+
+            # Conta linhas lendo apenas metadados do Parquet
+            linhas = pl.scan_parquet(tmp_path).select(pl.len()).collect().item()
 
         self.logger.success(
             "conversao_concluida",
@@ -1,3 +1,4 @@
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any
 
@@ -5,6 +6,7 @@ import duckdb
 
 from participacao_eleitoral.config import Settings
 from participacao_eleitoral.core.contracts.ingestao_metadata import IngestaoMetadataDict
+from participacao_eleitoral.utils.conexao_duckdb import conexao_duckdb
 from participacao_eleitoral.utils.logger import ModernLogger
 
 
@@ -33,8 +35,8 @@ class MetadataStore:
         # Garante que o diretório existe
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Conexão DuckDB (arquivo local)
-        self.conn = duckdb.connect(str(self.db_path))
+        # Sem conexão permanente: o banco é compartilhado por workers paralelos
+        # e o DuckDB trava o arquivo para um único processo (ver conexao())
 
         # Inicializa schema
         self._create_tables()
@@ -46,31 +48,32 @@ class MetadataStore:
         Inicializa o esquema se não existir.
         """
 
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS ingestao_metadata (
-                dataset TEXT NOT NULL,
-                ano INTEGER NOT NULL,
-
-                timestamp_inicio TIMESTAMP NOT NULL,
-                timestamp_fim TIMESTAMP NOT NULL,
-
-                linhas BIGINT,
-                tamanho_bytes BIGINT,
-                duracao_segundos DOUBLE,
-                status TEXT,
-                checksum TEXT,
-                erro TEXT,
-
-                PRIMARY KEY (dataset, ano)
+        with self.conexao() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingestao_metadata (
+                    dataset TEXT NOT NULL,
+                    ano INTEGER NOT NULL,
+
+                    timestamp_inicio TIMESTAMP NOT NULL,
+                    timestamp_fim TIMESTAMP NOT NULL,
+
+                    linhas BIGINT,
+                    tamanho_bytes BIGINT,
+                    duracao_segundos DOUBLE,
+                    status TEXT,
+                    checksum TEXT,
+                    erro TEXT,
+
+                    PRIMARY KEY (dataset, ano)
+                )
+                """
             )
-            """
-        )
 
-        # Add missing columns if table already exists (migration)
-        self.conn.execute("ALTER TABLE ingestao_metadata ADD COLUMN IF NOT EXISTS status TEXT")
-        self.conn.execute("ALTER TABLE ingestao_metadata ADD COLUMN IF NOT EXISTS checksum TEXT")
-        self.conn.execute("ALTER TABLE ingestao_metadata ADD COLUMN IF NOT EXISTS erro TEXT")
+            # Add missing columns if table already exists (migration)
+            conn.execute("ALTER TABLE ingestao_metadata ADD COLUMN IF NOT EXISTS status TEXT")
+            conn.execute("ALTER TABLE ingestao_metadata ADD COLUMN IF NOT EXISTS checksum TEXT")
+            conn.execute("ALTER TABLE ingestao_metadata ADD COLUMN IF NOT EXISTS erro TEXT")
 
     def salvar(self, metadata: IngestaoMetadataDict) -> None:
         """
@@ -78,44 +81,45 @@ class MetadataStore:
 
         Usa UPSERT por ano para garantir idempotência."""
 
-        self.conn.execute(
-            """
-            INSERT INTO ingestao_metadata (
-                dataset,
-                ano,
-                timestamp_inicio,
-                timestamp_fim,
-                linhas,
-                tamanho_bytes,
-                duracao_segundos,
-                status,
-                checksum,
-                erro
+        with self.conexao() as conn:
+            conn.execute(
+                """
+                INSERT INTO ingestao_metadata (
+                    dataset,
+                    ano,
+                    timestamp_inicio,
+                    timestamp_fim,
+                    linhas,
+                    tamanho_bytes,
+                    duracao_segundos,
+                    status,
+                    checksum,
+                    erro
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (dataset, ano) DO UPDATE SET
+                    timestamp_inicio = excluded.timestamp_inicio,
+                    timestamp_fim = excluded.timestamp_fim,
+                    linhas = excluded.linhas,
+                    tamanho_bytes = excluded.tamanho_bytes,
+                    duracao_segundos = excluded.duracao_segundos,
+                    status = excluded.status,
+                    checksum = excluded.checksum,
+                    erro = excluded.erro
+                """,
+                (
+                    metadata["dataset"],
+                    metadata["ano"],
+                    metadata["inicio"],
+                    metadata["fim"],
+                    metadata["linhas"],
+                    metadata["tamanho_bytes"],
+                    metadata["duracao_segundos"],
+                    metadata["status"],
+                    metadata["checksum"],
+                    metadata["erro"],
+                ),
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (dataset, ano) DO UPDATE SET
-                timestamp_inicio = excluded.timestamp_inicio,
-                timestamp_fim = excluded.timestamp_fim,
-                linhas = excluded.linhas,
-                tamanho_bytes = excluded.tamanho_bytes,
-                duracao_segundos = excluded.duracao_segundos,
-                status = excluded.status,
-                checksum = excluded.checksum,
-                erro = excluded.erro
-            """,
-            (
-                metadata["dataset"],
-                metadata["ano"],
-                metadata["inicio"],
-                metadata["fim"],
-                metadata["linhas"],
-                metadata["tamanho_bytes"],
-                metadata["duracao_segundos"],
-                metadata["status"],
-                metadata["checksum"],
-                metadata["erro"],
-            ),
-        )
 
         self.logger.success(
             "metadata_salvo",
@@ -128,19 +132,20 @@ class MetadataStore:
         Busca metadados de uma ingestão específica.
         """
 
-        row = self.conn.execute(
-            """
-            SELECT *
-            FROM ingestao_metadata
-            WHERE dataset = ? AND ano = ?
-            """,
-            (dataset, ano),
-        ).fetchone()
+        with self.conexao() as conn:
+            row = conn.execute(
+                """
+                SELECT *
+                FROM ingestao_metadata
+                WHERE dataset = ? AND ano = ?
+                """,
+                (dataset, ano),
+            ).fetchone()
+            columns = [c[0] for c in conn.description]
 
         if not row:
             return None
 
-        columns = [c[0] for c in self.conn.description]
         return dict(zip(columns, row, strict=False))
 
     def listar_todos(self) -> list[dict[str, Any]]:
@@ -151,23 +156,27 @@ class MetadataStore:
             Lista de dicionários de metadados
         """
 
-        rows = self.conn.execute(
-            """
-            SELECT *
-            FROM ingestao_metadata
-            ORDER BY ano DESC
-            """
-        ).fetchall()
+        with self.conexao() as conn:
+            rows = conn.execute(
+                """
+                SELECT *
+                FROM ingestao_metadata
+                ORDER BY ano DESC
+                """
+            ).fetchall()
+            columns = [c[0] for c in conn.description]
 
         if not rows:
             return []
 
-        columns = [c[0] for c in self.conn.description]
         return [dict(zip(columns, row, strict=False)) for row in rows]
 
+    def conexao(self) -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+        """Conexão curta com o banco, aberta só durante uma leitura ou escrita."""
+        return conexao_duckdb(self.db_path)
+
     def close(self) -> None:
-        """Fecha a conexão com o DuckDB."""
-        self.conn.close()
+        """Nada a fechar: cada operação abre e fecha a própria conexão."""
 
     def __enter__(self) -> "MetadataStore":
         """Suporta uso com contexto 'with'."""
@@ -179,5 +188,5 @@ class MetadataStore:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        """Fecha conexão ao sair do contexto."""
+        """Mantido por compatibilidade com o uso em 'with'."""
         self.close()
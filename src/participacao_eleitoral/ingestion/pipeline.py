@@ -35,9 +35,15 @@ from participacao_eleitoral.ingestion.schemas.comparecimento import (
     validar_schema_contra_contrato,
 )
 
+# Escrita concorrente segura (trava por partição)
+from participacao_eleitoral.utils.escrita_atomica import trava_particao
+
 # Logger estruturado (não print)
 from participacao_eleitoral.utils.logger import ModernLogger
 
+# Manifesto de partições (estatísticas para poda sem abrir Parquet)
+from participacao_eleitoral.utils.manifesto import registrar_no_manifesto
+
 
 class IngestionPipeline:
     """
@@ -83,14 +89,13 @@ class IngestionPipeline:
         Fluxo:
         1. Cria entidade do domínio
         2. Verifica idempotência
-        3. Valida schema vs contrato
-        4. Download
-        5. Conversão
-        6. Persistência de metadados
+        3. Trava a partição e verifica idempotência de novo
+        4. Valida schema vs contrato
+        5. Download
+        6. Conversão (escrita atômica)
+        7. Persistência de metadados
         """
 
-        inicio = datetime.now(UTC)
-
         dataset = Dataset(
             nome="comparecimento_abstencao",
             ano=ano,
@@ -98,6 +103,22 @@ class IngestionPipeline:
             f"perfil_comparecimento_abstencao/perfil_comparecimento_abstencao_{ano}.zip",
         )
 
+        if self._ja_ingerido(dataset, ano):
+            return
+
+        dataset_dir = self.settings.bronze_dir / dataset.nome / f"year={ano}"
+
+        # Workers paralelos no mesmo diretório serializam por partição
+        with trava_particao(dataset_dir):
+            # Outro worker pode ter concluído enquanto esperávamos a trava
+            if self._ja_ingerido(dataset, ano):
+                return
+
+            self._ingerir(dataset, ano)
+
+    def _ja_ingerido(self, dataset: Dataset, ano: int) -> bool:
+        """Idempotência: existe ingestão bem-sucedida registrada."""
+
         # Verifica se já existe ingestão bem-sucedida
         registro = self.metadata_store.buscar(dataset.nome, ano)
 
@@ -107,7 +128,14 @@ class IngestionPipeline:
                 dataset=dataset.nome,
                 ano=ano,
             )
-            return
+            return True
+
+        return False
+
+    def _ingerir(self, dataset: Dataset, ano: int) -> None:
+        """Executa download e conversão de um ano (com a partição travada)."""
+
+        inicio = datetime.now(UTC)
 
         # Garante que o schema físico respeita o domínio
         validar_schema_contra_contrato()
@@ -143,6 +171,9 @@ class IngestionPipeline:
                 raw_csv_path.unlink()
                 self.logger.info("raw_csv_removido", arquivo=raw_csv_path.name)
 
+            # Estatísticas da partição para leitores podarem sem abrir o Parquet
+            registrar_no_manifesto(self.settings.bronze_dir / dataset.nome, [parquet_path])
+
             fim = datetime.now(UTC)
 
             metadata = construir_metadata_sucesso(
@@ -1,13 +1,40 @@
 """Camada Silver do Lakehouse"""
 
-from .pipeline import SilverTransformationPipeline
-from .region_mapper import RegionMapper
-from .results import SilverTransformResult
-from .transformer import BronzeToSilverTransformer
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pipeline import SilverTransformationPipeline
+    from .reader import agregar_participacao, scan_silver
+    from .region_mapper import RegionMapper
+    from .results import SilverTransformResult
+    from .schema_registry import SchemaRegistry
+    from .transformer import BronzeToSilverTransformer
+
+# Exportações importadas sob demanda: quem só lê a Silver (dashboard) não
+# carrega o pipeline de transformação nem o DuckDB do metadata store
+_EXPORTACOES = {
+    "SilverTransformationPipeline": ".pipeline",
+    "RegionMapper": ".region_mapper",
+    "SilverTransformResult": ".results",
+    "SchemaRegistry": ".schema_registry",
+    "BronzeToSilverTransformer": ".transformer",
+    "scan_silver": ".reader",
+    "agregar_participacao": ".reader",
+}
 
 __all__ = [
     "SilverTransformationPipeline",
     "RegionMapper",
     "SilverTransformResult",
+    "SchemaRegistry",
     "BronzeToSilverTransformer",
+    "scan_silver",
+    "agregar_participacao",
 ]
+
+
+def __getattr__(nome: str) -> Any:
+    if nome not in _EXPORTACOES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    return getattr(import_module(_EXPORTACOES[nome], __name__), nome)
@@ -1,11 +1,13 @@
 """Gerencia persistência de metadados de transformação Silver"""
 
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any
 
 import duckdb
 
 from participacao_eleitoral.config import Settings
+from participacao_eleitoral.utils.conexao_duckdb import conexao_duckdb
 from participacao_eleitoral.utils.logger import ModernLogger
 
 
@@ -34,8 +36,8 @@ class SilverMetadataStore:
         # Garante que o diretório existe
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Conexão DuckDB (arquivo local)
-        self.conn = duckdb.connect(str(self.db_path))
+        # Sem conexão permanente: o banco é compartilhado por workers paralelos
+        # e o DuckDB trava o arquivo para um único processo (ver conexao())
 
         # Inicializa schema
         self._create_tables()
@@ -45,25 +47,26 @@ class SilverMetadataStore:
     def _create_tables(self) -> None:
         """Inicializa o esquema se não existir."""
 
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS silver_metadata (
-                dataset TEXT NOT NULL,
-                ano INTEGER NOT NULL,
-
-                timestamp_inicio TIMESTAMP NOT NULL,
-                timestamp_fim TIMESTAMP NOT NULL,
-
-                linhas_antes BIGINT,
-                linhas_depois BIGINT,
-                duracao_segundos DOUBLE,
-                status TEXT,
-                erro TEXT,
-
-                PRIMARY KEY (dataset, ano)
+        with self.conexao() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS silver_metadata (
+                    dataset TEXT NOT NULL,
+                    ano INTEGER NOT NULL,
+
+                    timestamp_inicio TIMESTAMP NOT NULL,
+                    timestamp_fim TIMESTAMP NOT NULL,
+
+                    linhas_antes BIGINT,
+                    linhas_depois BIGINT,
+                    duracao_segundos DOUBLE,
+                    status TEXT,
+                    erro TEXT,
+
+                    PRIMARY KEY (dataset, ano)
+                )
+                """
             )
-            """
-        )
 
     def salvar(self, metadata: dict[str, Any]) -> None:
         """
@@ -71,41 +74,42 @@ class SilverMetadataStore:
 
         Usa UPSERT por ano para garantir idempotência.
         """
-        self.conn.execute(
-            """
-            INSERT INTO silver_metadata (
-                dataset,
-                ano,
-                timestamp_inicio,
-                timestamp_fim,
-                linhas_antes,
-                linhas_depois,
-                duracao_segundos,
-                status,
-                erro
+        with self.conexao() as conn:
+            conn.execute(
+                """
+                INSERT INTO silver_metadata (
+                    dataset,
+                    ano,
+                    timestamp_inicio,
+                    timestamp_fim,
+                    linhas_antes,
+                    linhas_depois,
+                    duracao_segundos,
+                    status,
+                    erro
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (dataset, ano) DO UPDATE SET
+                    timestamp_inicio = excluded.timestamp_inicio,
+                    timestamp_fim = excluded.timestamp_fim,
+                    linhas_antes = excluded.linhas_antes,
+                    linhas_depois = excluded.linhas_depois,
+                    duracao_segundos = excluded.duracao_segundos,
+                    status = excluded.status,
+                    erro = excluded.erro
+                """,
+                (
+                    metadata["dataset"],
+                    metadata["ano"],
+                    metadata["inicio"],
+                    metadata["fim"],
+                    metadata["linhas_antes"],
+                    metadata["linhas_depois"],
+                    metadata["duracao_segundos"],
+                    metadata["status"],
+                    metadata["erro"],
+                ),
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (dataset, ano) DO UPDATE SET
-                timestamp_inicio = excluded.timestamp_inicio,
-                timestamp_fim = excluded.timestamp_fim,
-                linhas_antes = excluded.linhas_antes,
-                linhas_depois = excluded.linhas_depois,
-                duracao_segundos = excluded.duracao_segundos,
-                status = excluded.status,
-                erro = excluded.erro
-            """,
-            (
-                metadata["dataset"],
-                metadata["ano"],
-                metadata["inicio"],
-                metadata["fim"],
-                metadata["linhas_antes"],
-                metadata["linhas_depois"],
-                metadata["duracao_segundos"],
-                metadata["status"],
-                metadata["erro"],
-            ),
-        )
 
         self.logger.success(
             "silver_metadata_salvo",
@@ -116,41 +120,46 @@ class SilverMetadataStore:
     def buscar(self, dataset: str, ano: int) -> dict[str, Any] | None:
         """Busca metadados de uma transformação específica."""
 
-        row = self.conn.execute(
-            """
-            SELECT *
-            FROM silver_metadata
-            WHERE dataset = ? AND ano = ?
-            """,
-            (dataset, ano),
-        ).fetchone()
+        with self.conexao() as conn:
+            row = conn.execute(
+                """
+                SELECT *
+                FROM silver_metadata
+                WHERE dataset = ? AND ano = ?
+                """,
+                (dataset, ano),
+            ).fetchone()
+            columns = [c[0] for c in conn.description]
 
         if not row:
             return None
 
-        columns = [c[0] for c in self.conn.description]
         return dict(zip(columns, row, strict=False))
 
     def listar_todos(self) -> list[dict[str, Any]]:
         """Lista todas as entradas de metadados de transformação."""
 
-        rows = self.conn.execute(
-            """
-            SELECT *
-            FROM silver_metadata
-            ORDER BY ano DESC
-            """
-        ).fetchall()
+        with self.conexao() as conn:
+            rows = conn.execute(
+                """
+                SELECT *
+                FROM silver_metadata
+                ORDER BY ano DESC
+                """
+            ).fetchall()
+            columns = [c[0] for c in conn.description]
 
         if not rows:
             return []
 
-        columns = [c[0] for c in self.conn.description]
         return [dict(zip(columns, row, strict=False)) for row in rows]
 
+    def conexao(self) -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+        """Conexão curta com o banco, aberta só durante uma leitura ou escrita."""
+        return conexao_duckdb(self.db_path)
+
     def close(self) -> None:
-        """Fecha a conexão com o DuckDB."""
-        self.conn.close()
+        """Nada a fechar: cada operação abre e fecha a própria conexão."""
 
     def __enter__(self) -> "SilverMetadataStore":
         """Suporta uso com contexto 'with'."""
@@ -162,5 +171,5 @@ class SilverMetadataStore:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        """Fecha conexão ao sair do contexto."""
+        """Mantido por compatibilidade com o uso em 'with'."""
         self.close()
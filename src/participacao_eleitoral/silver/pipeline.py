@@ -3,17 +3,23 @@
 from datetime import UTC, datetime
 
 from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento import ComparecimentoContrato
 from participacao_eleitoral.core.entities import Dataset
 from participacao_eleitoral.core.enums import StatusIngestao
+from participacao_eleitoral.silver.reader import caminho_particao_silver, diretorio_silver
 from participacao_eleitoral.silver.region_mapper import RegionMapper
 from participacao_eleitoral.silver.schemas.comparecimento_silver import (
     SCHEMA_SILVER,
     validar_schema_silver_contra_contrato,
 )
+from participacao_eleitoral.utils.escrita_atomica import trava_particao
 from participacao_eleitoral.utils.logger import ModernLogger
+from participacao_eleitoral.utils.manifesto import registrar_no_manifesto
+from participacao_eleitoral.utils.snapshots import PartitionSnapshots
 
 from .metadata_store import SilverMetadataStore
 from .results import SilverTransformResult
+from .schema_registry import SchemaRegistry
 from .transformer import BronzeToSilverTransformer
 
 
@@ -37,6 +43,7 @@ class SilverTransformationPipeline:
         settings: Settings,
         logger: ModernLogger,
         metadata_store: SilverMetadataStore | None = None,
+        schema_registry: SchemaRegistry | None = None,
     ):
         self.settings = settings
         self.logger = logger
@@ -47,8 +54,18 @@ class SilverTransformationPipeline:
             logger=logger,
         )
 
+        # Registro de schemas do bronze por ano (mesmo banco de metadados)
+        self.schema_registry = schema_registry or SchemaRegistry(
+            settings=settings,
+            logger=logger,
+            db_path=self.metadata_store.db_path,
+        )
+
         # Transformer
-        self.transformer = BronzeToSilverTransformer(logger=logger)
+        self.transformer = BronzeToSilverTransformer(
+            logger=logger,
+            materializar_taxas=settings.silver_materializar_taxas,
+        )
 
         # Region Mapper
         self.region_mapper = RegionMapper()
@@ -60,34 +77,57 @@ class SilverTransformationPipeline:
         Fluxo:
         1. Cria entidade do domínio
         2. Verifica idempotência (DuckDB + arquivo)
-        3. Valida schema vs contrato
-        4. Verifica se bronze existe
-        5. Transforma
-        6. Persiste metadados
+        3. Trava a partição e verifica idempotência de novo
+        4. Valida schema vs contrato
+        5. Verifica se bronze existe
+        6. Registra o schema físico do bronze do ano
+        7. Transforma (escrita atômica)
+        8. Persiste metadados
         """
 
-        inicio = datetime.now(UTC)
-
         dataset = Dataset(
             nome="comparecimento_abstencao_silver",
             ano=ano,
             url_origem=f"{self.settings.bronze_dir}/comparecimento_abstencao/year={ano}/data.parquet",
         )
 
+        if self._ja_transformado(dataset, ano):
+            return
+
+        # Workers paralelos no mesmo diretório serializam por partição
+        with trava_particao(caminho_particao_silver(self.settings, ano).parent):
+            # Outro worker pode ter concluído enquanto esperávamos a trava
+            if self._ja_transformado(dataset, ano):
+                return
+
+            self._transformar(dataset, ano)
+
+    def _ja_transformado(self, dataset: Dataset, ano: int) -> bool:
+        """Idempotência: metadata de sucesso E arquivo Silver publicado."""
+
         # Verifica se já existe transformação bem-sucedida
         registro = self.metadata_store.buscar(dataset.nome, ano)
 
         # Idempotência nível 1: Verifica metadata
-        if registro and registro["status"] == StatusIngestao.SUCESSO.value:
-            # Idempotência nível 2: Verifica se arquivo ainda existe
-            silver_path = self.settings.silver_dir / dataset.nome / f"year={ano}" / "data.parquet"
-            if silver_path.exists():
-                self.logger.info(
-                    "transformacao_ja_realizada",
-                    dataset=dataset.nome,
-                    ano=ano,
-                )
-                return
+        if not registro or registro["status"] != StatusIngestao.SUCESSO.value:
+            return False
+
+        # Idempotência nível 2: Verifica se arquivo ainda existe
+        # (a escrita é atômica, então existir implica estar completo)
+        if not caminho_particao_silver(self.settings, ano).exists():
+            return False
+
+        self.logger.info(
+            "transformacao_ja_realizada",
+            dataset=dataset.nome,
+            ano=ano,
+        )
+        return True
+
+    def _transformar(self, dataset: Dataset, ano: int) -> None:
+        """Executa a transformação de um ano (com a partição travada)."""
+
+        inicio = datetime.now(UTC)
 
         # Garante que o schema físico respeita o domínio
         validar_schema_silver_contra_contrato()
@@ -115,7 +155,10 @@ class SilverTransformationPipeline:
                 )
                 return
 
-            silver_path = self.settings.silver_dir / dataset.nome / f"year={ano}" / "data.parquet"
+            # Registra o schema físico do ano (lê apenas o rodapé do Parquet)
+            self.schema_registry.registrar(ComparecimentoContrato.DATASET_NAME, ano, bronze_path)
+
+            silver_path = caminho_particao_silver(self.settings, ano)
 
             result: SilverTransformResult = self.transformer.transform(
                 bronze_parquet_path=bronze_path,
@@ -124,6 +167,12 @@ class SilverTransformationPipeline:
                 schema=SCHEMA_SILVER,
             )
 
+            # Nova versão imutável da partição (rollback sem reprocessar o bronze)
+            PartitionSnapshots(silver_path.parent).commit([silver_path.name], "transform")
+
+            # Estatísticas da partição para leitores podarem sem abrir o Parquet
+            registrar_no_manifesto(diretorio_silver(self.settings), [silver_path])
+
             fim = datetime.now(UTC)
 
             metadata = {
@@ -0,0 +1,214 @@
+"""Ponto único de leitura da camada Silver"""
+
+import re
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from pathlib import Path
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.core.contracts.comparecimento_silver import (
+    ComparecimentoSilverContrato,
+)
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+from participacao_eleitoral.utils.manifesto import carregar_manifesto, entrada_atual, pode_conter
+from participacao_eleitoral.utils.snapshots import PartitionSnapshots
+
+# Chave de partição Hive (diretórios year=YYYY)
+COLUNA_PARTICAO = "year"
+HIVE_SCHEMA: dict[str, pl.DataType | type[pl.DataType]] = {COLUNA_PARTICAO: pl.Int16}
+
+_PADRAO_PARTICAO = re.compile(rf"^{COLUNA_PARTICAO}=(\d{{4}})$")
+
+# Colunas virtuais: taxas nunca são lidas do disco, sempre derivadas das contagens
+TAXAS_VIRTUAIS = ComparecimentoSilverContrato.CAMPOS_DERIVADOS
+CONTAGENS = ["QT_APTOS", "QT_COMPARECIMENTO", "QT_ABSTENCAO"]
+
+
+def taxa_virtual(taxa: str, agregada: bool = False) -> pl.Expr:
+    """
+    Expressão de uma taxa percentual derivada das contagens.
+
+    Com agregada=True, soma numerador e denominador antes de dividir: é a
+    taxa correta em qualquer grão (média de taxas por linha não é). Sem
+    aptos (denominador 0), a taxa é nula.
+    """
+    numerador = pl.col(TAXAS_VIRTUAIS[taxa])
+    denominador = pl.col(ComparecimentoSilverContrato.DENOMINADOR_TAXAS)
+    if agregada:
+        # Int64 antes de somar: a soma de Int32 (tipo físico da Silver) estoura
+        numerador = numerador.cast(pl.Int64).sum()
+        denominador = denominador.cast(pl.Int64).sum()
+
+    # Sem aptos a taxa é nula (não NaN/inf), como o NULLIF das visões do catálogo
+    return pl.when(denominador > 0).then(numerador.cast(pl.Float64) / denominador * 100).alias(taxa)
+
+
+def agregar_participacao(lf: pl.LazyFrame, por: Sequence[str]) -> pl.LazyFrame:
+    """
+    Agrega contagens e taxas no grão pedido.
+
+    Retorna as colunas de agrupamento, as contagens somadas (QT_*) e as taxas
+    (TAXA_*_PCT) calculadas a partir das somas, ponderadas pelos aptos.
+    """
+    return lf.group_by(list(por)).agg(
+        [pl.col(c).cast(pl.Int64).sum() for c in CONTAGENS]
+        + [taxa_virtual(taxa, agregada=True) for taxa in TAXAS_VIRTUAIS]
+    )
+
+
+def diretorio_silver(settings: Settings) -> Path:
+    """Diretório do dataset Silver (raiz das partições year=YYYY)."""
+    return settings.silver_dir / ComparecimentoSilverContrato.DATASET_NAME
+
+
+def caminho_particao_silver(settings: Settings, ano: int) -> Path:
+    """Caminho do arquivo Parquet Silver de um ano."""
+    return diretorio_silver(settings) / f"{COLUNA_PARTICAO}={ano}" / "data.parquet"
+
+
+def listar_particoes_silver(
+    settings: Settings,
+    anos: Iterable[int] | None = None,
+) -> dict[int, Path]:
+    """
+    Lista as partições Silver existentes, podando pelo nome do diretório.
+
+    Nenhum arquivo Parquet é aberto aqui: anos fora do filtro
+    nem chegam ao plano de leitura.
+    """
+    raiz = diretorio_silver(settings)
+    if not raiz.exists():
+        return {}
+
+    filtro = set(anos) if anos is not None else None
+    particoes: dict[int, Path] = {}
+
+    for diretorio in sorted(raiz.iterdir()):
+        match = _PADRAO_PARTICAO.match(diretorio.name)
+        if not match:
+            continue
+
+        ano = int(match.group(1))
+        arquivo = diretorio / "data.parquet"
+        if (filtro is None or ano in filtro) and arquivo.exists():
+            particoes[ano] = arquivo
+
+    return particoes
+
+
+def scan_silver(
+    anos: Sequence[int] | None = None,
+    ufs: Sequence[str] | None = None,
+    columns: Sequence[str] | None = None,
+    *,
+    settings: Settings | None = None,
+    schema: Mapping[str, pl.DataType | type[pl.DataType]] | None = None,
+    versoes: Mapping[int, int] | None = None,
+) -> pl.LazyFrame:
+    """
+    Retorna um LazyFrame sobre a Silver particionada por ano.
+
+    - anos: poda de partições pelo nome do diretório (year=YYYY)
+    - ufs: predicado em SG_UF, empurrado para o scan (row groups ordenados por UF);
+      partições cujo min/max de SG_UF no manifesto exclui as UFs nem são abertas
+    - columns: projeção aplicada direto no scan; a coluna de partição
+      "year" pode ser pedida como qualquer outra
+    - schema: schema unificado de leitura (padrão: SCHEMA_SILVER). Colunas que
+      não existem em um ano entram como nulos tipados, de forma lazy, sem
+      concat diagonal nem reescrita de partições antigas
+    - versoes: snapshot fixado por ano (ex.: {2022: 3}); anos fora do mapa
+      leem o snapshot atual (ver utils.snapshots)
+
+    As taxas (TAXA_*_PCT) são colunas virtuais: derivadas das contagens por
+    linha, estejam ou não materializadas no arquivo.
+
+    O planejamento usa o manifesto da camada (_manifest.json): com a entrada
+    do arquivo em dia, colunas e estatísticas vêm dele e o rodapé do Parquet
+    não é lido; sem ela, o rodapé é lido como antes.
+
+    Sem partições correspondentes, retorna um LazyFrame vazio com o schema esperado.
+    """
+    settings = settings or Settings()
+    schema_leitura = dict(schema if schema is not None else SCHEMA_SILVER)
+    virtuais = [taxa for taxa in TAXAS_VIRTUAIS if taxa in schema_leitura]
+
+    raiz = diretorio_silver(settings)
+    manifesto = carregar_manifesto(raiz)
+    particoes: dict[int, Path] = {}
+    colunas_por_ano: dict[int, Collection[str] | None] = {}
+
+    for ano, arquivo in listar_particoes_silver(settings, anos).items():
+        if versoes is not None and ano in versoes:
+            arquivo = PartitionSnapshots(arquivo.parent).caminho(versoes[ano], arquivo.name)
+
+        # Versões fixadas não estão no manifesto: caem no rodapé do Parquet
+        entrada = entrada_atual(manifesto, raiz, arquivo)
+        if entrada is not None and ufs is not None and not pode_conter(entrada, "SG_UF", ufs):
+            continue
+
+        particoes[ano] = arquivo
+        colunas_por_ano[ano] = entrada["colunas"].keys() if entrada is not None else None
+
+    if not particoes:
+        schema_vazio = {**schema_leitura, **HIVE_SCHEMA}
+        nomes = list(columns) if columns is not None else list(schema_vazio)
+        return pl.LazyFrame(schema={nome: schema_vazio[nome] for nome in nomes})
+
+    schema_fisico = {c: t for c, t in schema_leitura.items() if c not in virtuais}
+    lf = pl.concat(
+        [
+            _scan_alinhado(ano, arquivo, schema_fisico, colunas_por_ano[ano])
+            for ano, arquivo in particoes.items()
+        ],
+        how="vertical",
+    )
+
+    # Projeção remove as expressões não pedidas; as pedidas puxam só as contagens
+    lf = lf.with_columns(
+        [taxa_virtual(taxa).cast(schema_leitura[taxa]) for taxa in virtuais]
+    ).select([*schema_leitura, COLUNA_PARTICAO])
+
+    if ufs is not None:
+        lf = lf.filter(pl.col("SG_UF").is_in(list(ufs)))
+
+    if columns is not None:
+        lf = lf.select(columns)
+
+    return lf
+
+
+def _scan_alinhado(
+    ano: int,
+    arquivo: Path,
+    schema: Mapping[str, pl.DataType | type[pl.DataType]],
+    colunas_arquivo: Collection[str] | None = None,
+) -> pl.LazyFrame:
+    """
+    Scan lazy de uma partição já no schema unificado.
+
+    As colunas do arquivo vêm do manifesto (`colunas_arquivo`) ou, sem ele,
+    do rodapé do Parquet: colunas ausentes viram nulos tipados e tipos
+    antigos são convertidos, então o concat entre anos é sempre vertical.
+    """
+    schema_arquivo: Mapping[str, pl.DataType | type[pl.DataType] | None]
+    if colunas_arquivo is not None:
+        # Só os nomes são conhecidos: cast incondicional (no-op se o tipo já bate)
+        schema_arquivo = dict.fromkeys(colunas_arquivo)
+    else:
+        schema_arquivo = pl.read_parquet_schema(arquivo)
+
+    colunas: list[pl.Expr] = []
+    for nome, tipo in schema.items():
+        if nome not in schema_arquivo:
+            colunas.append(pl.lit(None, dtype=tipo).alias(nome))
+        elif schema_arquivo[nome] != tipo:
+            colunas.append(pl.col(nome).cast(tipo))
+        else:
+            colunas.append(pl.col(nome))
+
+    return (
+        pl.scan_parquet(arquivo)
+        .select(colunas)
+        .with_columns(pl.lit(ano, dtype=HIVE_SCHEMA[COLUNA_PARTICAO]).alias(COLUNA_PARTICAO))
+    )
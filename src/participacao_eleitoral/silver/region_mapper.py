@@ -1,10 +1,14 @@
 """Mapeamento de UFs para regiões geográficas"""
 
+from typing import ClassVar
+
 
 class RegionMapper:
     """Mapeia sigla UF para região geográfica brasileira."""
 
-    REGIAO_MAP = {
+    REGIAO_DESCONHECIDA: ClassVar[str] = "Desconhecido"
+
+    REGIAO_MAP: ClassVar[dict[str, str]] = {
         "AC": "Norte",
         "AP": "Norte",
         "AM": "Norte",
@@ -38,4 +42,9 @@ class RegionMapper:
     @classmethod
     def get_regiao(cls, uf: str) -> str:
         """Retorna região geográfica baseada na UF (Exterior para ZZ, Desconhecido para inválidos)."""
-        return cls.REGIAO_MAP.get(uf, "Desconhecido")
+        return cls.REGIAO_MAP.get(uf, cls.REGIAO_DESCONHECIDA)
+
+    @classmethod
+    def regioes(cls) -> list[str]:
+        """Retorna o domínio fechado de regiões (ordem estável, inclui Desconhecido)."""
+        return list(dict.fromkeys(cls.REGIAO_MAP.values())) + [cls.REGIAO_DESCONHECIDA]
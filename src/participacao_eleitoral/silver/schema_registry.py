@@ -0,0 +1,161 @@
+"""Registro dos schemas físicos do bronze por ano"""
+
+from contextlib import AbstractContextManager
+from pathlib import Path
+
+import duckdb
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+from participacao_eleitoral.utils.conexao_duckdb import conexao_duckdb
+from participacao_eleitoral.utils.logger import ModernLogger
+
+
+class SchemaRegistry:
+    """
+    Registra o schema físico de cada ano do bronze usando DuckDB.
+
+    O arquivo de perfil do TSE ganhou colunas ao longo de 2014–2024, então
+    cada ano tem um conjunto próprio de colunas. O registro permite:
+    - saber quais dimensões existem em cada ano sem abrir os Parquet
+    - detectar colunas novas do TSE que ainda não estão no SCHEMA_SILVER
+
+    Apenas o rodapé do Parquet é lido no registro; nenhum dado é carregado.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        logger: ModernLogger,
+        db_path: Path | None = None,
+    ):
+        self.settings = settings
+        self.logger = logger
+
+        # Compartilha o banco de metadados da Silver
+        self.db_path = db_path or self.settings.silver_dir / "_metadata.duckdb"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Sem conexão permanente: o banco é compartilhado por workers paralelos
+        # e o DuckDB trava o arquivo para um único processo (ver conexao())
+
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        """Inicializa o esquema se não existir."""
+
+        with self.conexao() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schema_registry (
+                    dataset TEXT NOT NULL,
+                    ano INTEGER NOT NULL,
+                    coluna TEXT NOT NULL,
+                    tipo TEXT NOT NULL,
+                    posicao INTEGER NOT NULL,
+
+                    PRIMARY KEY (dataset, ano, coluna)
+                )
+                """
+            )
+
+    def registrar(self, dataset: str, ano: int, parquet_path: Path) -> dict[str, str]:
+        """
+        Registra (ou substitui) o schema físico de um ano a partir do rodapé do Parquet.
+
+        Returns:
+            Mapeamento coluna → tipo registrado
+        """
+        schema = {nome: str(tipo) for nome, tipo in pl.read_parquet_schema(parquet_path).items()}
+
+        with self.conexao() as conn:
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute(
+                    "DELETE FROM schema_registry WHERE dataset = ? AND ano = ?",
+                    (dataset, ano),
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO schema_registry (dataset, ano, coluna, tipo, posicao)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (dataset, ano, coluna, tipo, posicao)
+                        for posicao, (coluna, tipo) in enumerate(schema.items())
+                    ],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        fora_do_schema = [c for c in schema if c not in SCHEMA_SILVER and not c.startswith("_")]
+        self.logger.info(
+            "schema_bronze_registrado",
+            dataset=dataset,
+            ano=ano,
+            colunas=len(schema),
+            fora_do_schema_silver=len(fora_do_schema),
+        )
+
+        return schema
+
+    def buscar(self, dataset: str, ano: int) -> dict[str, str] | None:
+        """Retorna o schema registrado de um ano (coluna → tipo), na ordem original."""
+
+        with self.conexao() as conn:
+            rows = conn.execute(
+                """
+                SELECT coluna, tipo
+                FROM schema_registry
+                WHERE dataset = ? AND ano = ?
+                ORDER BY posicao
+                """,
+                (dataset, ano),
+            ).fetchall()
+
+        if not rows:
+            return None
+
+        return dict(rows)
+
+    def colunas_por_ano(self, dataset: str) -> dict[int, list[str]]:
+        """Lista as colunas de cada ano registrado."""
+
+        with self.conexao() as conn:
+            rows = conn.execute(
+                """
+                SELECT ano, coluna
+                FROM schema_registry
+                WHERE dataset = ?
+                ORDER BY ano, posicao
+                """,
+                (dataset,),
+            ).fetchall()
+
+        colunas: dict[int, list[str]] = {}
+        for ano, coluna in rows:
+            colunas.setdefault(ano, []).append(coluna)
+        return colunas
+
+    def conexao(self) -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+        """Conexão curta com o banco, aberta só durante uma leitura ou escrita."""
+        return conexao_duckdb(self.db_path)
+
+    def close(self) -> None:
+        """Nada a fechar: cada operação abre e fecha a própria conexão."""
+
+    def __enter__(self) -> "SchemaRegistry":
+        """Suporta uso com contexto 'with'."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Mantido por compatibilidade com o uso em 'with'."""
+        self.close()
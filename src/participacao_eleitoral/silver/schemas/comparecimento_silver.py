@@ -5,20 +5,44 @@ import polars as pl
 from participacao_eleitoral.core.contracts.comparecimento_silver import (
     ComparecimentoSilverContrato,
 )
+from participacao_eleitoral.silver.region_mapper import RegionMapper
 
-SCHEMA_SILVER = {
+# Domínio fechado de regiões: Enum guarda só o índice da categoria
+# e torna group_by/filter por região baratos nos scans do dashboard.
+REGIAO_ENUM = pl.Enum(RegionMapper.regioes())
+
+# SCHEMA FÍSICO de escrita da Silver.
+#
+# Os tipos são os mais estreitos que o contrato permite:
+# - contagens por linha de perfil cabem folgadamente em Int32
+# - taxas percentuais (0-100) não precisam de mais que Float32
+# - SG_UF é Categorical (não Enum) para preservar UFs fora do mapa,
+#   que continuam chegando à Silver com região "Desconhecido"
+SCHEMA_SILVER: dict[str, pl.DataType | type[pl.DataType]] = {
     # Campos bronze (mantidos)
-    "ANO_ELEICAO": pl.Int32,
+    "ANO_ELEICAO": pl.Int16,
     "CD_MUNICIPIO": pl.Int32,
     "NM_MUNICIPIO": pl.Utf8,
-    "SG_UF": pl.Utf8,
-    "QT_APTOS": pl.Int64,
-    "QT_COMPARECIMENTO": pl.Int64,
-    "QT_ABSTENCAO": pl.Int64,
+    "SG_UF": pl.Categorical,
+    "QT_APTOS": pl.Int32,
+    "QT_COMPARECIMENTO": pl.Int32,
+    "QT_ABSTENCAO": pl.Int32,
+    # Dimensões opcionais (presentes conforme o ano)
+    "NR_TURNO": pl.Int8,
+    "NR_ZONA": pl.Int16,
+    "DS_GENERO": pl.Categorical,
+    "DS_ESTADO_CIVIL": pl.Categorical,
+    "DS_FAIXA_ETARIA": pl.Categorical,
+    "DS_GRAU_ESCOLARIDADE": pl.Categorical,
+    "DS_COR_RACA": pl.Categorical,
+    "DS_QUILOMBOLA": pl.Categorical,
+    "DS_INTERPRETE_LIBRAS": pl.Categorical,
+    "DS_IDENTIDADE_GENERO": pl.Categorical,
+    "DS_IDIOMA_INDIGENA": pl.Categorical,
     # Campos silver (novos)
-    "TAXA_COMPARECIMENTO_PCT": pl.Float64,
-    "TAXA_ABSTENCAO_PCT": pl.Float64,
-    "NOME_REGIAO": pl.Utf8,
+    "TAXA_COMPARECIMENTO_PCT": pl.Float32,
+    "TAXA_ABSTENCAO_PCT": pl.Float32,
+    "NOME_REGIAO": REGIAO_ENUM,
 }
 
 # Mapeamento de tipos lógicos (contrato) → tipos Polars físicos válidos
@@ -34,7 +58,7 @@ LOGICO_PHYSICO_MAP: dict[str, tuple[type[pl.DataType], ...]] = {
         pl.UInt32,
         pl.UInt64,
     ),
-    "texto": (pl.Utf8, pl.Categorical),
+    "texto": (pl.Utf8, pl.Categorical, pl.Enum),
     "decimal": (pl.Float32, pl.Float64),
 }
 
@@ -65,7 +89,8 @@ def validar_schema_silver_contra_contrato() -> None:
     for campo in campos_contrato:
         if campo in ComparecimentoSilverContrato.CAMPOS_VALIDACOES:
             tipo_logico = ComparecimentoSilverContrato.CAMPOS_VALIDACOES[campo]["tipo"]
-            tipo_fisico = SCHEMA_SILVER[campo]
+            # Enum é instância parametrizada; base_type() devolve a classe
+            tipo_fisico = SCHEMA_SILVER[campo].base_type()
 
             # Buscar tipos válidos para o tipo lógico
             tipos_validos = LOGICO_PHYSICO_MAP.get(tipo_logico, ())
@@ -1,10 +1,15 @@
 """Transformador da camada Bronze para Silver"""
 
+from collections.abc import Mapping
 from pathlib import Path
 
 import polars as pl
 
+from participacao_eleitoral.core.contracts.comparecimento_silver import (
+    ComparecimentoSilverContrato,
+)
 from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
 from participacao_eleitoral.utils.logger import ModernLogger
 
 from .results import SilverTransformResult
@@ -16,7 +21,7 @@ class BronzeToSilverTransformer:
 
     Esta classe:
     - adiciona colunas calculadas (taxas)
-    - padroniza formatos
+    - padroniza formatos (projeta e converte para o schema Silver)
     - remove nulos
     - adiciona informações geográficas
 
@@ -26,15 +31,18 @@ class BronzeToSilverTransformer:
     - conhece Airflow
     """
 
-    def __init__(self, logger: ModernLogger):
+    def __init__(self, logger: ModernLogger, materializar_taxas: bool = True):
         self.logger = logger
 
+        # Sem materializar, as taxas só existem como colunas virtuais do leitor
+        self.materializar_taxas = materializar_taxas
+
     def transform(
         self,
         bronze_parquet_path: Path,
         silver_parquet_path: Path,
         region_mapper: RegionMapper,
-        schema: dict[str, type[pl.DataType]] | None,
+        schema: Mapping[str, pl.DataType | type[pl.DataType]] | None,
     ) -> SilverTransformResult:
         """
         Transforma dados do bronze para silver.
@@ -43,14 +51,16 @@ class BronzeToSilverTransformer:
         1. Ler Parquet bronze (eager - todos os dados usados)
         2. Calcular taxas de participação
         3. Adicionar região geográfica
-        4. Remover nulos
-        5. Escrever Parquet silver
+        4. Projetar e converter para o schema (quando informado)
+        5. Remover nulos
+        6. Ordenar por UF e escrever Parquet silver (escrita atômica)
 
         Args:
             bronze_parquet_path: Caminho do arquivo Parquet bronze
             silver_parquet_path: Caminho de destino para Parquet silver
             region_mapper: Mapeador de UF para região
-            schema: Schema explícito (contrato de dados)
+            schema: Schema explícito (contrato de dados). Colunas fora dele são
+                descartadas; campos opcionais ausentes no bronze são ignorados.
 
         Returns:
             SilverTransformResult com caminho e número de linhas
@@ -67,29 +77,46 @@ class BronzeToSilverTransformer:
         linhas_antes = len(df)
         self.logger.info("bronze_lido", linhas=linhas_antes)
 
-        # 2. Calcular taxas de participação
-        df = df.with_columns(
-            [
-                # Taxa de comparecimento: (comparecimento / aptos) * 100
-                ((pl.col("QT_COMPARECIMENTO") / pl.col("QT_APTOS")) * 100).alias(
-                    "TAXA_COMPARECIMENTO_PCT"
-                ),
-                # Taxa de abstenção: (abstenções / aptos) * 100
-                ((pl.col("QT_ABSTENCAO") / pl.col("QT_APTOS")) * 100).alias("TAXA_ABSTENCAO_PCT"),
-            ]
-        )
+        # 2. Calcular taxas de participação (opcional: deriváveis na leitura)
+        if self.materializar_taxas:
+            denominador = ComparecimentoSilverContrato.DENOMINADOR_TAXAS
+            df = df.with_columns(
+                [
+                    ((pl.col(numerador) / pl.col(denominador)) * 100).alias(taxa)
+                    for taxa, numerador in ComparecimentoSilverContrato.CAMPOS_DERIVADOS.items()
+                ]
+            )
 
-        # 3. Adicionar região geográfica (usando apply Python)
+        # 3. Adicionar região geográfica (mapeamento vetorizado, sem apply Python)
         df = df.with_columns(
             [
                 pl.col("SG_UF")
-                .map_elements(region_mapper.get_regiao, return_dtype=pl.Utf8)
+                .cast(pl.Utf8)
+                .replace_strict(
+                    region_mapper.REGIAO_MAP,
+                    default=region_mapper.REGIAO_DESCONHECIDA,
+                    return_dtype=pl.Utf8,
+                )
                 .alias("NOME_REGIAO")
             ]
         )
 
-        # 4. Remover linhas com nulos (garantir qualidade)
-        df = df.drop_nulls()
+        # 4. Projetar e converter para o schema físico declarado
+        if schema is not None:
+            if not self.materializar_taxas:
+                schema = {
+                    campo: tipo
+                    for campo, tipo in schema.items()
+                    if campo not in ComparecimentoSilverContrato.CAMPOS_DERIVADOS
+                }
+            df = self._aplicar_schema(df, schema)
+
+        # 5. Remover linhas com nulos nos campos obrigatórios (garantir qualidade)
+        # Dimensões opcionais podem vir nulas (#NULO# no TSE) sem descartar contagens
+        obrigatorios = [
+            c for c in ComparecimentoSilverContrato.CAMPOS_OBRIGATORIOS if c in df.columns
+        ]
+        df = df.drop_nulls(subset=obrigatorios)
 
         linhas_depois = len(df)
         linhas_removidas = linhas_antes - linhas_depois
@@ -101,17 +128,19 @@ class BronzeToSilverTransformer:
                 pct_removido=f"{(linhas_removidas / linhas_antes) * 100:.2f}%",
             )
 
-        # 5. Garantir diretório de destino existe
-        silver_parquet_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # 6. Escrever silver
-        df.write_parquet(
-            silver_parquet_path,
-            compression="zstd",
-            compression_level=3,
-            statistics=True,
-            row_group_size=100_000,
-        )
+        # 6. Ordenar por UF/município: row groups com faixas estreitas de SG_UF
+        # permitem que filtros por UF pulem row groups pelas estatísticas
+        df = df.sort([c for c in ("SG_UF", "CD_MUNICIPIO") if c in df.columns])
+
+        # 7. Escrever silver (temporário + fsync + rename atômico; cria o diretório)
+        with escrita_atomica(silver_parquet_path) as tmp_path:
+            df.write_parquet(
+                tmp_path,
+                compression="zstd",
+                compression_level=3,
+                statistics=True,
+                row_group_size=100_000,
+            )
 
         self.logger.success(
             "transformacao_concluida",
@@ -123,3 +152,25 @@ class BronzeToSilverTransformer:
             silver_path=silver_parquet_path,
             linhas=linhas_depois,
         )
+
+    @staticmethod
+    def _aplicar_schema(
+        df: pl.DataFrame,
+        schema: Mapping[str, pl.DataType | type[pl.DataType]],
+    ) -> pl.DataFrame:
+        """
+        Projeta o DataFrame nas colunas do schema e converte os tipos.
+
+        - Campos opcionais do contrato ausentes no bronze são pulados
+        - Qualquer outro campo ausente é erro (falhar cedo)
+        - O cast é estrito: contagem que não cabe em Int32 falha em vez de truncar
+        """
+        opcionais = set(ComparecimentoSilverContrato.CAMPOS_OPCIONAIS)
+
+        faltantes = [c for c in schema if c not in df.columns and c not in opcionais]
+        if faltantes:
+            raise RuntimeError(f"Bronze não contém campos exigidos pela Silver: {faltantes}")
+
+        return df.select(
+            [pl.col(campo).cast(tipo) for campo, tipo in schema.items() if campo in df.columns]
+        )
@@ -0,0 +1,52 @@
+"""Conexões curtas com os bancos DuckDB de metadados, compartilhados entre processos"""
+
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import duckdb
+
+# Espera máxima pelo banco aberto por outro processo, e intervalo base entre tentativas
+ESPERA_MAXIMA_SEGUNDOS = 60.0
+INTERVALO_SEGUNDOS = 0.05
+
+
+@contextmanager
+def conexao_duckdb(
+    db_path: Path,
+    espera_maxima: float = ESPERA_MAXIMA_SEGUNDOS,
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """
+    Abre o banco só pelo tempo de uma leitura ou escrita.
+
+    O DuckDB trava o arquivo para um único processo com conexão de escrita.
+    Os metadados (_metadata.duckdb) são compartilhados por workers paralelos
+    sobre o mesmo diretório de dados, então ninguém mantém o banco aberto:
+    cada operação abre, executa e fecha. Se outro processo está com o
+    arquivo aberto (IOException de trava), tenta de novo com espera
+    crescente e aleatória até `espera_maxima` segundos.
+
+    Uso:
+        with conexao_duckdb(db_path) as conn:
+            conn.execute("SELECT ...")
+    """
+    limite = time.monotonic() + espera_maxima
+    tentativa = 0
+
+    while True:
+        try:
+            conn = duckdb.connect(str(db_path))
+            break
+        except duckdb.IOException:
+            if time.monotonic() >= limite:
+                raise
+            tentativa += 1
+            # Jitter evita que workers em espera tentem todos no mesmo instante
+            time.sleep(min(INTERVALO_SEGUNDOS * tentativa, 1.0) * random.uniform(0.5, 1.5))
+
+    try:
+        yield conn
+    finally:
+        conn.close()
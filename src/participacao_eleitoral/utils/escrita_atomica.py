@@ -0,0 +1,104 @@
+"""Escrita atômica e trava por partição para os arquivos do Lakehouse"""
+
+import os
+import sys
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# Arquivo de trava dentro do diretório da partição (year=YYYY/.lock)
+ARQUIVO_TRAVA = ".lock"
+
+
+@contextmanager
+def escrita_atomica(destino: Path) -> Iterator[Path]:
+    """
+    Entrega um caminho temporário para escrita e publica em `destino` ao final.
+
+    O temporário fica no MESMO diretório do destino (mesmo sistema de
+    arquivos), então o os.replace final é atômico: leitores veem o arquivo
+    antigo ou o novo completo, nunca um Parquet truncado. Em caso de erro o
+    temporário é removido e o destino fica intacto.
+
+    Uso:
+        with escrita_atomica(parquet_path) as tmp:
+            df.write_parquet(tmp)
+    """
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    tmp = destino.with_name(f".{destino.name}.{uuid.uuid4().hex}.tmp")
+
+    try:
+        yield tmp
+        _fsync_arquivo(tmp)
+        os.replace(tmp, destino)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    # Persiste a entrada de diretório do rename (sem efeito no Windows)
+    _fsync_diretorio(destino.parent)
+
+
+@contextmanager
+def trava_particao(diretorio: Path, nome: str = ARQUIVO_TRAVA) -> Iterator[None]:
+    """
+    Trava consultiva exclusiva de uma partição, entre processos.
+
+    Bloqueia até a trava ser liberada. Workers paralelos sobre o mesmo
+    diretório de dados serializam por partição (year=YYYY), não globalmente.
+
+    A trava é por descritor: NÃO aninhe trava_particao com o mesmo `nome`
+    no mesmo diretório dentro de um processo. Travas de recursos distintos
+    do mesmo diretório (ex.: o manifesto) usam outro `nome`.
+    """
+    diretorio.mkdir(parents=True, exist_ok=True)
+
+    with open(diretorio / nome, "a+b") as arquivo:
+        _travar(arquivo)
+        try:
+            yield
+        finally:
+            _destravar(arquivo)
+
+
+def _fsync_arquivo(caminho: Path) -> None:
+    """Força os dados do arquivo para o disco antes do rename."""
+    fd = os.open(caminho, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_diretorio(diretorio: Path) -> None:
+    if sys.platform == "win32":
+        return
+
+    fd = os.open(diretorio, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _travar(arquivo: IO[bytes]) -> None:
+    if sys.platform == "win32":
+        arquivo.seek(0)
+        msvcrt.locking(arquivo.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX)
+
+
+def _destravar(arquivo: IO[bytes]) -> None:
+    if sys.platform == "win32":
+        arquivo.seek(0)
+        msvcrt.locking(arquivo.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(arquivo.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,234 @@
+"""Manifesto de partições por camada (_manifest.json)"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica, trava_particao
+
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
+
+ARQUIVO_MANIFESTO = "_manifest.json"
+TRAVA_MANIFESTO = ".manifest.lock"
+VERSAO_MANIFESTO = 1
+
+_BLOCO_CHECKSUM = 1024 * 1024
+
+
+class EstatisticaColuna(TypedDict):
+    """Estatísticas de uma coluna, combinadas de todos os row groups."""
+
+    min: Any
+    max: Any
+    nulos: int | None
+
+
+class EntradaManifesto(TypedDict):
+    """Um arquivo Parquet da camada, conhecido sem abrir o arquivo."""
+
+    particao: dict[str, str]
+    tamanho_bytes: int
+    mtime_ns: int
+    linhas: int
+    row_groups: int
+    sha256: str
+    colunas: dict[str, EstatisticaColuna]
+
+
+class Manifesto(TypedDict):
+    versao: int
+    atualizado_em: str
+    arquivos: dict[str, EntradaManifesto]
+
+
+def carregar_manifesto(raiz: Path) -> Manifesto:
+    """
+    Lê o manifesto de uma camada (raiz do dataset).
+
+    Manifesto ausente, corrompido ou de outra versão equivale a vazio:
+    leitores caem no caminho antigo (rodapé do Parquet), nunca falham.
+    """
+    vazio: Manifesto = {"versao": VERSAO_MANIFESTO, "atualizado_em": "", "arquivos": {}}
+
+    try:
+        dados = json.loads((raiz / ARQUIVO_MANIFESTO).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return vazio
+
+    if not isinstance(dados, dict) or dados.get("versao") != VERSAO_MANIFESTO:
+        return vazio
+    return dados  # type: ignore[return-value]
+
+
+def registrar_no_manifesto(raiz: Path, arquivos: Iterable[Path]) -> Manifesto:
+    """
+    Adiciona (ou substitui) as entradas dos arquivos recém-escritos.
+
+    Chamado pelos pipelines logo após publicar os arquivos. O manifesto
+    inteiro é reescrito de forma atômica, sob uma trava própria na raiz do
+    dataset (independente das travas de partição). Entradas de arquivos
+    que não existem mais são descartadas.
+    """
+    with trava_particao(raiz, TRAVA_MANIFESTO):
+        manifesto = carregar_manifesto(raiz)
+
+        for arquivo in arquivos:
+            manifesto["arquivos"][_chave(raiz, arquivo)] = descrever_parquet(raiz, arquivo)
+
+        manifesto["arquivos"] = {
+            chave: entrada
+            for chave, entrada in sorted(manifesto["arquivos"].items())
+            if (raiz / chave).exists()
+        }
+        manifesto["atualizado_em"] = datetime.now(UTC).isoformat()
+
+        with escrita_atomica(raiz / ARQUIVO_MANIFESTO) as tmp_path:
+            tmp_path.write_text(
+                json.dumps(manifesto, ensure_ascii=False, indent=1, default=str),
+                encoding="utf-8",
+            )
+
+    return manifesto
+
+
+def descrever_parquet(raiz: Path, arquivo: Path) -> EntradaManifesto:
+    """Entrada de manifesto de um arquivo: só o rodapé é lido, mais o checksum."""
+    # Importado aqui: leitores só consultam o manifesto e não precisam do PyArrow
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_metadata(arquivo)
+    stat = arquivo.stat()
+
+    colunas: dict[str, EstatisticaColuna] = {}
+    for indice in range(metadata.num_columns):
+        nome = metadata.schema.column(indice).path
+        colunas[nome] = _combinar_row_groups(metadata, indice)
+
+    particao = dict(
+        parte.split("=", 1) for parte in Path(_chave(raiz, arquivo)).parent.parts if "=" in parte
+    )
+
+    return {
+        "particao": particao,
+        "tamanho_bytes": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "linhas": metadata.num_rows,
+        "row_groups": metadata.num_row_groups,
+        "sha256": _sha256(arquivo),
+        "colunas": colunas,
+    }
+
+
+def entrada_atual(manifesto: Manifesto, raiz: Path, arquivo: Path) -> EntradaManifesto | None:
+    """
+    Entrada do arquivo, se ainda descreve o arquivo em disco.
+
+    A validação é por stat (tamanho + mtime): o arquivo não é aberto. Um
+    arquivo reescrito sem passar pelo manifesto volta a ser lido pelo rodapé.
+    """
+    entrada = manifesto["arquivos"].get(_chave(raiz, arquivo))
+    if entrada is None:
+        return None
+
+    try:
+        stat = arquivo.stat()
+    except OSError:
+        return None
+
+    if stat.st_size != entrada["tamanho_bytes"] or stat.st_mtime_ns != entrada["mtime_ns"]:
+        return None
+    return entrada
+
+
+def pode_conter(entrada: EntradaManifesto, coluna: str, valores: Iterable[Any]) -> bool:
+    """
+    False só quando as estatísticas provam que nenhum valor está no arquivo.
+
+    Sem estatísticas (coluna ausente, min/max nulos, tipos incomparáveis)
+    a resposta é conservadora: True.
+    """
+    estatistica = entrada["colunas"].get(coluna)
+    if estatistica is None:
+        # Coluna ausente do arquivo: lida como nula, nenhum valor pedido casa
+        return False
+    if estatistica["min"] is None or estatistica["max"] is None:
+        return True
+
+    try:
+        return any(estatistica["min"] <= valor <= estatistica["max"] for valor in valores)
+    except TypeError:
+        return True
+
+
+def verificar_manifesto(raiz: Path) -> dict[str, str]:
+    """
+    Confere os checksums do manifesto contra os arquivos em disco.
+
+    Returns:
+        Arquivos divergentes (caminho relativo → motivo); vazio se tudo confere
+    """
+    divergentes: dict[str, str] = {}
+
+    for chave, entrada in carregar_manifesto(raiz)["arquivos"].items():
+        arquivo = raiz / chave
+        if not arquivo.exists():
+            divergentes[chave] = "ausente"
+        elif _sha256(arquivo) != entrada["sha256"]:
+            divergentes[chave] = "checksum divergente"
+
+    return divergentes
+
+
+def _combinar_row_groups(metadata: "pq.FileMetaData", indice: int) -> EstatisticaColuna:
+    minimo: Any = None
+    maximo: Any = None
+    nulos: int | None = 0
+
+    for rg in range(metadata.num_row_groups):
+        estatisticas = metadata.row_group(rg).column(indice).statistics
+        if estatisticas is None:
+            return {"min": None, "max": None, "nulos": None}
+
+        if estatisticas.has_null_count and nulos is not None:
+            nulos += estatisticas.null_count
+        else:
+            nulos = None
+
+        if not estatisticas.has_min_max:
+            # Row group só com nulos não tem min/max: não restringe o intervalo
+            if (
+                estatisticas.has_null_count
+                and estatisticas.null_count == metadata.row_group(rg).num_rows
+            ):
+                continue
+            return {"min": None, "max": None, "nulos": nulos}
+
+        minimo = estatisticas.min if minimo is None else min(minimo, estatisticas.min)
+        maximo = estatisticas.max if maximo is None else max(maximo, estatisticas.max)
+
+    return {"min": _json(minimo), "max": _json(maximo), "nulos": nulos}
+
+
+def _json(valor: Any) -> Any:
+    """Valores de estatística em tipos JSON (bytes e datas viram texto)."""
+    if valor is None or isinstance(valor, bool | int | float | str):
+        return valor
+    if isinstance(valor, bytes):
+        return valor.decode("utf-8", errors="replace")
+    return str(valor)
+
+
+def _chave(raiz: Path, arquivo: Path) -> str:
+    return arquivo.relative_to(raiz).as_posix()
+
+
+def _sha256(arquivo: Path) -> str:
+    digest = hashlib.sha256()
+    with open(arquivo, "rb") as f:
+        while bloco := f.read(_BLOCO_CHECKSUM):
+            digest.update(bloco)
+    return digest.hexdigest()
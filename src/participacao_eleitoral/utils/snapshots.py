@@ -0,0 +1,296 @@
+"""Snapshots imutáveis por partição (time travel, rollback e vacuum)"""
+
+import json
+import os
+import shutil
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TypedDict
+
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+
+ARQUIVO_SNAPSHOTS = "_snapshots.json"
+DIRETORIO_VERSOES = "_versoes"
+FORMATO_SNAPSHOTS = 1
+
+
+class Snapshot(TypedDict):
+    """Estado completo da partição: cada arquivo publicado → versão imutável."""
+
+    versao: int
+    criado_em: str
+    operacao: str
+    arquivos: dict[str, int]
+
+
+class LogSnapshots(TypedDict):
+    formato: int
+    atual: int | None
+    fixados: list[int]
+    snapshots: list[Snapshot]
+
+
+class PartitionSnapshots:
+    """
+    Formato de tabela com snapshots de uma partição (year=YYYY).
+
+    Inspirado em Iceberg/Delta, em versão local e mínima:
+    - cada escrita publica os arquivos normalmente (escrita atômica) e depois
+      faz commit: o arquivo publicado ganha um hardlink imutável em
+      `_versoes/<versao>/<nome>` e o log `_snapshots.json` ganha um snapshot
+      com o estado completo da partição (arquivos não reescritos herdam a
+      versão do snapshot anterior)
+    - escritas de vários arquivos (as tabelas de um ano da Gold) montam a
+      versão inteira em `_versoes/<versao>/` (nova_versao) e publicam tudo de
+      uma vez: o único passo visível é a troca atômica do log
+    - leitores resolvem `<nome>` pelo snapshot atual (atual) e veem sempre uma
+      versão completa; ou fixam uma versão lendo `caminho(versao, nome)`.
+      O arquivo publicado `<nome>` é um espelho do snapshot atual
+    - rollback troca o arquivo publicado pelo hardlink da versão pedida:
+      `os.replace` por arquivo, sem recomputar nada
+    - vacuum remove as versões que nenhum snapshot retido referencia
+
+    Arquivos de versão nunca são reescritos: a escrita atômica sempre cria um
+    inode novo para o arquivo publicado, então o hardlink antigo continua
+    apontando para os bytes da versão anterior.
+
+    Commit, rollback e vacuum alteram a partição: chame-os com a trava da
+    partição (trava_particao) já obtida.
+    """
+
+    def __init__(self, diretorio: Path):
+        self.diretorio = diretorio
+        self.log_path = diretorio / ARQUIVO_SNAPSHOTS
+        self.versoes_dir = diretorio / DIRETORIO_VERSOES
+
+    def carregar(self) -> LogSnapshots:
+        """Lê o log da partição (vazio se a partição nunca teve commit)."""
+        try:
+            dados = json.loads(self.log_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"formato": FORMATO_SNAPSHOTS, "atual": None, "fixados": [], "snapshots": []}
+
+        if dados.get("formato") != FORMATO_SNAPSHOTS:
+            raise ValueError(f"Formato de snapshots não suportado em {self.log_path}")
+        return dados  # type: ignore[no-any-return]
+
+    def snapshot(self, versao: int | None = None) -> Snapshot:
+        """Snapshot de uma versão (padrão: o atual)."""
+        log = self.carregar()
+        alvo = log["atual"] if versao is None else versao
+
+        for snapshot in log["snapshots"]:
+            if snapshot["versao"] == alvo:
+                return snapshot
+
+        raise ValueError(f"Snapshot {alvo} não existe em {self.diretorio}")
+
+    def caminho(self, versao: int, nome: str) -> Path:
+        """Arquivo imutável de `nome` como estava no snapshot `versao`."""
+        arquivos = self.snapshot(versao)["arquivos"]
+        if nome not in arquivos:
+            raise ValueError(f"Snapshot {versao} de {self.diretorio} não contém {nome}")
+        return self._arquivo_versao(arquivos[nome], nome)
+
+    def atual(self, nome: str) -> Path:
+        """
+        Arquivo de `nome` no snapshot atual.
+
+        Sem snapshot que contenha `nome` (partição sem commit), é o próprio
+        arquivo publicado.
+        """
+        # Uma única leitura do log: o ponteiro e os arquivos são do mesmo snapshot
+        arquivos = _arquivos_atuais(self.carregar())
+        if nome in arquivos:
+            return self._arquivo_versao(arquivos[nome], nome)
+        return self.diretorio / nome
+
+    def versao_em(self, instante: datetime) -> int | None:
+        """Time travel: última versão commitada até `instante` (com fuso horário)."""
+        anteriores = [
+            s["versao"]
+            for s in self.carregar()["snapshots"]
+            if datetime.fromisoformat(s["criado_em"]) <= instante
+        ]
+        return max(anteriores, default=None)
+
+    def commit(self, nomes: Iterable[str], operacao: str) -> Snapshot:
+        """
+        Registra como nova versão os arquivos recém-publicados `nomes`.
+
+        Returns:
+            O snapshot criado (agora o atual)
+        """
+        log = self.carregar()
+        versao = _proxima_versao(log)
+        nomes = list(nomes)
+
+        for nome in nomes:
+            _vincular(self.diretorio / nome, self._arquivo_versao(versao, nome))
+
+        return self._registrar(log, versao, nomes, operacao)
+
+    @contextmanager
+    def nova_versao(self, operacao: str) -> Iterator[Path]:
+        """
+        Entrega o diretório da próxima versão para montar vários arquivos juntos.
+
+        Ao final, todos os arquivos escritos no diretório viram UM snapshot:
+        a única troca visível é a reescrita atômica do log, então leitores
+        que resolvem pelo snapshot (atual) veem a versão anterior inteira ou
+        a nova inteira. Depois os arquivos publicados são espelhados. Em caso
+        de erro o diretório é removido e a partição fica intacta.
+
+        Uso:
+            with snapshots.nova_versao("aggregate") as versao_dir:
+                df.write_parquet(versao_dir / "uf.parquet")
+        """
+        log = self.carregar()
+        versao = _proxima_versao(log)
+        versao_dir = self.versoes_dir / f"{versao:05d}"
+
+        # Sobra de uma escrita interrompida (versão sem snapshot no log)
+        shutil.rmtree(versao_dir, ignore_errors=True)
+        versao_dir.mkdir(parents=True)
+
+        try:
+            yield versao_dir
+            nomes = sorted(p.name for p in versao_dir.iterdir() if not p.name.startswith("."))
+            self._registrar(log, versao, nomes, operacao)
+        except BaseException:
+            shutil.rmtree(versao_dir, ignore_errors=True)
+            raise
+
+        for nome in nomes:
+            self._espelhar(versao, nome)
+
+    def rollback(self, versao: int) -> Snapshot:
+        """
+        Volta a partição ao snapshot `versao`.
+
+        Cada arquivo publicado é trocado atomicamente pelo hardlink da versão;
+        arquivos que não existiam naquele snapshot são removidos. O log não
+        perde histórico: só o ponteiro `atual` muda.
+        """
+        log = self.carregar()
+        alvo = self.snapshot(versao)
+        atuais = self.snapshot(log["atual"])["arquivos"] if log["atual"] is not None else {}
+
+        for nome, versao_arquivo in alvo["arquivos"].items():
+            self._espelhar(versao_arquivo, nome)
+
+        for nome in atuais.keys() - alvo["arquivos"].keys():
+            (self.diretorio / nome).unlink(missing_ok=True)
+
+        log["atual"] = versao
+        self._salvar(log)
+        return alvo
+
+    def fixar(self, versao: int, fixo: bool = True) -> None:
+        """Protege (ou libera) um snapshot do vacuum."""
+        self.snapshot(versao)
+        log = self.carregar()
+
+        fixados = set(log["fixados"])
+        if fixo:
+            fixados.add(versao)
+        else:
+            fixados.discard(versao)
+        log["fixados"] = sorted(fixados)
+        self._salvar(log)
+
+    def vacuum(self, reter: int) -> list[Path]:
+        """
+        Expira snapshots antigos e remove os arquivos que ficaram sem referência.
+
+        Ficam: as `reter` versões mais recentes, a atual e as fixadas.
+        Arquivos de commits interrompidos (sem snapshot) também são removidos.
+
+        Returns:
+            Arquivos de versão removidos
+        """
+        log = self.carregar()
+        recentes = sorted((s["versao"] for s in log["snapshots"]), reverse=True)[:reter]
+        manter = set(recentes) | set(log["fixados"])
+        if log["atual"] is not None:
+            manter.add(log["atual"])
+
+        log["snapshots"] = [s for s in log["snapshots"] if s["versao"] in manter]
+        referenciados = {
+            self._arquivo_versao(versao, nome)
+            for s in log["snapshots"]
+            for nome, versao in s["arquivos"].items()
+        }
+        self._salvar(log)
+
+        removidos: list[Path] = []
+        if not self.versoes_dir.exists():
+            return removidos
+
+        for arquivo in sorted(self.versoes_dir.glob("*/*")):
+            if arquivo not in referenciados:
+                arquivo.unlink()
+                removidos.append(arquivo)
+
+        for diretorio in self.versoes_dir.iterdir():
+            if diretorio.is_dir() and not any(diretorio.iterdir()):
+                diretorio.rmdir()
+
+        return removidos
+
+    def _arquivo_versao(self, versao: int, nome: str) -> Path:
+        return self.versoes_dir / f"{versao:05d}" / nome
+
+    def _registrar(
+        self, log: LogSnapshots, versao: int, nomes: Iterable[str], operacao: str
+    ) -> Snapshot:
+        """Grava o snapshot `versao` (arquivos não listados herdam do atual)."""
+        arquivos = _arquivos_atuais(log) | dict.fromkeys(nomes, versao)
+
+        snapshot: Snapshot = {
+            "versao": versao,
+            "criado_em": datetime.now(UTC).isoformat(),
+            "operacao": operacao,
+            "arquivos": dict(sorted(arquivos.items())),
+        }
+        log["snapshots"].append(snapshot)
+        log["atual"] = versao
+        self._salvar(log)
+
+        return snapshot
+
+    def _espelhar(self, versao: int, nome: str) -> None:
+        """Troca atomicamente o arquivo publicado pelo hardlink da versão."""
+        publicado = self.diretorio / nome
+        tmp = publicado.with_name(f".{nome}.espelho.tmp")
+        _vincular(self._arquivo_versao(versao, nome), tmp)
+        os.replace(tmp, publicado)
+
+    def _salvar(self, log: LogSnapshots) -> None:
+        with escrita_atomica(self.log_path) as tmp_path:
+            tmp_path.write_text(json.dumps(log, indent=1), encoding="utf-8")
+
+
+def _arquivos_atuais(log: LogSnapshots) -> dict[str, int]:
+    for snapshot in log["snapshots"]:
+        if snapshot["versao"] == log["atual"]:
+            return dict(snapshot["arquivos"])
+    return {}
+
+
+def _proxima_versao(log: LogSnapshots) -> int:
+    return max((s["versao"] for s in log["snapshots"]), default=0) + 1
+
+
+def _vincular(origem: Path, destino: Path) -> None:
+    """Hardlink (sem cópia de dados); cópia onde o sistema de arquivos não suporta."""
+    destino.parent.mkdir(parents=True, exist_ok=True)
+
+    # Sobra de um commit interrompido (versão sem snapshot no log)
+    destino.unlink(missing_ok=True)
+    try:
+        os.link(origem, destino)
+    except OSError:
+        shutil.copy2(origem, destino)
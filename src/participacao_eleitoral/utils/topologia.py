@@ -0,0 +1,234 @@
+"""Simplificação de geometrias com topologia preservada (TopoJSON quantizado)"""
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+Ponto = tuple[int, int]
+
+# Casas decimais das coordenadas decodificadas (~1 m no equador)
+CASAS_DECIMAIS = 5
+
+
+def simplificar_topologia(
+    geojson: dict[str, Any],
+    *,
+    tolerancia: float,
+    quantizacao: int = 100_000,
+    objeto: str = "geometrias",
+) -> dict[str, Any]:
+    """
+    Converte um FeatureCollection (Polygon/MultiPolygon) em TopoJSON simplificado.
+
+    Preserva a topologia como o TopoJSON: as fronteiras compartilhadas entre
+    feições viram um único arco, simplificado UMA vez (Douglas-Peucker) e
+    referenciado pelos dois lados, então vizinhos continuam se encaixando
+    sem frestas nem sobreposições.
+
+    - quantizacao: coordenadas viram inteiros numa grade quantizacao × quantizacao
+      sobre o bounding box; arcos são gravados em deltas (inteiros pequenos)
+    - tolerancia: distância máxima da simplificação, nas unidades do GeoJSON
+      (graus para WGS84)
+
+    Anéis que degeneram (menos de 4 pontos) são descartados; propriedades das
+    feições são mantidas.
+    """
+    feicoes = geojson["features"]
+    xs, ys = zip(*(p for f in feicoes for anel in _aneis(f["geometry"]) for p in anel), strict=True)
+    x0, y0 = min(xs), min(ys)
+    sx = (max(xs) - x0) / (quantizacao - 1) or 1.0
+    sy = (max(ys) - y0) / (quantizacao - 1) or 1.0
+
+    def quantizar(anel: list[list[float]]) -> list[Ponto]:
+        pontos: list[Ponto] = []
+        for x, y in anel:
+            ponto = (round((x - x0) / sx), round((y - y0) / sy))
+            if not pontos or pontos[-1] != ponto:
+                pontos.append(ponto)
+        if pontos[0] != pontos[-1]:
+            pontos.append(pontos[0])
+        return pontos
+
+    # Polígonos de cada feição, como listas de anéis quantizados; anéis
+    # menores que uma célula da grade colapsam e saem já aqui
+    poligonos: list[list[list[list[Ponto]]]] = []
+    for feicao in feicoes:
+        poligonos.append([])
+        for poligono in _poligonos(feicao["geometry"]):
+            aneis = [quantizar(anel) for anel in poligono]
+            if len(aneis[0]) >= 4:
+                poligonos[-1].append([anel for anel in aneis if len(anel) >= 4])
+
+    juncoes = _juncoes(anel for feicao in poligonos for poligono in feicao for anel in poligono)
+
+    arcos: list[list[Ponto]] = []
+    indices: dict[tuple[Ponto, ...], int] = {}
+    tolerancia_grade = tolerancia / max(sx, sy)
+
+    def indexar(arco: list[Ponto]) -> int:
+        chave = tuple(arco)
+        if chave in indices:
+            return indices[chave]
+        if chave[::-1] in indices:
+            return ~indices[chave[::-1]]
+        indices[chave] = len(arcos)
+        arcos.append(_douglas_peucker(arco, tolerancia_grade))
+        return indices[chave]
+
+    geometrias = []
+    for propriedades, poligonos_feicao in zip(
+        (f.get("properties", {}) for f in feicoes), poligonos, strict=True
+    ):
+        arcos_poligonos = []
+        for aneis_quantizados in poligonos_feicao:
+            aneis_arcos = [
+                [indexar(arco) for arco in _cortar(anel, juncoes)] for anel in aneis_quantizados
+            ]
+            # Anel externo degenerado descarta o polígono; furo degenerado, só o furo
+            validos = [indices for indices in aneis_arcos if _pontos_anel(indices, arcos) >= 4]
+            if validos and validos[0] is aneis_arcos[0]:
+                arcos_poligonos.append(validos)
+
+        geometrias.append(
+            {
+                "type": "MultiPolygon",
+                "arcs": arcos_poligonos,
+                "properties": propriedades,
+            }
+        )
+
+    return {
+        "type": "Topology",
+        "transform": {"scale": [sx, sy], "translate": [x0, y0]},
+        "objects": {objeto: {"type": "GeometryCollection", "geometries": geometrias}},
+        "arcs": [_delta(arco) for arco in arcos],
+    }
+
+
+def topojson_para_geojson(topologia: dict[str, Any], objeto: str) -> dict[str, Any]:
+    """Decodifica um objeto do TopoJSON (quantizado) em FeatureCollection GeoJSON."""
+    (sx, sy), (x0, y0) = topologia["transform"]["scale"], topologia["transform"]["translate"]
+
+    arcos: list[list[list[float]]] = []
+    for arco in topologia["arcs"]:
+        x = y = 0
+        pontos = []
+        for dx, dy in arco:
+            x, y = x + dx, y + dy
+            pontos.append([round(x * sx + x0, CASAS_DECIMAIS), round(y * sy + y0, CASAS_DECIMAIS)])
+        arcos.append(pontos)
+
+    def anel(indices: list[int]) -> list[list[float]]:
+        coordenadas: list[list[float]] = []
+        for i in indices:
+            pontos = arcos[i] if i >= 0 else arcos[~i][::-1]
+            coordenadas.extend(pontos[1:] if coordenadas else pontos)
+        return coordenadas
+
+    feicoes = []
+    for geometria in topologia["objects"][objeto]["geometries"]:
+        poligonos = [[anel(a) for a in poligono] for poligono in geometria["arcs"]]
+        feicoes.append(
+            {
+                "type": "Feature",
+                "properties": geometria.get("properties", {}),
+                "geometry": {"type": "MultiPolygon", "coordinates": poligonos},
+            }
+        )
+
+    return {"type": "FeatureCollection", "features": feicoes}
+
+
+def _poligonos(geometria: dict[str, Any]) -> list[list[list[list[float]]]]:
+    if geometria["type"] == "Polygon":
+        return [geometria["coordinates"]]
+    if geometria["type"] == "MultiPolygon":
+        return list(geometria["coordinates"])
+    raise ValueError(f"Geometria não suportada: {geometria['type']}")
+
+
+def _aneis(geometria: dict[str, Any]) -> list[list[list[float]]]:
+    return [anel for poligono in _poligonos(geometria) for anel in poligono]
+
+
+def _juncoes(aneis: Iterable[list[Ponto]]) -> set[Ponto]:
+    """
+    Pontos onde fronteiras se encontram ou se separam.
+
+    Um ponto é junção se, somando todas as ocorrências, tem mais de dois
+    vizinhos distintos: ali um arco compartilhado começa ou termina.
+    """
+    vizinhos: dict[Ponto, set[Ponto]] = defaultdict(set)
+    for anel in aneis:
+        # Anel fechado: o último ponto repete o primeiro
+        n = len(anel) - 1
+        for i in range(n):
+            vizinhos[anel[i]].update((anel[i - 1], anel[i + 1]))
+    return {ponto for ponto, vizinhanca in vizinhos.items() if len(vizinhanca) > 2}
+
+
+def _cortar(anel: list[Ponto], juncoes: set[Ponto]) -> list[list[Ponto]]:
+    """Corta um anel fechado em arcos entre junções consecutivas."""
+    pontos = anel[:-1]
+    cortes = [i for i, ponto in enumerate(pontos) if ponto in juncoes]
+
+    if not cortes:
+        # Anel sem vizinhos (ilha): um arco fechado, começando no menor
+        # ponto para que anéis idênticos gerem a mesma chave
+        inicio = pontos.index(min(pontos))
+        rotacionado = pontos[inicio:] + pontos[:inicio]
+        return [[*rotacionado, rotacionado[0]]]
+
+    rotacionado = pontos[cortes[0] :] + pontos[: cortes[0]]
+    posicoes = [i - cortes[0] for i in cortes] + [len(pontos)]
+    fechado = [*rotacionado, rotacionado[0]]
+    return [fechado[a : b + 1] for a, b in zip(posicoes, posicoes[1:], strict=False)]
+
+
+def _douglas_peucker(pontos: list[Ponto], tolerancia: float) -> list[Ponto]:
+    """Douglas-Peucker iterativo; extremos (junções) sempre mantidos."""
+    if len(pontos) <= 2:
+        return pontos
+
+    manter = [False] * len(pontos)
+    manter[0] = manter[-1] = True
+    pilha = [(0, len(pontos) - 1)]
+
+    while pilha:
+        inicio, fim = pilha.pop()
+        maior, indice = 0.0, -1
+        for i in range(inicio + 1, fim):
+            distancia = _distancia_segmento(pontos[i], pontos[inicio], pontos[fim])
+            if distancia > maior:
+                maior, indice = distancia, i
+        if indice >= 0 and maior > tolerancia:
+            manter[indice] = True
+            pilha.extend([(inicio, indice), (indice, fim)])
+
+    return [ponto for ponto, fica in zip(pontos, manter, strict=True) if fica]
+
+
+def _distancia_segmento(p: Ponto, a: Ponto, b: Ponto) -> float:
+    (px, py), (ax, ay), (bx, by) = p, a, b
+    dx, dy = bx - ax, by - ay
+    if dx == dy == 0:
+        # Arco fechado: extremos coincidem
+        return math.hypot(px - ax, py - ay)
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def _pontos_anel(indices: list[int], arcos: list[list[Ponto]]) -> int:
+    """Pontos do anel montado (extremos compartilhados entre arcos contam uma vez)."""
+    return 1 + sum(len(arcos[i if i >= 0 else ~i]) - 1 for i in indices)
+
+
+def _delta(arco: list[Ponto]) -> list[list[int]]:
+    """Codifica o arco em deltas: o primeiro ponto absoluto, os demais relativos."""
+    anterior = (0, 0)
+    deltas = []
+    for x, y in arco:
+        deltas.append([x - anterior[0], y - anterior[1]])
+        anterior = (x, y)
+    return deltas
@@ -0,0 +1,270 @@
+"""
+Harness de desempenho do dashboard: dirige o app sem navegador
+(streamlit.testing.AppTest) sobre uma Silver sintética em várias escalas e
+mede carga a frio, rerun aquecido, troca de ano e filtro de região, além do
+pico de memória (RSS) do processo.
+
+Cada escala roda num processo Python novo, apontado para a Silver sintética
+por PARTICIPACAO_PROJECT_ROOT: a carga a frio inclui imports e o pico de
+memória não herda o das escalas anteriores.
+
+As medidas alimentam a baseline de regressão (baseline_desempenho.json),
+verificada por test_desempenho.py. Para regravar após uma mudança
+intencional (ou numa máquina nova):
+
+    uv run python tests/dashboard/desempenho.py --linhas 10000,200000,1000000 --salvar
+    uv run python tests/dashboard/desempenho.py --verificar
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.silver.reader import caminho_particao_silver
+from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+
+DASHBOARD = Path(__file__).resolve().parents[2] / "src" / "participacao_eleitoral" / "dashboard.py"
+BASELINE = Path(__file__).with_name("baseline_desempenho.json")
+
+# Anos da barra lateral do dashboard (todos selecionados por padrão)
+ANOS = [2014, 2016, 2018, 2020, 2022, 2024]
+UFS = list(RegionMapper.REGIAO_MAP)
+
+# Medidas comparadas com a baseline (ms, exceto o pico de memória em MB)
+MEDIDAS = ("carga_fria", "rerun", "troca_ano", "filtro_regiao", "pico_memoria_mb")
+
+# Folga sobre a baseline, por medida: a latência via AppTest varia bem entre
+# execuções (pega regressões de ~2x), o pico de memória quase nada
+TOLERANCIA_PADRAO = {
+    "carga_fria": 1.0,
+    "rerun": 1.0,
+    "troca_ano": 1.0,
+    "filtro_regiao": 1.0,
+    "pico_memoria_mb": 0.25,
+}
+
+# Executado no processo filho; imprime as medidas em JSON na última linha
+MEDICAO = """
+import json, statistics, sys, time
+inicio = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+
+def cronometrar(acao):
+    inicio = time.perf_counter()
+    acao()
+    return (time.perf_counter() - inicio) * 1000
+
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.run()
+carga_fria = (time.perf_counter() - inicio) * 1000
+repeticoes = int(sys.argv[2])
+
+# Widgets são relidos a cada interação: a árvore de elementos muda a cada run
+def anos():
+    return at.sidebar.multiselect[0]
+
+def regioes():
+    return at.sidebar.multiselect[1]
+
+todos_anos, todas_regioes = list(anos().value), list(regioes().value)
+
+rerun, troca_ano, filtro_regiao = [], [], []
+for _ in range(repeticoes):
+    rerun.append(cronometrar(at.run))
+    # Desmarca e remarca o ano mais antigo (agregados já em cache)
+    troca_ano.append(cronometrar(lambda: anos().set_value(todos_anos[1:]).run()))
+    troca_ano.append(cronometrar(lambda: anos().set_value(todos_anos).run()))
+    filtro_regiao.append(cronometrar(lambda: regioes().set_value(["Nordeste"]).run()))
+    filtro_regiao.append(cronometrar(lambda: regioes().set_value(todas_regioes).run()))
+
+def pico_memoria_mb():
+    # VmHWM é do espaço de endereçamento deste processo; ru_maxrss sobrevive
+    # ao fork/exec e herdaria o pico do processo pai (ex.: o pytest)
+    try:
+        with open("/proc/self/status") as status:
+            for linha in status:
+                if linha.startswith("VmHWM:"):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss: bytes no macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024)
+
+pico = pico_memoria_mb()
+
+print(json.dumps({
+    "carga_fria": carga_fria,
+    "rerun": statistics.median(rerun),
+    "troca_ano": statistics.median(troca_ano),
+    "filtro_regiao": statistics.median(filtro_regiao),
+    "pico_memoria_mb": pico,
+    "excecoes": [str(e.value) for e in at.exception],
+    "metricas": len(at.metric),
+}))
+"""
+
+
+def gerar_silver(raiz: Path, linhas: int, anos: list[int] = ANOS, seed: int = 42) -> None:
+    """Partições Silver sintéticas com `linhas` linhas por ano (colunas lidas pelo dashboard)."""
+    settings = Settings(project_root=raiz)
+
+    def sortear(valores: pl.Series, semente: int) -> pl.Series:
+        return valores.sample(linhas, with_replacement=True, seed=semente)
+
+    for indice, ano in enumerate(anos):
+        semente = seed + 3 * indice
+        df = (
+            pl.DataFrame(
+                {
+                    "SG_UF": sortear(pl.Series(UFS), semente),
+                    "QT_APTOS": sortear(pl.int_range(1, 400, eager=True), semente + 1),
+                    # Taxa de comparecimento entre 60% e 95%
+                    "taxa": sortear(pl.int_range(600, 950, eager=True), semente + 2) / 1000,
+                }
+            )
+            .with_columns(
+                pl.lit(ano).alias("ANO_ELEICAO"),
+                pl.lit(1).alias("NR_TURNO"),
+                pl.col("SG_UF").replace_strict(RegionMapper.REGIAO_MAP).alias("NOME_REGIAO"),
+                (pl.col("QT_APTOS") * pl.col("taxa")).cast(pl.Int64).alias("QT_COMPARECIMENTO"),
+            )
+            .with_columns((pl.col("QT_APTOS") - pl.col("QT_COMPARECIMENTO")).alias("QT_ABSTENCAO"))
+            .select(
+                "ANO_ELEICAO",
+                "NR_TURNO",
+                "SG_UF",
+                "NOME_REGIAO",
+                "QT_APTOS",
+                "QT_COMPARECIMENTO",
+                "QT_ABSTENCAO",
+            )
+        )
+        caminho = caminho_particao_silver(settings, ano)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        df.cast({c: SCHEMA_SILVER[c] for c in df.columns}).sort("SG_UF").write_parquet(caminho)
+
+
+def medir(raiz: Path, repeticoes: int = 3) -> dict[str, float | None]:
+    """Mede o dashboard sobre a Silver de `raiz`, num processo novo."""
+    resultado = subprocess.run(
+        [sys.executable, "-c", MEDICAO, str(DASHBOARD), str(repeticoes)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PARTICIPACAO_PROJECT_ROOT": str(raiz)},
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(f"Medição falhou:\n{resultado.stderr[-2000:]}")
+
+    medidas: dict[str, Any] = json.loads(resultado.stdout.strip().splitlines()[-1])
+    if medidas.pop("excecoes"):
+        raise RuntimeError("O dashboard levantou exceção durante a medição")
+    if not medidas.pop("metricas"):
+        raise RuntimeError("O dashboard não exibiu as métricas: Silver sintética não foi lida")
+
+    return medidas
+
+
+def medir_escala(linhas: int, repeticoes: int = 3) -> dict[str, float | None]:
+    """Gera a Silver sintética da escala num diretório temporário e mede."""
+    with tempfile.TemporaryDirectory() as tmp:
+        gerar_silver(Path(tmp), linhas)
+        return medir(Path(tmp), repeticoes)
+
+
+def comparar_com_baseline(
+    medidas: dict[str, float | None],
+    referencia: dict[str, float | None],
+    tolerancia: dict[str, float] = TOLERANCIA_PADRAO,
+) -> list[str]:
+    """Regressões: medidas acima da baseline além da tolerância (ex.: 0.5 = +50%)."""
+    regressoes = []
+    for nome in MEDIDAS:
+        atual, base = medidas.get(nome), referencia.get(nome)
+        if atual is None or base is None:
+            continue
+        limite = tolerancia[nome]
+        if atual > base * (1 + limite):
+            regressoes.append(f"{nome}: {atual:.1f} > {base:.1f} (+{limite:.0%} de tolerância)")
+    return regressoes
+
+
+def carregar_baseline(caminho: Path = BASELINE) -> dict[str, Any]:
+    """Baseline gravada; vazia se ainda não existe."""
+    if not caminho.exists():
+        return {"tolerancia": TOLERANCIA_PADRAO, "escalas": {}}
+    return json.loads(caminho.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--linhas", default=None, help="Escalas (linhas por ano), separadas por vírgula"
+    )
+    parser.add_argument("--repeticoes", type=int, default=3, help="Repetições por interação")
+    parser.add_argument("--salvar", action="store_true", help="Grava as medidas como baseline")
+    parser.add_argument("--verificar", action="store_true", help="Sai com 1 se houver regressão")
+    args = parser.parse_args()
+
+    baseline = carregar_baseline()
+    if args.linhas:
+        escalas = [int(linhas) for linhas in args.linhas.split(",")]
+    else:
+        escalas = [int(linhas) for linhas in baseline["escalas"]] or [10_000]
+
+    print(f"{'linhas/ano':>12}" + "".join(f"{nome:>18}" for nome in MEDIDAS))
+    resultados: dict[str, dict[str, float | None]] = {}
+    regressoes: list[str] = []
+    for linhas in escalas:
+        medidas = medir_escala(linhas, args.repeticoes)
+        resultados[str(linhas)] = medidas
+        print(
+            f"{linhas:>12,}"
+            + "".join(
+                f"{medidas[nome]:>18.1f}" if medidas[nome] is not None else f"{'-':>18}"
+                for nome in MEDIDAS
+            )
+        )
+
+        referencia = baseline["escalas"].get(str(linhas))
+        if referencia is not None:
+            regressoes += [
+                f"{linhas:,} linhas: {regressao}"
+                for regressao in comparar_com_baseline(medidas, referencia, baseline["tolerancia"])
+            ]
+
+    if args.salvar:
+        conteudo = {
+            "tolerancia": baseline["tolerancia"],
+            "ambiente": {"python": platform.python_version(), "plataforma": platform.platform()},
+            "escalas": {
+                linhas: {nome: None if v is None else round(v, 1) for nome, v in medidas.items()}
+                for linhas, medidas in resultados.items()
+            },
+        }
+        BASELINE.write_text(json.dumps(conteudo, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline gravada em {BASELINE}")
+
+    if regressoes:
+        print("\nRegressões em relação à baseline:")
+        for regressao in regressoes:
+            print(f"  - {regressao}")
+        if args.verificar:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
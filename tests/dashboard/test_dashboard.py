@@ -1,14 +1,16 @@
 # Importar funções do dashboard
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pandas as pd
+import polars as pl
 import pytest
 from streamlit.testing.v1 import AppTest
 
 sys.path.append("src")
 from participacao_eleitoral.dashboard import carregar_dados_reais, carregar_geojson
+from participacao_eleitoral.dashboard_data import scan_base_uf
 
 
 class TestDashboard:
@@ -21,6 +23,7 @@ class TestDashboard:
             {
                 "SG_UF": ["SP", "RJ", "MG"],
                 "NOME_REGIAO": ["Sudeste", "Sudeste", "Sudeste"],
+                "QT_APTOS": [1100, 1000, 750],
                 "QT_COMPARECIMENTO": [1000, 800, 600],
                 "QT_ABSTENCAO": [100, 200, 150],
                 "TAXA_COMPARECIMENTO_PCT": [90.9, 80.0, 80.0],
@@ -30,7 +33,7 @@ class TestDashboard:
     def test_carregar_dados_reais_success(self, tmp_path, sample_data):
         """Testa carregamento de dados reais com sucesso."""
         # Criar arquivo parquet simulado
-        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao"
+        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao_silver"
         silver_dir.mkdir(parents=True)
         parquet_path = silver_dir / "year=2022" / "data.parquet"
         parquet_path.parent.mkdir()
@@ -39,9 +42,9 @@ class TestDashboard:
         with patch("participacao_eleitoral.dashboard.PROJECT_ROOT", tmp_path):
             nacional, regional, mapa = carregar_dados_reais([2022])
 
-            assert isinstance(nacional, pd.DataFrame)
-            assert isinstance(regional, pd.DataFrame)
-            assert isinstance(mapa, pd.DataFrame)
+            assert isinstance(nacional, pl.DataFrame)
+            assert isinstance(regional, pl.DataFrame)
+            assert isinstance(mapa, pl.DataFrame)
             assert len(nacional) > 0
             assert len(regional) > 0
             assert len(mapa) > 0
@@ -49,28 +52,29 @@ class TestDashboard:
     def test_carregar_dados_reais_aggregations(self, tmp_path, sample_data):
         """Testa agregações corretas dos dados."""
         # Criar arquivo parquet
-        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao"
+        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao_silver"
         silver_dir.mkdir(parents=True)
         parquet_path = silver_dir / "year=2022" / "data.parquet"
         parquet_path.parent.mkdir()
         sample_data.to_parquet(parquet_path)
 
-        nacional, regional, mapa = carregar_dados_reais([2022])
+        with patch("participacao_eleitoral.dashboard.PROJECT_ROOT", tmp_path):
+            nacional, regional, mapa = carregar_dados_reais([2022])
 
         # Verificar agregações nacionais
-        assert nacional["comparecimento_total"].iloc[0] > 0
-        assert nacional["abstencao_total"].iloc[0] > 0
-        assert nacional["taxa_comparecimento"].iloc[0] > 0
+        assert nacional["comparecimento_total"][0] > 0
+        assert nacional["abstencao_total"][0] > 0
+        assert nacional["taxa_comparecimento"][0] > 0
 
         # Verificar agregações regionais (Sudeste)
-        sudeste = regional[regional["NOME_REGIAO"] == "Sudeste"]
+        sudeste = regional.filter(pl.col("NOME_REGIAO") == "Sudeste")
         assert len(sudeste) == 1
-        assert sudeste["comparecimento_total"].iloc[0] > 0
-        assert sudeste["abstencao_total"].iloc[0] > 0
+        assert sudeste["comparecimento_total"][0] > 0
+        assert sudeste["abstencao_total"][0] > 0
 
         # Verificar mapa (sem ZZ)
         assert len(mapa) > 0
-        assert "ZZ" not in mapa["SG_UF"].values
+        assert "ZZ" not in mapa["SG_UF"].to_list()
 
     def test_carregar_dados_reais_column_renaming(self, tmp_path, sample_data):
         """Testa renomeação de colunas no dashboard (não na função)."""
@@ -78,31 +82,74 @@ class TestDashboard:
         # Na prática, testado via AppTest
         pass  # Implementar se necessário
 
+    def test_base_uf_le_gold_com_mesmos_totais_da_silver(self, settings, logger):
+        """Série UF da Gold substitui o scan da Silver sem mudar os números."""
+        from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+        from participacao_eleitoral.gold.reader import caminho_historico_gold
+        from participacao_eleitoral.silver.reader import caminho_particao_silver
+        from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+
+        silver = pl.DataFrame(
+            {
+                "ANO_ELEICAO": [2022, 2022, 2022, 2022],
+                "CD_MUNICIPIO": [1, 1, 1, 2],
+                "NM_MUNICIPIO": ["SALVADOR", "SALVADOR", "SALVADOR", "SAO PAULO"],
+                "SG_UF": ["BA", "BA", "BA", "SP"],
+                "QT_APTOS": [100, 900, 50, 10],
+                "QT_COMPARECIMENTO": [100, 450, 25, 5],
+                "QT_ABSTENCAO": [0, 450, 25, 5],
+                "NR_TURNO": [1, 1, 2, 1],
+                "NR_ZONA": [10, 11, 10, 1],
+                "NOME_REGIAO": ["Nordeste", "Nordeste", "Nordeste", "Sudeste"],
+            }
+        )
+        caminho = caminho_particao_silver(settings, 2022)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        silver.cast({c: SCHEMA_SILVER[c] for c in silver.columns}).write_parquet(caminho)
+        GoldAggregationPipeline(settings=settings, logger=logger).refresh()
+
+        def totais() -> list[tuple[str, int, int]]:
+            df = scan_base_uf([2022], settings).collect()
+            return sorted(
+                df.group_by(pl.col("SG_UF").cast(pl.String))
+                .agg(pl.col("QT_APTOS").sum(), pl.col("QT_COMPARECIMENTO").sum())
+                .rows()
+            )
+
+        da_gold = totais()
+        caminho_historico_gold(settings, "uf").unlink()
+        assert da_gold == totais() == [("BA", 1050, 575), ("SP", 10, 5)]
+
     def test_carregar_dados_reais_missing_file(self):
         """Testa carregamento quando arquivo não existe."""
         nacional, regional, mapa = carregar_dados_reais([9999])  # Ano inexistente
-        assert nacional.empty or len(nacional) == 0
+        assert nacional.is_empty()
+        assert nacional.columns == [
+            "Ano",
+            "comparecimento_total",
+            "abstencao_total",
+            "taxa_comparecimento",
+        ]
+
+    def test_carregar_geojson_usa_geometria_empacotada(self):
+        """O mapa lê a geometria do pacote, sem rede."""
+        carregar_geojson.clear()
+        colecao = {"type": "FeatureCollection", "features": []}
+        with patch(
+            "participacao_eleitoral.dashboard.carregar_geometria_uf", return_value=colecao
+        ) as mock_geometria:
+            assert carregar_geojson() == colecao
+            assert carregar_geojson() == colecao
 
-    def test_carregar_geojson_success(self):
-        """Testa carregamento do GeoJSON com sucesso."""
-        with patch("participacao_eleitoral.dashboard.requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"type": "FeatureCollection", "features": []}
-            mock_get.return_value = mock_response
+        # Decodificada uma vez por processo (st.cache_resource)
+        mock_geometria.assert_called_once()
 
-            geojson = carregar_geojson()
-            assert geojson is not None
-            assert "type" in geojson
-
-    def test_carregar_geojson_failure(self):
-        """Testa falha no carregamento do GeoJSON."""
-        with patch(
-            "participacao_eleitoral.dashboard.requests.get",
-            side_effect=Exception("Network error"),
-        ):
-            geojson = carregar_geojson()
-            assert geojson is None
-            assert geojson is None
+    def test_carregar_geojson_sem_geometria(self):
+        """Sem o arquivo empacotado, o mapa não tem geometria (e não baixa nada)."""
+        carregar_geojson.clear()
+        with patch("participacao_eleitoral.dashboard.carregar_geometria_uf", return_value=None):
+            assert carregar_geojson() is None
+        carregar_geojson.clear()
 
     def test_app_initialization(self):
         """Testa inicialização básica do app Streamlit."""
@@ -198,47 +245,54 @@ class TestDashboard:
 
             at.run(timeout=10)
 
-            # Verificar abas
-            tabs = at.main.tabs
-            assert len(tabs) == 4  # Nacional, Mapa, Regional, Dados
+            # Verificar abas (seletor: só a aba ativa é renderizada)
+            abas = at.radio(key="aba")
+            assert len(abas.options) == 4  # Nacional, Mapa, Regional, Dados
 
-            tab_names = [tab.label for tab in tabs]
+            tab_names = abas.options
             assert "Visão Nacional" in tab_names
             assert "Mapa Interativo" in tab_names
             assert "Comparação Regional" in tab_names
             assert "Dados Detalhados" in tab_names
+            assert abas.value == "Visão Nacional"
 
-    def test_metrics_display(self, tmp_path, sample_data):
+    def test_metrics_display(self, tmp_path, sample_data, monkeypatch):
         """Testa exibição de métricas nacionais."""
         # Criar arquivo parquet
-        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao"
+        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao_silver"
         silver_dir.mkdir(parents=True)
         parquet_path = silver_dir / "year=2022" / "data.parquet"
         parquet_path.parent.mkdir()
         sample_data.to_parquet(parquet_path)
 
-        with patch("participacao_eleitoral.dashboard.PROJECT_ROOT", tmp_path):
-            at = AppTest.from_file("src/participacao_eleitoral/dashboard.py")
-            at.run(timeout=10)
-
-            # Verificar métricas
-            metrics = at.metric
-            assert len(metrics) == 3
-            assert "Taxa de Comparecimento" in metrics[0].label
-            assert "Total Comparecimentos" in metrics[1].label
-            assert "Total Abstenções" in metrics[2].label
-
-            # Valores esperados baseados nos dados de exemplo
-            # Taxa média: (90.9 + 80.0 + 80.0) / 3 ≈ 83.63
-            # Comparecimentos: 2400, Abstenções: 450
-            assert abs(float(metrics[0].value[:-1]) - 83.63) < 0.1  # Aproximado
-            assert "2,400" in metrics[1].value
-            assert "450" in metrics[2].value
+        # O AppTest reexecuta o script (PROJECT_ROOT é recalculado): a raiz
+        # dos dados vem do ambiente
+        monkeypatch.setenv("PARTICIPACAO_PROJECT_ROOT", str(tmp_path))
+        at = AppTest.from_file("src/participacao_eleitoral/dashboard.py")
+        at.run(timeout=10)
+
+        # As métricas são do último ano selecionado: só 2022 tem dados
+        at.sidebar.multiselect[0].set_value([2022]).run(timeout=10)
+
+        # Verificar métricas
+        metrics = at.metric
+        assert len(metrics) == 3
+        assert "Taxa de Comparecimento" in metrics[0].label
+        assert "Total Comparecimentos" in metrics[1].label
+        assert "Total Abstenções" in metrics[2].label
+
+        # Valores esperados baseados nos dados de exemplo
+        # Taxa ponderada pelos aptos: 2400 / 2850 ≈ 84.21 (não a média das
+        # taxas das UFs, 83.63)
+        # Comparecimentos: 2400, Abstenções: 450
+        assert abs(float(metrics[0].value[:-1]) - 84.21) < 0.1  # Aproximado
+        assert "2,400" in metrics[1].value
+        assert "450" in metrics[2].value
 
     def test_filter_interactions(self, tmp_path, sample_data):
         """Testa interações de filtros."""
         # Criar arquivos para múltiplos anos
-        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao"
+        silver_dir = tmp_path / "data" / "silver" / "comparecimento_abstencao_silver"
         silver_dir.mkdir(parents=True)
 
         for year in [2020, 2022]:
@@ -0,0 +1,37 @@
+"""Testes do harness de desempenho do dashboard (ver desempenho.py)"""
+
+import pytest
+from desempenho import MEDIDAS, carregar_baseline, comparar_com_baseline, medir_escala
+
+
+def test_comparar_com_baseline():
+    """Só medidas acima da baseline além da tolerância são regressões."""
+    referencia = {"carga_fria": 1000.0, "rerun": 100.0, "pico_memoria_mb": 200.0}
+    tolerancia = {"carga_fria": 0.5, "rerun": 0.5, "pico_memoria_mb": 0.25}
+
+    dentro = {"carga_fria": 1400.0, "rerun": 90.0, "pico_memoria_mb": None}
+    assert comparar_com_baseline(dentro, referencia, tolerancia) == []
+
+    fora = {"carga_fria": 1600.0, "rerun": 90.0, "pico_memoria_mb": 260.0}
+    regressoes = comparar_com_baseline(fora, referencia, tolerancia)
+    assert [regressao.split(":")[0] for regressao in regressoes] == [
+        "carga_fria",
+        "pico_memoria_mb",
+    ]
+
+
+@pytest.mark.slow
+def test_dashboard_sem_regressao_na_menor_escala():
+    """A menor escala da baseline roda headless e não regride além da tolerância."""
+    baseline = carregar_baseline()
+    if not baseline["escalas"]:
+        pytest.skip("Baseline de desempenho não gravada")
+
+    linhas = min(int(escala) for escala in baseline["escalas"])
+    medidas = medir_escala(linhas)
+
+    assert set(MEDIDAS) <= set(medidas)
+    assert (
+        comparar_com_baseline(medidas, baseline["escalas"][str(linhas)], baseline["tolerancia"])
+        == []
+    )
@@ -0,0 +1,40 @@
+from collections.abc import Iterator
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.catalog import LakehouseCatalog
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.silver.reader import caminho_particao_silver
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+from participacao_eleitoral.utils.logger import ModernLogger
+
+
+def escrever_silver(
+    settings: Settings, ano: int, aptos: list[int], comparecimento: list[int]
+) -> None:
+    """Escreve uma partição Silver mínima da BA (um município por contagem)."""
+    n = len(aptos)
+    df = pl.DataFrame(
+        {
+            "ANO_ELEICAO": [ano] * n,
+            "CD_MUNICIPIO": list(range(1, n + 1)),
+            "NM_MUNICIPIO": [f"MUNICIPIO {i}" for i in range(1, n + 1)],
+            "SG_UF": ["BA"] * n,
+            "QT_APTOS": aptos,
+            "QT_COMPARECIMENTO": comparecimento,
+            "QT_ABSTENCAO": [a - c for a, c in zip(aptos, comparecimento, strict=True)],
+            "NR_TURNO": [1] * n,
+            "NR_ZONA": [1] * n,
+            "NOME_REGIAO": ["Nordeste"] * n,
+        }
+    )
+    caminho = caminho_particao_silver(settings, ano)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    df.cast({c: SCHEMA_SILVER[c] for c in df.columns}).write_parquet(caminho)
+
+
+@pytest.fixture
+def catalogo(settings: Settings, logger: ModernLogger) -> Iterator[LakehouseCatalog]:
+    with LakehouseCatalog(settings=settings, logger=logger) as catalogo:
+        yield catalogo
@@ -0,0 +1,94 @@
+"""Testes do catálogo DuckDB do Lakehouse"""
+
+import duckdb
+import pytest
+
+from participacao_eleitoral.catalog import planejar_visoes
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+
+from .conftest import escrever_silver
+
+
+def test_catalogo_vazio(catalogo) -> None:  # type: ignore[no-untyped-def]
+    """Sem partições, o catálogo existe e não tem visões."""
+    assert catalogo.visoes() == {}
+
+
+def test_visao_silver_deriva_taxas(settings, catalogo) -> None:  # type: ignore[no-untyped-def]
+    """Taxas não materializadas são derivadas das contagens na visão."""
+    escrever_silver(settings, 2022, [100, 300], [80, 150])
+
+    with catalogo.conexao() as conn:
+        df = conn.sql(
+            """
+            SELECT year, sum(QT_COMPARECIMENTO) / sum(QT_APTOS) * 100 AS taxa,
+                   max(TAXA_COMPARECIMENTO_PCT) AS maior
+            FROM silver_comparecimento
+            GROUP BY year
+            """
+        ).pl()
+
+    assert df["year"].to_list() == [2022]
+    assert df["taxa"].item() == pytest.approx(57.5)
+    assert df["maior"].item() == pytest.approx(80.0)
+
+
+def test_atualizacao_automatica(settings, catalogo) -> None:  # type: ignore[no-untyped-def]
+    """Partição nova aparece na próxima conexão; visões inalteradas são mantidas."""
+    escrever_silver(settings, 2022, [100], [80])
+    with catalogo.conexao() as conn:
+        assert conn.sql("SELECT count(*) FROM silver_comparecimento").fetchone() == (1,)
+
+    escrever_silver(settings, 2018, [100], [70])
+    with catalogo.conexao() as conn:
+        anos = conn.sql("SELECT DISTINCT year FROM silver_comparecimento ORDER BY 1").fetchall()
+    assert anos == [(2018,), (2022,)]
+
+    result = catalogo.atualizar()
+    assert result.recriadas == []
+    assert result.mantidas == ["silver_comparecimento"]
+
+
+def test_poda_por_particao(settings, catalogo) -> None:  # type: ignore[no-untyped-def]
+    """Filtro em year lê só a partição pedida."""
+    escrever_silver(settings, 2018, [100], [70])
+    escrever_silver(settings, 2022, [100], [80])
+
+    with catalogo.conexao() as conn:
+        plano = conn.sql(
+            "EXPLAIN ANALYZE SELECT * FROM silver_comparecimento WHERE year = 2022"
+        ).fetchall()[0][1]
+
+    assert "Scanning Files: 1/2" in plano
+
+
+def test_pool_reutiliza_cursores(settings, catalogo) -> None:  # type: ignore[no-untyped-def]
+    escrever_silver(settings, 2022, [100], [80])
+
+    with catalogo.conexao() as primeiro:
+        pass
+    with catalogo.conexao() as segundo:
+        assert segundo is primeiro
+
+        # Conexões concorrentes recebem cursores distintos
+        with catalogo.conexao() as terceiro:
+            assert terceiro is not segundo
+
+    # Consumidores só leem
+    with pytest.raises(duckdb.Error, match="read-only"), catalogo.conexao() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+
+
+def test_visoes_gold(settings, logger, catalogo) -> None:  # type: ignore[no-untyped-def]
+    """Tabelas anuais, variações e séries da Gold viram visões gold_*."""
+    escrever_silver(settings, 2022, [100, 300], [80, 150])
+    GoldAggregationPipeline(settings=settings, logger=logger).refresh()
+
+    visoes = catalogo.visoes()
+    assert set(planejar_visoes(settings)) == set(visoes)
+    assert {"gold_uf", "gold_cubo_demografico", "gold_historico_uf"} <= set(visoes)
+    assert visoes["gold_uf"] == "gold"
+
+    with catalogo.conexao() as conn:
+        taxa = conn.sql("SELECT TAXA_COMPARECIMENTO_PCT FROM gold_uf WHERE year = 2022").fetchone()
+    assert taxa == (pytest.approx(57.5),)
@@ -0,0 +1,131 @@
+"""Testes do cache de resultados de consultas SQL"""
+
+import os
+
+import duckdb
+import pytest
+from typer.testing import CliRunner
+
+from participacao_eleitoral.catalog import QueryResultCache, normalizar_sql
+from participacao_eleitoral.cli import app
+
+from .conftest import escrever_silver
+
+SQL_TOTAL = "SELECT year, sum(QT_APTOS) AS aptos FROM silver_comparecimento GROUP BY year"
+
+
+@pytest.fixture
+def cache(settings, logger, catalogo):  # type: ignore[no-untyped-def]
+    return QueryResultCache(settings=settings, logger=logger, catalog=catalogo)
+
+
+def test_normalizar_sql_preserva_literais() -> None:
+    sql = "SELECT  *\n  FROM gold_uf -- comentário\n WHERE SG_UF = 'B  A' ;"
+
+    assert normalizar_sql(sql) == "SELECT * FROM gold_uf WHERE SG_UF = 'B  A'"
+
+
+def test_normalizar_sql_comentario_de_bloco() -> None:
+    """'--' dentro de /* */ não engole o resto da linha."""
+    assert normalizar_sql("SELECT 1 /* -- x */ + 2") == "SELECT 1 + 2"
+    assert normalizar_sql("SELECT '/* a */', 10/2") == "SELECT '/* a */', 10/2"
+
+
+def test_executa_o_sql_original(settings, cache) -> None:  # type: ignore[no-untyped-def]
+    """A consulta normalizada só compõe a chave; o DuckDB recebe a original."""
+    escrever_silver(settings, 2022, [100], [80])
+    sql = "SELECT 1 /* -- x */ + 2 AS total FROM silver_comparecimento"
+
+    assert cache.executar(sql).df["total"].to_list() == [3]
+    assert cache.executar(sql).do_cache
+
+
+def test_repeticao_vem_do_cache(settings, cache) -> None:  # type: ignore[no-untyped-def]
+    """Mesma consulta (a menos de espaços) com partições inalteradas não executa de novo."""
+    escrever_silver(settings, 2022, [100, 300], [80, 150])
+
+    primeira = cache.executar(SQL_TOTAL)
+    segunda = cache.executar(SQL_TOTAL.replace(" ", "  ") + ";")
+
+    assert not primeira.do_cache
+    assert segunda.do_cache
+    assert segunda.visoes == ["silver_comparecimento"]
+    assert segunda.df.equals(primeira.df)
+
+
+def test_particao_reescrita_invalida(settings, cache) -> None:  # type: ignore[no-untyped-def]
+    escrever_silver(settings, 2022, [100], [80])
+    cache.executar(SQL_TOTAL)
+
+    escrever_silver(settings, 2022, [500], [80])
+    result = cache.executar(SQL_TOTAL)
+
+    assert not result.do_cache
+    assert result.df["aptos"].to_list() == [500]
+
+
+def test_atualizacao_adiada_ignora_o_cache(settings, cache, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """Com a atualização do catálogo adiada, a assinatura registrada não serve de chave."""
+    escrever_silver(settings, 2022, [100], [80])
+    cache.executar(SQL_TOTAL)
+
+    def catalogo_travado(planejadas):  # type: ignore[no-untyped-def]
+        raise duckdb.IOException("Could not set lock on file")
+
+    monkeypatch.setattr(cache.catalog, "_atualizar", catalogo_travado)
+    escrever_silver(settings, 2022, [500], [80])
+
+    for _ in range(2):
+        result = cache.executar(SQL_TOTAL)
+        assert not result.do_cache
+        assert result.df["aptos"].to_list() == [500]
+
+
+def test_consultas_nao_cacheaveis(settings, cache) -> None:  # type: ignore[no-untyped-def]
+    """Sem visão lida ou com função volátil, a consulta sempre executa."""
+    escrever_silver(settings, 2022, [100], [80])
+
+    for sql in ["SELECT 1 AS x", "SELECT now(), count(*) FROM silver_comparecimento"]:
+        cache.executar(sql)
+        assert not cache.executar(sql).do_cache
+
+    assert not cache.executar(SQL_TOTAL, usar_cache=False).do_cache
+    assert not cache.executar(SQL_TOTAL, usar_cache=False).do_cache
+
+
+def test_despejo_por_tamanho(settings, cache) -> None:  # type: ignore[no-untyped-def]
+    """Acima do limite, sai a entrada usada há mais tempo."""
+    escrever_silver(settings, 2022, [100], [80])
+    cache.executar("SELECT 1 AS a FROM silver_comparecimento")
+    (antiga,) = cache.cache_dir.glob("*.parquet")
+    os.utime(antiga, (0, 0))
+
+    cache.executar("SELECT 2 AS b FROM silver_comparecimento")
+    (recente,) = set(cache.cache_dir.glob("*.parquet")) - {antiga}
+    cache.max_bytes = recente.stat().st_size
+    cache._despejar()
+
+    assert not antiga.exists()
+    assert recente.exists()
+    assert cache.limpar() == 1
+
+
+def test_cli_query_formatos(settings, monkeypatch, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    escrever_silver(settings, 2022, [100, 300], [80, 150])
+    monkeypatch.setenv("PARTICIPACAO_PROJECT_ROOT", str(settings.project_root))
+    runner = CliRunner()
+
+    csv = runner.invoke(app, ["query", SQL_TOTAL, "--format", "csv"])
+    assert csv.exit_code == 0, csv.output
+    assert "year,aptos\n2022,400\n" in csv.output
+
+    destino = tmp_path / "resultado.parquet"
+    parquet = runner.invoke(app, ["query", SQL_TOTAL, "-f", "parquet", "-o", str(destino)])
+    assert parquet.exit_code == 0, parquet.output
+    assert destino.exists()
+
+    sem_saida = runner.invoke(app, ["query", SQL_TOTAL, "-f", "parquet"])
+    assert sem_saida.exit_code == 2
+
+    invalida = runner.invoke(app, ["query", "SELECT * FROM tabela_inexistente"])
+    assert invalida.exit_code == 1
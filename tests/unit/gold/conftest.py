@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.silver.reader import caminho_particao_silver
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+
+
+@pytest.fixture
+def silver_2022(settings: Settings) -> Path:
+    """
+    Partição Silver mínima de 2022, no schema físico da Silver.
+
+    BA tem duas zonas no 1º turno com taxas muito diferentes (100% e 50%),
+    para que média de taxas e taxa ponderada deem resultados distintos.
+    """
+    df = pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2022, 2022, 2022, 2022],
+            "CD_MUNICIPIO": [1, 1, 1, 2],
+            "NM_MUNICIPIO": ["SALVADOR", "SALVADOR", "SALVADOR", "SAO PAULO"],
+            "SG_UF": ["BA", "BA", "BA", "SP"],
+            "QT_APTOS": [100, 900, 50, 10],
+            "QT_COMPARECIMENTO": [100, 450, 25, 5],
+            "QT_ABSTENCAO": [0, 450, 25, 5],
+            "NR_TURNO": [1, 1, 2, 1],
+            "NR_ZONA": [10, 11, 10, 1],
+            "NOME_REGIAO": ["Nordeste", "Nordeste", "Nordeste", "Sudeste"],
+            "DS_GENERO": ["FEMININO", "MASCULINO", "FEMININO", "MASCULINO"],
+            "DS_FAIXA_ETARIA": ["18 anos", "18 anos", "18 anos", "30 a 34 anos"],
+        }
+    )
+    df = df.cast({coluna: SCHEMA_SILVER[coluna] for coluna in df.columns})
+
+    caminho = caminho_particao_silver(settings, 2022)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    df.write_parquet(caminho)
+    return caminho
@@ -0,0 +1,60 @@
+"""Testes do GoldAggregateBuilder"""
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.builder import GoldAggregateBuilder
+from participacao_eleitoral.gold.schemas.comparecimento_gold import schema_gold
+from participacao_eleitoral.silver.reader import scan_silver
+
+
+def test_builder_escreve_todos_os_graos(settings, logger, silver_2022, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Cada grão vira uma tabela no schema Gold."""
+    result = GoldAggregateBuilder(logger=logger).build(
+        silver=scan_silver(anos=[2022], settings=settings),
+        destino_dir=tmp_path / "gold",
+    )
+
+    assert set(result.tabelas) == set(ComparecimentoGoldContrato.GRAOS)
+    assert result.linhas_silver == 4
+    assert result.linhas_por_grao == {
+        "municipio": 3,
+        "zona": 4,
+        "uf": 3,
+        "regiao": 3,
+        "nacional": 2,
+    }
+
+    for grao, caminho in result.tabelas.items():
+        assert dict(pl.read_parquet_schema(caminho)) == schema_gold(grao)
+
+
+def test_builder_taxa_ponderada_pelos_aptos(settings, logger, silver_2022, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """A taxa da UF é soma/soma das zonas, não a média das taxas (75%)."""
+    result = GoldAggregateBuilder(logger=logger).build(
+        silver=scan_silver(anos=[2022], settings=settings),
+        destino_dir=tmp_path / "gold",
+    )
+
+    uf = pl.read_parquet(result.tabelas["uf"]).filter(
+        (pl.col("SG_UF") == "BA") & (pl.col("NR_TURNO") == 1)
+    )
+
+    assert uf["QT_APTOS"].to_list() == [1000]
+    assert uf["TAXA_COMPARECIMENTO_PCT"][0] == pytest.approx(55.0)
+
+
+def test_builder_nacional_soma_tudo(settings, logger, silver_2022, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """O grão nacional fecha com a soma da Silver por turno."""
+    result = GoldAggregateBuilder(logger=logger).build(
+        silver=scan_silver(anos=[2022], settings=settings),
+        destino_dir=tmp_path / "gold",
+    )
+
+    nacional = pl.read_parquet(result.tabelas["nacional"]).sort("NR_TURNO")
+
+    assert nacional["QT_APTOS"].to_list() == [1010, 50]
+    assert nacional["QT_COMPARECIMENTO"].to_list() == [555, 25]
@@ -0,0 +1,83 @@
+"""Testes do cubo demográfico da Gold"""
+
+import pytest
+
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.cube import (
+    DemographicCubeBuilder,
+    conjuntos_cubo,
+    consultar_cubo,
+    grupo_id,
+)
+from participacao_eleitoral.gold.reader import caminho_tabela_gold
+
+
+def _construir_cubo(settings, logger, silver_path):  # type: ignore[no-untyped-def]
+    destino = caminho_tabela_gold(settings, 2022, ComparecimentoGoldContrato.TABELA_CUBO)
+    return DemographicCubeBuilder(logger=logger).build(silver_path, destino)
+
+
+def test_grupo_id_segue_convencao_grouping() -> None:
+    """Bit 1 = coluna agregada; a primeira coluna é o bit mais significativo."""
+    assert grupo_id("uf", []) == 0b0011111111
+    assert grupo_id("nacional", []) == 0b1111111111
+    assert grupo_id("regiao", ["DS_GENERO"]) == 0b0101111111
+
+
+def test_grupo_id_rejeita_conjunto_nao_materializado() -> None:
+    """Mais dimensões que o cubo materializa é erro explícito."""
+    with pytest.raises(ValueError, match="até 2 dimensões"):
+        grupo_id("uf", ["DS_GENERO", "DS_COR_RACA", "DS_FAIXA_ETARIA"])
+
+    with pytest.raises(ValueError, match="fora do cubo"):
+        grupo_id("uf", ["NM_MUNICIPIO"])
+
+
+def test_cubo_um_conjunto_por_combinacao(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """3 níveis × (1 total + 8 simples + 28 pares) = 111 conjuntos."""
+    result = _construir_cubo(settings, logger, silver_2022)
+
+    assert result.conjuntos == len(conjuntos_cubo()) == 111
+    assert result.cubo_path.exists()
+
+
+def test_consultar_cubo_por_regiao(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """Corte demográfico por região sai do cubo com taxa ponderada."""
+    _construir_cubo(settings, logger, silver_2022)
+
+    df = consultar_cubo(
+        ["DS_FAIXA_ETARIA", "DS_GENERO"],
+        anos=[2022],
+        regioes=["Nordeste"],
+        settings=settings,
+    ).filter(NR_TURNO=1)
+
+    assert df.columns[:5] == [
+        "ANO_ELEICAO",
+        "NR_TURNO",
+        "NOME_REGIAO",
+        "DS_FAIXA_ETARIA",
+        "DS_GENERO",
+    ]
+    assert df["DS_GENERO"].to_list() == ["FEMININO", "MASCULINO"]
+    assert df["TAXA_COMPARECIMENTO_PCT"].to_list() == [pytest.approx(100.0), pytest.approx(50.0)]
+
+
+def test_consultar_cubo_nacional_e_dimensao_ausente(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """Dimensão ausente no ano vira um único grupo nulo com o total do turno."""
+    _construir_cubo(settings, logger, silver_2022)
+
+    df = consultar_cubo(["DS_QUILOMBOLA"], settings=settings).sort("NR_TURNO")
+
+    assert df["DS_QUILOMBOLA"].to_list() == [None, None]
+    assert df["QT_APTOS"].to_list() == [1010, 50]
+
+
+def test_consultar_cubo_sem_particoes(settings) -> None:  # type: ignore[no-untyped-def]
+    """Sem cubo construído, a consulta é vazia e tipada."""
+    df = consultar_cubo(["DS_GENERO"], ufs=["BA"], settings=settings)
+
+    assert df.is_empty()
+    assert "SG_UF" in df.columns
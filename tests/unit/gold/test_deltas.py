@@ -0,0 +1,81 @@
+"""Testes das tabelas de variação da Gold"""
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.gold.deltas import maiores_variacoes, scan_delta
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+from participacao_eleitoral.silver.reader import caminho_particao_silver
+
+
+@pytest.fixture
+def gold_2018_2022(settings, logger, silver_2022):  # type: ignore[no-untyped-def]
+    """Gold de 2018 e 2022; em 2018 todo mundo compareceu."""
+    destino = caminho_particao_silver(settings, 2018)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    pl.read_parquet(silver_2022).with_columns(
+        pl.lit(2018, dtype=pl.Int16).alias("ANO_ELEICAO"),
+        pl.col("QT_APTOS").alias("QT_COMPARECIMENTO"),
+        pl.lit(0, dtype=pl.Int32).alias("QT_ABSTENCAO"),
+    ).write_parquet(destino)
+
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.refresh()
+    return pipeline
+
+
+def test_delta_ano_contra_eleicao_anterior(settings, gold_2018_2022) -> None:  # type: ignore[no-untyped-def]
+    """2022 é comparado com 2018 (mesmo tipo de eleição), em pontos percentuais."""
+    df = scan_delta("ano", "uf", [2022], settings=settings).collect()
+    ba = df.filter((pl.col("SG_UF") == "BA") & (pl.col("NR_TURNO") == 1))
+
+    assert ba["ANO_BASE"].to_list() == [2018]
+    assert ba["TAXA_COMPARECIMENTO_PCT_BASE"][0] == pytest.approx(100.0)
+    assert ba["DELTA_TAXA_COMPARECIMENTO_PP"][0] == pytest.approx(-45.0)
+    assert ba["DELTA_QT_ABSTENCAO"].to_list() == [450]
+
+
+def test_delta_turno_segundo_contra_primeiro(settings, gold_2018_2022) -> None:  # type: ignore[no-untyped-def]
+    """Só chaves com os dois turnos entram; SP não teve 2º turno."""
+    df = scan_delta("turno", "municipio", [2022], settings=settings).collect()
+
+    assert df["SG_UF"].to_list() == ["BA"]
+    assert df["NR_TURNO"].to_list() == [2]
+    assert df["NR_TURNO_BASE"].to_list() == [1]
+    assert df["DELTA_TAXA_COMPARECIMENTO_PP"][0] == pytest.approx(50.0 - 55.0)
+
+
+def test_delta_cubo_casa_dimensoes_agregadas(settings, gold_2018_2022) -> None:  # type: ignore[no-untyped-def]
+    """No cubo, nulos da dimensão agregada casam entre os anos."""
+    df = scan_delta("ano", "cubo_demografico", [2022], settings=settings).collect()
+
+    total_nacional = df.filter((pl.col("GRUPO_ID") == 0b1111111111) & (pl.col("NR_TURNO") == 1))
+    assert total_nacional["QT_APTOS"].to_list() == [1010]
+    assert total_nacional["QT_APTOS_BASE"].to_list() == [1010]
+
+
+def test_maiores_variacoes_ordena_quedas(settings, gold_2018_2022) -> None:  # type: ignore[no-untyped-def]
+    """Ranking de quedas sai direto da tabela pré-calculada."""
+    df = maiores_variacoes("ano", "municipio", 2022, n=2, ufs=["BA"], settings=settings)
+
+    assert df["NM_MUNICIPIO"].to_list() == ["SALVADOR", "SALVADOR"]
+    assert df["NR_TURNO"].to_list() == [2, 1]
+    assert df["DELTA_TAXA_COMPARECIMENTO_PP"].to_list() == [
+        pytest.approx(-50.0),
+        pytest.approx(-45.0),
+    ]
+
+
+def test_scan_delta_sem_particoes_tipado(settings) -> None:  # type: ignore[no-untyped-def]
+    """Sem variações calculadas, o scan é vazio com as colunas esperadas."""
+    df = scan_delta("ano", "uf", settings=settings).collect()
+
+    assert df.is_empty()
+    assert "DELTA_TAXA_ABSTENCAO_PP" in df.columns
+    assert "ANO_BASE" in df.columns
+
+
+def test_delta_tipo_invalido(settings) -> None:  # type: ignore[no-untyped-def]
+    """Tipo de variação fora do contrato é erro explícito."""
+    with pytest.raises(ValueError, match="Tipo de variação desconhecido"):
+        scan_delta("mes", "uf", settings=settings)
@@ -0,0 +1,111 @@
+"""Testes do índice de extremos e outliers da Gold"""
+
+import polars as pl
+import pytest
+from typer.testing import CliRunner
+
+from participacao_eleitoral.cli import app
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.outliers import (
+    OutlierIndexBuilder,
+    consultar_outliers,
+    z_robusto,
+)
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+from participacao_eleitoral.gold.reader import caminho_tabela_gold
+from participacao_eleitoral.silver.reader import caminho_particao_silver
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+
+# Comparecimento de 7 municípios da BA: 50% a 55% e um atípico com 95%
+COMPARECIMENTO_BA = [50, 51, 52, 53, 54, 55, 95]
+
+
+@pytest.fixture
+def silver_ba(settings):  # type: ignore[no-untyped-def]
+    n = len(COMPARECIMENTO_BA)
+    df = pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2022] * n,
+            "CD_MUNICIPIO": list(range(1, n + 1)),
+            "NM_MUNICIPIO": [f"MUNICIPIO {i}" for i in range(1, n + 1)],
+            "SG_UF": ["BA"] * n,
+            "QT_APTOS": [100] * n,
+            "QT_COMPARECIMENTO": COMPARECIMENTO_BA,
+            "QT_ABSTENCAO": [100 - c for c in COMPARECIMENTO_BA],
+            "NR_TURNO": [1] * n,
+            "NR_ZONA": list(range(1, n + 1)),
+            "NOME_REGIAO": ["Nordeste"] * n,
+        }
+    )
+    df = df.cast({coluna: SCHEMA_SILVER[coluna] for coluna in df.columns})
+
+    caminho = caminho_particao_silver(settings, 2022)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    df.write_parquet(caminho)
+    return caminho
+
+
+def test_z_robusto_por_janela() -> None:
+    """Mediana 53, MAD 2: o município com 95% fica com z = 0,6745 × 42 / 2."""
+    df = pl.DataFrame(
+        {"uf": ["BA"] * 7 + ["SP"] * 2, "v": [*map(float, COMPARECIMENTO_BA), 70.0, 70.0]}
+    )
+    mediana, mad, z = z_robusto(pl.col("v"), ["uf"])
+
+    resultado = df.with_columns(mediana.alias("med"), mad.alias("mad"), z.alias("z"))
+    ba = resultado.filter(uf="BA")
+
+    assert ba["med"].unique().to_list() == [53.0]
+    assert ba["mad"].unique().to_list() == [2.0]
+    assert ba["z"][-1] == pytest.approx(0.6745 * 42 / 2)
+
+    # MAD zero: z indefinido em vez de infinito
+    assert resultado.filter(uf="SP")["z"].null_count() == 2
+
+
+def test_indice_guarda_extremos_e_outliers(settings, logger, silver_ba) -> None:  # type: ignore[no-untyped-def]
+    """Com top_n=2, ficam 2 maiores + 2 menores por grupo; o atípico é marcado."""
+    GoldAggregationPipeline(settings=settings, logger=logger).run(2022)
+    tabelas = {
+        grao: caminho_tabela_gold(settings, 2022, grao) for grao in ComparecimentoGoldContrato.GRAOS
+    }
+
+    destino = caminho_tabela_gold(settings, 2022, "indice_teste")
+    result = OutlierIndexBuilder(logger=logger, top_n=2).build(tabelas, destino)
+
+    df = pl.read_parquet(destino).filter(NIVEL="municipio", TAXA="TAXA_COMPARECIMENTO_PCT")
+    assert len(df) == 4
+    assert df.filter(pl.col("OUTLIER"))["CD_MUNICIPIO"].to_list() == [7]
+
+    # Um outlier por nível × taxa (município e zona, comparecimento e abstenção)
+    assert result.outliers == 4
+
+
+def test_consultar_outliers_le_o_indice(settings, logger, silver_ba) -> None:  # type: ignore[no-untyped-def]
+    GoldAggregationPipeline(settings=settings, logger=logger).run(2022)
+
+    df = consultar_outliers(2022, ["BA"], apenas_outliers=True, settings=settings)
+    assert df["NM_MUNICIPIO"].to_list() == ["MUNICIPIO 7"]
+    assert df["VALOR"].item() == pytest.approx(95.0)
+
+    todos = consultar_outliers(2022, ["BA"], nivel="zona", settings=settings)
+    assert todos["NR_ZONA"][0] == 7
+    assert todos["CD_MUNICIPIO"].null_count() == len(todos)
+
+    assert consultar_outliers(2018, settings=settings).is_empty()
+
+    with pytest.raises(ValueError, match="Nível desconhecido"):
+        consultar_outliers(2022, nivel="uf", settings=settings)
+
+
+def test_cli_analytics_outliers(settings, logger, silver_ba, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    GoldAggregationPipeline(settings=settings, logger=logger).run(2022)
+    monkeypatch.setenv("PARTICIPACAO_PROJECT_ROOT", str(settings.project_root))
+
+    result = CliRunner().invoke(app, ["analytics", "outliers", "--ano", "2022", "--uf", "ba"])
+
+    assert result.exit_code == 0, result.output
+    assert "MUNICIPIO 7" in result.output
+    assert "MUNICIPIO 1 " not in result.output
@@ -0,0 +1,103 @@
+"""Testes do GoldAggregationPipeline"""
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+from participacao_eleitoral.gold.reader import (
+    caminho_tabela_gold,
+    diretorio_particao_gold,
+    scan_gold,
+)
+from participacao_eleitoral.utils.snapshots import PartitionSnapshots
+
+
+def test_pipeline_gold_fluxo_completo(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """Pipeline deve materializar os grãos e salvar metadata de sucesso."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.run(2022)
+
+    assert caminho_tabela_gold(settings, 2022, "uf").exists()
+    assert scan_gold("nacional", settings=settings).collect()["QT_APTOS"].sum() == 1060
+
+    metadata = pipeline.metadata_store.buscar("comparecimento_abstencao_gold", 2022)
+    assert metadata is not None
+    assert metadata["status"] == "sucesso"
+    assert metadata["linhas_silver"] == 4
+
+
+def test_pipeline_gold_idempotente(settings, logger, silver_2022, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """Segunda execução não reconstrói os agregados."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.run(2022)
+
+    def falhar(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("não deveria reconstruir")
+
+    monkeypatch.setattr(pipeline.builder, "build", falhar)
+    pipeline.run(2022)
+
+
+def test_pipeline_gold_reconstroi_se_tabela_sumiu(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """Metadata de sucesso sem todas as tabelas não conta como agregado."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.run(2022)
+
+    caminho_tabela_gold(settings, 2022, "zona").unlink()
+    pipeline.run(2022)
+
+    assert caminho_tabela_gold(settings, 2022, "zona").exists()
+
+
+def test_pipeline_gold_silver_inexistente_skip(settings, logger) -> None:  # type: ignore[no-untyped-def]
+    """Sem Silver do ano, o pipeline pula sem gravar metadata."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.run(2018)
+
+    assert pipeline.metadata_store.buscar("comparecimento_abstencao_gold", 2018) is None
+    assert scan_gold("uf", settings=settings).collect().is_empty()
+
+
+def test_pipeline_gold_erro_salva_metadata_falha(
+    settings, logger, silver_2022, monkeypatch
+) -> None:  # type: ignore[no-untyped-def]
+    """Erro na agregação é registrado como falha e propagado."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+
+    def falhar(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise RuntimeError("falha simulada")
+
+    monkeypatch.setattr(pipeline.builder, "build", falhar)
+
+    with pytest.raises(RuntimeError):
+        pipeline.run(2022)
+
+    metadata = pipeline.metadata_store.buscar("comparecimento_abstencao_gold", 2022)
+    assert metadata is not None
+    assert metadata["status"] == "falha"
+
+
+def test_pipeline_gold_falha_nao_publica_versao_parcial(
+    settings, logger, silver_2022, monkeypatch
+) -> None:  # type: ignore[no-untyped-def]
+    """Falha depois dos grãos não expõe grãos novos com outliers antigos."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.run(2022)
+    snapshots = PartitionSnapshots(diretorio_particao_gold(settings, 2022))
+    publicado = snapshots.snapshot()
+
+    def falhar(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise RuntimeError("falha simulada")
+
+    silver = pl.read_parquet(silver_2022)
+    silver.with_columns(pl.col("QT_APTOS") * 2).write_parquet(silver_2022)
+    monkeypatch.setattr(pipeline.outlier_builder, "build", falhar)
+
+    with pytest.raises(RuntimeError):
+        pipeline.run(2022)
+
+    assert snapshots.snapshot() == publicado
+    assert not (snapshots.versoes_dir / "00002").exists()
+    assert scan_gold("nacional", settings=settings).collect()["QT_APTOS"].sum() == 1060
+    nacional = caminho_tabela_gold(settings, 2022, "nacional")
+    assert pl.read_parquet(nacional)["QT_APTOS"].sum() == 1060
@@ -0,0 +1,65 @@
+"""Testes do leitor da camada Gold"""
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.gold.reader import (
+    caminho_historico_gold,
+    caminho_tabela_gold,
+    diretorio_gold,
+    scan_gold,
+    scan_historico_gold,
+)
+from participacao_eleitoral.gold.schemas.comparecimento_gold import schema_gold
+
+
+def test_caminho_tabela_gold(settings) -> None:  # type: ignore[no-untyped-def]
+    """Tabelas ficam em gold/<dataset>/year=YYYY/<grao>.parquet."""
+    caminho = caminho_tabela_gold(settings, 2022, "uf")
+
+    assert caminho.parent.parent == diretorio_gold(settings)
+    assert caminho.parent.name == "year=2022"
+    assert caminho.name == "uf.parquet"
+
+
+def test_scan_gold_vazio_tipado(settings) -> None:  # type: ignore[no-untyped-def]
+    """Sem partições, o scan é vazio e já no schema do grão."""
+    df = scan_gold("regiao", settings=settings).collect()
+
+    assert df.is_empty()
+    assert df.schema == schema_gold("regiao")
+
+
+def test_scan_gold_grao_desconhecido(settings) -> None:  # type: ignore[no-untyped-def]
+    """Grão fora do contrato é erro explícito."""
+    with pytest.raises(ValueError, match="Grão desconhecido"):
+        scan_gold("bairro", settings=settings)
+
+
+def test_scan_historico_gold_filtra_anos(settings) -> None:  # type: ignore[no-untyped-def]
+    """A série multi-ano é lida de um único arquivo, com filtro por ano."""
+    assert scan_historico_gold("uf", settings=settings).collect().is_empty()
+
+    schema = schema_gold("uf")
+    caminho = caminho_historico_gold(settings, "uf")
+    caminho.parent.mkdir(parents=True)
+    pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2018, 2022],
+            "NR_TURNO": [1, 1],
+            "NOME_REGIAO": ["Nordeste", "Nordeste"],
+            "SG_UF": ["BA", "BA"],
+            "QT_APTOS": [10, 20],
+            "QT_COMPARECIMENTO": [8, 15],
+            "QT_ABSTENCAO": [2, 5],
+            "TAXA_COMPARECIMENTO_PCT": [80.0, 75.0],
+            "TAXA_ABSTENCAO_PCT": [20.0, 25.0],
+        }
+    ).cast(schema).write_parquet(caminho)
+
+    df = scan_historico_gold("uf", [2022], settings=settings).collect()
+    assert df["QT_APTOS"].to_list() == [20]
+    assert df.columns == list(schema)
+
+    with pytest.raises(ValueError, match="sem série histórica"):
+        scan_historico_gold("municipio", settings=settings)
@@ -0,0 +1,74 @@
+"""Testes da atualização incremental da Gold"""
+
+import polars as pl
+
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+from participacao_eleitoral.gold.reader import caminho_historico_gold, diretorio_particao_gold
+from participacao_eleitoral.silver.reader import caminho_particao_silver
+
+
+def _copiar_silver(settings, origem, ano: int) -> None:  # type: ignore[no-untyped-def]
+    destino = caminho_particao_silver(settings, ano)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    pl.read_parquet(origem).with_columns(
+        pl.lit(ano, dtype=pl.Int16).alias("ANO_ELEICAO")
+    ).write_parquet(destino)
+
+
+def test_refresh_agrega_anos_novos_e_historico(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """Primeiro refresh agrega todos os anos e monta as séries multi-ano."""
+    _copiar_silver(settings, silver_2022, 2018)
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+
+    plano = pipeline.refresh()
+
+    assert plano.reconstruir == [2018, 2022]
+    historico = pl.read_parquet(caminho_historico_gold(settings, "nacional"))
+    assert sorted(historico["ANO_ELEICAO"].unique().to_list()) == [2018, 2022]
+
+
+def test_refresh_sem_mudancas_nao_reagrega(settings, logger, silver_2022, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """Silver inalterada: nenhum ano é recalculado."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.refresh()
+
+    def falhar(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("não deveria reagregar")
+
+    monkeypatch.setattr(pipeline.builder, "build", falhar)
+    plano = pipeline.refresh()
+
+    assert plano.reconstruir == []
+    assert plano.em_dia == [2022]
+
+
+def test_refresh_so_reagrega_ano_alterado(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """Reescrever a Silver de um ano invalida só aquele ano."""
+    _copiar_silver(settings, silver_2022, 2018)
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.refresh()
+
+    # Nova versão de 2022 com o dobro de aptos em todas as linhas
+    df = pl.read_parquet(silver_2022).with_columns(pl.col("QT_APTOS") * 2)
+    df.write_parquet(silver_2022)
+
+    plano = pipeline.refresh()
+
+    assert plano.reconstruir == [2022]
+    assert plano.em_dia == [2018]
+
+    historico = pl.read_parquet(caminho_historico_gold(settings, "nacional"))
+    total_2022 = historico.filter(pl.col("ANO_ELEICAO") == 2022)["QT_APTOS"].sum()
+    assert total_2022 == 2 * 1060
+
+
+def test_refresh_reporta_gold_sem_silver(settings, logger, silver_2022) -> None:  # type: ignore[no-untyped-def]
+    """Gold de um ano cuja Silver sumiu é reportada, não apagada."""
+    pipeline = GoldAggregationPipeline(settings=settings, logger=logger)
+    pipeline.refresh()
+
+    silver_2022.unlink()
+    plano = pipeline.refresh()
+
+    assert plano.sem_silver == [2022]
+    assert (diretorio_particao_gold(settings, 2022) / "nacional.parquet").exists()
@@ -0,0 +1,102 @@
+"""Testes dos sketches de distribuição das taxas da Gold"""
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.core.contracts.comparecimento_gold import (
+    ComparecimentoGoldContrato,
+)
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+from participacao_eleitoral.gold.reader import caminho_tabela_gold
+from participacao_eleitoral.gold.sketches import (
+    ERRO_MAXIMO_PP,
+    N_BINS,
+    bin_da_taxa,
+    histograma,
+    percentis,
+)
+
+# Limite de erro do sketch, com folga para o arredondamento de ponto flutuante
+TOLERANCIA = ERRO_MAXIMO_PP + 1e-9
+
+
+@pytest.fixture
+def gold_2022(settings, logger, silver_2022):  # type: ignore[no-untyped-def]
+    GoldAggregationPipeline(settings=settings, logger=logger).run(2022)
+    return caminho_tabela_gold(settings, 2022, ComparecimentoGoldContrato.TABELA_SKETCH)
+
+
+def test_bin_da_taxa_cobre_os_extremos() -> None:
+    """0% cai no primeiro bin e 100% no último."""
+    df = pl.DataFrame({"taxa": [0.0, 50.0, 100.0]}).select(bin_da_taxa(pl.col("taxa")))
+
+    assert df.to_series().to_list() == [0, 500, N_BINS - 1]
+
+
+def test_sketch_escrito_pelo_pipeline(gold_2022) -> None:  # type: ignore[no-untyped-def]
+    """Sketch esparso: só bins não vazios, um por nível × taxa × partição."""
+    df = pl.read_parquet(gold_2022)
+
+    zonas = df.filter(NIVEL="zona", TAXA="TAXA_COMPARECIMENTO_PCT", NR_TURNO=1)
+    assert zonas["CONTAGEM"].sum() == 3
+    assert sorted(zonas["BIN"].to_list()) == [500, 500, N_BINS - 1]
+
+
+def test_percentis_mescla_ufs_dentro_do_erro(settings, gold_2022) -> None:  # type: ignore[no-untyped-def]
+    """Zonas do 1º turno: 50%, 50% (BA e SP) e 100% (BA)."""
+    df = percentis(
+        quantis=[0.5, 1.0],
+        nivel="zona",
+        por=["NR_TURNO"],
+        anos=[2022],
+        settings=settings,
+    ).filter(NR_TURNO=1)
+
+    assert df["UNIDADES"].item() == 3
+    assert df["P50"].item() == pytest.approx(50.0, abs=TOLERANCIA)
+    assert df["P100"].item() == pytest.approx(100.0, abs=TOLERANCIA)
+    assert df["ERRO_MAXIMO_PP"].item() == ERRO_MAXIMO_PP
+
+
+def test_percentis_por_uf(settings, gold_2022) -> None:  # type: ignore[no-untyped-def]
+    """Mediana municipal por UF vem do sketch de cada partição."""
+    df = percentis(
+        por=["NR_TURNO", "SG_UF"],
+        anos=[2022],
+        settings=settings,
+    ).filter(NR_TURNO=1)
+
+    assert df["SG_UF"].cast(pl.String).to_list() == ["BA", "SP"]
+    assert df["P50"].to_list() == pytest.approx([55.0, 50.0], abs=TOLERANCIA)
+
+
+def test_histograma_em_faixas(settings, gold_2022) -> None:  # type: ignore[no-untyped-def]
+    """Bins de 0,1 p.p. somados em faixas de 10 p.p."""
+    df = histograma(
+        "TAXA_COMPARECIMENTO_PCT",
+        largura_pp=10,
+        nivel="zona",
+        por=["NR_TURNO"],
+        anos=[2022],
+        settings=settings,
+    ).filter(NR_TURNO=1)
+
+    assert df["FAIXA_INICIO_PP"].to_list() == [50.0, 90.0]
+    assert df["FAIXA_FIM_PP"].to_list() == [60.0, 100.0]
+    assert df["UNIDADES"].to_list() == [2, 1]
+
+
+def test_consultas_sem_gold_retornam_vazio(settings) -> None:  # type: ignore[no-untyped-def]
+    assert percentis(anos=[2022], settings=settings).is_empty()
+    assert histograma(anos=[2022], settings=settings).is_empty()
+
+
+def test_parametros_invalidos(settings) -> None:  # type: ignore[no-untyped-def]
+    with pytest.raises(ValueError, match="Taxa desconhecida"):
+        percentis("QT_APTOS", settings=settings)
+
+    with pytest.raises(ValueError, match="Nível desconhecido"):
+        percentis(nivel="uf", settings=settings)
+
+    with pytest.raises(ValueError, match="múltiplo"):
+        histograma(largura_pp=0.25, settings=settings)
@@ -1,3 +1,5 @@
+import polars as pl
+
 from participacao_eleitoral.ingestion.converter import CSVToParquetConverter
 from participacao_eleitoral.ingestion.schemas.comparecimento import (
     SCHEMA_COMPARECIMENTO,
@@ -28,3 +30,25 @@ def test_converter_gera_parquet(tmp_path, logger) -> None:  # type: ignore[no-un
 
     assert parquet.exists()
     assert result.linhas == 1
+
+
+def test_converter_decodifica_latin1_do_tse(tmp_path, logger) -> None:  # type: ignore[no-untyped-def]
+    """CSVs do TSE vêm em Latin-1: os acentos chegam intactos ao Parquet."""
+    csv = tmp_path / "input.csv"
+    parquet = tmp_path / "output.parquet"
+    csv.write_bytes(
+        "ANO_ELEICAO;CD_MUNICIPIO;NM_MUNICIPIO;SG_UF;QT_APTOS;QT_COMPARECIMENTO;QT_ABSTENCAO\n"
+        "2022;71072;SÃO PAULO;SP;1000;800;200\n"
+        "2022;36056;ITAGIBÁ;BA;10;8;2\n".encode("latin-1")
+    )
+
+    CSVToParquetConverter(logger=logger).convert(
+        csv_path=csv,
+        parquet_path=parquet,
+        schema=SCHEMA_COMPARECIMENTO,
+        source="test",
+    )
+
+    assert pl.read_parquet(parquet)["NM_MUNICIPIO"].to_list() == ["SÃO PAULO", "ITAGIBÁ"]
+    # A cópia UTF-8 intermediária não fica no diretório de saída
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["input.csv", "output.parquet"]
@@ -13,7 +13,8 @@ def test_silver_metadata_store_cria_tabela(tmp_path, logger):
     store = SilverMetadataStore(settings=settings, logger=logger, db_path=db_path)
 
     # Verifica se tabela foi criada
-    tables = store.conn.execute("SHOW TABLES").fetchall()
+    with store.conexao() as conn:
+        tables = conn.execute("SHOW TABLES").fetchall()
     assert ("silver_metadata",) in tables
 
 
@@ -87,9 +88,10 @@ def test_silver_metadata_store_upsert_idempotencia(tmp_path, logger):
     result = store.buscar("test_silver", 2022)
     assert result["duracao_segundos"] == 600  # Valor atualizado
 
-    count = store.conn.execute(
-        "SELECT COUNT(*) FROM silver_metadata WHERE dataset = 'test_silver' AND ano = 2022"
-    ).fetchone()[0]
+    with store.conexao() as conn:
+        count = conn.execute(
+            "SELECT COUNT(*) FROM silver_metadata WHERE dataset = 'test_silver' AND ano = 2022"
+        ).fetchone()[0]
     assert count == 1
 
 
@@ -1,9 +1,14 @@
 """Testes do SilverTransformationPipeline"""
 
+import multiprocessing
+from pathlib import Path
+
 import polars as pl
 import pytest
 
+from participacao_eleitoral.config import Settings
 from participacao_eleitoral.silver.pipeline import SilverTransformationPipeline
+from participacao_eleitoral.utils.logger import ModernLogger
 
 
 def test_pipeline_idempotencia_execucao_repetida(settings, logger):
@@ -208,3 +213,103 @@ def test_pipeline_injeta_metadata_store(settings, logger):
     _ = custom_store.buscar("comparecimento_abstencao_silver", 2022)
     # Como o bronze não existe, o pipeline faz skip e não salva metadata
     # Este comportamento pode ser ajustado conforme necessidade
+
+
+def test_pipeline_registra_schema_bronze(settings, logger):
+    """Pipeline deve registrar o schema físico do bronze transformado."""
+    bronze_dir = settings.bronze_dir / "comparecimento_abstencao" / "year=2014"
+    bronze_dir.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2014],
+            "CD_MUNICIPIO": [1],
+            "NM_MUNICIPIO": ["A"],
+            "SG_UF": ["SP"],
+            "QT_APTOS": [100],
+            "QT_COMPARECIMENTO": [80],
+            "QT_ABSTENCAO": [20],
+        }
+    ).write_parquet(bronze_dir / "data.parquet")
+
+    pipeline = SilverTransformationPipeline(settings=settings, logger=logger)
+    pipeline.run(2014)
+
+    schema = pipeline.schema_registry.buscar("comparecimento_abstencao", 2014)
+    assert schema is not None
+    assert "QT_APTOS" in schema
+
+
+def test_pipeline_falha_na_escrita_nao_publica_particao(settings, logger, monkeypatch):
+    """Queda no meio da escrita não deixa Parquet truncado no lugar da partição."""
+    bronze_dir = settings.bronze_dir / "comparecimento_abstencao" / "year=2022"
+    bronze_dir.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2022],
+            "CD_MUNICIPIO": [1],
+            "NM_MUNICIPIO": ["A"],
+            "SG_UF": ["SP"],
+            "QT_APTOS": [100],
+            "QT_COMPARECIMENTO": [80],
+            "QT_ABSTENCAO": [20],
+        }
+    ).write_parquet(bronze_dir / "data.parquet")
+
+    def escrita_interrompida(self, file, **kwargs):  # type: ignore[no-untyped-def]
+        file.write_bytes(b"PAR1")
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", escrita_interrompida)
+
+    pipeline = SilverTransformationPipeline(settings=settings, logger=logger)
+    with pytest.raises(OSError):
+        pipeline.run(2022)
+
+    particao = settings.silver_dir / "comparecimento_abstencao_silver" / "year=2022"
+    assert not (particao / "data.parquet").exists()
+    assert not list(particao.glob("*.tmp"))
+
+
+def _transformar_em_processo(project_root: str, ano: int) -> None:
+    settings = Settings(project_root=Path(project_root))
+    SilverTransformationPipeline(settings=settings, logger=ModernLogger(level="ERROR")).run(ano)
+
+
+def test_pipeline_workers_em_processos_paralelos(settings, logger):
+    """Processos paralelos no mesmo diretório de dados compartilham os metadados."""
+    for ano in (2018, 2022):
+        bronze_dir = settings.bronze_dir / "comparecimento_abstencao" / f"year={ano}"
+        bronze_dir.mkdir(parents=True, exist_ok=True)
+        pl.DataFrame(
+            {
+                "ANO_ELEICAO": [ano] * 3,
+                "CD_MUNICIPIO": [1, 2, 3],
+                "NM_MUNICIPIO": ["A", "B", "C"],
+                "SG_UF": ["SP", "RJ", "MG"],
+                "QT_APTOS": [100, 200, 300],
+                "QT_COMPARECIMENTO": [80, 150, 240],
+                "QT_ABSTENCAO": [20, 50, 60],
+                "_metadata_ingestion_timestamp": ["2024-01-01"] * 3,
+                "_metadata_source": ["test"] * 3,
+            }
+        ).write_parquet(bronze_dir / "data.parquet")
+
+    # Um pipeline vivo neste processo não pode impedir os workers de abrir o banco
+    pipeline = SilverTransformationPipeline(settings=settings, logger=logger)
+
+    contexto = multiprocessing.get_context("spawn")
+    workers = [
+        contexto.Process(target=_transformar_em_processo, args=(str(settings.project_root), ano))
+        for ano in (2018, 2022)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=120)
+
+    assert [worker.exitcode for worker in workers] == [0, 0]
+    for ano in (2018, 2022):
+        registro = pipeline.metadata_store.buscar("comparecimento_abstencao_silver", ano)
+        assert registro is not None
+        assert registro["status"] == "sucesso"
+        assert pipeline.schema_registry.buscar("comparecimento_abstencao", ano) is not None
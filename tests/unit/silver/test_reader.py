@@ -0,0 +1,210 @@
+"""Testes do leitor da camada Silver"""
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.silver.reader import (
+    agregar_participacao,
+    caminho_particao_silver,
+    diretorio_silver,
+    listar_particoes_silver,
+    scan_silver,
+)
+from participacao_eleitoral.utils.manifesto import registrar_no_manifesto
+
+
+def _escrever_particao(settings, ano: int, ufs: list[str]) -> None:  # type: ignore[no-untyped-def]
+    caminho = caminho_particao_silver(settings, ano)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "ANO_ELEICAO": [ano] * len(ufs),
+            "SG_UF": ufs,
+            "QT_APTOS": [100] * len(ufs),
+            "QT_COMPARECIMENTO": [80] * len(ufs),
+        }
+    ).write_parquet(caminho)
+
+
+def test_caminho_particao_usa_dataset_silver(settings) -> None:  # type: ignore[no-untyped-def]
+    """Todos os consumidores devem resolver o mesmo diretório Silver."""
+    caminho = caminho_particao_silver(settings, 2022)
+
+    assert caminho.parent.parent == diretorio_silver(settings)
+    assert caminho.parent.parent.name == "comparecimento_abstencao_silver"
+    assert caminho.parent.name == "year=2022"
+
+
+def test_listar_particoes_poda_por_diretorio(settings) -> None:  # type: ignore[no-untyped-def]
+    """Partições fora do filtro e diretórios estranhos devem ser ignorados."""
+    _escrever_particao(settings, 2020, ["SP"])
+    _escrever_particao(settings, 2022, ["SP"])
+    (diretorio_silver(settings) / "_tmp").mkdir()
+
+    assert list(listar_particoes_silver(settings)) == [2020, 2022]
+    assert list(listar_particoes_silver(settings, [2022, 2024])) == [2022]
+
+
+def test_scan_silver_filtra_anos_ufs_e_projeta(settings) -> None:  # type: ignore[no-untyped-def]
+    """scan_silver deve aplicar poda por ano, filtro de UF e projeção."""
+    _escrever_particao(settings, 2020, ["SP", "BA"])
+    _escrever_particao(settings, 2022, ["SP", "BA", "RJ"])
+
+    df = scan_silver(
+        anos=[2022],
+        ufs=["BA", "RJ"],
+        columns=["year", "SG_UF"],
+        settings=settings,
+    ).collect()
+
+    assert df.columns == ["year", "SG_UF"]
+    assert df["year"].to_list() == [2022, 2022]
+    assert sorted(df["SG_UF"].to_list()) == ["BA", "RJ"]
+
+
+def test_scan_silver_sem_particoes_retorna_vazio(settings) -> None:  # type: ignore[no-untyped-def]
+    """Sem partições, o scan deve ser vazio e manter as colunas pedidas."""
+    df = scan_silver(anos=[2030], columns=["year", "QT_APTOS"], settings=settings).collect()
+
+    assert df.is_empty()
+    assert df.columns == ["year", "QT_APTOS"]
+
+
+def test_scan_silver_unifica_anos_com_colunas_diferentes(settings) -> None:  # type: ignore[no-untyped-def]
+    """Colunas ausentes em anos antigos devem virar nulos tipados no scan."""
+    _escrever_particao(settings, 2014, ["SP"])
+
+    recente = caminho_particao_silver(settings, 2024)
+    recente.parent.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2024],
+            "SG_UF": ["BA"],
+            "QT_APTOS": [50],
+            "QT_COMPARECIMENTO": [40],
+            "DS_QUILOMBOLA": ["SIM"],
+        }
+    ).write_parquet(recente)
+
+    df = scan_silver(columns=["year", "QT_APTOS", "DS_QUILOMBOLA"], settings=settings).collect()
+
+    assert df.schema["QT_APTOS"] == pl.Int32
+    assert df.schema["DS_QUILOMBOLA"] == pl.Categorical
+    assert df.sort("year")["DS_QUILOMBOLA"].to_list() == [None, "SIM"]
+
+
+def test_scan_silver_deriva_taxas_das_contagens(settings) -> None:  # type: ignore[no-untyped-def]
+    """Taxas são virtuais: calculadas das contagens mesmo sem estar no arquivo."""
+    _escrever_particao(settings, 2022, ["SP"])
+
+    df = scan_silver(columns=["TAXA_COMPARECIMENTO_PCT"], settings=settings).collect()
+
+    assert df.schema["TAXA_COMPARECIMENTO_PCT"] == pl.Float32
+    assert df["TAXA_COMPARECIMENTO_PCT"].to_list() == [80.0]
+
+
+def test_scan_silver_ignora_taxa_materializada(settings) -> None:  # type: ignore[no-untyped-def]
+    """Uma taxa gravada no arquivo nunca diverge das contagens lidas."""
+    caminho = caminho_particao_silver(settings, 2022)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "QT_APTOS": [200],
+            "QT_COMPARECIMENTO": [150],
+            "TAXA_COMPARECIMENTO_PCT": [99.0],
+        }
+    ).write_parquet(caminho)
+
+    df = scan_silver(columns=["TAXA_COMPARECIMENTO_PCT"], settings=settings).collect()
+
+    assert df["TAXA_COMPARECIMENTO_PCT"].to_list() == [75.0]
+
+
+def test_agregar_participacao_pondera_pelos_aptos() -> None:
+    """A taxa agregada é soma/soma, não a média das taxas por linha."""
+    lf = pl.LazyFrame(
+        {
+            "SG_UF": ["SP", "SP"],
+            "QT_APTOS": [100, 900],
+            "QT_COMPARECIMENTO": [100, 450],
+            "QT_ABSTENCAO": [0, 450],
+        }
+    )
+
+    df = agregar_participacao(lf, ["SG_UF"]).collect()
+
+    assert df["QT_APTOS"].to_list() == [1000]
+    assert df["TAXA_COMPARECIMENTO_PCT"][0] == pytest.approx(55.0)
+    assert df["TAXA_ABSTENCAO_PCT"][0] == pytest.approx(45.0)
+
+
+def test_agregar_participacao_soma_int32_sem_estouro() -> None:
+    """Contagens Int32 (tipo físico da Silver) somam em Int64."""
+    grande = 2**30
+    lf = pl.LazyFrame(
+        {
+            "SG_UF": ["SP"] * 4,
+            "QT_APTOS": [grande] * 4,
+            "QT_COMPARECIMENTO": [grande // 2] * 4,
+            "QT_ABSTENCAO": [grande // 2] * 4,
+        },
+        schema_overrides=dict.fromkeys(["QT_APTOS", "QT_COMPARECIMENTO", "QT_ABSTENCAO"], pl.Int32),
+    )
+
+    df = agregar_participacao(lf, ["SG_UF"]).collect()
+
+    assert df["QT_APTOS"].to_list() == [4 * grande]
+    assert df["TAXA_COMPARECIMENTO_PCT"][0] == pytest.approx(50.0)
+
+
+def test_taxa_sem_aptos_e_nula(settings) -> None:  # type: ignore[no-untyped-def]
+    """Zero aptos dá taxa nula (não NaN/inf), por linha e agregada, como no catálogo."""
+    caminho = caminho_particao_silver(settings, 2022)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "SG_UF": ["AC", "SP"],
+            "QT_APTOS": [0, 100],
+            "QT_COMPARECIMENTO": [0, 80],
+            "QT_ABSTENCAO": [0, 20],
+        }
+    ).write_parquet(caminho)
+
+    linhas = scan_silver(columns=["TAXA_COMPARECIMENTO_PCT"], settings=settings).collect()
+    agregado = (
+        agregar_participacao(scan_silver(settings=settings), ["SG_UF"]).sort("SG_UF").collect()
+    )
+
+    assert linhas["TAXA_COMPARECIMENTO_PCT"].to_list() == [None, 80.0]
+    assert agregado["TAXA_COMPARECIMENTO_PCT"].to_list() == [None, 80.0]
+    assert agregado["TAXA_ABSTENCAO_PCT"].to_list() == [None, 20.0]
+
+
+def test_scan_silver_poda_ufs_pelo_manifesto(settings, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """Com o manifesto em dia, partições sem a UF pedida não são abertas."""
+    _escrever_particao(settings, 2020, ["AC", "BA"])
+    _escrever_particao(settings, 2022, ["SP", "TO"])
+    registrar_no_manifesto(diretorio_silver(settings), listar_particoes_silver(settings).values())
+
+    # Nenhum rodapé pode ser lido no planejamento
+    def _proibido(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("rodapé lido")
+
+    monkeypatch.setattr(pl, "read_parquet_schema", _proibido)
+    lf = scan_silver(ufs=["SP"], settings=settings)
+    monkeypatch.undo()
+
+    df = lf.collect()
+    assert df["year"].unique().to_list() == [2022]
+    assert df["SG_UF"].cast(pl.String).to_list() == ["SP"]
+
+
+def test_scan_silver_ignora_manifesto_desatualizado(settings) -> None:  # type: ignore[no-untyped-def]
+    """Arquivo reescrito fora do pipeline: a entrada não vale e nada é podado errado."""
+    _escrever_particao(settings, 2022, ["AC"])
+    registrar_no_manifesto(diretorio_silver(settings), listar_particoes_silver(settings).values())
+    _escrever_particao(settings, 2022, ["AC", "SP"])
+
+    df = scan_silver(ufs=["SP"], settings=settings).collect()
+
+    assert df["SG_UF"].cast(pl.String).to_list() == ["SP"]
@@ -0,0 +1,35 @@
+"""Testes do registro de schemas do bronze"""
+
+import polars as pl
+
+from participacao_eleitoral.silver.schema_registry import SchemaRegistry
+
+
+def _bronze(tmp_path, nome: str, colunas: dict[str, list[object]]):  # type: ignore[no-untyped-def]
+    caminho = tmp_path / nome
+    pl.DataFrame(colunas).write_parquet(caminho)
+    return caminho
+
+
+def test_registrar_e_buscar_schema(settings, logger, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Schema físico deve ser registrado na ordem original do arquivo."""
+    caminho = _bronze(tmp_path, "b.parquet", {"SG_UF": ["SP"], "QT_APTOS": [1]})
+
+    with SchemaRegistry(settings=settings, logger=logger) as registry:
+        registrado = registry.registrar("comparecimento_abstencao", 2022, caminho)
+
+        assert registrado == {"SG_UF": "String", "QT_APTOS": "Int64"}
+        assert registry.buscar("comparecimento_abstencao", 2022) == registrado
+        assert registry.buscar("comparecimento_abstencao", 2014) is None
+
+
+def test_registrar_substitui_ano(settings, logger, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Registrar de novo o mesmo ano deve substituir as colunas anteriores."""
+    antigo = _bronze(tmp_path, "a.parquet", {"SG_UF": ["SP"], "NR_ZONA": [1]})
+    novo = _bronze(tmp_path, "n.parquet", {"SG_UF": ["SP"]})
+
+    with SchemaRegistry(settings=settings, logger=logger) as registry:
+        registry.registrar("comparecimento_abstencao", 2022, antigo)
+        registry.registrar("comparecimento_abstencao", 2022, novo)
+
+        assert registry.colunas_por_ano("comparecimento_abstencao") == {2022: ["SG_UF"]}
@@ -25,11 +25,14 @@ def test_schema_silver_contem_tipos_polars():
     import polars as pl
 
     for campo, tipo in SCHEMA_SILVER.items():
-        assert tipo in [
+        assert tipo.base_type() in [
+            pl.Int8,
+            pl.Int16,
             pl.Int32,
-            pl.Int64,
             pl.Utf8,
-            pl.Float64,
+            pl.Categorical,
+            pl.Enum,
+            pl.Float32,
         ], f"Campo {campo} tem tipo inválido: {tipo}"
 
 
@@ -71,18 +74,28 @@ def test_schema_silver_tipos_corretos():
     """Schema Silver deve ter tipos corretos para cada campo."""
     import polars as pl
 
-    # Campos numéricos
-    assert SCHEMA_SILVER["ANO_ELEICAO"] == pl.Int32
+    # Campos numéricos (tipos compactos)
+    assert SCHEMA_SILVER["ANO_ELEICAO"] == pl.Int16
     assert SCHEMA_SILVER["CD_MUNICIPIO"] == pl.Int32
-    assert SCHEMA_SILVER["QT_APTOS"] == pl.Int64
-    assert SCHEMA_SILVER["QT_COMPARECIMENTO"] == pl.Int64
-    assert SCHEMA_SILVER["QT_ABSTENCAO"] == pl.Int64
+    assert SCHEMA_SILVER["QT_APTOS"] == pl.Int32
+    assert SCHEMA_SILVER["QT_COMPARECIMENTO"] == pl.Int32
+    assert SCHEMA_SILVER["QT_ABSTENCAO"] == pl.Int32
 
     # Campos texto
     assert SCHEMA_SILVER["NM_MUNICIPIO"] == pl.Utf8
-    assert SCHEMA_SILVER["SG_UF"] == pl.Utf8
-    assert SCHEMA_SILVER["NOME_REGIAO"] == pl.Utf8
+    assert SCHEMA_SILVER["SG_UF"] == pl.Categorical
+    assert isinstance(SCHEMA_SILVER["NOME_REGIAO"], pl.Enum)
 
     # Campos decimais (taxas)
-    assert SCHEMA_SILVER["TAXA_COMPARECIMENTO_PCT"] == pl.Float64
-    assert SCHEMA_SILVER["TAXA_ABSTENCAO_PCT"] == pl.Float64
+    assert SCHEMA_SILVER["TAXA_COMPARECIMENTO_PCT"] == pl.Float32
+    assert SCHEMA_SILVER["TAXA_ABSTENCAO_PCT"] == pl.Float32
+
+
+def test_schema_silver_regiao_enum_inclui_desconhecido():
+    """Enum de região deve aceitar todas as regiões do RegionMapper."""
+    from participacao_eleitoral.silver.region_mapper import RegionMapper
+
+    categorias = SCHEMA_SILVER["NOME_REGIAO"].categories.to_list()  # type: ignore[union-attr]
+
+    assert set(RegionMapper.REGIAO_MAP.values()).issubset(categorias)
+    assert RegionMapper.REGIAO_DESCONHECIDA in categorias
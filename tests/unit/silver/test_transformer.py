@@ -1,6 +1,7 @@
 """Testes do Transformer Bronze → Silver"""
 
 import polars as pl
+import pytest
 
 from participacao_eleitoral.silver.region_mapper import RegionMapper
 from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
@@ -204,3 +205,106 @@ def test_transformer_mantera_colunas_originais(tmp_path, logger) -> None:  # typ
     assert "QT_APTOS" in df_silver.columns
     assert "QT_COMPARECIMENTO" in df_silver.columns
     assert "QT_ABSTENCAO" in df_silver.columns
+
+
+def test_transformer_aplica_schema_silver(tmp_path, logger) -> None:  # type: ignore[no-untyped-def]
+    """
+    Transformer deve projetar no SCHEMA_SILVER e usar os tipos compactos declarados.
+    """
+    bronze_path = tmp_path / "bronze.parquet"
+    df_bronze = pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2022, 2022],
+            "NR_TURNO": [1, 1],
+            "CD_MUNICIPIO": [1, 2],
+            "NM_MUNICIPIO": ["A", "B"],
+            "SG_UF": ["SP", "BA"],
+            "DS_GENERO": ["FEMININO", "MASCULINO"],
+            "QT_APTOS": [100, 200],
+            "QT_COMPARECIMENTO": [80, 150],
+            "QT_ABSTENCAO": [20, 50],
+            "QT_COMPARECIMENTO_TTE": [0, 0],
+            "_metadata_ingestion_timestamp": ["2024-01-01", "2024-01-01"],
+            "_metadata_source": ["test", "test"],
+        }
+    )
+    df_bronze.write_parquet(bronze_path)
+
+    silver_path = tmp_path / "silver.parquet"
+    BronzeToSilverTransformer(logger=logger).transform(
+        bronze_parquet_path=bronze_path,
+        silver_parquet_path=silver_path,
+        region_mapper=RegionMapper(),
+        schema=SCHEMA_SILVER,
+    )
+
+    schema_silver = pl.read_parquet_schema(silver_path)
+
+    # Colunas fora do schema (metadados técnicos, contagens extras) são descartadas
+    assert "_metadata_source" not in schema_silver
+    assert "QT_COMPARECIMENTO_TTE" not in schema_silver
+    # Opcionais presentes no bronze são mantidos; ausentes não são inventados
+    assert "NR_TURNO" in schema_silver
+    assert "DS_GENERO" in schema_silver
+    assert "NR_ZONA" not in schema_silver
+
+    assert schema_silver["QT_APTOS"] == pl.Int32
+    assert schema_silver["TAXA_COMPARECIMENTO_PCT"] == pl.Float32
+    assert schema_silver["NOME_REGIAO"] == SCHEMA_SILVER["NOME_REGIAO"]
+
+
+def test_transformer_falha_sem_campo_obrigatorio(tmp_path, logger) -> None:  # type: ignore[no-untyped-def]
+    """
+    Transformer deve falhar cedo se o bronze não tiver um campo obrigatório.
+    """
+    bronze_path = tmp_path / "bronze.parquet"
+    pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2022],
+            "CD_MUNICIPIO": [1],
+            "SG_UF": ["SP"],
+            "QT_APTOS": [100],
+            "QT_COMPARECIMENTO": [80],
+            "QT_ABSTENCAO": [20],
+        }
+    ).write_parquet(bronze_path)
+
+    with pytest.raises(RuntimeError, match="NM_MUNICIPIO"):
+        BronzeToSilverTransformer(logger=logger).transform(
+            bronze_parquet_path=bronze_path,
+            silver_parquet_path=tmp_path / "silver.parquet",
+            region_mapper=RegionMapper(),
+            schema=SCHEMA_SILVER,
+        )
+
+
+def test_transformer_sem_materializar_taxas(tmp_path, logger) -> None:  # type: ignore[no-untyped-def]
+    """
+    Com materializar_taxas=False, as taxas ficam só como colunas virtuais da leitura.
+    """
+    bronze_path = tmp_path / "bronze.parquet"
+    pl.DataFrame(
+        {
+            "ANO_ELEICAO": [2022],
+            "CD_MUNICIPIO": [1],
+            "NM_MUNICIPIO": ["A"],
+            "SG_UF": ["SP"],
+            "QT_APTOS": [100],
+            "QT_COMPARECIMENTO": [80],
+            "QT_ABSTENCAO": [20],
+        }
+    ).write_parquet(bronze_path)
+
+    silver_path = tmp_path / "silver.parquet"
+    transformer = BronzeToSilverTransformer(logger=logger, materializar_taxas=False)
+    transformer.transform(
+        bronze_parquet_path=bronze_path,
+        silver_parquet_path=silver_path,
+        region_mapper=RegionMapper(),
+        schema=SCHEMA_SILVER,
+    )
+
+    colunas = pl.read_parquet_schema(silver_path)
+    assert "TAXA_COMPARECIMENTO_PCT" not in colunas
+    assert "TAXA_ABSTENCAO_PCT" not in colunas
+    assert "QT_COMPARECIMENTO" in colunas
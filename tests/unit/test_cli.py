@@ -14,6 +14,9 @@ def test_cli_help_principal() -> None:
     assert "data" in result.stdout
     assert "validate" in result.stdout
     assert "utils" in result.stdout
+    assert "analytics" in result.stdout
+    assert "query" in result.stdout
+    assert "snapshots" in result.stdout
 
 
 def test_cli_data_help() -> None:
@@ -27,6 +30,7 @@ def test_cli_data_help() -> None:
     assert result.returncode == 0
     assert "ingest" in result.stdout
     assert "list-years" in result.stdout
+    assert "aggregate" in result.stdout
 
 
 def test_cli_utils_version() -> None:
@@ -0,0 +1,47 @@
+"""Testes das conexões curtas com os bancos de metadados"""
+
+import multiprocessing
+import time
+
+import duckdb
+import pytest
+
+from participacao_eleitoral.utils.conexao_duckdb import conexao_duckdb
+
+
+def _segurar_banco(db_path: str, aberto, segundos: float) -> None:  # type: ignore[no-untyped-def]
+    with duckdb.connect(db_path) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS t (x INTEGER)")
+        aberto.set()
+        time.sleep(segundos)
+
+
+def test_conexao_espera_outro_processo_liberar_o_banco(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Com o arquivo travado por outro processo, tenta de novo até conseguir."""
+    db_path = tmp_path / "_metadata.duckdb"
+    contexto = multiprocessing.get_context("spawn")
+    aberto = contexto.Event()
+    processo = contexto.Process(target=_segurar_banco, args=(str(db_path), aberto, 0.5))
+    processo.start()
+    assert aberto.wait(timeout=30)
+
+    with conexao_duckdb(db_path) as conn:
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    processo.join(timeout=30)
+    with conexao_duckdb(db_path) as conn:
+        assert conn.execute("SELECT count(*) FROM t").fetchone() == (1,)
+
+
+def test_conexao_desiste_apos_espera_maxima(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    db_path = tmp_path / "_metadata.duckdb"
+    contexto = multiprocessing.get_context("spawn")
+    aberto = contexto.Event()
+    processo = contexto.Process(target=_segurar_banco, args=(str(db_path), aberto, 2.0))
+    processo.start()
+    assert aberto.wait(timeout=30)
+
+    with pytest.raises(duckdb.IOException), conexao_duckdb(db_path, espera_maxima=0.2):
+        pass
+
+    processo.join(timeout=30)
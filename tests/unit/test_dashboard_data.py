@@ -0,0 +1,348 @@
+"""Testes dos dados do dashboard"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral import dashboard_data
+from participacao_eleitoral.config import Settings
+from participacao_eleitoral.dashboard_data import (
+    CacheAnual,
+    CacheArrowDisco,
+    agregar_dashboard,
+    anos_historico_uf,
+    carregar_municipios,
+    carregar_visoes,
+    criar_cache,
+    filtrar_visoes,
+    scan_base_uf,
+    visoes_vazias,
+)
+from participacao_eleitoral.gold.pipeline import GoldAggregationPipeline
+from participacao_eleitoral.gold.reader import caminho_tabela_gold
+from participacao_eleitoral.gold.schemas.comparecimento_gold import schema_gold
+from participacao_eleitoral.silver.reader import (
+    agregar_participacao,
+    caminho_particao_silver,
+    listar_particoes_silver,
+)
+from participacao_eleitoral.silver.schemas.comparecimento_silver import SCHEMA_SILVER
+
+# Lakehouse de amostras do modo demo (scripts/generate_mocks.py)
+AMOSTRAS = Path(__file__).resolve().parents[2] / "data" / "samples"
+
+BASE = pl.DataFrame(
+    {
+        "Ano": [2022, 2022, 2022, 2022, 2018],
+        "SG_UF": ["BA", "BA", "SP", "ZZ", "BA"],
+        "NOME_REGIAO": ["Nordeste", "Nordeste", "Sudeste", "Exterior", "Nordeste"],
+        "QT_APTOS": [100, 900, 10, 40, 50],
+        "QT_COMPARECIMENTO": [100, 450, 5, 10, 40],
+        "QT_ABSTENCAO": [0, 450, 5, 30, 10],
+    }
+)
+
+
+def test_agregar_dashboard_le_a_base_uma_vez() -> None:
+    """As três visões saem de uma única execução do plano da base."""
+    execucoes = []
+
+    def contar(df: pl.DataFrame) -> pl.DataFrame:
+        execucoes.append(len(df))
+        return df
+
+    nacional, regional, mapa = agregar_dashboard(BASE.lazy().map_batches(contar))
+
+    assert len(execucoes) == 1
+    assert nacional.columns == [
+        "Ano",
+        "comparecimento_total",
+        "abstencao_total",
+        "taxa_comparecimento",
+    ]
+    assert regional["NOME_REGIAO"].to_list() == ["Nordeste", "Exterior", "Nordeste", "Sudeste"]
+    assert mapa.columns == ["Ano", "SG_UF", "taxa_comparecimento", "regiao"]
+
+
+def test_agregar_dashboard_igual_a_agregacao_direta() -> None:
+    """Reagregar as contagens por UF dá as mesmas taxas (soma/soma) da base."""
+    nacional, regional, mapa = agregar_dashboard(BASE.lazy())
+
+    direto = agregar_participacao(BASE.lazy(), ["Ano"]).sort("Ano").collect()
+    assert nacional["taxa_comparecimento"].to_list() == direto["TAXA_COMPARECIMENTO_PCT"].to_list()
+    assert nacional["comparecimento_total"].to_list() == [40, 565]
+
+    # Exterior entra nos totais, mas não no mapa
+    assert "ZZ" not in mapa["SG_UF"].to_list()
+    ba_2022 = mapa.filter(pl.col("Ano") == 2022, pl.col("SG_UF") == "BA")
+    assert ba_2022["taxa_comparecimento"].item() == pytest.approx(55.0)
+    assert ba_2022["regiao"].item() == "Nordeste"
+
+
+def test_filtrar_visoes() -> None:
+    """Recorta anos, regiões e ano do mapa sem alterar as visões em cache."""
+    visoes = agregar_dashboard(BASE.lazy())
+
+    nacional, regional, mapa = filtrar_visoes(visoes, [2022], ["Nordeste", "Exterior"], 2022)
+
+    assert nacional["Ano"].to_list() == [2022]
+    assert regional["NOME_REGIAO"].to_list() == ["Exterior", "Nordeste"]
+    assert mapa["SG_UF"].to_list() == ["BA"]
+    assert len(visoes[0]) == 2
+
+    # Sem ano de mapa, o mapa fica vazio (as demais visões não dependem dele)
+    _, regional, mapa = filtrar_visoes(visoes, [2018, 2022], ["Sudeste"], None)
+    assert regional["Ano"].to_list() == [2022]
+    assert mapa.is_empty()
+
+
+def test_visoes_vazias_no_schema_das_visoes() -> None:
+    """As visões vazias passam pelos mesmos filtros e renomeações das reais."""
+    for vazia, real in zip(visoes_vazias(), agregar_dashboard(BASE.lazy()), strict=True):
+        assert vazia.is_empty()
+        assert vazia.columns == real.columns
+
+    assert all(df.is_empty() for df in filtrar_visoes(visoes_vazias(), [2022], ["Sul"], 2022))
+
+
+def test_amostras_demo_lidas_pelo_leitor_da_silver() -> None:
+    """As amostras do modo demo são uma Lakehouse tipada lida como a produção."""
+    settings = Settings(project_root=AMOSTRAS)
+    particoes = listar_particoes_silver(settings)
+    assert particoes
+
+    for ano, caminho in particoes.items():
+        assert pl.read_parquet_schema(caminho).items() <= SCHEMA_SILVER.items(), ano
+
+    visoes = carregar_visoes(list(particoes), CacheAnual(max_bytes=0), settings=settings)
+    assert visoes is not None
+    assert sorted(visoes[0]["Ano"].to_list()) == sorted(particoes)
+
+
+def _gravar_silver(settings: Settings, ano: int, df: pl.DataFrame) -> None:
+    caminho = caminho_particao_silver(settings, ano)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    df.cast({c: SCHEMA_SILVER[c] for c in df.columns}).write_parquet(caminho)
+
+
+def _agregado(ano: int, linhas: int = 1) -> pl.DataFrame:
+    return pl.DataFrame({"Ano": [ano] * linhas, "QT_APTOS": list(range(linhas))})
+
+
+def test_cache_anual_lru_limitado_em_bytes() -> None:
+    tamanho = int(_agregado(2014).estimated_size())
+    cache = CacheAnual(max_bytes=2 * tamanho)
+
+    cache.obter(2014, lambda: _agregado(2014))
+    cache.obter(2018, lambda: _agregado(2018))
+    cache.obter(2014, lambda: _agregado(2014))  # 2014 passa a ser o mais recente
+    cache.obter(2022, lambda: _agregado(2022))
+
+    assert len(cache) == 2
+    assert cache.tamanho_bytes == 2 * tamanho
+    assert (cache.acertos, cache.faltas) == (1, 3)
+
+    # 2018 (menos recente) saiu; 2014 continua em cache
+    cache.obter(2014, lambda: pytest.fail("2014 deveria estar em cache"))
+    assert len(cache.obter(2018, lambda: _agregado(2018, linhas=3))) == 3
+
+    # Entrada maior que o limite é devolvida, mas não guardada
+    grande = cache.obter(2024, lambda: _agregado(2024, linhas=10_000))
+    assert len(grande) == 10_000
+    assert len(cache) == 2
+
+
+def test_cache_anual_desligado_nao_guarda_frames_vazios() -> None:
+    """max_bytes=0 desliga o cache, inclusive para frames de tamanho estimado 0."""
+    cache = CacheAnual(max_bytes=0)
+
+    assert cache.obter(2014, pl.DataFrame).is_empty()
+    assert cache.obter(2014, pl.DataFrame).is_empty()
+
+    assert len(cache) == 0
+    assert (cache.acertos, cache.faltas) == (0, 2)
+
+
+def test_carregar_visoes_calcula_so_anos_novos(settings, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """Trocar um ano na seleção custa só a agregação desse ano."""
+    for ano in (2018, 2022):
+        _gravar_silver(settings, ano, BASE.drop("Ano"))
+
+    lidos: list[list[int]] = []
+
+    def scan_contado(anos, settings):  # type: ignore[no-untyped-def]
+        lidos.append(list(anos))
+        return scan_base_uf(anos, settings)
+
+    monkeypatch.setattr(dashboard_data, "scan_base_uf", scan_contado)
+    cache = CacheAnual(max_bytes=1024 * 1024)
+
+    visoes = carregar_visoes([2022], cache, settings=settings)
+    assert visoes is not None
+    visoes = carregar_visoes([2018, 2022], cache, settings=settings)
+    assert visoes is not None
+    assert lidos == [[2022], [2018]]
+    assert visoes[0]["Ano"].to_list() == [2018, 2022]
+
+    # Partição reescrita: a chave (tamanho + mtime) muda e o ano é recalculado
+    _gravar_silver(settings, 2022, BASE.drop("Ano").head(2))
+    carregar_visoes([2018, 2022], cache, settings=settings)
+    assert lidos[-1] == [2022]
+
+    assert carregar_visoes([2030], cache, settings=settings) is None
+
+
+def test_carregar_visoes_silver_mais_nova_que_a_serie_gold(settings, logger) -> None:  # type: ignore[no-untyped-def]
+    """Anos fora da série historico_uf (Silver mais nova que a Gold) vêm da Silver."""
+    _gravar_silver(settings, 2018, MUNICIPIOS.with_columns(pl.lit(2018).alias("ANO_ELEICAO")))
+    GoldAggregationPipeline(settings=settings, logger=logger).refresh([2018])
+    assert anos_historico_uf(settings) == {2018}
+
+    _gravar_silver(settings, 2022, MUNICIPIOS)
+    visoes = carregar_visoes([2018, 2022], CacheAnual(max_bytes=1024 * 1024), settings=settings)
+
+    assert visoes is not None
+    nacional, _, mapa = visoes
+    assert nacional["Ano"].to_list() == [2018, 2022]
+    # Mesmas contagens nos dois anos: série Gold e Silver somam igual
+    assert nacional["comparecimento_total"].to_list() == [170, 170]
+
+    lidos = scan_base_uf([2018, 2022], settings).collect()
+    assert sorted(lidos["Ano"].unique().to_list()) == [2018, 2022]
+
+
+def test_cache_arrow_disco_compartilhado_entre_processos(  # type: ignore[no-untyped-def]
+    settings, tmp_path, monkeypatch
+) -> None:
+    """Um worker aproveita o que outro agregou; reescrever a partição recalcula."""
+    _gravar_silver(settings, 2022, BASE.drop("Ano"))
+
+    lidos: list[list[int]] = []
+
+    def scan_contado(anos, settings):  # type: ignore[no-untyped-def]
+        lidos.append(list(anos))
+        return scan_base_uf(anos, settings)
+
+    monkeypatch.setattr(dashboard_data, "scan_base_uf", scan_contado)
+    # Duas instâncias no mesmo diretório simulam dois processos do host
+    worker_a = CacheArrowDisco(tmp_path / "cache", max_bytes=1024 * 1024)
+    worker_b = CacheArrowDisco(tmp_path / "cache", max_bytes=1024 * 1024)
+
+    visoes_a = carregar_visoes([2022], worker_a, settings=settings)
+    visoes_b = carregar_visoes([2022], worker_b, settings=settings)
+    assert visoes_a is not None and visoes_b is not None
+    assert lidos == [[2022]]
+    assert (worker_b.acertos, worker_b.faltas) == (1, 0)
+    for df_a, df_b in zip(visoes_a, visoes_b, strict=True):
+        assert df_a.equals(df_b)
+
+    _gravar_silver(settings, 2022, BASE.drop("Ano").head(2))
+    carregar_visoes([2022], worker_b, settings=settings)
+    assert lidos == [[2022], [2022]]
+
+
+def test_cache_arrow_disco_lru_limitado_em_bytes(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    sonda = CacheArrowDisco(tmp_path / "sonda", max_bytes=1024 * 1024)
+    sonda.obter(2014, lambda: _agregado(2014))
+    tamanho = sonda.tamanho_bytes
+
+    cache = CacheArrowDisco(tmp_path / "cache", max_bytes=2 * tamanho)
+    cache.obter(2014, lambda: _agregado(2014))
+    cache.obter(2018, lambda: _agregado(2018))
+    cache.obter(2014, lambda: _agregado(2014))  # 2014 passa a ser o mais recente
+    cache.obter(2022, lambda: _agregado(2022))
+
+    assert len(cache) == 2
+    assert (cache.acertos, cache.faltas) == (1, 3)
+
+    # 2018 (menos recente) saiu; 2014 continua em cache, lido do disco
+    assert cache.obter(2014, lambda: pytest.fail("2014 deveria estar em cache")).equals(
+        _agregado(2014)
+    )
+    assert len(cache.obter(2018, lambda: _agregado(2018, linhas=3))) == 3
+
+    assert cache.limpar() == 2
+    assert len(cache) == 0
+
+    # max_bytes=0 desliga o cache: nada é gravado
+    desligado = CacheArrowDisco(tmp_path / "desligado", max_bytes=0)
+    desligado.obter(2014, lambda: _agregado(2014))
+    assert not (tmp_path / "desligado").exists()
+
+
+@pytest.mark.parametrize("conteudo", [b"lixo", b"", "truncado"])
+def test_cache_arrow_disco_recalcula_entrada_corrompida(tmp_path, conteudo) -> None:  # type: ignore[no-untyped-def]
+    """Entrada ilegível (escrita interrompida, lixo) é removida e recalculada."""
+    cache = CacheArrowDisco(tmp_path, max_bytes=1024 * 1024)
+    cache.obter(2014, lambda: _agregado(2014))
+    (arquivo,) = tmp_path.glob("*.arrow")
+    completo = arquivo.read_bytes()
+    arquivo.write_bytes(completo[: len(completo) // 2] if conteudo == "truncado" else conteudo)
+
+    df = cache.obter(2014, lambda: _agregado(2014, linhas=2))
+
+    assert len(df) == 2
+    assert (cache.acertos, cache.faltas) == (0, 2)
+    # Regravada: a próxima leitura é um acerto
+    assert len(cache.obter(2014, lambda: pytest.fail("2014 deveria estar em cache"))) == 2
+
+
+def test_criar_cache_pelo_backend_configurado(settings) -> None:  # type: ignore[no-untyped-def]
+    assert isinstance(criar_cache(settings), CacheAnual)
+
+    disco = criar_cache(settings.model_copy(update={"dashboard_cache_backend": "disco"}))
+    assert isinstance(disco, CacheArrowDisco)
+    assert disco.diretorio == settings.data_dir / "_dashboard_cache"
+
+
+MUNICIPIOS = pl.DataFrame(
+    {
+        "ANO_ELEICAO": [2022, 2022, 2022, 2022],
+        "NR_TURNO": [1, 2, 1, 1],
+        "NOME_REGIAO": ["Nordeste", "Nordeste", "Nordeste", "Sudeste"],
+        "SG_UF": ["BA", "BA", "BA", "SP"],
+        "CD_MUNICIPIO": [1, 1, 2, 3],
+        "NM_MUNICIPIO": ["SALVADOR", "SALVADOR", "FEIRA DE SANTANA", "SÃO PAULO"],
+        "QT_APTOS": [100, 100, 50, 10],
+        "QT_COMPARECIMENTO": [80, 60, 25, 5],
+        "QT_ABSTENCAO": [20, 40, 25, 5],
+    }
+)
+
+
+def test_carregar_municipios_le_so_a_uf_da_gold(settings) -> None:  # type: ignore[no-untyped-def]
+    """Com a Gold do ano, só os municípios da UF pedida são agregados (turnos somados)."""
+    gold = agregar_participacao(MUNICIPIOS.lazy(), MUNICIPIOS.columns[:6]).collect()
+    caminho = caminho_tabela_gold(settings, 2022, "municipio")
+    caminho.parent.mkdir(parents=True)
+    gold.select(list(schema_gold("municipio"))).cast(schema_gold("municipio")).write_parquet(
+        caminho
+    )
+
+    cache = CacheAnual(max_bytes=1024 * 1024)
+    df = carregar_municipios("BA", 2022, cache, settings=settings)
+
+    assert df is not None
+    assert df["NM_MUNICIPIO"].to_list() == ["FEIRA DE SANTANA", "SALVADOR"]
+    assert df["QT_APTOS"].to_list() == [50, 200]
+    assert df["taxa_comparecimento"].to_list() == pytest.approx([50.0, 70.0])
+
+    # Segunda interação com a mesma UF vem do cache
+    assert carregar_municipios("BA", 2022, cache, settings=settings) is df
+    assert cache.acertos == 1
+
+    assert carregar_municipios("RJ", 2022, cache, settings=settings) is None
+
+
+def test_carregar_municipios_fallback_silver(settings) -> None:  # type: ignore[no-untyped-def]
+    """Sem a Gold do ano, lê a Silver (com poda de UF)."""
+    assert carregar_municipios("SP", 2022, CacheAnual(max_bytes=1024), settings=settings) is None
+
+    _gravar_silver(settings, 2022, MUNICIPIOS)
+
+    df = carregar_municipios("SP", 2022, CacheAnual(max_bytes=1024 * 1024), settings=settings)
+
+    assert df is not None
+    assert df["NM_MUNICIPIO"].to_list() == ["SÃO PAULO"]
+    assert df["taxa_comparecimento"].item() == pytest.approx(50.0)
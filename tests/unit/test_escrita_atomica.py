@@ -0,0 +1,60 @@
+"""Testes da escrita atômica e da trava por partição"""
+
+import threading
+import time
+
+import polars as pl
+import pytest
+
+from participacao_eleitoral.utils.escrita_atomica import (
+    ARQUIVO_TRAVA,
+    escrita_atomica,
+    trava_particao,
+)
+
+
+def test_escrita_atomica_publica_arquivo_completo(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """O destino só aparece ao final, sem temporários sobrando."""
+    destino = tmp_path / "year=2022" / "data.parquet"
+
+    with escrita_atomica(destino) as tmp:
+        assert tmp.parent == destino.parent
+        pl.DataFrame({"a": [1, 2]}).write_parquet(tmp)
+        assert not destino.exists()
+
+    assert pl.read_parquet(destino)["a"].to_list() == [1, 2]
+    assert [p.name for p in destino.parent.iterdir()] == ["data.parquet"]
+
+
+def test_escrita_atomica_falha_preserva_destino(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Erro no meio da escrita não toca o arquivo publicado."""
+    destino = tmp_path / "data.parquet"
+    pl.DataFrame({"a": [1]}).write_parquet(destino)
+
+    with pytest.raises(RuntimeError), escrita_atomica(destino) as tmp:
+        tmp.write_bytes(b"PAR1 truncado")
+        raise RuntimeError("falha simulada")
+
+    assert pl.read_parquet(destino)["a"].to_list() == [1]
+    assert [p.name for p in tmp_path.iterdir()] == ["data.parquet"]
+
+
+def test_trava_particao_serializa_escritores(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Dois workers na mesma partição não entram juntos na seção crítica."""
+    eventos: list[str] = []
+
+    def worker(nome: str) -> None:
+        with trava_particao(tmp_path):
+            eventos.append(f"{nome}:inicio")
+            time.sleep(0.05)
+            eventos.append(f"{nome}:fim")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (tmp_path / ARQUIVO_TRAVA).exists()
+    assert eventos[0].split(":")[0] == eventos[1].split(":")[0]
+    assert eventos[2].split(":")[0] == eventos[3].split(":")[0]
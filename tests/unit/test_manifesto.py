@@ -0,0 +1,115 @@
+"""Testes do manifesto de partições"""
+
+import json
+import os
+
+import polars as pl
+from typer.testing import CliRunner
+
+from participacao_eleitoral.cli import app
+from participacao_eleitoral.silver.reader import caminho_particao_silver, diretorio_silver
+from participacao_eleitoral.utils.manifesto import (
+    ARQUIVO_MANIFESTO,
+    carregar_manifesto,
+    entrada_atual,
+    pode_conter,
+    registrar_no_manifesto,
+    verificar_manifesto,
+)
+
+
+def _escrever(caminho, df: pl.DataFrame) -> None:  # type: ignore[no-untyped-def]
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    df.write_parquet(caminho, row_group_size=2)
+
+
+def test_registra_estatisticas_por_arquivo(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Min/max e nulos combinam todos os row groups; partição vem do caminho."""
+    arquivo = tmp_path / "year=2022" / "data.parquet"
+    _escrever(
+        arquivo,
+        pl.DataFrame({"SG_UF": ["BA", "AC", "SP", None], "QT_APTOS": [10, 5, None, None]}),
+    )
+
+    manifesto = registrar_no_manifesto(tmp_path, [arquivo])
+    entrada = manifesto["arquivos"]["year=2022/data.parquet"]
+
+    assert entrada["particao"] == {"year": "2022"}
+    assert entrada["linhas"] == 4
+    assert entrada["row_groups"] == 2
+    assert entrada["colunas"]["SG_UF"] == {"min": "AC", "max": "SP", "nulos": 1}
+    assert entrada["colunas"]["QT_APTOS"] == {"min": 5, "max": 10, "nulos": 2}
+
+    # Persistido em JSON legível, relido igual
+    assert json.loads((tmp_path / ARQUIVO_MANIFESTO).read_text())["arquivos"].keys() == {
+        "year=2022/data.parquet"
+    }
+    assert carregar_manifesto(tmp_path) == manifesto
+
+
+def test_pode_conter_e_conservador(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    arquivo = tmp_path / "year=2022" / "data.parquet"
+    _escrever(arquivo, pl.DataFrame({"SG_UF": ["BA", "CE"]}))
+    entrada = registrar_no_manifesto(tmp_path, [arquivo])["arquivos"]["year=2022/data.parquet"]
+
+    assert pode_conter(entrada, "SG_UF", ["BA"])
+    assert pode_conter(entrada, "SG_UF", ["SP", "BB"])
+    assert not pode_conter(entrada, "SG_UF", ["SP", "AC"])
+
+    # Coluna ausente é nula no arquivo; tipos incomparáveis não podam
+    assert not pode_conter(entrada, "NR_ZONA", [1])
+    assert pode_conter(entrada, "SG_UF", [1])
+
+
+def test_entrada_invalida_apos_reescrita(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    arquivo = tmp_path / "year=2022" / "data.parquet"
+    _escrever(arquivo, pl.DataFrame({"x": [1]}))
+    manifesto = registrar_no_manifesto(tmp_path, [arquivo])
+    assert entrada_atual(manifesto, tmp_path, arquivo) is not None
+
+    _escrever(arquivo, pl.DataFrame({"x": [1, 2, 3]}))
+    assert entrada_atual(manifesto, tmp_path, arquivo) is None
+
+
+def test_manifesto_ausente_ou_corrompido_equivale_a_vazio(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    assert carregar_manifesto(tmp_path)["arquivos"] == {}
+
+    (tmp_path / ARQUIVO_MANIFESTO).write_text("{corrompido")
+    assert carregar_manifesto(tmp_path)["arquivos"] == {}
+
+
+def test_descarta_arquivos_removidos_e_verifica_checksums(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    a = tmp_path / "year=2018" / "data.parquet"
+    b = tmp_path / "year=2022" / "data.parquet"
+    _escrever(a, pl.DataFrame({"x": [1]}))
+    _escrever(b, pl.DataFrame({"x": [2]}))
+    registrar_no_manifesto(tmp_path, [a, b])
+
+    # Corrompe b mantendo tamanho e mtime: só o checksum percebe
+    stat = b.stat()
+    conteudo = bytearray(b.read_bytes())
+    conteudo[10] ^= 0xFF
+    b.write_bytes(bytes(conteudo))
+    os.utime(b, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert verificar_manifesto(tmp_path) == {"year=2022/data.parquet": "checksum divergente"}
+
+    a.unlink()
+    assert verificar_manifesto(tmp_path)["year=2018/data.parquet"] == "ausente"
+
+    manifesto = registrar_no_manifesto(tmp_path, [])
+    assert list(manifesto["arquivos"]) == ["year=2022/data.parquet"]
+
+
+def test_cli_validate_manifest(settings, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    arquivo = caminho_particao_silver(settings, 2022)
+    _escrever(arquivo, pl.DataFrame({"x": [1]}))
+    registrar_no_manifesto(diretorio_silver(settings), [arquivo])
+    monkeypatch.setenv("PARTICIPACAO_PROJECT_ROOT", str(settings.project_root))
+
+    ok = CliRunner().invoke(app, ["validate", "manifest", "silver"])
+    assert ok.exit_code == 0, ok.output
+    assert "1 arquivo(s), 0 divergente(s)" in ok.output
+
+    arquivo.write_bytes(b"corrompido")
+    assert CliRunner().invoke(app, ["validate", "manifest", "silver"]).exit_code == 1
@@ -0,0 +1,230 @@
+"""Testes dos snapshots por partição"""
+
+from datetime import UTC, datetime, timedelta
+
+import polars as pl
+import pytest
+from typer.testing import CliRunner
+
+from participacao_eleitoral.cli import app
+from participacao_eleitoral.silver.reader import caminho_particao_silver, scan_silver
+from participacao_eleitoral.utils.escrita_atomica import escrita_atomica
+from participacao_eleitoral.utils.snapshots import DIRETORIO_VERSOES, PartitionSnapshots
+
+
+def _publicar(caminho, valores: list[int]) -> None:  # type: ignore[no-untyped-def]
+    with escrita_atomica(caminho) as tmp:
+        pl.DataFrame({"x": valores}).write_parquet(tmp)
+
+
+def _ler(caminho) -> list[int]:  # type: ignore[no-untyped-def]
+    return pl.read_parquet(caminho)["x"].to_list()
+
+
+def test_commit_preserva_versoes_anteriores(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """A escrita atômica troca o inode publicado; o hardlink da versão fica intacto."""
+    snapshots = PartitionSnapshots(tmp_path)
+    arquivo = tmp_path / "data.parquet"
+
+    _publicar(arquivo, [1])
+    assert snapshots.commit(["data.parquet"], "transform")["versao"] == 1
+    _publicar(arquivo, [2])
+    snapshots.commit(["data.parquet"], "transform")
+
+    assert _ler(arquivo) == [2]
+    assert _ler(snapshots.caminho(1, "data.parquet")) == [1]
+    assert _ler(snapshots.caminho(2, "data.parquet")) == [2]
+    assert snapshots.carregar()["atual"] == 2
+
+
+def test_commit_parcial_herda_arquivos_do_snapshot_anterior(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    snapshots = PartitionSnapshots(tmp_path)
+    _publicar(tmp_path / "uf.parquet", [1])
+    _publicar(tmp_path / "delta.parquet", [10])
+    snapshots.commit(["uf.parquet", "delta.parquet"], "aggregate")
+
+    _publicar(tmp_path / "delta.parquet", [11])
+    snapshot = snapshots.commit(["delta.parquet"], "deltas")
+
+    assert snapshot["arquivos"] == {"delta.parquet": 2, "uf.parquet": 1}
+
+
+def test_nova_versao_publica_todos_os_arquivos_juntos(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Até o fim do bloco, leitores resolvem a versão anterior inteira."""
+    snapshots = PartitionSnapshots(tmp_path)
+    with snapshots.nova_versao("aggregate") as versao_dir:
+        _publicar(versao_dir / "uf.parquet", [1])
+        _publicar(versao_dir / "cubo.parquet", [10])
+
+    with snapshots.nova_versao("aggregate") as versao_dir:
+        _publicar(versao_dir / "uf.parquet", [2])
+        assert _ler(snapshots.atual("uf.parquet")) == [1]
+        _publicar(versao_dir / "cubo.parquet", [20])
+        assert _ler(snapshots.atual("cubo.parquet")) == [10]
+
+    assert snapshots.snapshot()["arquivos"] == {"cubo.parquet": 2, "uf.parquet": 2}
+    assert _ler(snapshots.atual("uf.parquet")) == [2]
+    assert _ler(tmp_path / "cubo.parquet") == [20]
+
+
+def test_nova_versao_descarta_escrita_com_erro(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    snapshots = PartitionSnapshots(tmp_path)
+    with snapshots.nova_versao("aggregate") as versao_dir:
+        _publicar(versao_dir / "uf.parquet", [1])
+
+    with pytest.raises(RuntimeError), snapshots.nova_versao("aggregate") as versao_dir:
+        _publicar(versao_dir / "uf.parquet", [2])
+        raise RuntimeError("falha no meio da escrita")
+
+    assert snapshots.carregar()["atual"] == 1
+    assert not versao_dir.exists()
+    assert _ler(tmp_path / "uf.parquet") == [1]
+
+
+def test_rollback_troca_ponteiro_sem_perder_historico(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    snapshots = PartitionSnapshots(tmp_path)
+    arquivo = tmp_path / "data.parquet"
+    _publicar(arquivo, [1])
+    snapshots.commit(["data.parquet"], "transform")
+    _publicar(arquivo, [2])
+    _publicar(tmp_path / "extra.parquet", [9])
+    snapshots.commit(["data.parquet", "extra.parquet"], "transform")
+
+    snapshots.rollback(1)
+
+    assert _ler(arquivo) == [1]
+    assert not (tmp_path / "extra.parquet").exists()
+    assert snapshots.carregar()["atual"] == 1
+    assert [s["versao"] for s in snapshots.carregar()["snapshots"]] == [1, 2]
+
+    # Novo commit após rollback ganha versão nova, sem reaproveitar a 2
+    _publicar(arquivo, [3])
+    assert snapshots.commit(["data.parquet"], "transform")["versao"] == 3
+    assert _ler(snapshots.caminho(2, "data.parquet")) == [2]
+
+    with pytest.raises(ValueError, match="não existe"):
+        snapshots.rollback(42)
+
+
+def test_vacuum_retem_recentes_atual_e_fixados(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    snapshots = PartitionSnapshots(tmp_path)
+    arquivo = tmp_path / "data.parquet"
+    for valor in range(1, 6):
+        _publicar(arquivo, [valor])
+        snapshots.commit(["data.parquet"], "transform")
+
+    snapshots.fixar(1)
+    snapshots.rollback(2)
+    removidos = snapshots.vacuum(reter=1)
+
+    # Fica: 5 (mais recente), 2 (atual) e 1 (fixado)
+    assert {p.parent.name for p in removidos} == {"00003", "00004"}
+    assert [s["versao"] for s in snapshots.carregar()["snapshots"]] == [1, 2, 5]
+    assert sorted(d.name for d in (tmp_path / DIRETORIO_VERSOES).iterdir()) == [
+        "00001",
+        "00002",
+        "00005",
+    ]
+    assert _ler(arquivo) == [2]
+
+    snapshots.fixar(1, fixo=False)
+    snapshots.vacuum(reter=1)
+    assert [s["versao"] for s in snapshots.carregar()["snapshots"]] == [2, 5]
+
+
+def test_vacuum_remove_sobras_de_commit_interrompido(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    snapshots = PartitionSnapshots(tmp_path)
+    _publicar(tmp_path / "data.parquet", [1])
+    snapshots.commit(["data.parquet"], "transform")
+
+    orfao = tmp_path / DIRETORIO_VERSOES / "00002" / "data.parquet"
+    orfao.parent.mkdir(parents=True)
+    orfao.write_bytes(b"sem snapshot")
+
+    assert snapshots.vacuum(reter=3) == [orfao]
+    assert not orfao.parent.exists()
+
+
+def test_versao_em_faz_time_travel(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    snapshots = PartitionSnapshots(tmp_path)
+    antes = datetime.now(UTC) - timedelta(seconds=1)
+    _publicar(tmp_path / "data.parquet", [1])
+    snapshots.commit(["data.parquet"], "transform")
+
+    assert snapshots.versao_em(antes) is None
+    assert snapshots.versao_em(datetime.now(UTC)) == 1
+
+
+def test_scan_silver_le_versao_fixada(settings) -> None:  # type: ignore[no-untyped-def]
+    arquivo = caminho_particao_silver(settings, 2022)
+    snapshots = PartitionSnapshots(arquivo.parent)
+    for aptos in (100, 200):
+        with escrita_atomica(arquivo) as tmp:
+            pl.DataFrame(
+                {"SG_UF": ["BA"], "QT_APTOS": [aptos], "QT_COMPARECIMENTO": [50]}
+            ).write_parquet(tmp)
+        snapshots.commit([arquivo.name], "transform")
+
+    def aptos(**kwargs: object) -> list[int]:
+        lf = scan_silver([2022], columns=["QT_APTOS"], settings=settings, **kwargs)  # type: ignore[arg-type]
+        return lf.collect()["QT_APTOS"].to_list()
+
+    assert aptos() == [200]
+    assert aptos(versoes={2022: 1}) == [100]
+
+
+def test_cli_snapshots_list_rollback_vacuum(settings, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    arquivo = caminho_particao_silver(settings, 2022)
+    snapshots = PartitionSnapshots(arquivo.parent)
+    for valor in range(1, 4):
+        _publicar(arquivo, [valor])
+        snapshots.commit([arquivo.name], "transform")
+    monkeypatch.setenv("PARTICIPACAO_PROJECT_ROOT", str(settings.project_root))
+    runner = CliRunner()
+
+    listagem = runner.invoke(app, ["snapshots", "list", "silver", "2022"])
+    assert listagem.exit_code == 0, listagem.output
+    assert "* v3" in listagem.output
+
+    rollback = runner.invoke(app, ["snapshots", "rollback", "silver", "2022", "1"])
+    assert rollback.exit_code == 0, rollback.output
+    assert _ler(arquivo) == [1]
+
+    vacuum = runner.invoke(app, ["snapshots", "vacuum", "silver", "--reter", "1"])
+    assert vacuum.exit_code == 0, vacuum.output
+    assert "1 arquivo(s) de versão removido(s)" in vacuum.output
+
+    assert runner.invoke(app, ["snapshots", "rollback", "silver", "2022", "2"]).exit_code == 1
+    assert runner.invoke(app, ["snapshots", "list", "bronze", "2022"]).exit_code == 2
+
+
+def test_cli_vacuum_rejeita_camada_sem_snapshots(settings, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """Camada inválida sai com código 2, sem varrer partições (nem relatar sucesso)."""
+    monkeypatch.setenv("PARTICIPACAO_PROJECT_ROOT", str(settings.project_root))
+
+    result = CliRunner().invoke(app, ["snapshots", "vacuum", "bronze"])
+
+    assert result.exit_code == 2
+    assert "não versionada" in result.output
+    assert "Vacuum" not in result.output
+
+
+def test_cli_vacuum_valida_reter_e_ignora_diretorios_estranhos(settings, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """--reter < 1 é rejeitado; diretórios year=<não numérico> não derrubam o vacuum."""
+    arquivo = caminho_particao_silver(settings, 2022)
+    snapshots = PartitionSnapshots(arquivo.parent)
+    for valor in range(1, 4):
+        _publicar(arquivo, [valor])
+        snapshots.commit([arquivo.name], "transform")
+    (arquivo.parent.parent / "year=foo").mkdir()
+    monkeypatch.setenv("PARTICIPACAO_PROJECT_ROOT", str(settings.project_root))
+    runner = CliRunner()
+
+    for reter in ["0", "-1"]:
+        result = runner.invoke(app, ["snapshots", "vacuum", "silver", "--reter", reter])
+        assert result.exit_code == 2, result.output
+    assert len(snapshots.carregar()["snapshots"]) == 3
+
+    result = runner.invoke(app, ["snapshots", "vacuum", "silver", "--reter", "1"])
+    assert result.exit_code == 0, result.output
+    assert "2 arquivo(s) de versão removido(s) em 1 partição(ões)" in result.output
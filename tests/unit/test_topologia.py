@@ -0,0 +1,112 @@
+"""Testes da simplificação com topologia preservada"""
+
+import json
+import math
+from importlib import resources
+
+import pytest
+
+from participacao_eleitoral import dashboard_data
+from participacao_eleitoral.dashboard_data import carregar_geometria_uf
+from participacao_eleitoral.silver.region_mapper import RegionMapper
+from participacao_eleitoral.utils.topologia import simplificar_topologia, topojson_para_geojson
+
+# Fronteira x≈1 entre AA e BB, com ruído menor que a tolerância
+BORDA = [[1 + 0.001 * math.sin(i), i / 100] for i in range(101)]
+FURO = [[0.2, 0.2], [0.4, 0.2], [0.4, 0.4], [0.2, 0.4], [0.2, 0.2]]
+ILHA = [[3, 3], [3.1, 3], [3.1, 3.1], [3, 3.1], [3, 3]]
+
+
+def _feicao(sigla: str, tipo: str, coordenadas: list) -> dict:  # type: ignore[type-arg]
+    return {
+        "type": "Feature",
+        "properties": {"sigla": sigla},
+        "geometry": {"type": tipo, "coordinates": coordenadas},
+    }
+
+
+COLECAO = {
+    "type": "FeatureCollection",
+    "features": [
+        _feicao("AA", "Polygon", [[[0, 0], *BORDA, [0, 1], [0, 0]], FURO]),
+        _feicao("BB", "MultiPolygon", [[[[1, 0], [2, 0], [2, 1], *BORDA[::-1]]], [ILHA]]),
+        # Enclave que preenche o furo de AA
+        _feicao("CC", "Polygon", [FURO[::-1]]),
+    ],
+}
+
+
+def _geometrias(topologia: dict) -> dict[str, list]:  # type: ignore[type-arg]
+    return {g["properties"]["sigla"]: g["arcs"] for g in topologia["objects"]["ufs"]["geometries"]}
+
+
+def test_fronteiras_compartilhadas_viram_um_arco() -> None:
+    topologia = simplificar_topologia(COLECAO, tolerancia=0.01, quantizacao=10_000, objeto="ufs")
+    arcos = _geometrias(topologia)
+
+    # O arco da fronteira aparece em AA e, invertido (~i), em BB
+    arcos_aa = {i for anel in arcos["AA"][0] for i in anel}
+    arcos_bb = {i for poligono in arcos["BB"] for anel in poligono for i in anel}
+    assert any(~i in arcos_aa for i in arcos_bb if i < 0)
+
+    # Furo de AA e enclave CC: o mesmo anel
+    assert arcos["CC"][0][0] == [~i for i in arcos["AA"][0][1]]
+
+
+def test_simplifica_e_decodifica_aneis_fechados() -> None:
+    topologia = simplificar_topologia(COLECAO, tolerancia=0.01, quantizacao=10_000, objeto="ufs")
+    geojson = topojson_para_geojson(topologia, "ufs")
+
+    assert [f["properties"]["sigla"] for f in geojson["features"]] == ["AA", "BB", "CC"]
+    for feicao in geojson["features"]:
+        for poligono in feicao["geometry"]["coordinates"]:
+            for anel in poligono:
+                assert anel[0] == anel[-1]
+                assert len(anel) >= 4
+
+    # O ruído da fronteira some: AA fica com os 4 cantos
+    anel_aa = geojson["features"][0]["geometry"]["coordinates"][0][0]
+    assert len(anel_aa) == 5
+    assert len(json.dumps(topologia)) < len(json.dumps(COLECAO)) / 4
+
+
+def test_anel_menor_que_a_grade_e_descartado() -> None:
+    colecao = {
+        "type": "FeatureCollection",
+        "features": [
+            _feicao("AA", "Polygon", [[[0, 0], [10, 0], [10, 10], [0, 0]]]),
+            _feicao("BB", "Polygon", [[[5, 1], [5.00001, 1], [5.00001, 1.00001], [5, 1]]]),
+        ],
+    }
+    topologia = simplificar_topologia(colecao, tolerancia=0.1, quantizacao=1000, objeto="ufs")
+
+    assert _geometrias(topologia)["BB"] == []
+
+
+def test_carregar_geometria_uf_empacotada(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(dashboard_data.resources, "files", lambda pacote: tmp_path)
+    assert carregar_geometria_uf() is None
+
+    destino = tmp_path / dashboard_data.ARQUIVO_GEOMETRIA_UF
+    destino.parent.mkdir(parents=True)
+    topologia = simplificar_topologia(COLECAO, tolerancia=0.01, objeto="ufs")
+    destino.write_text(json.dumps(topologia))
+
+    geojson = carregar_geometria_uf()
+    assert geojson is not None
+    assert len(geojson["features"]) == 3
+
+
+@pytest.mark.skipif(
+    not resources.files("participacao_eleitoral")
+    .joinpath(dashboard_data.ARQUIVO_GEOMETRIA_UF)
+    .is_file(),
+    reason="geometria dos estados ainda não gerada (scripts/build_geometria.py)",
+)
+def test_geometria_uf_versionada_cobre_as_27_ufs() -> None:
+    geojson = carregar_geometria_uf()
+
+    assert geojson is not None
+    siglas = [feicao["properties"]["sigla"] for feicao in geojson["features"]]
+    assert len(siglas) == 27
+    assert set(siglas) == set(RegionMapper.REGIAO_MAP) - {dashboard_data.UF_EXTERIOR}